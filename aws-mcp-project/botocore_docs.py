@@ -0,0 +1,240 @@
+import os
+import re
+import html
+import time
+from typing import Dict, List, Optional
+
+import botocore
+import botocore.exceptions
+import botocore.session
+from botocore import xform_name
+
+base_url = os.getenv("AWS_DOCS_BASE_URL", "https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services")
+
+# Nesting depth for request/response syntax and response structures
+# (some shapes are recursive, e.g. EventBridge patterns or IAM policies)
+MAX_DEPTH = int(os.getenv("AWS_DOCS_MAX_DEPTH", "6"))
+
+# Type names as the boto3 reference pages print them
+TYPE_NAMES = {
+    'string': 'string',
+    'integer': 'integer',
+    'long': 'integer',
+    'boolean': 'boolean',
+    'float': 'float',
+    'double': 'float',
+    'timestamp': 'datetime',
+    'blob': 'bytes',
+    'list': 'list',
+    'structure': 'dict',
+    'map': 'dict',
+}
+
+SYNTAX_PLACEHOLDERS = {
+    'string': "'string'",
+    'integer': '123',
+    'long': '123',
+    'boolean': 'True|False',
+    'float': '123.0',
+    'double': '123.0',
+    'timestamp': 'datetime(2015, 1, 1)',
+    'blob': "b'bytes'",
+}
+
+_TAG = re.compile(r"<[^>]+>")
+_SPACE = re.compile(r"\s+")
+_FIRST_PARAGRAPH = re.compile(r"<p>(.*?)</p>", re.S)
+
+# Typographic punctuation in the model docs, mapped to plain ASCII; any other
+# non-ASCII text (names, symbols, translated examples) is kept as is
+_ASCII = str.maketrans({
+    '\u2018': "'", '\u2019': "'", '\u201c': '"', '\u201d': '"',
+    '\u2013': '-', '\u2014': '-', '\u2026': '...', '\u00a0': ' ',
+    '\u2264': '<=', '\u2265': '>=',
+})
+
+_session = None
+
+
+def _get_session():
+    global _session
+    if _session is None:
+        _session = botocore.session.get_session()
+    return _session
+
+
+def available_services() -> List[str]:
+    """Service names with a model in the installed botocore"""
+    return _get_session().get_available_services()
+
+
+def _text(documentation: str) -> str:
+    """Plain text of a botocore HTML documentation fragment"""
+    text = html.unescape(_TAG.sub(" ", documentation or "")).translate(_ASCII)
+    text = _SPACE.sub(" ", text)
+    text = re.sub(r"\s+([.,;:)])", r"\1", text)
+    text = re.sub(r"\(\s+", "(", text)
+    return text.strip()
+
+
+def _summary(documentation: str) -> str:
+    """First paragraph, like the description line of a boto3 method page"""
+    match = _FIRST_PARAGRAPH.search(documentation or "")
+    return _text(match.group(1) if match else documentation)
+
+
+def _type_name(shape) -> str:
+    if shape.type_name == 'blob' and shape.serialization.get('streaming'):
+        return 'StreamingBody'
+    return TYPE_NAMES.get(shape.type_name, shape.type_name)
+
+
+def _syntax(shape, indent: int, depth: int, seen: tuple) -> str:
+    """Placeholder value for a shape in boto3's Request/Response Syntax format"""
+    pad = '    ' * indent
+    if shape.name in seen or depth > MAX_DEPTH:
+        return "{'... recursive ...'}"
+    seen = seen + (shape.name,) if shape.type_name in ('structure', 'list', 'map') else seen
+
+    if shape.type_name == 'structure':
+        if not shape.members:
+            return '{}'
+        lines = [
+            f"{pad}    '{name}': {_syntax(member, indent + 1, depth + 1, seen)}"
+            for name, member in shape.members.items()
+        ]
+        return "{\n" + ",\n".join(lines) + f"\n{pad}}}"
+    if shape.type_name == 'list':
+        return f"[\n{pad}    {_syntax(shape.member, indent + 1, depth + 1, seen)},\n{pad}]"
+    if shape.type_name == 'map':
+        value = _syntax(shape.value, indent + 1, depth + 1, seen)
+        return f"{{\n{pad}    'string': {value}\n{pad}}}"
+    if shape.type_name == 'string' and shape.enum:
+        return "|".join(f"'{value}'" for value in shape.enum)
+    if _type_name(shape) == 'StreamingBody':
+        return 'StreamingBody()'
+    return SYNTAX_PLACEHOLDERS.get(shape.type_name, "'string'")
+
+
+def _request_syntax(method_name: str, input_shape) -> str:
+    if input_shape is None or not input_shape.members:
+        return f"response = client.{method_name}()"
+    lines = [
+        f"    {name}={_syntax(member, 1, 1, (input_shape.name,))}"
+        for name, member in input_shape.members.items()
+    ]
+    return f"response = client.{method_name}(\n" + ",\n".join(lines) + "\n)"
+
+
+def _response_syntax(output_shape) -> str:
+    if output_shape is None:
+        return ""
+    return _syntax(output_shape, 0, 0, ())
+
+
+def _parameters(input_shape) -> List[Dict]:
+    if input_shape is None:
+        return []
+    required = set(input_shape.required_members)
+    return [
+        {
+            'name': name,
+            'type': _type_name(member),
+            'description': _text(member.documentation),
+            'required': name in required
+        }
+        for name, member in input_shape.members.items()
+    ]
+
+
+def _response_structure(shape, depth: int = 0, seen: tuple = ()) -> Dict:
+    """Same layout as the HTML scraper's _parse_response_structure: name -> type/description/nested"""
+    structure = {}
+    if shape is None or shape.type_name != 'structure':
+        return structure
+
+    for name, member in shape.members.items():
+        field = {
+            'type': f"({_type_name(member)})",
+            'description': _text(member.documentation)
+        }
+
+        # Lists and maps are described by their element shape
+        inner = member
+        while inner.type_name in ('list', 'map'):
+            inner = inner.member if inner.type_name == 'list' else inner.value
+        if inner.type_name == 'structure' and inner.name not in seen and depth < MAX_DEPTH:
+            nested = _response_structure(inner, depth + 1, seen + (inner.name,))
+            if nested:
+                field['nested'] = nested
+
+        structure[name] = field
+    return structure
+
+
+def build_method_docs(service_model, operation_name: str) -> Dict:
+    """
+    Build one method record from a botocore operation model
+
+    Args:
+        service_model: botocore ServiceModel
+        operation_name: API operation name (e.g. 'DescribeInstances')
+
+    Returns:
+        Dict with the same keys as the HTML scraper's method records
+    """
+    operation = service_model.operation_model(operation_name)
+    method_name = xform_name(operation_name)
+    return {
+        'name': method_name,
+        'description': _summary(operation.documentation),
+        'request_syntax': _request_syntax(method_name, operation.input_shape),
+        'response_syntax': _response_syntax(operation.output_shape),
+        'parameters': _parameters(operation.input_shape),
+        'response_structure': _response_structure(operation.output_shape),
+        'service': service_model.service_name
+    }
+
+
+def build_service_docs(service_name: str) -> Optional[Dict]:
+    """
+    Build service documentation from the botocore service model installed
+    with boto3, without any network access
+
+    Args:
+        service_name: AWS service (e.g., 'ec2', 's3', 'lambda')
+
+    Returns:
+        Dictionary with service documentation (same layout as
+        scrape_service_docs), or None if botocore has no model for the service
+    """
+    try:
+        service_model = _get_session().get_service_model(service_name)
+    except botocore.exceptions.UnknownServiceError:
+        print(f"No botocore model for {service_name}")
+        return None
+
+    started = time.perf_counter()
+    methods = [build_method_docs(service_model, name) for name in service_model.operation_names]
+    methods.sort(key=lambda m: m['name'])
+
+    print(f"Built {len(methods)} methods for {service_name} from botocore {botocore.__version__} "
+          f"in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return {
+        'service': service_name,
+        'url': f"{base_url}/{service_name}.html",
+        'methods': methods,
+        'examples': [],
+        'timestamp': time.time(),
+        'source': 'botocore',
+        'botocore_version': botocore.__version__
+    }
+
+
+if __name__ == "__main__":
+    import sys
+    import json
+
+    docs = build_service_docs(sys.argv[1] if len(sys.argv) > 1 else "sqs")
+    if docs:
+        print(json.dumps(docs['methods'][0], indent=2))
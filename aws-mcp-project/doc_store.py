@@ -0,0 +1,157 @@
+import os
+import mmap
+import json
+import zlib
+import struct
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# File layout:
+#   MAGIC | header length (u64 little-endian) | header JSON | method records
+# The header holds everything except the methods, plus a name -> (offset,
+# length) index into the record area; every method record is zlib'd JSON, so
+# one method is read by slicing the mapped file and decoding only that record.
+MAGIC = b"AWSDOCS1"
+_LENGTH = struct.Struct("<Q")
+
+# Decoded services kept in memory
+MAX_SERVICES = int(os.getenv("AWS_DOCS_CACHE_SERVICES", "16"))
+
+
+def _version(stat: os.stat_result) -> tuple:
+    # Rewrites go through a rename, so the inode changes even within one mtime tick
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def write_service_docs(path: Path, docs: Dict):
+    """
+    Write service docs in the indexed binary format (atomically)
+
+    Args:
+        path: Destination file (conventionally <service>_docs.bin)
+        docs: Service docs as returned by build_service_docs / scrape_service_docs
+    """
+    records = []
+    index = {}
+    offset = 0
+    for method in docs.get('methods', []):
+        record = zlib.compress(json.dumps(method, separators=(',', ':')).encode('utf-8'))
+        index[method['name']] = [offset, len(record)]
+        records.append(record)
+        offset += len(record)
+
+    header = {k: v for k, v in docs.items() if k != 'methods'}
+    header['method_index'] = index
+    header['method_names'] = [method['name'] for method in docs.get('methods', [])]
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+
+    path = Path(path)
+    tmp = path.with_suffix('.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(MAGIC)
+        f.write(_LENGTH.pack(len(header_bytes)))
+        f.write(header_bytes)
+        for record in records:
+            f.write(record)
+    tmp.replace(path)
+
+
+class ServiceDocs:
+    """Memory-mapped docs of one service; methods are decoded on demand"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self.version = _version(os.fstat(f.fileno()))
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._map[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{self.path} is not a docs file")
+        header_start = len(MAGIC) + _LENGTH.size
+        (header_length,) = _LENGTH.unpack(self._map[len(MAGIC):header_start])
+        self.header = json.loads(self._map[header_start:header_start + header_length])
+        self._records_start = header_start + header_length
+        self._index = self.header.pop('method_index')
+        self.method_names: List[str] = self.header.pop('method_names')
+        self._json = None
+
+    def __len__(self):
+        return len(self.method_names)
+
+    def __contains__(self, name: str):
+        return name in self._index
+
+    def method(self, name: str) -> Optional[Dict]:
+        """One method record, or None if the service has no such method"""
+        entry = self._index.get(name)
+        if entry is None:
+            return None
+        start = self._records_start + entry[0]
+        return json.loads(zlib.decompress(self._map[start:start + entry[1]]))
+
+    def methods(self, start: int = 0, stop: Optional[int] = None) -> List[Dict]:
+        """Method records in stored order, decoding only the requested slice"""
+        return [self.method(name) for name in self.method_names[start:stop]]
+
+    def to_dict(self) -> Dict:
+        """Full docs dict, same layout as the one written"""
+        return {**self.header, 'methods': self.methods()}
+
+    def to_json(self) -> str:
+        """Serialized full docs, built once per file version"""
+        if self._json is None:
+            self._json = json.dumps(self.to_dict())
+        return self._json
+
+
+class DocStore:
+    """LRU of opened service docs, reopened when a file is rewritten"""
+
+    def __init__(self, max_services: int = MAX_SERVICES):
+        self.max_services = max_services
+        self._lock = threading.Lock()
+        self._services: "OrderedDict[str, ServiceDocs]" = OrderedDict()
+
+    def get(self, path: Path) -> Optional[ServiceDocs]:
+        """
+        Open (or reuse) the docs stored at path
+
+        Returns:
+            ServiceDocs, or None if the file does not exist
+        """
+        key = str(path)
+        try:
+            version = _version(os.stat(key))
+        except FileNotFoundError:
+            return None
+
+        with self._lock:
+            docs = self._services.get(key)
+            if docs is not None and docs.version == version:
+                self._services.move_to_end(key)
+                return docs
+
+        docs = ServiceDocs(Path(path))
+        with self._lock:
+            self._services[key] = docs
+            self._services.move_to_end(key)
+            while len(self._services) > self.max_services:
+                self._services.popitem(last=False)
+        return docs
+
+    def invalidate(self, path: Path):
+        with self._lock:
+            self._services.pop(str(path), None)
+
+
+def load_docs(path: Path) -> Optional[Dict]:
+    """Full docs dict from either the binary format or a legacy <service>_docs.json"""
+    path = Path(path)
+    if not path.exists():
+        return None
+    if path.suffix == '.json':
+        with open(path, 'r') as f:
+            return json.load(f)
+    return ServiceDocs(path).to_dict()
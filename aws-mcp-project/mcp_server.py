@@ -1,6 +1,7 @@
 import os
 import json
 import re
+import time
 import asyncio
 from typing import Dict, List, Set
 from pathlib import Path
@@ -10,6 +11,10 @@ from fastmcp import FastMCP
 import boto3
 from dotenv import load_dotenv
 from utils import scrape_service_docs
+from botocore_docs import build_service_docs
+from search_index import SearchIndex
+from doc_store import DocStore, load_docs, write_service_docs
+import botocore
 
 load_dotenv()
 
@@ -18,8 +23,15 @@ mcp = FastMCP("AWS Auto-Doc Server")
 RESOURCES_DIR = Path("./aws_resources")
 RESOURCES_DIR.mkdir(exist_ok=True)
 
+# "botocore" builds docs from the installed SDK's service models and only
+# scrapes the HTML reference for services it has no model for; "html" always scrapes
+DOCS_BACKEND = os.getenv("AWS_DOCS_BACKEND", "botocore")
+
 resource_index = {}
 
+# Opened <service>_docs.bin files, most recently used last
+doc_store = DocStore()
+
 class ResourceManager:
     """Manages FastMCP resources and determines when to scrape"""
     
@@ -62,10 +74,8 @@ class ResourceManager:
             has_resources = service in resource_index
             
             if has_resources:
-                # Check if resources are recent (less than 7 days old)
-                timestamp = resource_index[service].get('timestamp', 0)
-                age_days = (asyncio.get_event_loop().time() - timestamp) / 86400
-                has_resources = age_days < 7
+                # Check if resources are recent (less than 7 days old, or built from the installed botocore)
+                has_resources = not self._is_stale(service)
             
             result[service] = has_resources
         
@@ -96,39 +106,91 @@ class ResourceManager:
         
         return detected_services
     
-    async def ensure_resources(self, services: List[str]) -> Dict[str, str]:
+    def _load_previous_docs(self, service: str):
+        """Last scrape of a service, used to refresh it incrementally"""
+        if service not in resource_index:
+            return None
+        try:
+            return load_docs(Path(resource_index[service]['file']))
+        except ValueError:
+            return None
+    
+    def get_docs(self, service: str):
+        """
+        Stored docs of a service, memory-mapped so single methods load without
+        decoding the rest
+        
+        Returns:
+            doc_store.ServiceDocs, or None if the service has no docs yet
+        """
+        if service not in resource_index:
+            return None
+        resource_file = Path(resource_index[service]['file'])
+        
+        if resource_file.suffix == '.json' and resource_file.exists():
+            # Convert docs saved before the binary format once
+            with open(resource_file, 'r') as f:
+                docs = json.load(f)
+            resource_file = resource_file.with_suffix('.bin')
+            write_service_docs(resource_file, docs)
+            resource_index[service]['file'] = str(resource_file)
+            self.save_resource_index()
+        
+        return doc_store.get(resource_file)
+    
+    async def ensure_resources(self, services: List[str], full_refresh: bool = False) -> Dict[str, str]:
         """
         Ensure resources exist for given services, scraping if necessary
         
+        Stale services are refreshed incrementally: unchanged pages are
+        answered with 304 or matched by content hash and not parsed again.
+        
         Args:
             services: List of AWS service names
+            full_refresh: Re-download and re-parse every page of stale services
         
         Returns:
             Dict mapping service -> resource_uri
         """
         results = {}
+        updated = False
         
         for service in services:
             if service not in resource_index or self._is_stale(service):
-                print(f"Scraping documentation for {service}...")
+                previous = None if full_refresh else self._load_previous_docs(service)
+                print(f"{'Refreshing' if previous else 'Scraping'} documentation for {service}...")
+                
+                docs = None
+                if DOCS_BACKEND == "botocore":
+                    docs = await asyncio.to_thread(build_service_docs, service)
                 
-                # Scrape documentation
-                docs = scrape_service_docs(service)
+                if docs is None:
+                    # Scrape documentation off the event loop; method pages are fetched concurrently
+                    docs = await asyncio.to_thread(scrape_service_docs, service, previous=previous)
 
-                print(docs)
+                if docs:
+                    print(f"{service}: {len(docs['methods'])} methods from {docs.get('source', 'html')}")
                 
                 if docs:
                     # Save to disk
-                    resource_file = RESOURCES_DIR / f"{service}_docs.json"
-                    with open(resource_file, 'w') as f:
-                        json.dump(docs, f, indent=2)
+                    resource_file = RESOURCES_DIR / f"{service}_docs.bin"
+                    write_service_docs(resource_file, docs)
                     
                     # Update index
                     resource_index[service] = {
                         'file': str(resource_file),
                         'timestamp': docs['timestamp'],
-                        'method_count': len(docs['methods'])
+                        'method_count': len(docs['methods']),
+                        'source': docs.get('source', 'html')
                     }
+                    if 'refresh' in docs:
+                        resource_index[service]['refresh'] = docs['refresh']
+                    if 'botocore_version' in docs:
+                        resource_index[service]['botocore_version'] = docs['botocore_version']
+                    
+                    # Make the new docs searchable
+                    search_index.add_service(service, docs)
+                    updated = True
                     
                     # Register as MCP resource
                     self._register_resource(service, resource_file)
@@ -139,16 +201,22 @@ class ResourceManager:
             else:
                 results[service] = f"aws://{service}/docs"
         
-        self.save_resource_index()
+        # Lookups of services that are already cached don't rewrite anything
+        if updated:
+            self.save_resource_index()
+            search_index.save()
         return results
     
     def _is_stale(self, service: str) -> bool:
-        """Check if service documentation is stale (>7 days old)"""
+        """Check if service documentation is stale (>7 days old, or built from another botocore version)"""
         if service not in resource_index:
             return True
         
+        if resource_index[service].get('source') == 'botocore':
+            return resource_index[service].get('botocore_version') != botocore.__version__
+        
         timestamp = resource_index[service].get('timestamp', 0)
-        age_days = (asyncio.get_event_loop().time() - timestamp) / 86400
+        age_days = (time.time() - timestamp) / 86400
         return age_days > 7
     
     def _register_resource(self, service: str, resource_file: Path):
@@ -160,6 +228,7 @@ class ResourceManager:
 
 # Initialize scraper and resource manager
 resource_manager = ResourceManager()
+search_index = SearchIndex(RESOURCES_DIR / "search_index.pkl")
 
 # MCP Tools
 
@@ -189,17 +258,18 @@ async def check_aws_resources(query: str) -> dict:
 
 
 @mcp.tool()
-async def scrape_aws_documentation(services: list) -> dict:
+async def scrape_aws_documentation(services: list, full_refresh: bool = False) -> dict:
     """
     Scrape AWS SDK documentation for specified services and create MCP resources.
     
     Args:
         services: List of AWS service names (e.g., ['ec2', 's3'])
+        full_refresh: Re-parse every page of stale services instead of refreshing incrementally
     
     Returns:
         Dict with scraping results and resource URIs
     """
-    results = await resource_manager.ensure_resources(services)
+    results = await resource_manager.ensure_resources(services, full_refresh=full_refresh)
     
     return {
         'scraped_services': services,
@@ -209,13 +279,15 @@ async def scrape_aws_documentation(services: list) -> dict:
 
 
 @mcp.tool()
-async def get_aws_service_methods(service: str) -> dict:
+async def get_aws_service_methods(service: str, method: str = None) -> dict:
     """
-    Get all available methods/operations for an AWS service.
+    Get all available methods/operations for an AWS service, or the full
+    documentation of one method.
     Scrapes documentation if not already cached.
     
     Args:
         service: AWS service name (e.g., 'ec2', 's3')
+        method: Optional method name (e.g., 'describe_instances') to return only that method
     
     Returns:
         Dict with service methods and their descriptions
@@ -223,20 +295,61 @@ async def get_aws_service_methods(service: str) -> dict:
     # Ensure we have resources
     await resource_manager.ensure_resources([service])
     
-    # Load from disk
-    resource_file = RESOURCES_DIR / f"{service}_docs.json"
-    if resource_file.exists():
-        with open(resource_file, 'r') as f:
-            docs = json.load(f)
-        
+    # Only the requested records are decoded
+    docs = resource_manager.get_docs(service)
+    if docs is None:
+        return {'error': f'Could not load documentation for {service}'}
+    
+    if method:
+        record = docs.method(method)
+        if record is None:
+            return {'error': f'{service} has no method {method}; use search_aws_operations to find it'}
         return {
             'service': service,
-            'method_count': len(docs['methods']),
-            'methods': docs['methods'][:20],  # Return first 20 methods
-            'documentation_url': docs['url']
+            'method': record,
+            'documentation_url': docs.header['url']
         }
     
-    return {'error': f'Could not load documentation for {service}'}
+    return {
+        'service': service,
+        'method_count': len(docs),
+        'methods': docs.methods(0, 20),  # Return first 20 methods
+        'documentation_url': docs.header['url']
+    }
+
+
+@mcp.tool()
+async def search_aws_operations(query: str, service: str = None, limit: int = 10) -> dict:
+    """
+    Find AWS operations by what they do, ranked by relevance (BM25 with
+    fuzzy matching for misspelled words). Use this instead of guessing
+    operation names.
+    
+    Args:
+        query: What you want to do (e.g. 'attach an EBS volume to an instance')
+        service: Optional AWS service name to search within (e.g. 'ec2')
+        limit: Maximum number of operations to return (default 10)
+    
+    Returns:
+        Dict with ranked operations and their parameter schemas
+    """
+    started = time.perf_counter()
+    if service and service not in resource_index:
+        await resource_manager.ensure_resources([service])
+    
+    # Picks up docs written by earlier runs or other processes
+    search_index.sync(resource_index)
+    
+    if service and service not in search_index.segments:
+        return {'error': f'No documentation available for {service}'}
+    
+    result = search_index.search(query, service=service, limit=limit)
+    return {
+        'query': query,
+        'service': service,
+        **result,
+        'took_ms': round((time.perf_counter() - started) * 1000, 2)
+    }
 
 
 @mcp.tool()
@@ -333,20 +446,18 @@ async def list_available_resources() -> dict:
 @mcp.resource("aws://ec2/docs")
 async def get_ec2_docs() -> str:
     """EC2 service documentation"""
-    resource_file = RESOURCES_DIR / "ec2_docs.json"
-    if resource_file.exists():
-        with open(resource_file, 'r') as f:
-            return json.dumps(json.load(f), indent=2)
+    docs = resource_manager.get_docs("ec2")
+    if docs is not None:
+        return docs.to_json()
     return json.dumps({'error': 'EC2 docs not yet scraped'})
 
 
 @mcp.resource("aws://s3/docs")
 async def get_s3_docs() -> str:
     """S3 service documentation"""
-    resource_file = RESOURCES_DIR / "s3_docs.json"
-    if resource_file.exists():
-        with open(resource_file, 'r') as f:
-            return json.dumps(json.load(f), indent=2)
+    docs = resource_manager.get_docs("s3")
+    if docs is not None:
+        return docs.to_json()
     return json.dumps({'error': 'S3 docs not yet scraped'})
 
 
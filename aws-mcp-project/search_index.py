@@ -0,0 +1,310 @@
+import re
+import math
+import pickle
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from doc_store import load_docs
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Term frequency weight per field, so a word in the method name counts more
+# than the same word deep in a parameter description
+FIELD_WEIGHTS = {
+    'name': 4.0,
+    'description': 2.0,
+    'param_names': 2.0,
+    'param_docs': 1.0,
+}
+
+# Extra weight for operations whose name is made of the query's words
+# (stop_instances for "stop instance" over stop_db_instance)
+NAME_BOOST = 2.0
+
+# Fuzzy matching of query words missing from the vocabulary (typos).
+# Trigram overlap misses swapped letters ('instnace' shares a third of its
+# trigrams with 'instance'), so a term within FUZZY_EDITS_PER_CHARS edits
+# per character (a transposition is one edit) also matches
+FUZZY_THRESHOLD = 0.45
+FUZZY_EDITS_PER_CHARS = 4
+FUZZY_EXPANSIONS = 3
+
+PARAM_DOC_CHARS = 200
+INDEX_VERSION = 1
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'how', 'i', 'in', 'is', 'it',
+    'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'what', 'when', 'which', 'with', 'you',
+}
+
+_WORD = re.compile(r"[A-Za-z0-9]+")
+_CAMEL = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+
+def _stem(word: str) -> str:
+    """Plural folding only: instances -> instance, policies -> policy"""
+    if len(word) > 4 and word.endswith('ies'):
+        return word[:-3] + 'y'
+    if len(word) > 3 and word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+        return word[:-1]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, stemmed words; snake_case and CamelCase identifiers are split"""
+    tokens = []
+    for word in _WORD.findall(text or ""):
+        for part in _CAMEL.findall(word):
+            part = part.lower()
+            if part not in STOPWORDS:
+                tokens.append(_stem(part))
+    return tokens
+
+
+def _trigrams(term: str) -> set:
+    padded = f"${term}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance counting an adjacent transposition as one edit"""
+    before, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (a[i - 1] != b[j - 1]),
+            )
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], before[j - 2] + 1)
+        before, previous = previous, current
+    return previous[-1]
+
+
+class ServiceSegment:
+    """Inverted index over one service's methods"""
+
+    def __init__(self, service: str, timestamp: float, docs: Dict):
+        self.service = service
+        self.timestamp = timestamp
+        self.methods = []
+        self.lengths = []
+        self.names = []
+        self.postings = defaultdict(lambda: ([], []))
+
+        for method in docs.get('methods', []):
+            fields = {
+                'name': tokenize(method.get('name', '')),
+                'description': tokenize(method.get('description', '')),
+                'param_names': tokenize(" ".join(p.get('name', '') for p in method.get('parameters', []))),
+                'param_docs': tokenize(" ".join(p.get('description', '') for p in method.get('parameters', []))),
+            }
+            weights = defaultdict(float)
+            for field, tokens in fields.items():
+                for token in tokens:
+                    weights[token] += FIELD_WEIGHTS[field]
+
+            doc_id = len(self.methods)
+            for token, weight in weights.items():
+                ids, tfs = self.postings[token]
+                ids.append(doc_id)
+                tfs.append(weight)
+            self.lengths.append(sum(weights.values()))
+            self.names.append(frozenset(fields['name']))
+            self.methods.append(self._summary(method))
+
+        self.postings = dict(self.postings)
+
+        # Vocabulary by trigram for fuzzy matching
+        trigrams = defaultdict(list)
+        for token in self.postings:
+            for gram in _trigrams(token):
+                trigrams[gram].append(token)
+        self.trigrams = dict(trigrams)
+
+    def _summary(self, method: Dict) -> Dict:
+        """What a search hit returns: the operation and its parameter schema"""
+        return {
+            'service': self.service,
+            'operation': method.get('name'),
+            'description': method.get('description', ''),
+            'parameters': [
+                {
+                    'name': p.get('name'),
+                    'type': p.get('type'),
+                    'required': p.get('required', False),
+                    'description': p.get('description', '')[:PARAM_DOC_CHARS]
+                }
+                for p in method.get('parameters', [])
+            ]
+        }
+
+
+class SearchIndex:
+    """
+    BM25 index over the cached docs of every service in aws_resources, with
+    trigram and edit-distance fuzzy matching for query words that appear in
+    no method.
+
+    The index is split into one segment per service, rebuilt only when that
+    service's docs change, and pickled next to index.json.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.segments: Dict[str, ServiceSegment] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'rb') as f:
+                data = pickle.load(f)
+            if data.get('version') == INDEX_VERSION:
+                self.segments = data['segments']
+        except Exception as e:
+            print(f"Ignoring unreadable search index {self.path}: {e}")
+            self.segments = {}
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp = self.path.with_suffix('.tmp')
+            with open(tmp, 'wb') as f:
+                pickle.dump({'version': INDEX_VERSION, 'segments': self.segments}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(self.path)
+            self._dirty = False
+
+    def add_service(self, service: str, docs: Dict, timestamp: Optional[float] = None):
+        """Index (or re-index) one service's docs; timestamp defaults to the docs' own"""
+        segment = ServiceSegment(service, docs.get('timestamp', 0) if timestamp is None else timestamp, docs)
+        with self._lock:
+            self.segments[service] = segment
+            self._dirty = True
+
+    def sync(self, resource_index: Dict):
+        """Index services whose docs were written or replaced since their segment was built"""
+        changed = False
+        for service, entry in resource_index.items():
+            segment = self.segments.get(service)
+            if segment is not None and segment.timestamp == entry.get('timestamp'):
+                continue
+            docs = load_docs(Path(entry['file']))
+            if docs is None:
+                continue
+            self.add_service(service, docs, entry.get('timestamp'))
+            changed = True
+
+        for service in set(self.segments) - set(resource_index):
+            with self._lock:
+                del self.segments[service]
+                self._dirty = True
+            changed = True
+
+        if changed:
+            self.save()
+
+    def _fuzzy(self, term: str, segments: List[ServiceSegment]) -> List[tuple]:
+        """(vocabulary term, similarity) pairs sharing enough trigrams with term or a few edits away"""
+        grams = _trigrams(term)
+        candidates = defaultdict(set)
+        for segment in segments:
+            for gram in grams:
+                for token in segment.trigrams.get(gram, ()):
+                    candidates[token].add(gram)
+
+        max_edits = max(1, len(term) // FUZZY_EDITS_PER_CHARS)
+        matches = []
+        for token, shared in candidates.items():
+            count = len(shared)
+            similarity = count / (len(grams) + len(_trigrams(token)) - count)
+            if abs(len(token) - len(term)) <= max_edits:
+                edits = _edit_distance(term, token)
+                if edits <= max_edits:
+                    similarity = max(similarity, 1 - edits / max(len(term), len(token)))
+            if similarity >= FUZZY_THRESHOLD:
+                matches.append((token, similarity))
+        matches.sort(key=lambda m: -m[1])
+        return matches[:FUZZY_EXPANSIONS]
+
+    def search(self, query: str, service: Optional[str] = None, limit: int = 10) -> Dict:
+        """
+        Rank operations against a free-text query
+
+        Args:
+            query: Words describing the operation (e.g. 'attach volume to instance')
+            service: Only search this service
+            limit: Maximum results
+
+        Returns:
+            Dict with ranked results and any fuzzy term corrections
+        """
+        segments = [self.segments[service]] if service else list(self.segments.values())
+        segments = [s for s in segments if s.methods]
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not segments or not terms:
+            return {'results': [], 'total_matches': 0}
+
+        doc_count = sum(len(s.methods) for s in segments)
+        avg_length = sum(sum(s.lengths) for s in segments) / doc_count
+
+        # Query words nobody uses are replaced by their closest vocabulary terms
+        weighted_terms = []
+        corrections = {}
+        for term in terms:
+            if any(term in s.postings for s in segments):
+                weighted_terms.append((term, 1.0))
+                continue
+            matches = self._fuzzy(term, segments)
+            if matches:
+                corrections[term] = [m[0] for m in matches]
+            weighted_terms.extend(matches)
+
+        scores = {}
+        idfs = {}
+        for term, term_weight in weighted_terms:
+            df = sum(len(s.postings[term][0]) for s in segments if term in s.postings)
+            idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5)) * term_weight
+            for segment in segments:
+                posting = segment.postings.get(term)
+                if posting is None:
+                    continue
+                lengths = segment.lengths
+                for doc_id, tf in zip(*posting):
+                    norm = tf + K1 * (1 - B + B * lengths[doc_id] / avg_length)
+                    key = (segment.service, doc_id)
+                    scores[key] = scores.get(key, 0.0) + idf * tf * (K1 + 1) / norm
+            idfs[term] = idf
+
+        for key in scores:
+            name = self.segments[key[0]].names[key[1]]
+            matched = [idfs[term] for term, _ in weighted_terms if term in name]
+            if matched:
+                coverage = len(matched) / len(name)
+                scores[key] += NAME_BOOST * coverage * coverage * sum(matched)
+
+        ranked = sorted(scores.items(), key=lambda item: -item[1])[:limit]
+        results = [
+            {**self.segments[service_name].methods[doc_id], 'score': round(score, 3)}
+            for (service_name, doc_id), score in ranked
+        ]
+        response = {'results': results, 'total_matches': len(scores)}
+        if corrections:
+            response['corrections'] = corrections
+        return response
+
+    def stats(self) -> Dict:
+        return {
+            service: {'methods': len(segment.methods), 'terms': len(segment.postings)}
+            for service, segment in self.segments.items()
+        }
@@ -1,60 +1,219 @@
 import os
 import json
 import re
+import time
+import hashlib
+import random
 import asyncio
-from typing import Dict, List, Set
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Set
 from pathlib import Path
+from urllib.parse import urlsplit
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from fastmcp import FastMCP
 import boto3
 from dotenv import load_dotenv
 import re
 
-base_url = "https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services"
-session = requests.Session()
-session.headers.update({
+load_dotenv()
+
+base_url = os.getenv("AWS_DOCS_BASE_URL", "https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services")
+
+# Scraping limits
+MAX_WORKERS = int(os.getenv("AWS_DOCS_MAX_WORKERS", "16"))
+MAX_PER_HOST = int(os.getenv("AWS_DOCS_MAX_PER_HOST", "8"))
+MIN_HOST_INTERVAL = float(os.getenv("AWS_DOCS_MIN_HOST_INTERVAL", "0.02"))  # seconds between requests to one host
+MAX_RETRIES = int(os.getenv("AWS_DOCS_MAX_RETRIES", "4"))
+BACKOFF_BASE = float(os.getenv("AWS_DOCS_BACKOFF_BASE", "0.5"))
+BACKOFF_MAX = 30.0
+REQUEST_TIMEOUT = float(os.getenv("AWS_DOCS_REQUEST_TIMEOUT", "30"))
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+CHECKPOINT_DIR = Path(os.getenv("AWS_DOCS_CHECKPOINT_DIR", "./aws_resources/checkpoints"))
+
+HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-})
+}
+
+# requests.Session is not thread-safe, so every worker thread gets its own
+_local = threading.local()
+
+
+def _session() -> requests.Session:
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(HEADERS)
+        session.mount("https://", HTTPAdapter(pool_maxsize=MAX_PER_HOST))
+        session.mount("http://", HTTPAdapter(pool_maxsize=MAX_PER_HOST))
+        _local.session = session
+    return session
+
+
+class HostLimiter:
+    """Caps concurrent requests per host and spaces out their start times"""
+
+    def __init__(self, max_concurrent: int, min_interval: float):
+        self.max_concurrent = max_concurrent
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._hosts = {}
+
+    @contextmanager
+    def slot(self, url: str):
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = [threading.Semaphore(self.max_concurrent), 0.0]
+            state = self._hosts[host]
+
+        with state[0]:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, state[1])
+                state[1] = start + self.min_interval
+            if start > now:
+                time.sleep(start - now)
+            yield
+
+
+host_limiter = HostLimiter(MAX_PER_HOST, MIN_HOST_INTERVAL)
+
+
+def _retry_delay(attempt: int, response: Optional[requests.Response] = None) -> float:
+    """Retry-After when the server sent one, else exponential backoff with jitter"""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), BACKOFF_MAX)
+    return min(BACKOFF_BASE * (2 ** attempt), BACKOFF_MAX) * random.uniform(0.5, 1.0)
+
+
+def fetch(url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    """
+    GET a documentation page politely, retrying connection errors,
+    timeouts, throttling and 5xx responses with backoff
+
+    Args:
+        url: Page URL
+        headers: Extra request headers (e.g. conditional GET validators)
+
+    Raises:
+        requests.exceptions.RequestException once retries are exhausted
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            with host_limiter.slot(url):
+                response = _session().get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if attempt == MAX_RETRIES:
+                raise
+            time.sleep(_retry_delay(attempt))
+            continue
+
+        if response.status_code in RETRY_STATUSES and attempt < MAX_RETRIES:
+            time.sleep(_retry_delay(attempt, response))
+            continue
+        response.raise_for_status()
+        return response
+
+def _conditional_headers(page: Optional[Dict]) -> Dict[str, str]:
+    """If-None-Match / If-Modified-Since from a page's stored validators"""
+    headers = {}
+    if page:
+        if page.get('etag'):
+            headers['If-None-Match'] = page['etag']
+        if page.get('last_modified'):
+            headers['If-Modified-Since'] = page['last_modified']
+    return headers
+
+
+def _page_info(url: str, response: requests.Response) -> Dict:
+    """Validators and content hash stored per page for the next refresh"""
+    return {
+        'url': url,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'hash': hashlib.sha256(response.content).hexdigest()
+    }
 
-def scrape_service_docs(service_name: str) -> Dict:
+
+def scrape_service_docs(service_name: str, docs_url: Optional[str] = None, max_workers: Optional[int] = None,
+                        previous: Optional[Dict] = None) -> Dict:
     """
     Scrape documentation for a specific AWS service
     
+    Method pages are fetched concurrently and checkpointed as they arrive, so
+    a scrape that fails or is interrupted part-way resumes where it stopped.
+    
+    Given the previous scrape, every page is requested conditionally
+    (ETag / Last-Modified) and only pages whose content hash changed are
+    parsed again; everything else is carried over from previous.
+    
     Args:
         service_name: AWS service (e.g., 'ec2', 's3', 'lambda')
+        docs_url: Documentation root (defaults to base_url / AWS_DOCS_BASE_URL)
+        max_workers: Concurrent method page fetches (defaults to AWS_DOCS_MAX_WORKERS)
+        previous: Earlier result of this function for an incremental refresh
     
     Returns:
         Dictionary with service documentation
     """
     
-    url = f"{base_url}/{service_name}.html"
+    docs_url = docs_url or base_url
+    url = f"{docs_url}/{service_name}.html"
+    
+    # Validators are only reusable for the same URL
+    if previous and previous.get('url') != url:
+        previous = None
+    previous_index = (previous or {}).get('index_page')
     
     try:
         print(f"Fetching documentation from {url}")
-        response = session.get(url, timeout=30)
-        response.raise_for_status()
+        response = fetch(url, headers=_conditional_headers(previous_index))
+        stats = {'index_not_modified': False, 'not_modified': 0, 'unchanged': 0, 'parsed': 0,
+                 'bytes': len(response.content)}
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        if response.status_code == 304:
+            # Same method list and examples as last time
+            stats['index_not_modified'] = True
+            index_page = previous_index
+            pages = previous.get('pages', {})
+            method_and_urls = [{"name": m['name'], "url": pages[m['name']]['url']}
+                               for m in previous['methods'] if m['name'] in pages]
+            examples = previous['examples']
+        else:
+            index_page = _page_info(url, response)
+            soup = BeautifulSoup(response.text, 'html.parser')
+            method_and_urls = [{"name": m["name"], "url": f"{docs_url}/{m['url']}"}
+                               for m in _extract_methods_and_their_urls(soup=soup)]
+            examples = _extract_examples(soup)
         
         # Extract methods/operations
-        methods = _extract_methods(soup, service_name)
+        extracted = _extract_methods(method_and_urls, service_name, max_workers or MAX_WORKERS, previous, stats)
+        if extracted is None:
+            return None
+        methods, pages = extracted
         
         if not methods:
             print(f"Warning: No methods extracted for {service_name}. This might indicate a documentation format change.")
         
-        # Extract examples
-        examples = _extract_examples(soup)
-        
         result = {
             'service': service_name,
             'url': url,
             'methods': methods,
             'examples': examples,
-            'timestamp': asyncio.get_event_loop().time()
+            'timestamp': time.time(),
+            'index_page': index_page,
+            'pages': pages,
+            'refresh': stats
         }
         
-        print(f"Successfully scraped {len(methods)} methods and {len(examples)} examples for {service_name}")
+        print(f"Successfully scraped {len(methods)} methods and {len(examples)} examples for {service_name} "
+              f"({stats['parsed']} parsed, {stats['unchanged']} unchanged, {stats['not_modified']} not modified)")
         return result
     
     except requests.exceptions.RequestException as e:
@@ -248,25 +407,109 @@ def _parse_response_structure(ul_element) -> Dict:
     
     return structure
 
-def _extract_methods(soup: BeautifulSoup, service_name: str) -> List[Dict]:
-    method_and_urls = _extract_methods_and_their_urls(soup=soup)
+def _checkpoint_path(service_name: str) -> Path:
+    return CHECKPOINT_DIR / f"{service_name}.jsonl"
 
-    methods = []
 
-    for method_obj in method_and_urls:
-        name, url = method_obj.values()
-        url = f"{base_url}/{url}"
+def _load_checkpoint(service_name: str) -> Dict[str, Dict]:
+    """Method records and page info saved by an earlier, unfinished scrape of this service"""
+    path = _checkpoint_path(service_name)
+    done = {}
+    if not path.exists():
+        return done
+    with open(path, 'r') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Torn last line from an interrupted write
+                continue
+            done[entry['method']['name']] = entry
+    return done
 
-        print(f"Fetching documentation from {url}")
 
-        response = session.get(url, timeout=30)
-        response.raise_for_status()
-        method_soup = BeautifulSoup(response.text, 'html.parser')
+def _scrape_method(name: str, url: str, service_name: str, previous_method: Optional[Dict],
+                   previous_page: Optional[Dict]) -> tuple:
+    """
+    Fetch one method page, conditionally when it was scraped before.
+    
+    Returns:
+        (method record, page info, outcome, bytes downloaded) where outcome is
+        'not_modified', 'unchanged' or 'parsed'
+    """
+    if previous_method is None or previous_page is None or previous_page.get('url') != url:
+        previous_method = previous_page = None
 
-        method_details = _extract_method_details(soup=method_soup, method_name=name, service_name=service_name)
-        methods.append(method_details)
+    response = fetch(url, headers=_conditional_headers(previous_page))
+    if response.status_code == 304:
+        return previous_method, previous_page, 'not_modified', 0
 
-    return methods
+    page = _page_info(url, response)
+    if previous_page is not None and previous_page.get('hash') == page['hash']:
+        # Server ignored the validators (or rotated its ETag) but nothing changed
+        return previous_method, page, 'unchanged', len(response.content)
+
+    method_soup = BeautifulSoup(response.text, 'html.parser')
+    method_details = _extract_method_details(soup=method_soup, method_name=name, service_name=service_name)
+    return method_details, page, 'parsed', len(response.content)
+
+
+def _extract_methods(method_and_urls: List[Dict], service_name: str, max_workers: int,
+                     previous: Optional[Dict], stats: Dict) -> Optional[tuple]:
+    """
+    Fetch and parse every method page on a bounded thread pool.
+    
+    Returns:
+        (methods, pages) in index order, or None if any page still fails after
+        retries; the pages that did succeed stay in the checkpoint for the
+        next attempt.
+    """
+    previous_methods = {m['name']: m for m in (previous or {}).get('methods', [])}
+    previous_pages = (previous or {}).get('pages', {})
+
+    done = _load_checkpoint(service_name)
+    pending = [
+        (method_obj["name"], method_obj["url"])
+        for method_obj in method_and_urls
+        if method_obj["name"] not in done
+    ]
+    if done:
+        print(f"Resuming {service_name}: {len(done)} methods from checkpoint, {len(pending)} to fetch")
+
+    checkpoint = _checkpoint_path(service_name)
+    checkpoint.parent.mkdir(parents=True, exist_ok=True)
+    checkpoint_lock = threading.Lock()
+    failed = []
+
+    with open(checkpoint, 'a') as checkpoint_file, ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(_scrape_method, name, url, service_name, previous_methods.get(name), previous_pages.get(name)): (name, url)
+            for name, url in pending
+        }
+        for count, future in enumerate(as_completed(futures), 1):
+            name, url = futures[future]
+            try:
+                method_details, page, outcome, size = future.result()
+            except Exception as e:
+                print(f"Failed to fetch {url}: {e}")
+                failed.append(name)
+                continue
+            stats[outcome] += 1
+            stats['bytes'] += size
+            entry = done[name] = {'method': method_details, 'page': page}
+            with checkpoint_lock:
+                checkpoint_file.write(json.dumps(entry) + "\n")
+                checkpoint_file.flush()
+            if count % 50 == 0 or count == len(pending):
+                print(f"Fetched {count}/{len(pending)} method pages for {service_name}")
+
+    if failed:
+        print(f"{len(failed)} method pages of {service_name} failed; rerun to resume from the checkpoint")
+        return None
+
+    checkpoint.unlink(missing_ok=True)
+    names = [method_obj["name"] for method_obj in method_and_urls if method_obj["name"] in done]
+    return [done[name]['method'] for name in names], {name: done[name]['page'] for name in names}
 
 def _extract_examples(soup: BeautifulSoup) -> List[str]:
     """Extract code examples from documentation"""
@@ -0,0 +1,248 @@
+"""
+Doc scraper benchmark: sequential vs concurrent method page fetching in
+``aws-mcp-project/utils.py`` against a local fixture server, plus a scrape
+interrupted by an outage and resumed from its checkpoint, and incremental
+refreshes after a fraction of the pages changed.
+
+    python benchmarks/doc_scraper.py --methods 200 --latency-ms 40 --workers 1 4 16 --changed 0.05
+
+The fixture server renders boto3-style index and method pages (or serves
+saved pages from ``--pages DIR``, laid out as ``<service>.html`` and
+``<service>/client/<method>.html``), adds a fixed per-request latency and
+answers a fraction of first requests with 503 to exercise the retries.
+Pages carry an ETag and Last-Modified; the refresh is measured once with the
+server honouring conditional requests and once with it ignoring them, which
+leaves the per-page content hash to skip re-parsing.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SERVICE = "fixture"
+
+INDEX_PAGE = """<html><body><div class="section" id="client"><ul>
+{items}
+</ul></div></body></html>"""
+
+INDEX_ITEM = '<li class="toctree-l1"><a class="reference internal" href="{service}/client/{method}.html">{method}</a></li>'
+
+METHOD_PAGE = """<html><body><dl class="py method"><dt class="sig sig-object py">{service}.Client.{method}(**kwargs)</dt>
+<dd class="sig-object py">
+<p>Runs the {method} operation of the {service} fixture service (revision {revision}).</p>
+<p><strong>Request Syntax</strong></p>
+<div class="highlight-python notranslate"><div class="highlight"><pre>response = client.{method}(
+    ResourceId='string',
+    DryRun=True|False,
+    MaxResults=123
+)</pre></div></div>
+<p><strong>Response Syntax</strong></p>
+<div class="highlight-python notranslate"><div class="highlight"><pre>{{
+    'Items': [{{'ResourceId': 'string', 'State': 'string'}}],
+    'NextToken': 'string'
+}}</pre></div></div>
+<dl class="field-list simple">
+<dt class="field-odd">Parameters<span class="colon">:</span></dt>
+<dd class="field-odd"><ul class="simple">
+<li><p><strong>ResourceId</strong> (<em>string</em>) &#8211; <p>[REQUIRED]</p><p>The ID of the resource to {method}.</p></p></li>
+<li><p><strong>DryRun</strong> (<em>boolean</em>) &#8211; Checks whether you have the required permissions.</p></li>
+<li><p><strong>MaxResults</strong> (<em>integer</em>) &#8211; The maximum number of items to return.</p></li>
+</ul></dd>
+<dt class="field-even">Returns<span class="colon">:</span></dt>
+<dd class="field-even"><ul class="simple">
+<li><p><strong>Items</strong> <em>(list)</em> &#8211; The affected resources.</p></li>
+<li><p><strong>NextToken</strong> <em>(string)</em> &#8211; The token for the next page.</p></li>
+</ul></dd>
+</dl>
+</dd></dl></body></html>"""
+
+
+class FixtureServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, methods, latency, flaky, pages_dir=None):
+        super().__init__(("127.0.0.1", 0), FixtureHandler)
+        self.methods = methods
+        self.latency = latency
+        self.flaky = flaky
+        self.pages_dir = pages_dir
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.failed_once = set()
+        self.down_after = None  # Requests served before an outage starts
+        self.revisions = {}
+        self.validators = True
+        self.bytes = 0
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def reset(self, down_after=None):
+        with self.lock:
+            self.requests = 0
+            self.bytes = 0
+            self.failed_once.clear()
+            self.down_after = down_after
+
+    def render(self, path):
+        if self.pages_dir is not None:
+            page = self.pages_dir / path.lstrip("/")
+            return page.read_bytes() if page.is_file() else None
+        if path == f"/{SERVICE}.html":
+            items = "\n".join(INDEX_ITEM.format(service=SERVICE, method=m) for m in self.methods)
+            return INDEX_PAGE.format(items=items).encode()
+        prefix = f"/{SERVICE}/client/"
+        if path.startswith(prefix) and path.endswith(".html"):
+            method = path[len(prefix):-len(".html")]
+            if method in self.methods:
+                revision = self.revisions.get(method, 0)
+                return METHOD_PAGE.format(service=SERVICE, method=method, revision=revision).encode()
+        return None
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        time.sleep(server.latency)
+        with server.lock:
+            server.requests += 1
+            down = server.down_after is not None and server.requests > server.down_after
+            # Fail a stable subset of pages once each so every run sees the same retries
+            flaky = (
+                not down
+                and zlib.crc32(self.path.encode()) % 1000 < server.flaky * 1000
+                and self.path not in server.failed_once
+            )
+            if flaky:
+                server.failed_once.add(self.path)
+
+        if down or flaky:
+            self.send_error(503)
+            return
+        body = server.render(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        etag = f'"{zlib.crc32(body):08x}"'
+        if server.validators and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if server.validators:
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", "Mon, 06 Oct 2025 00:00:00 GMT")
+        self.end_headers()
+        self.wfile.write(body)
+        with server.lock:
+            server.bytes += len(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--methods", type=int, default=200, help="Method pages on the fixture index")
+    parser.add_argument("--latency-ms", type=float, default=40.0, help="Server-side delay per request")
+    parser.add_argument("--flaky", type=float, default=0.05, help="Fraction of pages answered 503 once")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--changed", type=float, default=0.05, help="Fraction of pages edited before a refresh")
+    parser.add_argument("--pages", type=Path, help="Serve saved pages from this directory instead")
+    parser.add_argument("--service", default=SERVICE, help="Service to scrape when using --pages")
+    args = parser.parse_args()
+
+    checkpoints = tempfile.TemporaryDirectory()
+    # Read by utils at import time
+    os.environ["AWS_DOCS_CHECKPOINT_DIR"] = checkpoints.name
+    os.environ.setdefault("AWS_DOCS_BACKOFF_BASE", "0.05")
+    os.environ.setdefault("AWS_DOCS_MAX_RETRIES", "3")
+    os.environ.setdefault("AWS_DOCS_MIN_HOST_INTERVAL", "0")
+    os.environ.setdefault("AWS_DOCS_MAX_PER_HOST", str(max(args.workers)))
+    sys.path.insert(0, str(ROOT / "aws-mcp-project"))
+    import utils
+
+    service = args.service if args.pages else SERVICE
+    methods = [f"operation_{i:04d}" for i in range(args.methods)]
+    server = FixtureServer(methods, args.latency_ms / 1000, args.flaky, args.pages)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    # The scraper logs every page; keep the table readable
+    devnull = open(os.devnull, "w")
+
+    def scrape(workers, previous=None):
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            started = time.perf_counter()
+            docs = utils.scrape_service_docs(service, docs_url=server.url, max_workers=workers, previous=previous)
+            return docs, time.perf_counter() - started
+        finally:
+            sys.stdout = stdout
+
+    print(f"{'workers':<9}{'methods':>9}{'requests':>10}{'seconds':>9}{'speedup':>9}")
+    baseline = full = None
+    for workers in args.workers:
+        server.reset()
+        docs, elapsed = scrape(workers)
+        if docs is None:
+            print(f"{workers:<9}{'failed':>9}{server.requests:>10}{elapsed:>9.2f}")
+            continue
+        baseline = baseline or elapsed
+        full = docs
+        print(f"{workers:<9}{len(docs['methods']):>9}{server.requests:>10}{elapsed:>9.2f}{baseline / elapsed:>8.1f}x")
+
+    if args.pages or full is None:
+        return
+
+    # Weekly refresh: edit a few pages, then refresh from the last full scrape
+    workers = max(args.workers)
+    server.flaky = 0
+    for method in methods[::max(1, round(1 / args.changed))] if args.changed else []:
+        server.revisions[method] = server.revisions.get(method, 0) + 1
+    server.reset()
+    _, full_elapsed = scrape(workers)
+    full_bytes = server.bytes
+    print()
+    print(f"{'refresh':<20}{'parsed':>8}{'unchanged':>11}{'304':>6}{'KB down':>9}{'seconds':>9}")
+    print(f"{'full':<20}{len(methods):>8}{0:>11}{0:>6}{full_bytes / 1024:>9.0f}{full_elapsed:>9.2f}")
+    for label, validators in (("conditional GET", True), ("content hash only", False)):
+        server.validators = validators
+        server.reset()
+        refreshed, elapsed = scrape(workers, previous=full)
+        stats = refreshed['refresh']
+        print(f"{label:<20}{stats['parsed']:>8}{stats['unchanged']:>11}{stats['not_modified']:>6}"
+              f"{server.bytes / 1024:>9.0f}{elapsed:>9.2f}")
+    server.validators = True
+
+    # Outage part-way through: the first run fails, the second resumes from the checkpoint
+    server.reset(down_after=args.methods // 2)
+    docs, elapsed = scrape(workers)
+    interrupted = server.requests
+    checkpoint = utils._checkpoint_path(service)
+    saved = sum(1 for _ in open(checkpoint)) if checkpoint.exists() else 0
+
+    server.reset()
+    resumed, resumed_elapsed = scrape(workers)
+    print()
+    print(f"interrupted run: {'failed' if docs is None else 'completed'} after {interrupted} requests, "
+          f"{saved} methods checkpointed")
+    print(f"resumed run:     {len(resumed['methods']) if resumed else 'failed'} methods with "
+          f"{server.requests} requests in {resumed_elapsed:.2f}s, checkpoint removed: {not checkpoint.exists()}")
+
+    server.shutdown()
+    checkpoints.cleanup()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
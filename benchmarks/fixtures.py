@@ -0,0 +1,445 @@
+"""
+Synthetic AWS responses for offline benchmarks.
+
+SyntheticAWS generates realistic, deterministic resources (instances with
+block devices, ENIs and tags; volumes; snapshots; VPCs; ...) and answers
+API calls through a botocore ``before-call`` hook on the pooled clients, so
+tools run their real code paths — pagination included — without any network
+traffic or credentials.
+"""
+
+import base64
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from botocore.awsrequest import AWSResponse
+
+from mcp_server.core.clients import get_client
+
+INSTANCE_TYPES = ["t3.micro", "t3.large", "m5.large", "m5.xlarge", "c6i.2xlarge", "r6g.large"]
+VOLUME_TYPES = ["gp3", "gp2", "io2", "st1"]
+STATES = ["running"] * 8 + ["stopped", "pending"]
+TEAMS = ["payments", "search", "ml", "platform", "web"]
+
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _ids(prefix: str, n: int) -> List[str]:
+    return [f"{prefix}-{i:017x}" for i in range(n)]
+
+
+def make_instances(n: int, region: str, seed: int = 1) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    azs = [f"{region}{z}" for z in "abc"]
+    out = []
+    for i, instance_id in enumerate(_ids("i", n)):
+        az = azs[i % len(azs)]
+        ip = f"10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}"
+        out.append({
+            "InstanceId": instance_id,
+            "ImageId": f"ami-{rng.randrange(16 ** 8):08x}",
+            "InstanceType": rng.choice(INSTANCE_TYPES),
+            "KeyName": "bench-key",
+            "LaunchTime": EPOCH + timedelta(minutes=i),
+            "Placement": {"AvailabilityZone": az, "GroupName": "", "Tenancy": "default"},
+            "PrivateDnsName": f"ip-{ip.replace('.', '-')}.{region}.compute.internal",
+            "PrivateIpAddress": ip,
+            "PublicIpAddress": f"3.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(256)}",
+            "State": {"Code": 16, "Name": rng.choice(STATES)},
+            "SubnetId": f"subnet-{i % 12:017x}",
+            "VpcId": f"vpc-{i % 3:017x}",
+            "Architecture": "x86_64",
+            "PlatformDetails": "Linux/UNIX",
+            "InstanceLifecycle": "spot" if i % 7 == 0 else None,
+            "BlockDeviceMappings": [
+                {
+                    "DeviceName": dev,
+                    "Ebs": {
+                        "AttachTime": EPOCH + timedelta(minutes=i),
+                        "DeleteOnTermination": True,
+                        "Status": "attached",
+                        "VolumeId": f"vol-{2 * i + k:017x}",
+                    },
+                }
+                for k, dev in enumerate(["/dev/xvda", "/dev/sdf"])
+            ],
+            "NetworkInterfaces": [{
+                "NetworkInterfaceId": f"eni-{i:017x}",
+                "MacAddress": "02:00:00:%02x:%02x:%02x" % ((i >> 16) & 255, (i >> 8) & 255, i & 255),
+                "PrivateIpAddress": ip,
+                "SubnetId": f"subnet-{i % 12:017x}",
+                "VpcId": f"vpc-{i % 3:017x}",
+                "Status": "in-use",
+                "Groups": [{"GroupId": f"sg-{i % 20:017x}", "GroupName": f"sg-{i % 20}"}],
+            }],
+            "SecurityGroups": [{"GroupId": f"sg-{i % 20:017x}", "GroupName": f"sg-{i % 20}"}],
+            "MetadataOptions": {"HttpTokens": "required", "HttpEndpoint": "enabled", "HttpPutResponseHopLimit": 2},
+            "Tags": [
+                {"Key": "Name", "Value": f"bench-{i}"},
+                {"Key": "team", "Value": TEAMS[i % len(TEAMS)]},
+                {"Key": "env", "Value": "prod" if i % 3 else "staging"},
+            ],
+        })
+        if out[-1]["InstanceLifecycle"] is None:
+            del out[-1]["InstanceLifecycle"]
+    return out
+
+
+def make_volumes(instances: List[Dict[str, Any]], seed: int = 2) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    volumes = []
+    for inst in instances:
+        for mapping in inst["BlockDeviceMappings"]:
+            volumes.append({
+                "VolumeId": mapping["Ebs"]["VolumeId"],
+                "Size": rng.choice([8, 20, 100, 500]),
+                "VolumeType": rng.choice(VOLUME_TYPES),
+                "Iops": 3000,
+                "State": "in-use",
+                "AvailabilityZone": inst["Placement"]["AvailabilityZone"],
+                "CreateTime": inst["LaunchTime"],
+                "Encrypted": True,
+                "Attachments": [{
+                    "InstanceId": inst["InstanceId"],
+                    "Device": mapping["DeviceName"],
+                    "State": "attached",
+                    "AttachTime": inst["LaunchTime"],
+                    "DeleteOnTermination": True,
+                }],
+            })
+    return volumes
+
+
+def make_snapshots(n: int, seed: int = 3, volume_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "SnapshotId": snapshot_id,
+            "VolumeId": volume_ids[i % len(volume_ids)] if volume_ids else f"vol-{rng.randrange(16 ** 12):017x}",
+            "VolumeSize": rng.choice([8, 20, 100, 500]),
+            "State": "completed",
+            "Progress": "100%",
+            "StartTime": EPOCH + timedelta(hours=i),
+            "OwnerId": "123456789012",
+            "Encrypted": True,
+            "Description": f"Created by CreateImage(i-{i:017x}) for ami-{i:08x}",
+            "Tags": [{"Key": "backup", "Value": "daily"}],
+        }
+        for i, snapshot_id in enumerate(_ids("snap", n))
+    ]
+
+
+def make_vpcs(n: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "VpcId": vpc_id,
+            "CidrBlock": f"10.{i}.0.0/16",
+            "IsDefault": i == 0,
+            "State": "available",
+            "DhcpOptionsId": "dopt-0",
+            "InstanceTenancy": "default",
+            "CidrBlockAssociationSet": [{"AssociationId": f"vpc-cidr-assoc-{i}", "CidrBlock": f"10.{i}.0.0/16"}],
+            "Tags": [{"Key": "Name", "Value": f"vpc-{i}"}],
+        }
+        for i, vpc_id in enumerate(_ids("vpc", n))
+    ]
+
+
+def make_subnets(n: int, region: str) -> List[Dict[str, Any]]:
+    return [
+        {
+            "SubnetId": subnet_id,
+            "VpcId": f"vpc-{i % 3:017x}",
+            "CidrBlock": f"10.{i % 3}.{i}.0/24",
+            "AvailabilityZone": f"{region}{'abc'[i % 3]}",
+            "AvailableIpAddressCount": 250,
+            "DefaultForAz": i < 3,
+            "MapPublicIpOnLaunch": i < 3,
+            "State": "available",
+        }
+        for i, subnet_id in enumerate(_ids("subnet", n))
+    ]
+
+
+def make_security_groups(n: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "GroupId": group_id,
+            "GroupName": f"sg-{i}",
+            "Description": "benchmark group",
+            "VpcId": f"vpc-{i % 3:017x}",
+            "IpPermissions": [
+                {"IpProtocol": "tcp", "FromPort": p, "ToPort": p, "IpRanges": [{"CidrIp": "10.0.0.0/8"}]}
+                for p in (22, 80, 443)
+            ],
+            "IpPermissionsEgress": [{"IpProtocol": "-1", "IpRanges": [{"CidrIp": "0.0.0.0/0"}]}],
+        }
+        for i, group_id in enumerate(_ids("sg", n))
+    ]
+
+
+def make_images(n: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "ImageId": f"ami-{i:017x}",
+            "Name": f"bench-image-{i}",
+            "State": "available",
+            "Architecture": "x86_64",
+            "CreationDate": (EPOCH + timedelta(days=i)).isoformat(),
+            "OwnerId": "123456789012",
+            "RootDeviceName": "/dev/xvda",
+            "BlockDeviceMappings": [{"DeviceName": "/dev/xvda", "Ebs": {"SnapshotId": f"snap-{i:017x}", "VolumeSize": 8}}],
+        }
+        for i in range(n)
+    ]
+
+
+def make_network_interfaces(instances: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {
+            **eni,
+            "AvailabilityZone": inst["Placement"]["AvailabilityZone"],
+            "InterfaceType": "interface",
+            "Attachment": {"InstanceId": inst["InstanceId"], "DeviceIndex": 0, "Status": "attached"},
+        }
+        for inst in instances
+        for eni in inst["NetworkInterfaces"]
+    ]
+
+
+def make_launch_template_versions(images: List[Dict[str, Any]], n: int = 5) -> List[Dict[str, Any]]:
+    return [
+        {
+            "LaunchTemplateId": f"lt-{i:017x}",
+            "LaunchTemplateName": f"bench-template-{i}",
+            "VersionNumber": 1,
+            "DefaultVersion": True,
+            "LaunchTemplateData": {
+                "ImageId": images[i % len(images)]["ImageId"],
+                "InstanceType": INSTANCE_TYPES[i % len(INSTANCE_TYPES)],
+            },
+        }
+        for i in range(n)
+    ]
+
+
+def make_spot_history(instance_types: List[str], region: str, points_per_az: int, seed: int = 4) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    history = []
+    for instance_type in instance_types:
+        for az in (f"{region}{z}" for z in "abc"):
+            price = rng.uniform(0.02, 0.2)
+            for k in range(points_per_az):
+                price = max(0.001, price * rng.uniform(0.95, 1.05))
+                history.append({
+                    "AvailabilityZone": az,
+                    "InstanceType": instance_type,
+                    "ProductDescription": "Linux/UNIX",
+                    "SpotPrice": f"{price:.6f}",
+                    "Timestamp": now - timedelta(hours=k),
+                })
+    return history
+
+
+# (response key, id request prefix, id field, default page size)
+PAGED_OPERATIONS = {
+    "DescribeInstances": ("Reservations", "InstanceId", "InstanceId", 1000),
+    "DescribeVolumes": ("Volumes", "VolumeId", "VolumeId", 500),
+    "DescribeSnapshots": ("Snapshots", "SnapshotId", "SnapshotId", 1000),
+    "DescribeSecurityGroups": ("SecurityGroups", "GroupId", "GroupId", 1000),
+    "DescribeImages": ("Images", "ImageId", "ImageId", 1000),
+    "DescribeVpcs": ("Vpcs", "VpcId", "VpcId", 1000),
+    "DescribeSubnets": ("Subnets", "SubnetId", "SubnetId", 1000),
+    "DescribeSpotPriceHistory": ("SpotPriceHistory", None, None, 1000),
+    "DescribeSpotInstanceRequests": ("SpotInstanceRequests", "SpotInstanceRequestId", "SpotInstanceRequestId", 1000),
+    "DescribeLaunchTemplates": ("LaunchTemplates", "LaunchTemplateId", "LaunchTemplateId", 1000),
+    "DescribeLaunchTemplateVersions": ("LaunchTemplateVersions", None, None, 1000),
+    "DescribeNetworkInterfaces": ("NetworkInterfaces", "NetworkInterfaceId", "NetworkInterfaceId", 1000),
+}
+
+
+def _tag(item: Dict[str, Any], key: str) -> Optional[str]:
+    return next((t["Value"] for t in item.get("Tags", []) if t["Key"] == key), None)
+
+
+# Filter name -> value(s) of an item it matches against
+FILTER_FIELDS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "instance-id": lambda i: i.get("InstanceId"),
+    "snapshot-id": lambda s: s.get("SnapshotId"),
+    "image-id": lambda i: i.get("ImageId"),
+    "volume-id": lambda v: v.get("VolumeId"),
+    "instance-state-name": lambda i: i["State"]["Name"],
+    "instance-type": lambda i: i.get("InstanceType"),
+    "instance-lifecycle": lambda i: i.get("InstanceLifecycle", "on-demand"),
+    "vpc-id": lambda i: i.get("VpcId"),
+    "subnet-id": lambda i: i.get("SubnetId"),
+    "availability-zone": lambda i: i.get("AvailabilityZone") or i.get("Placement", {}).get("AvailabilityZone"),
+    "attachment.instance-id": lambda v: [a["InstanceId"] for a in v.get("Attachments", [])],
+    "isDefault": lambda v: str(v.get("IsDefault")).lower(),
+}
+
+
+def _matches(item: Dict[str, Any], filters: Dict[str, set]) -> bool:
+    for name, values in filters.items():
+        if name.startswith("tag:"):
+            actual = _tag(item, name[4:])
+        elif name in FILTER_FIELDS:
+            actual = FILTER_FIELDS[name](item)
+        else:
+            continue  # Unknown filters are ignored
+        if isinstance(actual, list):
+            if not values.intersection(actual):
+                return False
+        elif actual not in values:
+            return False
+    return True
+
+
+class SyntheticAWS:
+    """
+    Serves synthetic responses to pooled boto3 clients.
+
+    Instances are wrapped one reservation per 10 instances, as EC2 does for
+    batched launches. Unknown operations get the response from
+    ``static_responses`` or an empty dict.
+    """
+
+    def __init__(self, region: str = "us-east-1"):
+        self.region = region
+        self.data: Dict[str, List[Dict[str, Any]]] = {op: [] for op in PAGED_OPERATIONS}
+        self.static_responses: Dict[str, Callable[[Dict[str, str]], Dict[str, Any]]] = {
+            "StartInstances": lambda p: {"StartingInstances": self._transition(p, "pending")},
+            "StopInstances": lambda p: {"StoppingInstances": self._transition(p, "stopping")},
+            "TerminateInstances": lambda p: {"TerminatingInstances": self._transition(p, "shutting-down")},
+            "DescribeInstanceAttribute": lambda p: {
+                "InstanceId": p.get("InstanceId"),
+                "UserData": {"Value": base64.b64encode(b"#!/bin/bash\necho hello\n").decode()},
+            },
+            "DescribeKeyPairs": lambda p: {
+                "KeyPairs": [{"KeyName": f"key-{i}", "KeyPairId": f"key-{i:017x}", "KeyType": "rsa"} for i in range(20)]
+            },
+            "DescribeRegions": lambda p: {"Regions": [{"RegionName": self.region}]},
+        }
+        self._volumes_by_instance: Dict[str, List[Dict[str, Any]]] = {}
+        self.calls = 0
+
+    # -------------------------
+    # Dataset
+    # -------------------------
+    def load(self, instances: int = 0, snapshots: int = 0, spot_points_per_az: int = 0) -> "SyntheticAWS":
+        insts = make_instances(instances, self.region)
+        reservations = [
+            {"ReservationId": f"r-{i:017x}", "OwnerId": "123456789012", "Instances": insts[i:i + 10]}
+            for i in range(0, len(insts), 10)
+        ]
+        self.data["DescribeInstances"] = reservations
+        self.data["DescribeVolumes"] = make_volumes(insts)
+        self._volumes_by_instance = {}
+        for vol in self.data["DescribeVolumes"]:
+            for attachment in vol["Attachments"]:
+                self._volumes_by_instance.setdefault(attachment["InstanceId"], []).append(vol)
+        self.data["DescribeSnapshots"] = make_snapshots(
+            snapshots, volume_ids=[v["VolumeId"] for v in self.data["DescribeVolumes"]]
+        )
+        self.data["DescribeVpcs"] = make_vpcs(3)
+        self.data["DescribeSubnets"] = make_subnets(12, self.region)
+        self.data["DescribeSecurityGroups"] = make_security_groups(20)
+        self.data["DescribeImages"] = make_images(50)
+        self.data["DescribeNetworkInterfaces"] = make_network_interfaces(insts)
+        self.data["DescribeLaunchTemplateVersions"] = make_launch_template_versions(self.data["DescribeImages"])
+        self.data["DescribeSpotPriceHistory"] = make_spot_history(INSTANCE_TYPES, self.region, spot_points_per_az)
+        return self
+
+    def instance_ids(self) -> List[str]:
+        return [i["InstanceId"] for r in self.data["DescribeInstances"] for i in r["Instances"]]
+
+    # -------------------------
+    # botocore hook
+    # -------------------------
+    def _transition(self, params: Dict[str, str], state: str) -> List[Dict[str, Any]]:
+        return [
+            {"InstanceId": v, "CurrentState": {"Name": state}, "PreviousState": {"Name": "running"}}
+            for k, v in params.items() if k.startswith("InstanceId.")
+        ]
+
+    @staticmethod
+    def _requested_ids(params: Dict[str, str], prefix: str) -> Optional[set]:
+        ids = {v for k, v in params.items() if k.startswith(f"{prefix}.")}
+        return ids or None
+
+    @staticmethod
+    def _filters(params: Dict[str, str]) -> Dict[str, set]:
+        """Query-protocol Filter.N.Name / Filter.N.Value.M pairs as {name: {values}}."""
+        filters: Dict[str, set] = {}
+        for k, name in params.items():
+            if k.startswith("Filter.") and k.endswith(".Name"):
+                prefix = k[: -len("Name")] + "Value."
+                filters[name] = {v for vk, v in params.items() if vk.startswith(prefix)}
+        return filters
+
+    def _paged(self, operation: str, params: Dict[str, str]) -> Dict[str, Any]:
+        key, id_prefix, id_field, default_page = PAGED_OPERATIONS[operation]
+        items = self.data[operation]
+
+        filters = self._filters(params)
+        if operation == "DescribeVolumes" and set(filters) == {"attachment.instance-id"}:
+            # Indexed path for the batched attachment lookups fleet tools make
+            items = [v for i in sorted(filters["attachment.instance-id"]) for v in self._volumes_by_instance.get(i, [])]
+        elif filters:
+            if operation == "DescribeInstances":
+                items = [
+                    {**r, "Instances": kept}
+                    for r in items
+                    for kept in [[i for i in r["Instances"] if _matches(i, filters)]]
+                    if kept
+                ]
+            else:
+                items = [i for i in items if _matches(i, filters)]
+
+        ids = self._requested_ids(params, id_prefix) if id_prefix else None
+        if ids is not None:
+            if operation == "DescribeInstances":
+                found = [i for r in items for i in r["Instances"] if i["InstanceId"] in ids]
+                return {key: [{"ReservationId": "r-0", "Instances": found}]} if found else {key: []}
+            return {key: [i for i in items if i[id_field] in ids]}
+
+        start = int(params.get("NextToken", 0))
+        size = int(params.get("MaxResults", default_page))
+        if operation == "DescribeInstances":
+            # MaxResults counts instances; each reservation holds 10
+            size = max(1, size // 10)
+
+        page = {key: items[start:start + size]}
+        if start + size < len(items):
+            page["NextToken"] = str(start + size)
+        return page
+
+    def handle(self, model, params, **kwargs):
+        self.calls += 1
+        operation = model.name
+        body = params.get("body") or {}
+        body = body if isinstance(body, dict) else {}
+
+        if operation in PAGED_OPERATIONS:
+            parsed = self._paged(operation, body)
+        elif operation in self.static_responses:
+            parsed = self.static_responses[operation](body)
+        else:
+            parsed = {}
+
+        parsed["ResponseMetadata"] = {"HTTPStatusCode": 200, "RequestId": "bench", "RetryAttempts": 0}
+        return AWSResponse("https://bench.invalid", 200, {}, None), parsed
+
+    def install(self, services=("ec2", "pricing"), regions=None):
+        """Route every call of the pooled clients for these services through the synthetic backend."""
+        for service in services:
+            for region in regions or [self.region]:
+                client = get_client(service, "us-east-1" if service == "pricing" else region)
+                client.meta.events.register_first(
+                    f"before-call.{client.meta.service_model.service_id.hyphenize()}",
+                    self.handle,
+                    unique_id=f"synthetic-aws-{service}",
+                )
+        return self
@@ -0,0 +1,77 @@
+"""
+Cold-start benchmark: time from spawning ``server.py`` over stdio to the
+first list_tools response, with eager and lazy tool loading.
+
+    python benchmarks/startup.py --runs 5
+
+The lazy runs share a manifest written by one warm-up eager start, so they
+measure the steady state after the first launch.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from fastmcp import Client
+from fastmcp.client.transports import PythonStdioTransport
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+async def first_list_tools(env):
+    transport = PythonStdioTransport(ROOT / "server.py", env=env, cwd=str(ROOT))
+    started = time.perf_counter()
+    async with Client(transport) as client:
+        tools = await client.list_tools()
+        elapsed = time.perf_counter() - started
+
+        # First call of a lazily registered tool pays for its module import
+        call_started = time.perf_counter()
+        await client.call_tool("admin.executor_stats", {})
+        first_call = time.perf_counter() - call_started
+    return elapsed, first_call, len(tools)
+
+
+def run_mode(mode, runs, manifest):
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(ROOT),
+        "AWS_MCP_TOOL_LOADING": mode,
+        "AWS_MCP_TOOL_MANIFEST_PATH": manifest,
+    }
+    samples, calls, count = [], [], 0
+    for _ in range(runs):
+        elapsed, first_call, count = asyncio.run(first_list_tools(env))
+        samples.append(elapsed)
+        calls.append(first_call)
+    return samples, calls, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest = str(Path(tmp) / "tool_manifest.json")
+
+        # Warm-up: writes the manifest and warms the OS file cache
+        run_mode("eager", 1, manifest)
+
+        print(f"{'mode':<8}{'tools':>7}{'median ms':>12}{'min ms':>10}{'max ms':>10}{'1st call ms':>13}")
+        for mode in ("eager", "lazy"):
+            samples, calls, count = run_mode(mode, args.runs, manifest)
+            ms = [s * 1000 for s in samples]
+            print(
+                f"{mode:<8}{count:>7}{statistics.median(ms):>12.0f}{min(ms):>10.0f}{max(ms):>10.0f}"
+                f"{statistics.median(calls) * 1000:>13.0f}"
+            )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""
+Offline tool benchmarks.
+
+Drives every registered tool through the FastMCP in-process client against
+synthetic AWS responses (see fixtures.py) and reports latency percentiles,
+Python allocations and response size per tool and dataset scale.
+
+    python benchmarks/tools.py                        # default scales
+    python benchmarks/tools.py --scales 10,1000 -n 20
+    python benchmarks/tools.py --only ec2.list --json results.json
+    python benchmarks/tools.py --compare results.json  # flag regressions
+
+No credentials or network access are needed; the response cache is disabled
+so every iteration exercises the tool itself.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# Must be set before the server (and Settings) are imported
+REGION = "us-east-1"
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "bench")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "bench")
+os.environ["AWS_DEFAULT_REGION"] = REGION
+os.environ.setdefault("AWS_MCP_CACHE_ENABLED", "false")
+os.environ.setdefault("AWS_MCP_TOOL_LOADING", "eager")
+_scratch = Path(tempfile.mkdtemp(prefix="aws-mcp-bench-"))
+os.environ.setdefault("AWS_MCP_PRICE_INDEX_PATH", str(_scratch / "prices.sqlite"))
+os.environ.setdefault("AWS_MCP_TOOL_MANIFEST_PATH", str(_scratch / "tool_manifest.json"))
+
+from fastmcp import Client  # noqa: E402
+
+from fixtures import INSTANCE_TYPES, VOLUME_TYPES, SyntheticAWS  # noqa: E402
+
+
+def cases(aws: SyntheticAWS, scale: int):
+    """(tool name, arguments) pairs for one dataset scale."""
+    ids = aws.instance_ids()
+    some_id = ids[len(ids) // 2] if ids else "i-0"
+    r = {"region": REGION}
+    return [
+        ("ec2.list_ec2_instances", {**r, "max_items": scale}),
+        ("ec2.list_ec2_instances[compact]", {**r, "max_items": scale, "fields": "compact"}),
+        ("ec2.list_running_instances", {**r, "max_items": scale}),
+        ("ec2.list_instances_by_tag", {**r, "tag_key": "team", "tag_value": "ml", "max_items": scale}),
+        ("ec2.get_instance_details", {**r, "instance_id": some_id}),
+        ("ec2.get_instance_running_details", {**r, "instance_id": some_id}),
+        ("ec2.list_spot_requests", r),
+        ("ec2.list_keypairs", r),
+        ("ec2.list_security_groups", r),
+        ("ec2.describe_security_group", {**r, "group_id": "sg-00000000000000001"}),
+        ("ec2.list_launch_templates", r),
+        ("ec2.start_instance", {**r, "instance_id": some_id}),
+        ("ec2.stop_instance", {**r, "instance_id": some_id}),
+        ("ec2.bulk_stop_instances", {**r, "tag_key": "team", "tag_value": "ml"}),
+        ("ec2.bulk_reboot_instances", {**r, "instance_ids": ids[:500]}),
+        ("aws.describe_images", r),
+        ("aws.get_user_data", {**r, "instance_id": some_id}),
+        ("aws.describe_metadata_options", {**r, "instance_id": some_id}),
+        ("aws.get_ondemand_price", {**r, "instance_type": "m5.large"}),
+        ("aws.get_spot_price_history", {**r, "instance_type": "m5.large"}),
+        ("aws.spot_price_stats", {**r, "instance_types": INSTANCE_TYPES}),
+        ("aws.cheapest_spot_az", {**r, "instance_types": INSTANCE_TYPES}),
+        ("pricing.estimate_fleet_cost", {**r, "group_by_tags": ["team", "env"]}),
+        ("ebs.describe_volumes", {**r, "max_items": 2 * scale}),
+        ("ebs.describe_volumes[compact]", {**r, "max_items": 2 * scale, "fields": "compact"}),
+        ("ebs.list_snapshots", {**r, "max_items": aws_snapshot_count(aws)}),
+        ("ebs.list_snapshots[compact]", {**r, "max_items": aws_snapshot_count(aws), "fields": "compact"}),
+        ("vpc.list_vpcs", r),
+        ("vpc.describe_vpc", r),
+        ("vpc.list_subnets", r),
+        ("vpc.describe_subnet", {**r, "vpc_id": "vpc-00000000000000000"}),
+        ("admin.executor_stats", {}),
+        ("admin.cache_stats", {}),
+    ]
+
+
+def aws_snapshot_count(aws: SyntheticAWS) -> int:
+    return max(len(aws.data["DescribeSnapshots"]), 1)
+
+
+def seed_price_index():
+    from mcp_server.pricing.index import get_price_index
+
+    index = get_price_index()
+    index.upsert(
+        (REGION, t, "Linux", "Shared", "NA", 0.01 * (k + 1), f"sku-{k}")
+        for k, t in enumerate(INSTANCE_TYPES)
+    )
+    index.upsert_storage((REGION, v, 0.08 + 0.01 * k, f"ebs-{k}") for k, v in enumerate(VOLUME_TYPES))
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+async def measure(client, tool, arguments, iterations):
+    # Warm-up (first call also imports lazily-loaded modules)
+    result = await client.call_tool(tool, arguments, raise_on_error=False)
+    error = result.is_error
+    size = sum(len(getattr(c, "text", "") or "") for c in result.content)
+
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await client.call_tool(tool, arguments, raise_on_error=False)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    await client.call_tool(tool, arguments, raise_on_error=False)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p95_ms": round(percentile(latencies, 0.95), 2),
+        "p99_ms": round(percentile(latencies, 0.99), 2),
+        "peak_alloc_kb": round((peak - before) / 1024, 1),
+        "response_bytes": size,
+        "error": error,
+    }
+
+
+async def run(args):
+    from server import mcp
+
+    aws = SyntheticAWS(REGION).install()
+    seed_price_index()
+
+    results = {}
+    covered = set()
+    async with Client(mcp) as client:
+        registered = {t.name for t in await client.list_tools()}
+        for scale in args.scales:
+            aws.load(instances=scale, snapshots=args.snapshots, spot_points_per_az=min(scale, 2000))
+            # Large datasets get fewer iterations so a full run stays reasonable
+            iterations = args.iterations if scale <= 1000 else max(3, args.iterations // 5)
+
+            for label, arguments in cases(aws, scale):
+                tool = label.split("[")[0]
+                if args.only and not any(o in label for o in args.only):
+                    continue
+                covered.add(tool)
+                calls_before = aws.calls
+                stats = await measure(client, tool, arguments, iterations)
+                stats["aws_calls"] = (aws.calls - calls_before) // (iterations + 2)
+                results[f"{label}@{scale}"] = stats
+                print_row(label, scale, stats)
+
+    missing = sorted(registered - covered)
+    if missing and not args.only:
+        print(f"\nNo benchmark case ({len(missing)}): {', '.join(missing)}")
+    return results
+
+
+def print_row(label, scale, s):
+    flag = "  ERROR" if s["error"] else ""
+    print(
+        f"{label:<38}{scale:>7}{s['p50_ms']:>10.2f}{s['p95_ms']:>10.2f}{s['p99_ms']:>10.2f}"
+        f"{s['peak_alloc_kb']:>15.1f}{s['response_bytes']:>14}{s['aws_calls']:>7}{flag}"
+    )
+
+
+def compare(results, baseline_path, threshold):
+    baseline = json.loads(Path(baseline_path).read_text())
+    regressions = []
+    for key, stats in results.items():
+        old = baseline.get(key)
+        if not old or not old["p50_ms"]:
+            continue
+        ratio = stats["p50_ms"] / old["p50_ms"]
+        if ratio > 1 + threshold:
+            regressions.append((key, old["p50_ms"], stats["p50_ms"], ratio))
+
+    if regressions:
+        print(f"\nRegressions (p50 more than {threshold:.0%} slower than {baseline_path}):")
+        for key, old, new, ratio in regressions:
+            print(f"  {key:<45}{old:>10.2f} -> {new:>10.2f} ms  (x{ratio:.2f})")
+    else:
+        print(f"\nNo p50 regressions beyond {threshold:.0%} against {baseline_path}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", default="10,1000,50000", help="Comma-separated instance counts")
+    parser.add_argument("--snapshots", type=int, default=10000)
+    parser.add_argument("-n", "--iterations", type=int, default=20)
+    parser.add_argument("--only", action="append", help="Only run cases whose label contains this (repeatable)")
+    parser.add_argument("--json", help="Write results to this file")
+    parser.add_argument("--compare", help="Baseline results file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed p50 slowdown vs baseline")
+    args = parser.parse_args()
+    args.scales = [int(s) for s in args.scales.split(",")]
+
+    print(
+        f"{'case':<38}{'scale':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+        f"{'peak alloc KB':>15}{'resp bytes':>14}{'calls':>7}"
+    )
+    results = asyncio.run(run(args))
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
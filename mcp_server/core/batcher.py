@@ -0,0 +1,143 @@
+"""
+Micro-batching of single-instance DescribeInstances lookups.
+
+Per-instance tools (details, status, metadata options, SSH instructions)
+used to issue one DescribeInstances per instance ID, so an agent checking
+40 instances made 40 calls. ``InstanceBatcher.get`` instead parks the
+caller for up to ``AWS_MCP_BATCH_WINDOW_MS``; every lookup for the same
+region/profile arriving in that window joins one DescribeInstances call
+(up to ``MAX_BATCH_IDS`` IDs, at which point the batch is sent early) and
+each caller gets its own instance back.
+
+Waiting callers hold their worker thread, so in async execution mode a
+batch is also sent early once it has as many callers as the region has
+workers: nobody else could join it before the window closes.
+
+IDs are sent as an ``instance-id`` filter rather than ``InstanceIds`` so one
+unknown or malformed ID yields "not found" for that caller instead of an
+InvalidInstanceID error for the whole batch.
+"""
+
+import copy
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from mcp_server.core.clients import get_client
+from mcp_server.core.config import Settings
+
+# EC2 accepts at most 200 values per filter
+MAX_BATCH_IDS = 200
+
+
+def describe_instances_by_id(
+    ids: Iterable[str], region: str, profile: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Instance ID -> instance for every ID that exists, in chunks of MAX_BATCH_IDS."""
+    ids = list(dict.fromkeys(ids))
+    ec2 = get_client("ec2", region, profile)
+    paginator = ec2.get_paginator("describe_instances")
+
+    found: Dict[str, Dict[str, Any]] = {}
+    for start in range(0, len(ids), MAX_BATCH_IDS):
+        chunk = ids[start:start + MAX_BATCH_IDS]
+        for page in paginator.paginate(Filters=[{"Name": "instance-id", "Values": chunk}]):
+            for reservation in page.get("Reservations", []):
+                for inst in reservation.get("Instances", []):
+                    found[inst["InstanceId"]] = inst
+    return found
+
+
+class _Batch:
+    __slots__ = ("ids", "callers", "full", "done", "result", "error")
+
+    def __init__(self):
+        self.ids: Dict[str, None] = {}
+        self.callers = 0
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.result: Dict[str, Dict[str, Any]] = {}
+        self.error: Optional[BaseException] = None
+
+
+class InstanceBatcher:
+    """Coalesces concurrent single-ID DescribeInstances lookups per (region, profile)."""
+
+    def __init__(self, window_ms: Optional[float] = None, max_ids: int = MAX_BATCH_IDS):
+        self.window = (Settings.BATCH_WINDOW_MS if window_ms is None else window_ms) / 1000
+        self.max_ids = max_ids
+        self.max_callers = Settings.TOOL_MAX_WORKERS_PER_REGION if Settings.TOOL_EXECUTION_MODE == "async" else None
+        self._lock = threading.Lock()
+        self._open: Dict[Tuple[str, Optional[str]], _Batch] = {}
+        self._stats = {"lookups": 0, "batches": 0, "batched_ids": 0, "max_batch_size": 0, "full_batches": 0}
+
+    def get(self, instance_id: str, region: str, profile: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """The instance with this ID, or None when it does not exist."""
+        if self.window <= 0:
+            with self._lock:
+                self._stats["lookups"] += 1
+            return describe_instances_by_id([instance_id], region, profile).get(instance_id)
+
+        key = (region, profile)
+        with self._lock:
+            self._stats["lookups"] += 1
+            batch = self._open.get(key)
+            leader = batch is None
+            if leader:
+                batch = self._open[key] = _Batch()
+            batch.ids[instance_id] = None
+            batch.callers += 1
+            if len(batch.ids) >= self.max_ids or batch.callers == self.max_callers:
+                # Closed to newcomers; the leader sends it without waiting out the window
+                del self._open[key]
+                batch.full.set()
+
+        if leader:
+            batch.full.wait(self.window)
+            with self._lock:
+                if self._open.get(key) is batch:
+                    del self._open[key]
+                self._stats["batches"] += 1
+                self._stats["batched_ids"] += len(batch.ids)
+                self._stats["max_batch_size"] = max(self._stats["max_batch_size"], len(batch.ids))
+                self._stats["full_batches"] += int(batch.full.is_set())
+            try:
+                batch.result = describe_instances_by_id(batch.ids, region, profile)
+            except BaseException as e:
+                batch.error = e
+            finally:
+                batch.done.set()
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            raise batch.error
+        inst = batch.result.get(instance_id)
+        # Several callers may hold the same instance; never hand out a shared dict
+        return copy.deepcopy(inst) if inst is not None and not leader else inst
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["open_batches"] = len(self._open)
+        stats["window_ms"] = self.window * 1000
+        stats["max_ids"] = self.max_ids
+        stats["mean_batch_size"] = round(stats["batched_ids"] / stats["batches"], 2) if stats["batches"] else 0.0
+        stats["calls_saved"] = stats["lookups"] - stats["batches"] if self.window > 0 else 0
+        return stats
+
+
+_batcher = InstanceBatcher()
+
+
+def get_instance_batcher() -> InstanceBatcher:
+    return _batcher
+
+
+def get_instance(instance_id: str, region: str, profile: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Look up one instance through the shared micro-batcher."""
+    return _batcher.get(instance_id, region, profile)
+
+
+def get_instances(ids: List[str], region: str, profile: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Look up many instances directly, MAX_BATCH_IDS per DescribeInstances call."""
+    return describe_instances_by_id(ids, region, profile)
@@ -0,0 +1,323 @@
+"""
+Response cache for read-only describe tools.
+
+Agents repeat the same describe calls many times per conversation. Read-only
+tools are wrapped with ``@cached`` which stores successful responses for a
+per-operation TTL. Each entry carries tags such as ``"ap-south-1/i-0abc"`` or
+``"ap-south-1/instances"``; mutating tools are wrapped with ``@invalidates``
+and drop every entry sharing one of their tags as soon as they run.
+
+Backends are pluggable: an in-memory LRU (default) or an on-disk SQLite
+store that survives restarts.
+"""
+
+import copy
+import functools
+import importlib
+import inspect
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from mcp_server.core.config import Settings
+
+_MISS = object()
+
+
+def tag(region: Optional[str], name: Optional[str]) -> Optional[str]:
+    """Cache tag for a resource ID or resource kind within a region (None when name is empty)."""
+    if not name:
+        return None
+    return f"{region or Settings.DEFAULT_REGION}/{name}"
+
+
+# =======================================================
+# BACKENDS
+# =======================================================
+class MemoryLRUBackend:
+    """Bounded in-process LRU."""
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Set[str], Any]]" = OrderedDict()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISS
+            expires_at, _, value = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return _MISS
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float, tags: Set[str]):
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, tags, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, tags: Set[str]) -> int:
+        with self._lock:
+            stale = [k for k, (_, entry_tags, _) in self._entries.items() if entry_tags & tags]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteBackend:
+    """On-disk cache so warm entries survive a server restart."""
+
+    def __init__(self, path: str):
+        Path(path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(Path(path).expanduser()), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, expires_at REAL, value BLOB)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entry_tags (tag TEXT, key TEXT)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entry_tags_tag ON entry_tags(tag)")
+
+    def get(self, key: str):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires_at, value FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[0] < time.time():
+            return _MISS
+        return pickle.loads(row[1])
+
+    def set(self, key: str, value: Any, ttl: float, tags: Set[str]):
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, expires_at, value) VALUES (?, ?, ?)",
+                (key, time.time() + ttl, blob),
+            )
+            self._conn.execute("DELETE FROM entry_tags WHERE key = ?", (key,))
+            self._conn.executemany(
+                "INSERT INTO entry_tags (tag, key) VALUES (?, ?)", [(t, key) for t in tags]
+            )
+
+    def invalidate(self, tags: Set[str]) -> int:
+        if not tags:
+            return 0
+        marks = ",".join("?" * len(tags))
+        with self._lock, self._conn:
+            keys = [
+                row[0]
+                for row in self._conn.execute(
+                    f"SELECT DISTINCT key FROM entry_tags WHERE tag IN ({marks})", tuple(tags)
+                )
+            ]
+            self._conn.executemany("DELETE FROM entries WHERE key = ?", [(k,) for k in keys])
+            self._conn.executemany("DELETE FROM entry_tags WHERE key = ?", [(k,) for k in keys])
+            return len(keys)
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.execute("DELETE FROM entry_tags")
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+# =======================================================
+# CACHE
+# =======================================================
+class ResponseCache:
+    def __init__(self, backend=None, default_ttl: Optional[float] = None, ttls: Optional[Dict[str, float]] = None):
+        self.backend = backend or MemoryLRUBackend(Settings.CACHE_MAX_ENTRIES)
+        self.default_ttl = default_ttl if default_ttl is not None else Settings.CACHE_DEFAULT_TTL
+        self.ttls = dict(ttls or {})
+        self._stats_lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "invalidated": 0, "stale_skipped": 0}
+        self.listeners: List[Callable[[Set[str]], None]] = []
+        # Bumped per tag on every invalidation (and for all tags on clear), so a
+        # read that overlapped a mutation can tell its result is already stale
+        self._generation_lock = threading.Lock()
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0
+
+    def ttl_for(self, operation: str, default: Optional[float] = None) -> float:
+        if operation in self.ttls:
+            return self.ttls[operation]
+        return default if default is not None else self.default_ttl
+
+    @staticmethod
+    def make_key(operation: str, params: Dict[str, Any]) -> str:
+        return json.dumps([operation, params], sort_keys=True, default=str)
+
+    def get(self, key: str):
+        value = self.backend.get(key)
+        with self._stats_lock:
+            self._stats["misses" if value is _MISS else "hits"] += 1
+        return value
+
+    def generation(self, tags: Iterable[Optional[str]]) -> Tuple[int, Tuple[int, ...]]:
+        """Snapshot to pass to set() for a value computed after this call."""
+        tags = sorted({t for t in tags if t})
+        with self._generation_lock:
+            return self._epoch, tuple(self._generations.get(t, 0) for t in tags)
+
+    def set(self, key: str, value: Any, ttl: float, tags: Iterable[Optional[str]], generation=None) -> bool:
+        """
+        Store value unless one of its tags was invalidated since generation
+        was taken; returns whether it was stored.
+        """
+        if ttl <= 0:
+            return False
+        tags = {t for t in tags if t}
+        with self._generation_lock:
+            if generation is not None and generation != (
+                self._epoch, tuple(self._generations.get(t, 0) for t in sorted(tags))
+            ):
+                with self._stats_lock:
+                    self._stats["stale_skipped"] += 1
+                return False
+            self.backend.set(key, value, ttl, tags)
+        return True
+
+    def add_listener(self, listener: Callable[[Set[str]], None]):
+        """Call listener(tags) on every invalidation (e.g. so the inventory store marks resources stale)."""
+        self.listeners.append(listener)
+
+    def invalidate(self, tags: Iterable[Optional[str]]) -> int:
+        tags = {t for t in tags if t}
+        with self._generation_lock:
+            for t in tags:
+                self._generations[t] = self._generations.get(t, 0) + 1
+            removed = self.backend.invalidate(tags)
+        with self._stats_lock:
+            self._stats["invalidated"] += removed
+        for listener in self.listeners:
+            listener(tags)
+        return removed
+
+    def clear(self):
+        with self._generation_lock:
+            self._epoch += 1
+            self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            counters = dict(self._stats)
+        return {
+            "backend": type(self.backend).__name__,
+            "entries": len(self.backend),
+            **counters,
+        }
+
+
+def _build_cache() -> ResponseCache:
+    if Settings.CACHE_BACKEND == "disk":
+        backend = SQLiteBackend(Settings.CACHE_PATH)
+    else:
+        backend = MemoryLRUBackend(Settings.CACHE_MAX_ENTRIES)
+    return ResponseCache(backend, ttls=json.loads(Settings.CACHE_TTLS or "{}"))
+
+
+_cache = _build_cache()
+
+
+def get_cache() -> ResponseCache:
+    return _cache
+
+
+def _is_error(value: Any) -> bool:
+    return isinstance(value, dict) and "error" in value
+
+
+def _bound_params(signature: inspect.Signature, args, kwargs) -> Dict[str, Any]:
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return dict(bound.arguments)
+
+
+# =======================================================
+# DECORATORS
+# =======================================================
+def cached(
+    operation: str,
+    tags: Callable[[Dict[str, Any]], List[str]],
+    ttl: Optional[float] = None,
+):
+    """
+    Cache successful responses of a read-only tool function.
+
+    Args:
+        operation: Cache namespace, normally the tool name
+        tags: Maps the call's bound parameters to invalidation tags
+        ttl: Default TTL in seconds (overridable per operation via AWS_MCP_CACHE_TTLS)
+    """
+
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not Settings.CACHE_ENABLED:
+                return fn(*args, **kwargs)
+
+            params = _bound_params(signature, args, kwargs)
+            key = _cache.make_key(operation, params)
+
+            value = _cache.get(key)
+            if value is not _MISS:
+                # Callers may mutate responses (e.g. fan-out adds a region column)
+                return copy.deepcopy(value)
+
+            call_tags = tags(params)
+            generation = _cache.generation(call_tags)
+            value = fn(*args, **kwargs)
+            if not _is_error(value):
+                # Skipped if a mutation invalidated any of these tags while fn ran
+                _cache.set(key, copy.deepcopy(value), _cache.ttl_for(operation, ttl), call_tags, generation)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates(tags: Callable[[Dict[str, Any]], List[str]]):
+    """Drop cached entries for the resources a mutating tool touches."""
+    # The inventory store listens for these invalidations; make sure it is loaded
+    # before the first mutation, even when no inventory read has happened yet
+    importlib.import_module("mcp_server.inventory.store")
+
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                if Settings.CACHE_ENABLED or _cache.listeners:
+                    _cache.invalidate(tags(_bound_params(signature, args, kwargs)))
+
+        return wrapper
+
+    return decorator
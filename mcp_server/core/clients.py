@@ -0,0 +1,147 @@
+"""
+Shared boto3 client pool.
+
+Building a boto3 client loads the botocore service model, resolves the
+endpoint and opens a fresh HTTPS connection pool. Tools call AWS on every
+invocation, so clients are built once per (service, region, profile) and
+reused; boto3 clients are thread-safe once created.
+"""
+
+import sys
+import threading
+from typing import Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+from mcp_server.core.config import Settings
+from mcp_server.core.metrics import get_metrics
+from mcp_server.core.ratelimit import get_rate_limiter
+
+# Error codes that mean the credentials baked into a client are no longer valid
+EXPIRED_CREDENTIAL_CODES = {
+    "ExpiredToken",
+    "ExpiredTokenException",
+    "RequestExpired",
+    "InvalidClientTokenId",
+}
+
+ClientKey = Tuple[str, str, Optional[str]]
+
+
+def default_client_config() -> Config:
+    """Connection and retry settings shared by every pooled client."""
+    return Config(
+        max_pool_connections=Settings.AWS_MAX_POOL_CONNECTIONS,
+        connect_timeout=Settings.AWS_CONNECT_TIMEOUT,
+        read_timeout=Settings.AWS_READ_TIMEOUT,
+        tcp_keepalive=True,
+        retries={
+            "max_attempts": Settings.AWS_MAX_ATTEMPTS,
+            "mode": Settings.AWS_RETRY_MODE,
+        },
+    )
+
+
+class ClientPool:
+    """Thread-safe cache of boto3 clients keyed by (service, region, profile)."""
+
+    def __init__(self, config: Optional[Config] = None):
+        self._config = config or default_client_config()
+        self._lock = threading.RLock()
+        self._sessions: Dict[Optional[str], boto3.session.Session] = {}
+        self._clients: Dict[ClientKey, object] = {}
+        self._stale_profiles = set()
+
+    # -------------------------
+    # Sessions
+    # -------------------------
+    def _session(self, profile: Optional[str]) -> boto3.session.Session:
+        session = self._sessions.get(profile)
+        if session is None:
+            session = boto3.session.Session(profile_name=profile)
+            self._sessions[profile] = session
+        return session
+
+    def _drop_profile(self, profile: Optional[str]):
+        """Forget a profile's session and every client built from it."""
+        self._sessions.pop(profile, None)
+        for key in [k for k in self._clients if k[2] == profile]:
+            del self._clients[key]
+
+    # -------------------------
+    # Clients
+    # -------------------------
+    def get(self, service: str, region: Optional[str] = None, profile: Optional[str] = None):
+        region = region or Settings.DEFAULT_REGION
+        profile = profile or Settings.AWS_PROFILE
+        key = (service, region, profile)
+
+        client = self._clients.get(key)
+        if client is not None and profile not in self._stale_profiles:
+            return client
+
+        with self._lock:
+            if profile in self._stale_profiles:
+                print(f"[ClientPool] Credentials expired for profile={profile!r}, rebuilding session", file=sys.stderr)
+                self._drop_profile(profile)
+                self._stale_profiles.discard(profile)
+
+            client = self._clients.get(key)
+            if client is None:
+                # boto3 sessions are not thread-safe, so client creation stays under the lock
+                client = self._session(profile).client(
+                    service, region_name=region, config=self._config
+                )
+                client.meta.events.register(
+                    "after-call.*.*", self._make_expiry_hook(profile)
+                )
+                if Settings.METRICS_ENABLED:
+                    get_metrics().attach(client)
+                if Settings.RATE_LIMIT_ENABLED:
+                    get_rate_limiter().attach(client, profile, region)
+                self._clients[key] = client
+
+            return client
+
+    def _make_expiry_hook(self, profile: Optional[str]):
+        # Refreshable credentials (SSO, assume-role, instance profile) renew
+        # themselves inside botocore. Static temporary credentials cannot, so an
+        # expiry error marks the profile stale and the next get() re-resolves them.
+        def _on_after_call(parsed=None, **kwargs):
+            code = (parsed or {}).get("Error", {}).get("Code")
+            if code in EXPIRED_CREDENTIAL_CODES:
+                self._stale_profiles.add(profile)
+
+        return _on_after_call
+
+    def invalidate(self, service: Optional[str] = None, region: Optional[str] = None, profile: Optional[str] = None):
+        """Drop cached clients matching the given fields (all clients when none given)."""
+        with self._lock:
+            for key in list(self._clients):
+                k_service, k_region, k_profile = key
+                if service and k_service != service:
+                    continue
+                if region and k_region != region:
+                    continue
+                if profile and k_profile != profile:
+                    continue
+                del self._clients[key]
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+            self._sessions.clear()
+            self._stale_profiles.clear()
+
+
+_pool = ClientPool()
+
+
+def get_client(service: str, region: Optional[str] = None, profile: Optional[str] = None):
+    """Return a pooled boto3 client for the given service/region/profile."""
+    return _pool.get(service, region, profile)
+
+
+def get_pool() -> ClientPool:
+    return _pool
@@ -5,3 +5,90 @@ load_dotenv()
 
 class Settings:
     DEFAULT_REGION = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
+    AWS_PROFILE = os.getenv("AWS_PROFILE") or None
+
+    # ---- Shared boto3 client pool ----
+    AWS_MAX_POOL_CONNECTIONS = int(os.getenv("AWS_MCP_MAX_POOL_CONNECTIONS", "50"))
+    AWS_CONNECT_TIMEOUT = float(os.getenv("AWS_MCP_CONNECT_TIMEOUT", "5"))
+    AWS_READ_TIMEOUT = float(os.getenv("AWS_MCP_READ_TIMEOUT", "60"))
+    AWS_MAX_ATTEMPTS = int(os.getenv("AWS_MCP_MAX_ATTEMPTS", "5"))
+    AWS_RETRY_MODE = os.getenv("AWS_MCP_RETRY_MODE", "adaptive")
+
+    # ---- Per-action rate limiting ----
+    RATE_LIMIT_ENABLED = os.getenv("AWS_MCP_RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_DEFAULT_RATE = float(os.getenv("AWS_MCP_RATE_LIMIT_DEFAULT_RATE", "10"))
+    RATE_LIMIT_DEFAULT_BURST = float(os.getenv("AWS_MCP_RATE_LIMIT_DEFAULT_BURST", "20"))
+    RATE_LIMIT_MAX_WAIT = float(os.getenv("AWS_MCP_RATE_LIMIT_MAX_WAIT", "30"))
+    # JSON object of overrides, e.g. {"ec2.DescribeInstances": {"rate": 10, "burst": 50}}
+    RATE_LIMITS = os.getenv("AWS_MCP_RATE_LIMITS", "")
+
+    # ---- Pagination ----
+    PAGINATION_MAX_ITEMS = int(os.getenv("AWS_MCP_PAGINATION_MAX_ITEMS", "1000"))
+
+    # ---- Tool execution ----
+    # "async" dispatches sync tools onto per-region worker pools, "sync" runs them as registered
+    TOOL_EXECUTION_MODE = os.getenv("AWS_MCP_TOOL_EXECUTION_MODE", "async")
+    TOOL_MAX_WORKERS_PER_REGION = int(os.getenv("AWS_MCP_MAX_WORKERS_PER_REGION", "8"))
+    TOOL_MAX_QUEUE_DEPTH = int(os.getenv("AWS_MCP_MAX_QUEUE_DEPTH", "64"))
+    # "lazy" advertises tools from a prebuilt manifest and imports modules on first call
+    TOOL_LOADING = os.getenv("AWS_MCP_TOOL_LOADING", "lazy")
+    TOOL_MANIFEST_PATH = os.getenv("AWS_MCP_TOOL_MANIFEST_PATH", "~/.aws/mcp_cache/tool_manifest.json")
+
+    # ---- Instrumentation ----
+    METRICS_ENABLED = os.getenv("AWS_MCP_METRICS_ENABLED", "false").lower() == "true"
+    METRICS_PATH = os.getenv("AWS_MCP_METRICS_PATH", "/metrics")
+    # Recent tool latencies kept per tool for percentiles
+    METRICS_SAMPLE_SIZE = int(os.getenv("AWS_MCP_METRICS_SAMPLE_SIZE", "512"))
+
+    # ---- Multi-region fan-out ----
+    FANOUT_MAX_WORKERS = int(os.getenv("AWS_MCP_FANOUT_MAX_WORKERS", "16"))
+    REGION_CACHE_TTL = int(os.getenv("AWS_MCP_REGION_CACHE_TTL", "86400"))
+
+    # ---- Response cache ----
+    CACHE_ENABLED = os.getenv("AWS_MCP_CACHE_ENABLED", "true").lower() == "true"
+    CACHE_BACKEND = os.getenv("AWS_MCP_CACHE_BACKEND", "memory")  # memory | disk
+    CACHE_PATH = os.getenv("AWS_MCP_CACHE_PATH", "~/.aws/mcp_cache/responses.sqlite")
+    CACHE_MAX_ENTRIES = int(os.getenv("AWS_MCP_CACHE_MAX_ENTRIES", "2048"))
+    CACHE_DEFAULT_TTL = float(os.getenv("AWS_MCP_CACHE_DEFAULT_TTL", "60"))
+    # JSON object of per-operation TTL overrides, e.g. {"ec2.get_instance_running_details": 5}
+    CACHE_TTLS = os.getenv("AWS_MCP_CACHE_TTLS", "")
+
+    # ---- Request coalescing ----
+    SINGLE_FLIGHT_ENABLED = os.getenv("AWS_MCP_SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
+    # Single-instance DescribeInstances lookups arriving within this window share one call (0 disables)
+    BATCH_WINDOW_MS = float(os.getenv("AWS_MCP_BATCH_WINDOW_MS", "10"))
+
+    # ---- Server-side waiters ----
+    WAITER_ENABLED = os.getenv("AWS_MCP_WAITER_ENABLED", "true").lower() == "true"
+    # Seconds before the first poll, multiplied by WAITER_BACKOFF after each one up to WAITER_MAX_DELAY
+    WAITER_INITIAL_DELAY = float(os.getenv("AWS_MCP_WAITER_INITIAL_DELAY", "2"))
+    WAITER_BACKOFF = float(os.getenv("AWS_MCP_WAITER_BACKOFF", "1.5"))
+    WAITER_MAX_DELAY = float(os.getenv("AWS_MCP_WAITER_MAX_DELAY", "30"))
+    # An operation times out this long after it starts
+    WAITER_TIMEOUT = float(os.getenv("AWS_MCP_WAITER_TIMEOUT", "3600"))
+    # Longest a single ops.wait call blocks before returning the operation still pending
+    WAITER_WAIT_TIMEOUT = float(os.getenv("AWS_MCP_WAITER_WAIT_TIMEOUT", "300"))
+    WAITER_RETENTION = float(os.getenv("AWS_MCP_WAITER_RETENTION", "3600"))
+
+    # ---- Local resource inventory ----
+    INVENTORY_PATH = os.getenv("AWS_MCP_INVENTORY_PATH", "~/.aws/mcp_cache/inventory.sqlite")
+    # Incremental refreshes fall back to a full re-listing once the last one is this old
+    INVENTORY_FULL_SYNC_INTERVAL = float(os.getenv("AWS_MCP_INVENTORY_FULL_SYNC_INTERVAL", "3600"))
+    # JSONL file of EventBridge events (EC2 state changes, CloudTrail API calls) replayed on refresh
+    INVENTORY_EVENTS_PATH = os.getenv("AWS_MCP_INVENTORY_EVENTS_PATH", "")
+    INVENTORY_SCHEDULE = os.getenv("AWS_MCP_INVENTORY_SCHEDULE", "false").lower() == "true"
+    INVENTORY_REGIONS = [r for r in os.getenv("AWS_MCP_INVENTORY_REGIONS", "").split(",") if r]
+    INVENTORY_REFRESH_INTERVAL = float(os.getenv("AWS_MCP_INVENTORY_REFRESH_INTERVAL", "300"))
+
+    # ---- Local price index ----
+    PRICE_INDEX_PATH = os.getenv("AWS_MCP_PRICE_INDEX_PATH", "~/.aws/mcp_cache/prices.sqlite")
+    PRICE_INDEX_SOURCE = os.getenv("AWS_MCP_PRICE_INDEX_SOURCE", "offer")  # offer | api
+    PRICE_INDEX_MAX_AGE = float(os.getenv("AWS_MCP_PRICE_INDEX_MAX_AGE", str(7 * 86400)))
+    PRICE_INDEX_CHECK_INTERVAL = float(os.getenv("AWS_MCP_PRICE_INDEX_CHECK_INTERVAL", "3600"))
+    PRICE_INDEX_SCHEDULE = os.getenv("AWS_MCP_PRICE_INDEX_SCHEDULE", "false").lower() == "true"
+    PRICE_INDEX_REGIONS = [r for r in os.getenv("AWS_MCP_PRICE_INDEX_REGIONS", "").split(",") if r]
+    PRICE_OFFER_BASE_URL = os.getenv("AWS_MCP_PRICE_OFFER_BASE_URL", "https://pricing.us-east-1.amazonaws.com")
+
+    # ---- Spot price history store ----
+    SPOT_HISTORY_LOOKBACK_DAYS = int(os.getenv("AWS_MCP_SPOT_HISTORY_LOOKBACK_DAYS", "30"))
+    SPOT_REFRESH_INTERVAL = float(os.getenv("AWS_MCP_SPOT_REFRESH_INTERVAL", "300"))
@@ -0,0 +1,6 @@
+class AWSMCPError(Exception):
+    """Base class for errors raised by the MCP server itself (not by AWS)."""
+
+
+class ExecutorSaturatedError(AWSMCPError):
+    """Raised when a region's tool queue is full and the call is rejected."""
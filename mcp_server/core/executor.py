@@ -0,0 +1,141 @@
+"""
+Async dispatch of blocking tool functions.
+
+Every tool wraps synchronous boto3 calls. Running them on the event loop
+stalls every other MCP request, so registered tools are re-wrapped as async
+functions that hand the call to a bounded thread pool per AWS region. A
+region that is slow or throttled only backs up its own queue.
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from fastmcp.tools import FunctionTool
+
+from mcp_server.core.config import Settings
+from mcp_server.core.exceptions import ExecutorSaturatedError
+
+
+class RegionExecutor:
+    """Per-region thread pools with a queue-depth limit and basic metrics."""
+
+    def __init__(self, max_workers: Optional[int] = None, max_queue_depth: Optional[int] = None):
+        self.max_workers = max_workers or Settings.TOOL_MAX_WORKERS_PER_REGION
+        self.max_queue_depth = max_queue_depth or Settings.TOOL_MAX_QUEUE_DEPTH
+        self._lock = threading.Lock()
+        self._pools: Dict[str, ThreadPoolExecutor] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def _pool(self, region: str) -> ThreadPoolExecutor:
+        pool = self._pools.get(region)
+        if pool is None:
+            pool = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=f"aws-mcp-{region}",
+            )
+            self._pools[region] = pool
+            self._stats[region] = {
+                "submitted": 0,
+                "completed": 0,
+                "failed": 0,
+                "rejected": 0,
+                "queued": 0,
+                "running": 0,
+                "max_queue_depth_seen": 0,
+                "total_wait_seconds": 0.0,
+                "total_run_seconds": 0.0,
+            }
+        return pool
+
+    async def run(self, region: Optional[str], fn: Callable[..., Any], /, *args, **kwargs) -> Any:
+        """Run fn(*args, **kwargs) on the region's pool and await the result."""
+        region = region or Settings.DEFAULT_REGION
+
+        with self._lock:
+            pool = self._pool(region)
+            stats = self._stats[region]
+            if stats["queued"] >= self.max_queue_depth:
+                stats["rejected"] += 1
+                raise ExecutorSaturatedError(
+                    f"Tool queue for region {region} is full "
+                    f"({stats['queued']} waiting, limit {self.max_queue_depth}); retry shortly"
+                )
+            stats["submitted"] += 1
+            stats["queued"] += 1
+            stats["max_queue_depth_seen"] = max(stats["max_queue_depth_seen"], stats["queued"])
+
+        # Worker threads do not inherit contextvars; carry the caller's context along
+        ctx = contextvars.copy_context()
+        enqueued_at = time.perf_counter()
+
+        def call():
+            started_at = time.perf_counter()
+            with self._lock:
+                stats["queued"] -= 1
+                stats["running"] += 1
+                stats["total_wait_seconds"] += started_at - enqueued_at
+            failed = False
+            try:
+                return ctx.run(fn, *args, **kwargs)
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                with self._lock:
+                    stats["running"] -= 1
+                    stats["completed"] += 1
+                    stats["failed"] += int(failed)
+                    stats["total_run_seconds"] += time.perf_counter() - started_at
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(pool, call)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_workers_per_region": self.max_workers,
+                "max_queue_depth": self.max_queue_depth,
+                "regions": {region: dict(s) for region, s in self._stats.items()},
+            }
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.shutdown(wait=wait)
+
+
+_executor = RegionExecutor()
+
+
+def get_executor() -> RegionExecutor:
+    return _executor
+
+
+def dispatch_async(tool: FunctionTool, executor: Optional[RegionExecutor] = None) -> FunctionTool:
+    """
+    Return a copy of a FunctionTool whose sync fn runs on the region executor.
+
+    Async tools are returned unchanged. The wrapper keeps the original
+    signature (via functools.wraps) so FastMCP validates arguments as before.
+    """
+    fn = tool.fn
+    if inspect.iscoroutinefunction(fn):
+        return tool
+
+    executor = executor or _executor
+    signature = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    async def run_on_executor(*args, **kwargs):
+        region = signature.bind_partial(*args, **kwargs).arguments.get("region")
+        return await executor.run(region, fn, *args, **kwargs)
+
+    return tool.model_copy(update={"fn": run_on_executor})
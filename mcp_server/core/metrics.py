@@ -0,0 +1,402 @@
+"""
+Per-tool and per-AWS-operation instrumentation.
+
+When ``AWS_MCP_METRICS_ENABLED`` is set, a FastMCP middleware wraps every
+tool call and records wall time, outcome and serialized response size.
+Pooled boto3 clients get botocore event hooks that time each API call,
+count retries (``ResponseMetadata.RetryAttempts``), throttled attempts and
+time queued in the rate limiter (ratelimit.py), and attribute them both to
+the AWS operation and to the tool call that made them. Attribution uses a
+contextvar, which the region executor and fan-out helpers already carry
+into their worker threads.
+
+Nothing is installed when metrics are disabled, so the only cost is a
+settings check at startup and when a client is created.
+
+Stats are exposed as Prometheus text on ``AWS_MCP_METRICS_PATH`` (HTTP
+transports only) and through the ``admin.tool_stats`` tool.
+"""
+
+import bisect
+import contextvars
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from mcp_server.core.config import Settings
+
+# Error codes AWS uses to signal request-rate throttling
+THROTTLE_CODES = {
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottled",
+    "RequestThrottledException",
+    "RequestLimitExceeded",
+    "TooManyRequestsException",
+    "ProvisionedThroughputExceededException",
+    "EC2ThrottledException",
+    "BandwidthLimitExceeded",
+    "SlowDown",
+    "PriorRequestNotComplete",
+}
+
+# Prometheus histogram buckets for tool wall time, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_START_KEY = "aws_mcp_metrics_started"
+
+
+class _CallScope:
+    """AWS activity attributed to one in-flight tool call."""
+
+    __slots__ = ("aws_calls", "aws_seconds", "retries", "throttled", "rate_wait_seconds")
+
+    def __init__(self):
+        self.aws_calls = 0
+        self.aws_seconds = 0.0
+        self.retries = 0
+        self.throttled = 0
+        self.rate_wait_seconds = 0.0
+
+
+_scope: contextvars.ContextVar[Optional[_CallScope]] = contextvars.ContextVar("aws_mcp_metrics_scope", default=None)
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+class ToolStats:
+    __slots__ = (
+        "calls", "errors", "seconds", "max_seconds", "buckets", "recent",
+        "response_bytes", "aws_calls", "aws_seconds", "retries", "throttled", "rate_wait_seconds",
+    )
+
+    def __init__(self, sample_size: int):
+        self.calls = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.recent = deque(maxlen=sample_size)
+        self.response_bytes = 0
+        self.aws_calls = 0
+        self.aws_seconds = 0.0
+        self.retries = 0
+        self.throttled = 0
+        self.rate_wait_seconds = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        ordered = sorted(self.recent)
+        latency = {}
+        if ordered:
+            latency = {
+                "p50_ms": round(_percentile(ordered, 0.5) * 1000, 2),
+                "p95_ms": round(_percentile(ordered, 0.95) * 1000, 2),
+                "p99_ms": round(_percentile(ordered, 0.99) * 1000, 2),
+            }
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "mean_ms": round(self.seconds * 1000 / self.calls, 2) if self.calls else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 2),
+            **latency,
+            "response_bytes": self.response_bytes,
+            "mean_response_bytes": self.response_bytes // self.calls if self.calls else 0,
+            "aws_calls": self.aws_calls,
+            "aws_seconds": round(self.aws_seconds, 4),
+            "aws_retries": self.retries,
+            "aws_throttled": self.throttled,
+            "rate_limit_wait_seconds": round(self.rate_wait_seconds, 4),
+        }
+
+
+class OperationStats:
+    __slots__ = ("calls", "errors", "seconds", "max_seconds", "retries", "throttled", "waits", "wait_seconds")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.retries = 0
+        self.throttled = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "mean_ms": round(self.seconds * 1000 / self.calls, 2) if self.calls else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 2),
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "rate_limit_waits": self.waits,
+            "rate_limit_wait_seconds": round(self.wait_seconds, 4),
+        }
+
+
+# (service, operation, region)
+OperationKey = Tuple[str, str, str]
+
+
+class Metrics:
+    """Thread-safe registry of tool and AWS operation counters."""
+
+    def __init__(self, sample_size: Optional[int] = None):
+        self.sample_size = sample_size or Settings.METRICS_SAMPLE_SIZE
+        self._lock = threading.Lock()
+        self._tools: Dict[str, ToolStats] = {}
+        self._operations: Dict[OperationKey, OperationStats] = {}
+        self.started_at = time.time()
+
+    # -------------------------
+    # Tool calls
+    # -------------------------
+    def begin_tool(self) -> Tuple[_CallScope, contextvars.Token]:
+        scope = _CallScope()
+        return scope, _scope.set(scope)
+
+    def end_tool(self, name: str, scope: _CallScope, token: contextvars.Token,
+                 seconds: float, response_bytes: int, error: bool):
+        _scope.reset(token)
+        with self._lock:
+            stats = self._tools.get(name)
+            if stats is None:
+                stats = self._tools[name] = ToolStats(self.sample_size)
+            stats.calls += 1
+            stats.errors += int(error)
+            stats.seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            stats.recent.append(seconds)
+            stats.response_bytes += response_bytes
+            stats.aws_calls += scope.aws_calls
+            stats.aws_seconds += scope.aws_seconds
+            stats.retries += scope.retries
+            stats.throttled += scope.throttled
+            stats.rate_wait_seconds += scope.rate_wait_seconds
+
+    # -------------------------
+    # botocore hooks
+    # -------------------------
+    def attach(self, client):
+        """Register timing hooks on a boto3 client."""
+        events = client.meta.events
+        events.register("before-parameter-build.*.*", self._on_before_call)
+        events.register("response-received.*.*", self._on_response_received)
+        events.register("after-call.*.*", self._on_after_call)
+        events.register("after-call-error.*.*", self._on_after_call_error)
+
+    @staticmethod
+    def _on_before_call(context=None, **kwargs):
+        if context is not None:
+            context[_START_KEY] = time.perf_counter()
+
+    def _on_response_received(self, event_name=None, parsed_response=None, context=None, **kwargs):
+        # Fires once per HTTP attempt, so throttled attempts that were later retried are counted too
+        code = (parsed_response or {}).get("Error", {}).get("Code")
+        if code not in THROTTLE_CODES:
+            return
+        _, service, operation = event_name.split(".", 2)
+        key = (service, operation, (context or {}).get("client_region", ""))
+        scope = _scope.get()
+        with self._lock:
+            self._operation(key).throttled += 1
+            if scope is not None:
+                scope.throttled += 1
+
+    def _on_after_call(self, event_name=None, parsed=None, context=None, **kwargs):
+        parsed = parsed or {}
+        retries = parsed.get("ResponseMetadata", {}).get("RetryAttempts", 0) or 0
+        self._record(event_name, context, retries, error="Error" in parsed)
+
+    def _on_after_call_error(self, event_name=None, context=None, **kwargs):
+        self._record(event_name, context, 0, error=True)
+
+    def _record(self, event_name: str, context: Optional[dict], retries: int, error: bool):
+        context = context or {}
+        started = context.pop(_START_KEY, None)
+        seconds = time.perf_counter() - started if started is not None else 0.0
+        _, service, operation = event_name.split(".", 2)
+        key = (service, operation, context.get("client_region", ""))
+        scope = _scope.get()
+
+        with self._lock:
+            stats = self._operation(key)
+            stats.calls += 1
+            stats.errors += int(error)
+            stats.seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.retries += retries
+            if scope is not None:
+                scope.aws_calls += 1
+                scope.aws_seconds += seconds
+                scope.retries += retries
+
+    def record_wait(self, service: str, operation: str, region: str, seconds: float):
+        """Time an HTTP attempt spent queued in the client-side rate limiter."""
+        scope = _scope.get()
+        with self._lock:
+            stats = self._operation((service, operation, region))
+            stats.waits += 1
+            stats.wait_seconds += seconds
+            if scope is not None:
+                scope.rate_wait_seconds += seconds
+
+    def _operation(self, key: OperationKey) -> OperationStats:
+        stats = self._operations.get(key)
+        if stats is None:
+            stats = self._operations[key] = OperationStats()
+        return stats
+
+    # -------------------------
+    # Reporting
+    # -------------------------
+    def stats(self, tool: Optional[str] = None) -> Dict[str, Any]:
+        with self._lock:
+            tools = {
+                name: s.snapshot() for name, s in sorted(self._tools.items())
+                if not tool or name.startswith(tool)
+            }
+            operations = {
+                f"{service}.{operation}@{region}": s.snapshot()
+                for (service, operation, region), s in sorted(self._operations.items())
+            }
+        return {
+            "enabled": True,
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "tools": tools,
+            "aws_operations": operations,
+        }
+
+    def reset(self):
+        with self._lock:
+            self._tools.clear()
+            self._operations.clear()
+            self.started_at = time.time()
+
+    def prometheus(self) -> str:
+        """Render every counter in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def family(name, kind, help_text):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            tools = sorted(self._tools.items())
+            operations = sorted(self._operations.items())
+
+            family("aws_mcp_tool_calls_total", "counter", "Tool calls by outcome.")
+            for name, s in tools:
+                lines.append(f'aws_mcp_tool_calls_total{{tool="{name}",outcome="ok"}} {s.calls - s.errors}')
+                lines.append(f'aws_mcp_tool_calls_total{{tool="{name}",outcome="error"}} {s.errors}')
+
+            family("aws_mcp_tool_duration_seconds", "histogram", "Tool wall time.")
+            for name, s in tools:
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, s.buckets):
+                    cumulative += count
+                    lines.append(f'aws_mcp_tool_duration_seconds_bucket{{tool="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'aws_mcp_tool_duration_seconds_bucket{{tool="{name}",le="+Inf"}} {s.calls}')
+                lines.append(f'aws_mcp_tool_duration_seconds_sum{{tool="{name}"}} {s.seconds:.6f}')
+                lines.append(f'aws_mcp_tool_duration_seconds_count{{tool="{name}"}} {s.calls}')
+
+            family("aws_mcp_tool_response_bytes_total", "counter", "Serialized tool response bytes.")
+            for name, s in tools:
+                lines.append(f'aws_mcp_tool_response_bytes_total{{tool="{name}"}} {s.response_bytes}')
+
+            family("aws_mcp_tool_aws_calls_total", "counter", "AWS API calls made by each tool.")
+            for name, s in tools:
+                lines.append(f'aws_mcp_tool_aws_calls_total{{tool="{name}"}} {s.aws_calls}')
+
+            family("aws_mcp_aws_calls_total", "counter", "AWS API calls by operation and outcome.")
+            for (service, operation, region), s in operations:
+                labels = f'service="{service}",operation="{operation}",region="{region}"'
+                lines.append(f'aws_mcp_aws_calls_total{{{labels},outcome="ok"}} {s.calls - s.errors}')
+                lines.append(f'aws_mcp_aws_calls_total{{{labels},outcome="error"}} {s.errors}')
+
+            family("aws_mcp_aws_call_duration_seconds", "summary", "AWS API call latency including retries.")
+            for (service, operation, region), s in operations:
+                labels = f'service="{service}",operation="{operation}",region="{region}"'
+                lines.append(f"aws_mcp_aws_call_duration_seconds_sum{{{labels}}} {s.seconds:.6f}")
+                lines.append(f"aws_mcp_aws_call_duration_seconds_count{{{labels}}} {s.calls}")
+
+            family("aws_mcp_aws_retries_total", "counter", "botocore retry attempts.")
+            for (service, operation, region), s in operations:
+                labels = f'service="{service}",operation="{operation}",region="{region}"'
+                lines.append(f"aws_mcp_aws_retries_total{{{labels}}} {s.retries}")
+
+            family("aws_mcp_aws_throttled_total", "counter", "HTTP attempts rejected with a throttling error.")
+            for (service, operation, region), s in operations:
+                labels = f'service="{service}",operation="{operation}",region="{region}"'
+                lines.append(f"aws_mcp_aws_throttled_total{{{labels}}} {s.throttled}")
+
+            family("aws_mcp_aws_rate_limit_wait_seconds", "summary", "Time spent queued in the client-side rate limiter.")
+            for (service, operation, region), s in operations:
+                labels = f'service="{service}",operation="{operation}",region="{region}"'
+                lines.append(f"aws_mcp_aws_rate_limit_wait_seconds_sum{{{labels}}} {s.wait_seconds:.6f}")
+                lines.append(f"aws_mcp_aws_rate_limit_wait_seconds_count{{{labels}}} {s.waits}")
+
+        return "\n".join(lines) + "\n"
+
+
+_metrics = Metrics()
+
+
+def get_metrics() -> Metrics:
+    return _metrics
+
+
+# =======================================================
+# SERVER INTEGRATION
+# =======================================================
+def _response_bytes(result) -> int:
+    return sum(len(getattr(block, "text", None) or "") for block in getattr(result, "content", None) or ())
+
+
+def _is_error(result) -> bool:
+    if getattr(result, "is_error", False):
+        return True
+    # Tools report failures as {"error": "..."} rather than raising
+    structured = getattr(result, "structured_content", None)
+    return isinstance(structured, dict) and "error" in structured
+
+
+def install(mcp, metrics: Optional[Metrics] = None):
+    """Attach the timing middleware and the Prometheus route to a FastMCP server."""
+    from fastmcp.server.middleware import Middleware
+    from starlette.responses import PlainTextResponse
+
+    metrics = metrics or _metrics
+
+    class ToolMetricsMiddleware(Middleware):
+        async def on_call_tool(self, context, call_next):
+            scope, token = metrics.begin_tool()
+            started = time.perf_counter()
+            result = None
+            try:
+                result = await call_next(context)
+                return result
+            finally:
+                metrics.end_tool(
+                    context.message.name,
+                    scope,
+                    token,
+                    time.perf_counter() - started,
+                    _response_bytes(result),
+                    error=result is None or _is_error(result),
+                )
+
+    mcp.add_middleware(ToolMetricsMiddleware())
+
+    @mcp.custom_route(Settings.METRICS_PATH, methods=["GET"], include_in_schema=False)
+    async def prometheus_metrics(request):
+        return PlainTextResponse(metrics.prometheus(), media_type="text/plain; version=0.0.4")
+
+    print(f"[Metrics] Tool instrumentation enabled (HTTP route {Settings.METRICS_PATH})", file=sys.stderr)
@@ -0,0 +1,143 @@
+"""
+Shared pagination layer for describe/list tools.
+
+Wraps botocore paginators so every tool walks all pages up to an overall
+item cap and hands back an opaque continuation cursor. Passing that cursor
+back as ``next_token`` resumes exactly where the previous call stopped, so
+earlier pages are never re-fetched.
+
+``paginate_nested`` is the variant for responses that group their items
+(DescribeInstances returns Reservations holding Instances): it counts and
+returns the nested items, and a cursor can stop part-way through a page.
+"""
+
+import base64
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from mcp_server.core.config import Settings
+
+
+def paginate(
+    client,
+    operation: str,
+    *,
+    params: Optional[Dict[str, Any]] = None,
+    page_size: Optional[int] = None,
+    max_items: Optional[int] = None,
+    next_token: Optional[str] = None,
+    result_key: Optional[str] = None,
+    transform: Optional[Callable[[List[Any]], List[Any]]] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Collect items for a paginated AWS operation.
+
+    Args:
+        client: boto3 client (see mcp_server.core.clients.get_client)
+        operation: Paginated operation name, e.g. "describe_instances"
+        params: Request parameters; keys with None values are dropped
+        page_size: MaxResults sent per API call (None = service default)
+        max_items: Overall item cap for this call (defaults to Settings.PAGINATION_MAX_ITEMS)
+        next_token: Cursor returned by a previous call
+        result_key: Response key holding the items (defaults to the paginator's first result key)
+        transform: Applied to each page's items as it arrives (e.g. field projection),
+            so untransformed items are never held for the whole listing
+
+    Returns:
+        (items, next_token) — next_token is None once the listing is exhausted.
+    """
+    paginator = client.get_paginator(operation)
+    result_key = result_key or paginator.result_keys[0].expression
+
+    request = {k: v for k, v in (params or {}).items() if v is not None}
+
+    pagination_config: Dict[str, Any] = {
+        "MaxItems": max_items or Settings.PAGINATION_MAX_ITEMS,
+    }
+    if page_size:
+        pagination_config["PageSize"] = page_size
+    if next_token:
+        pagination_config["StartingToken"] = next_token
+
+    pages = paginator.paginate(**request, PaginationConfig=pagination_config)
+
+    items: List[Any] = []
+    for page in pages:
+        page_items = page.get(result_key, [])
+        items.extend(transform(page_items) if transform else page_items)
+
+    return items, pages.resume_token
+
+
+def _encode_cursor(token: Optional[str], skip: int, page_size: Optional[int]) -> str:
+    cursor = {"NextToken": token, "Skip": skip, "PageSize": page_size}
+    return base64.urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+
+
+def _decode_cursor(next_token: str) -> Dict[str, Any]:
+    try:
+        return json.loads(base64.urlsafe_b64decode(next_token.encode()))
+    except ValueError:
+        raise ValueError(f"next_token {next_token!r} was not returned by this tool") from None
+
+
+def paginate_nested(
+    client,
+    operation: str,
+    *,
+    item_key: str,
+    params: Optional[Dict[str, Any]] = None,
+    page_size: Optional[int] = None,
+    max_items: Optional[int] = None,
+    next_token: Optional[str] = None,
+    result_key: Optional[str] = None,
+    transform: Optional[Callable[[List[Any]], List[Any]]] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Collect the items nested under each result of a NextToken / MaxResults
+    paginated operation, e.g. the Instances of every Reservation.
+
+    max_items counts the nested items, so a call never returns more than
+    asked; when the cap falls inside a page the cursor records the page's
+    token and how many of its items were already returned.
+
+    Args:
+        item_key: Key of the nested list inside each result, e.g. "Instances"
+        (other arguments as for paginate)
+
+    Returns:
+        (nested items, next_token) — next_token is None once the listing is exhausted.
+    """
+    result_key = result_key or client.get_paginator(operation).result_keys[0].expression
+    call = getattr(client, operation)
+    request = {k: v for k, v in (params or {}).items() if v is not None}
+    limit = max_items or Settings.PAGINATION_MAX_ITEMS
+
+    cursor = _decode_cursor(next_token) if next_token else {}
+    token, skip = cursor.get("NextToken"), cursor.get("Skip", 0)
+    # A page cut part-way is re-requested with the size it was first fetched with
+    size = cursor.get("PageSize") if skip else page_size
+
+    items: List[Any] = []
+    while True:
+        page_request = dict(request)
+        if size:
+            page_request["MaxResults"] = size
+        if token:
+            page_request["NextToken"] = token
+        response = call(**page_request)
+
+        nested = [item for result in response.get(result_key, []) for item in result.get(item_key, [])]
+        remaining = nested[skip:]
+        room = limit - len(items)
+        if len(remaining) > room:
+            kept = remaining[:room]
+            items.extend(transform(kept) if transform else kept)
+            return items, _encode_cursor(token, skip + room, size)
+        items.extend(transform(remaining) if transform else remaining)
+
+        token, skip, size = response.get("NextToken"), 0, page_size
+        if not token:
+            return items, None
+        if len(items) >= limit:
+            return items, _encode_cursor(token, 0, size)
@@ -0,0 +1,230 @@
+"""
+Client-side rate limiting per AWS API action.
+
+AWS throttles per account, region and action (EC2 uses a token bucket per
+API action), so concurrent agents bursting DescribeInstances or
+GetProducts used to fail with RequestLimitExceeded / ThrottlingException
+once botocore ran out of retries. Every HTTP attempt made by a pooled client
+now takes a token from a bucket keyed by (profile, region, service, action).
+
+* Callers beyond the burst reserve future slots in arrival order and sleep
+  until theirs comes up, so bursts are spread out instead of rejected.
+* The refill rate adapts (AIMD): it is cut by 30% when AWS answers with a
+  throttling error and climbs back linearly as requests succeed.
+* botocore's own ``adaptive`` retry mode stays underneath as the
+  per-client backstop.
+
+Limits come from ``DEFAULT_LIMITS`` and can be overridden per action, per
+service or globally with ``AWS_MCP_RATE_LIMITS``, e.g.
+``{"ec2.DescribeInstances": {"rate": 10, "burst": 50}, "pricing.*": {"rate": 2}}``.
+"""
+
+import json
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from mcp_server.core.config import Settings
+from mcp_server.core.metrics import THROTTLE_CODES, get_metrics
+
+# (refill rate per second, burst), looked up as "service.Action", then "service.*", then "*"
+DEFAULT_LIMITS: Dict[str, Tuple[float, float]] = {
+    "*": (Settings.RATE_LIMIT_DEFAULT_RATE, Settings.RATE_LIMIT_DEFAULT_BURST),
+    # EC2 non-mutating actions share a generous bucket; resource-creating ones are much tighter
+    "ec2.*": (20.0, 100.0),
+    "ec2.RunInstances": (2.0, 5.0),
+    "ec2.StartInstances": (5.0, 50.0),
+    "ec2.StopInstances": (5.0, 50.0),
+    "ec2.TerminateInstances": (5.0, 50.0),
+    "ec2.CreateVolume": (5.0, 50.0),
+    "ec2.CreateSnapshot": (5.0, 50.0),
+    "pricing.*": (5.0, 10.0),
+}
+
+# The rate never drops below this fraction of its configured value
+MIN_RATE_FRACTION = 0.05
+# Multiplicative decrease on throttling (the same beta as botocore's adaptive mode),
+# applied at most once per DECREASE_INTERVAL seconds
+DECREASE_FACTOR = 0.7
+DECREASE_INTERVAL = 1.0
+# Additive increase per successful attempt, as a fraction of the configured rate
+INCREASE_FRACTION = 0.02
+
+# (profile, region, service, action)
+BucketKey = Tuple[Optional[str], str, str, str]
+
+
+class TokenBucket:
+    """
+    Token bucket with FIFO reservations.
+
+    ``reserve`` always succeeds; when the bucket is empty the token count goes
+    negative and the returned delay is how long the caller must wait for the
+    tokens reserved ahead of it to refill.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self.tokens = self.burst
+        self._updated = time.monotonic()
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+        self.acquired = 0
+        self.delayed = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.throttled = 0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            self.acquired += 1
+            if delay:
+                self.delayed += 1
+                self.wait_seconds += delay
+                self.max_wait_seconds = max(self.max_wait_seconds, delay)
+            return delay
+
+    def on_throttled(self):
+        with self._lock:
+            self.throttled += 1
+            now = time.monotonic()
+            if now - self._last_decrease < DECREASE_INTERVAL:
+                return
+            self._refill(now)
+            self._last_decrease = now
+            self.rate = max(self.max_rate * MIN_RATE_FRACTION, self.rate * DECREASE_FACTOR)
+            # Drop the remaining burst so queued callers are paced at the new rate
+            self.tokens = min(self.tokens, 0.0)
+
+    def on_success(self):
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + self.max_rate * INCREASE_FRACTION)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "rate": round(self.rate, 3),
+                "max_rate": self.max_rate,
+                "burst": self.burst,
+                "tokens": round(self.tokens, 2),
+                "acquired": self.acquired,
+                "delayed": self.delayed,
+                "wait_seconds": round(self.wait_seconds, 3),
+                "max_wait_seconds": round(self.max_wait_seconds, 3),
+                "throttled": self.throttled,
+            }
+
+
+class RateLimiter:
+    """Token buckets per (profile, region, service, action), wired in via botocore events."""
+
+    def __init__(self, overrides: Optional[Dict[str, Dict[str, float]]] = None, max_wait: Optional[float] = None):
+        self.limits = dict(DEFAULT_LIMITS)
+        for name, limit in (overrides or {}).items():
+            rate, burst = self.limits.get(name, self.limits["*"])
+            rate = float(limit.get("rate", rate))
+            self.limits[name] = (rate, float(limit.get("burst", max(burst, rate))))
+        self.max_wait = Settings.RATE_LIMIT_MAX_WAIT if max_wait is None else max_wait
+        self._lock = threading.Lock()
+        self._buckets: Dict[BucketKey, TokenBucket] = {}
+
+    def limit_for(self, service: str, action: str) -> Tuple[float, float]:
+        return (
+            self.limits.get(f"{service}.{action}")
+            or self.limits.get(f"{service}.*")
+            or self.limits["*"]
+        )
+
+    def bucket(self, key: BucketKey) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = self._buckets[key] = TokenBucket(*self.limit_for(key[2], key[3]))
+        return bucket
+
+    def acquire(self, key: BucketKey) -> float:
+        """Take a token, sleeping for this caller's slot if needed. Returns the wait in seconds."""
+        delay = self.bucket(key).reserve()
+        if delay:
+            if delay > self.max_wait:
+                # Past this point waiting ties up a worker for little gain; let AWS decide
+                print(
+                    f"[RateLimit] {key[2]}.{key[3]} in {key[1]} is {delay:.1f}s behind; "
+                    f"sending after {self.max_wait:.0f}s",
+                    file=sys.stderr,
+                )
+                delay = self.max_wait
+            time.sleep(delay)
+        return delay
+
+    # -------------------------
+    # botocore hooks
+    # -------------------------
+    def attach(self, client, profile: Optional[str], region: str):
+        """Pace every HTTP attempt (retries included) of a pooled client."""
+
+        def key_for(event_name: str) -> BucketKey:
+            _, service, action = event_name.split(".", 2)
+            return (profile, region, service, action)
+
+        def before_send(event_name=None, **kwargs):
+            key = key_for(event_name)
+            waited = self.acquire(key)
+            if waited and Settings.METRICS_ENABLED:
+                get_metrics().record_wait(key[2], key[3], region, waited)
+
+        def response_received(event_name=None, parsed_response=None, exception=None, **kwargs):
+            if exception is not None:
+                return
+            code = (parsed_response or {}).get("Error", {}).get("Code")
+            bucket = self.bucket(key_for(event_name))
+            if code in THROTTLE_CODES:
+                bucket.on_throttled()
+            elif code is None:
+                bucket.on_success()
+
+        client.meta.events.register("before-send.*.*", before_send)
+        client.meta.events.register("response-received.*.*", response_received)
+
+    # -------------------------
+    # Reporting
+    # -------------------------
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            buckets = sorted(self._buckets.items(), key=lambda kv: tuple(str(k) for k in kv[0]))
+        return {
+            "enabled": Settings.RATE_LIMIT_ENABLED,
+            "max_wait_seconds": self.max_wait,
+            "buckets": {
+                f"{service}.{action}@{region}" + (f"[{profile}]" if profile else ""): bucket.stats()
+                for (profile, region, service, action), bucket in buckets
+            },
+        }
+
+    def reset(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+_limiter = RateLimiter(overrides=json.loads(Settings.RATE_LIMITS or "{}"))
+
+
+def get_rate_limiter() -> RateLimiter:
+    return _limiter
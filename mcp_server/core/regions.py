@@ -0,0 +1,138 @@
+"""
+Region discovery and multi-region fan-out.
+
+Inventory tools accept ``regions=["*"]`` (or an explicit list) and run the
+single-region implementation concurrently in every target region, so the
+call takes roughly as long as the slowest region instead of the sum.
+"""
+
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+from mcp_server.core.clients import get_client
+from mcp_server.core.config import Settings
+
+_regions_lock = threading.Lock()
+_regions_cache: Dict[str, Any] = {"regions": None, "fetched_at": 0.0}
+
+_fanout_pool = ThreadPoolExecutor(
+    max_workers=Settings.FANOUT_MAX_WORKERS,
+    thread_name_prefix="aws-mcp-fanout",
+)
+
+
+def get_enabled_regions(refresh: bool = False) -> List[str]:
+    """Regions enabled for the account, discovered once via DescribeRegions and cached."""
+    with _regions_lock:
+        age = time.time() - _regions_cache["fetched_at"]
+        if refresh or _regions_cache["regions"] is None or age > Settings.REGION_CACHE_TTL:
+            ec2 = get_client("ec2", Settings.DEFAULT_REGION)
+            resp = ec2.describe_regions(AllRegions=False)
+            _regions_cache["regions"] = sorted(r["RegionName"] for r in resp.get("Regions", []))
+            _regions_cache["fetched_at"] = time.time()
+        return list(_regions_cache["regions"])
+
+
+def resolve_regions(regions: List[str]) -> List[str]:
+    """Expand "*" to every enabled region and drop duplicates, keeping order."""
+    resolved: List[str] = []
+    for region in regions:
+        expanded = get_enabled_regions() if region in ("*", "all") else [region]
+        for r in expanded:
+            if r not in resolved:
+                resolved.append(r)
+    return resolved
+
+
+def _timed_call(fn: Callable[..., Any], region: str, kwargs: Dict[str, Any]):
+    started = time.perf_counter()
+    try:
+        return fn(region=region, **kwargs), None, time.perf_counter() - started
+    except Exception as e:
+        return None, str(e), time.perf_counter() - started
+
+
+def fan_out(fn: Callable[..., Any], regions: List[str], **kwargs) -> Dict[str, Any]:
+    """
+    Call fn(region=<r>, **kwargs) concurrently for every target region.
+
+    Returns the raw per-region results plus latency and error per region.
+    Failures in one region never fail the whole call; only a failure to
+    discover the regions ("*") returns {"error": ...}.
+    """
+    started = time.perf_counter()
+    try:
+        targets = resolve_regions(regions)
+    except Exception as e:
+        return {"error": f"Could not resolve regions: {e}"}
+
+    futures = {
+        region: _fanout_pool.submit(
+            contextvars.copy_context().run, _timed_call, fn, region, kwargs
+        )
+        for region in targets
+    }
+
+    results: Dict[str, Any] = {}
+    region_stats: Dict[str, Dict[str, Any]] = {}
+
+    for region, future in futures.items():
+        result, error, latency = future.result()
+        if error is None and isinstance(result, dict) and "error" in result:
+            error = result["error"]
+
+        region_stats[region] = {"latency_ms": round(latency * 1000, 1)}
+        if error is not None:
+            region_stats[region]["error"] = error
+        else:
+            results[region] = result
+
+    return {
+        "regions": targets,
+        "results": results,
+        "region_stats": region_stats,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+def fan_out_merge(
+    fn: Callable[..., Any],
+    regions: List[str],
+    items_key: str,
+    region_key: str = "region",
+    **kwargs,
+) -> Dict[str, Any]:
+    """
+    Fan out a list-style tool and merge its ``items_key`` lists into one,
+    tagging every item with the region it came from.
+    """
+    fanned = fan_out(fn, regions, **kwargs)
+    if "error" in fanned:
+        return fanned
+
+    merged: List[Any] = []
+    for region in fanned["regions"]:
+        result = fanned["results"].get(region)
+        if result is None:
+            continue
+
+        items = result.get(items_key, []) if isinstance(result, dict) else result
+        for item in items:
+            if isinstance(item, dict):
+                item[region_key] = region
+            merged.append(item)
+
+        stats = fanned["region_stats"][region]
+        stats["count"] = len(items)
+        if isinstance(result, dict) and result.get("next_token"):
+            stats["next_token"] = result["next_token"]
+
+    return {
+        "regions": fanned["regions"],
+        items_key: merged,
+        "region_stats": fanned["region_stats"],
+        "elapsed_ms": fanned["elapsed_ms"],
+    }
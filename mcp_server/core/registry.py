@@ -1,19 +1,86 @@
+import asyncio
+import hashlib
 import importlib
+import json
 import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from fastmcp.tools import FunctionTool
+from pydantic import PrivateAttr
+
 import mcp_server.tools
+from mcp_server.core.config import Settings
+from mcp_server.core.executor import dispatch_async
+
+MANIFEST_VERSION = 1
+
+# Tool metadata is derived from these packages; any change invalidates the manifest
+_MANIFEST_SOURCES = ("tools", "models")
+
+
+def _source_hashes() -> Dict[str, str]:
+    root = Path(mcp_server.tools.__file__).resolve().parent.parent
+    hashes = {}
+    for package in _MANIFEST_SOURCES:
+        for path in sorted((root / package).rglob("*.py")):
+            hashes[str(path.relative_to(root))] = hashlib.sha1(path.read_bytes()).hexdigest()
+    return hashes
+
+
+async def _unresolved(**kwargs):
+    raise RuntimeError("Lazy tool called before its implementation was imported")
+
+
+class LazyTool(FunctionTool):
+    """
+    Tool advertised from the manifest. Its implementing module (and boto3 with
+    it) is imported on the first call; later calls go straight to the real tool.
+    """
+
+    module: str
+    _resolved: Optional[FunctionTool] = PrivateAttr(default=None)
+
+    def resolve(self) -> FunctionTool:
+        if self._resolved is None:
+            started = time.perf_counter()
+            mod = importlib.import_module(self.module)
+            tool = next((t for t in getattr(mod, "tools", []) if t.name == self.name), None)
+            if tool is None:
+                raise RuntimeError(f"Tool {self.name} not found in {self.module}; rebuild the tool manifest")
+            if Settings.TOOL_EXECUTION_MODE == "async":
+                tool = dispatch_async(tool)
+            self._resolved = tool
+            print(
+                f"[Registry] Imported {self.module} for {self.name} "
+                f"in {(time.perf_counter() - started) * 1000:.0f} ms",
+                file=sys.stderr,
+            )
+        return self._resolved
+
+    async def run(self, arguments: Dict[str, Any]):
+        tool = self._resolved
+        if tool is None:
+            # Imports can take a while; keep them off the event loop
+            tool = await asyncio.get_running_loop().run_in_executor(None, self.resolve)
+        return await tool.run(arguments)
 
 
 class ToolRegistry:
     @staticmethod
-    def load_all_tools():
+    def _import_tools() -> List[FunctionTool]:
         all_tools = []
-        
+
         # Only load from service-level modules that have implementations
         # This avoids duplicate registration from individual tool files
         service_modules = [
             "mcp_server.tools.ec2",
             "mcp_server.tools.ebs",
-            "mcp_server.tools.vpc"
+            "mcp_server.tools.vpc",
+            "mcp_server.tools.inventory",
+            "mcp_server.tools.ops",
+            "mcp_server.tools.admin",
             # Add more service modules as they are implemented:
             # "mcp_server.tools.ecs",
             # "mcp_server.tools.ecr",
@@ -32,7 +99,7 @@ class ToolRegistry:
                 continue
 
             tools_list = getattr(mod, "tools", None)
-            
+
             if tools_list:
                 print(f"[Registry] Found {len(tools_list)} tools from {module_name}", file=sys.stderr)
                 all_tools.extend(tools_list)
@@ -41,3 +108,95 @@ class ToolRegistry:
 
         print(f"[Registry] Total tools loaded: {len(all_tools)}", file=sys.stderr)
         return all_tools
+
+    @staticmethod
+    def load_all_tools():
+        """Import every tool module eagerly (and refresh the lazy-loading manifest)."""
+        all_tools = ToolRegistry._import_tools()
+
+        try:
+            ToolRegistry.write_manifest(all_tools)
+        except OSError as e:
+            print(f"[Registry] Could not write tool manifest => {e}", file=sys.stderr)
+
+        if Settings.TOOL_EXECUTION_MODE == "async":
+            # Blocking boto3 tools run on per-region worker pools instead of the event loop
+            all_tools = [dispatch_async(tool) for tool in all_tools]
+            print(f"[Registry] Async execution enabled (workers/region={Settings.TOOL_MAX_WORKERS_PER_REGION})", file=sys.stderr)
+
+        return all_tools
+
+    # -------------------------
+    # Manifest
+    # -------------------------
+    @staticmethod
+    def manifest_path() -> Path:
+        return Path(Settings.TOOL_MANIFEST_PATH).expanduser()
+
+    @staticmethod
+    def write_manifest(tools: List[FunctionTool], path: Optional[Path] = None) -> Path:
+        path = path or ToolRegistry.manifest_path()
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "sources": _source_hashes(),
+            "tools": [
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "parameters": tool.parameters,
+                    "output_schema": tool.output_schema,
+                    "module": tool.fn.__module__,
+                }
+                for tool in tools
+            ],
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(manifest))
+        tmp.replace(path)
+        return path
+
+    @staticmethod
+    def read_manifest(path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+        """The manifest, or None when it is missing or built from different sources."""
+        path = path or ToolRegistry.manifest_path()
+        try:
+            manifest = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        if manifest.get("version") != MANIFEST_VERSION or manifest.get("sources") != _source_hashes():
+            return None
+        return manifest
+
+    @staticmethod
+    def load_lazy_tools():
+        """
+        Advertise tools from the manifest without importing their modules.
+        Falls back to an eager load (which rewrites the manifest) when the
+        manifest is missing or stale.
+        """
+        manifest = ToolRegistry.read_manifest()
+        if manifest is None:
+            print("[Registry] Tool manifest missing or stale; loading eagerly", file=sys.stderr)
+            return ToolRegistry.load_all_tools()
+
+        tools = [
+            LazyTool(
+                name=entry["name"],
+                description=entry["description"],
+                parameters=entry["parameters"],
+                output_schema=entry.get("output_schema"),
+                module=entry["module"],
+                fn=_unresolved,
+            )
+            for entry in manifest["tools"]
+        ]
+        print(f"[Registry] {len(tools)} tools registered lazily from manifest", file=sys.stderr)
+        return tools
+
+    @staticmethod
+    def load_tools():
+        if Settings.TOOL_LOADING == "lazy":
+            return ToolRegistry.load_lazy_tools()
+        return ToolRegistry.load_all_tools()
@@ -0,0 +1,133 @@
+"""
+Request coalescing (single-flight) for read-only tools.
+
+Several agent sessions often ask for the same thing at the same moment
+(the default VPC of a region, describe_images with the same owners, ...).
+The response cache only helps once the first call has finished; until then
+every caller goes to AWS. Tools wrapped with ``@coalesced`` share one
+in-flight call per normalized (operation, region, params) key: the first
+caller runs it, concurrent identical callers wait for and receive a copy of
+its result (or its exception).
+
+Nothing is remembered once the call completes; that is the cache's job.
+"""
+
+import copy
+import functools
+import inspect
+import json
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from mcp_server.core.config import Settings
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Thread-safe registry of in-flight calls keyed by string."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def make_key(operation: str, params: Dict[str, Any]) -> str:
+        # Unset optional parameters do not change the request
+        params = {k: v for k, v in params.items() if v is not None}
+        params.setdefault("region", Settings.DEFAULT_REGION)
+        return json.dumps([operation, params], sort_keys=True, default=str)
+
+    def do(self, operation: str, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            stats = self._stats.setdefault(operation, {"calls": 0, "executed": 0, "shared": 0, "max_waiters": 0})
+            stats["calls"] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                stats["executed"] += 1
+            else:
+                call.waiters += 1
+                stats["shared"] += 1
+                stats["max_waiters"] = max(stats["max_waiters"], call.waiters)
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            # Callers may mutate responses (e.g. fan-out adds a region column)
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            operations = {op: dict(s) for op, s in sorted(self._stats.items())}
+            in_flight = len(self._calls)
+        calls = sum(s["calls"] for s in operations.values())
+        shared = sum(s["shared"] for s in operations.values())
+        return {
+            "enabled": Settings.SINGLE_FLIGHT_ENABLED,
+            "in_flight": in_flight,
+            "calls": calls,
+            "deduplicated": shared,
+            "dedup_ratio": round(shared / calls, 4) if calls else 0.0,
+            "operations": operations,
+        }
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+_flights = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    return _flights
+
+
+def coalesced(operation: str):
+    """
+    Share one in-flight execution of a read-only tool function between
+    concurrent callers with identical parameters.
+
+    Args:
+        operation: Stats namespace and key prefix, normally the tool name
+    """
+
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not Settings.SINGLE_FLIGHT_ENABLED:
+                return fn(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = _flights.make_key(operation, dict(bound.arguments))
+            return _flights.do(operation, key, lambda: fn(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,408 @@
+"""
+Server-side waiters for long-running AWS operations.
+
+RunInstances, CreateSnapshot, CreateImage, AttachVolume and CopySnapshot
+return immediately while the resource is still pending, and an agent used to
+find out when it was ready by calling describe tools in a loop, paying for
+every round trip in tokens and API calls. The mutating tools now register an
+*operation* (a handle on the resources and the state they should reach) and
+return its ``operation_id``; ``ops.wait`` blocks on it server-side, streaming
+progress notifications, and ``ops.status`` reports it without blocking.
+
+A single daemon thread polls every pending operation:
+
+* Each operation backs off exponentially between polls (``AWS_MCP_WAITER_*``
+  settings), like botocore's waiters but without holding a worker per waiter.
+* Operations of the same kind, region and profile that are due are polled
+  together: one filtered describe call (200 IDs per call) covers them all.
+  Operations due within half their current delay ride along for free.
+* Resources are looked up with ID *filters* so one unknown ID does not fail
+  the whole batch; a resource still missing after ``MISSING_LIMIT`` polls
+  fails its operation.
+
+Operations live in memory only and are dropped ``AWS_MCP_WAITER_RETENTION``
+seconds after they finish.
+"""
+
+import sys
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from mcp_server.core.batcher import describe_instances_by_id
+from mcp_server.core.clients import get_client
+from mcp_server.core.config import Settings
+
+# EC2 accepts at most 200 values per filter
+MAX_POLL_IDS = 200
+# Polls in a row a resource may be missing (describe calls are eventually consistent)
+MISSING_LIMIT = 5
+# Failed describe calls in a row before an operation gives up
+MAX_POLL_ERRORS = 5
+
+PENDING = "pending"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+TIMED_OUT = "timed_out"
+
+# Resource ID -> (state, progress in [0, 1] or None)
+StateMap = Dict[str, Tuple[str, Optional[float]]]
+
+
+# -------------------------
+# Describe functions, one per resource kind
+# -------------------------
+def _filtered(ec2, method: str, key: str, filter_name: str, ids: List[str]) -> Iterable[Dict[str, Any]]:
+    paginator = ec2.get_paginator(method)
+    for start in range(0, len(ids), MAX_POLL_IDS):
+        chunk = ids[start:start + MAX_POLL_IDS]
+        for page in paginator.paginate(Filters=[{"Name": filter_name, "Values": chunk}]):
+            yield from page.get(key, [])
+
+
+def _instance_states(ids: List[str], region: str, profile: Optional[str]) -> StateMap:
+    found = describe_instances_by_id(ids, region, profile)
+    return {i: (inst["State"]["Name"], None) for i, inst in found.items()}
+
+
+def _snapshot_states(ids: List[str], region: str, profile: Optional[str]) -> StateMap:
+    ec2 = get_client("ec2", region, profile)
+    states = {}
+    for snap in _filtered(ec2, "describe_snapshots", "Snapshots", "snapshot-id", ids):
+        progress = (snap.get("Progress") or "").rstrip("%")
+        states[snap["SnapshotId"]] = (snap["State"], float(progress) / 100 if progress else None)
+    return states
+
+
+def _image_states(ids: List[str], region: str, profile: Optional[str]) -> StateMap:
+    ec2 = get_client("ec2", region, profile)
+    return {
+        image["ImageId"]: (image["State"], None)
+        for image in _filtered(ec2, "describe_images", "Images", "image-id", ids)
+    }
+
+
+def _volume_states(ids: List[str], region: str, profile: Optional[str]) -> StateMap:
+    ec2 = get_client("ec2", region, profile)
+    return {
+        vol["VolumeId"]: (vol["State"], None)
+        for vol in _filtered(ec2, "describe_volumes", "Volumes", "volume-id", ids)
+    }
+
+
+def _attachment_states(ids: List[str], region: str, profile: Optional[str]) -> StateMap:
+    ec2 = get_client("ec2", region, profile)
+    states = {}
+    for vol in _filtered(ec2, "describe_volumes", "Volumes", "volume-id", ids):
+        attachments = vol.get("Attachments") or []
+        states[vol["VolumeId"]] = (attachments[0]["State"] if attachments else "detached", None)
+    return states
+
+
+class WaiterKind:
+    """How to poll one resource kind and which states end a wait for each target."""
+
+    def __init__(self, describe: Callable[[List[str], str, Optional[str]], StateMap],
+                 targets: Dict[str, Set[str]], default_target: str):
+        self.describe = describe
+        # Target state -> states that mean it will never be reached
+        self.targets = targets
+        self.default_target = default_target
+
+
+WAITER_KINDS: Dict[str, WaiterKind] = {
+    "instance": WaiterKind(
+        _instance_states,
+        {
+            "running": {"shutting-down", "terminated"},
+            "stopped": {"shutting-down", "terminated"},
+            "terminated": set(),
+        },
+        "running",
+    ),
+    "snapshot": WaiterKind(_snapshot_states, {"completed": {"error"}}, "completed"),
+    "image": WaiterKind(
+        _image_states,
+        {"available": {"failed", "invalid", "error", "deregistered", "disabled"}},
+        "available",
+    ),
+    "volume": WaiterKind(
+        _volume_states,
+        {"available": {"error", "deleting", "deleted"}, "in-use": {"error", "deleting", "deleted"}},
+        "available",
+    ),
+    # Resource IDs are volume IDs; the state is that of the volume's attachment
+    "volume_attachment": WaiterKind(_attachment_states, {"attached": set(), "detached": set()}, "attached"),
+}
+
+
+# -------------------------
+# Operations
+# -------------------------
+class Operation:
+    """Handle on a set of resources expected to reach one state."""
+
+    def __init__(self, kind: str, resource_ids: List[str], region: str, target: str,
+                 profile: Optional[str], timeout: float, description: Optional[str]):
+        now = time.monotonic()
+        self.id = f"op-{uuid.uuid4().hex[:12]}"
+        self.kind = kind
+        self.resource_ids = resource_ids
+        self.region = region
+        self.profile = profile
+        self.target = target
+        self.description = description
+        self.status = PENDING
+        self.error: Optional[str] = None
+        self.states: StateMap = {}
+        self.missing: Dict[str, int] = {}
+        self.polls = 0
+        self.poll_errors = 0
+        self.started = now
+        self.deadline = now + timeout
+        self.finished: Optional[float] = None
+        self.delay = Settings.WAITER_INITIAL_DELAY
+        self.next_poll = now + self.delay
+        # Bumped on every observable change so waiters only report real progress
+        self.version = 0
+
+    @property
+    def done(self) -> bool:
+        return self.status != PENDING
+
+    def progress(self) -> Tuple[float, int]:
+        """(completed resources, with partial snapshot progress; total resources)"""
+        completed = 0.0
+        for rid in self.resource_ids:
+            state, fraction = self.states.get(rid, (None, None))
+            if state == self.target:
+                completed += 1
+            elif fraction is not None:
+                completed += min(fraction, 0.99)
+        return completed, len(self.resource_ids)
+
+    def reached(self) -> int:
+        return sum(1 for rid in self.resource_ids if self.states.get(rid, (None,))[0] == self.target)
+
+    def message(self) -> str:
+        text = f"{self.kind} {self.reached()}/{len(self.resource_ids)} {self.target}"
+        return text if self.status == PENDING else f"{text} ({self.status})"
+
+    def summary(self) -> Dict[str, Any]:
+        resources = {}
+        for rid in self.resource_ids:
+            state, fraction = self.states.get(rid, (None, None))
+            if fraction is not None and state != self.target:
+                resources[rid] = {"state": state, "progress": f"{fraction * 100:.0f}%"}
+            else:
+                resources[rid] = state
+        end = self.finished or time.monotonic()
+        summary = {
+            "operation_id": self.id,
+            "kind": self.kind,
+            "region": self.region,
+            "target": self.target,
+            "status": self.status,
+            "resources": resources,
+            "elapsed_s": round(end - self.started, 1),
+            "polls": self.polls,
+        }
+        if self.description:
+            summary["description"] = self.description
+        if self.error:
+            summary["error"] = self.error
+        return summary
+
+
+class WaiterRegistry:
+    """Pending operations and the daemon thread that polls them in batches."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ops: Dict[str, Operation] = {}
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {
+            "operations": 0, "succeeded": 0, "failed": 0, "timed_out": 0,
+            "describe_calls": 0, "resource_checks": 0, "poll_errors": 0,
+        }
+
+    def start(self, kind: str, resource_ids: List[str], region: str, *, target: Optional[str] = None,
+              profile: Optional[str] = None, timeout: Optional[float] = None,
+              description: Optional[str] = None) -> Operation:
+        if kind not in WAITER_KINDS:
+            raise ValueError(f"Unknown waiter kind {kind!r}; expected one of {sorted(WAITER_KINDS)}")
+        spec = WAITER_KINDS[kind]
+        target = target or spec.default_target
+        if target not in spec.targets:
+            raise ValueError(f"Cannot wait for {kind} to become {target!r}; expected one of {sorted(spec.targets)}")
+        resource_ids = list(dict.fromkeys(resource_ids))
+        if not resource_ids:
+            raise ValueError("No resource IDs to wait for")
+
+        op = Operation(kind, resource_ids, region, target, profile,
+                       timeout or Settings.WAITER_TIMEOUT, description)
+        with self._lock:
+            self._ops[op.id] = op
+            self._stats["operations"] += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="waiters", daemon=True)
+                self._thread.start()
+        self._wake.set()
+        return op
+
+    def get(self, operation_id: str) -> Optional[Operation]:
+        with self._lock:
+            return self._ops.get(operation_id)
+
+    def list(self) -> List[Operation]:
+        with self._lock:
+            return sorted(self._ops.values(), key=lambda op: op.started)
+
+    # -------------------------
+    # Poller
+    # -------------------------
+    def _finish(self, op: Operation, status: str, error: Optional[str] = None):
+        op.status = status
+        op.error = error
+        op.finished = time.monotonic()
+        op.version += 1
+        with self._lock:
+            self._stats[status] += 1
+
+    def _run(self):
+        while True:
+            self._wake.clear()
+            try:
+                wait = self._tick()
+            except Exception as e:
+                # Keep the poller alive; pending operations are retried on the next pass
+                print(f"[Waiters] Poller pass failed => {e}", file=sys.stderr)
+                wait = Settings.WAITER_INITIAL_DELAY
+            self._wake.wait(wait)
+
+    def _tick(self) -> float:
+        """One pass over the pending operations; returns seconds until the next one."""
+        now = time.monotonic()
+        with self._lock:
+            for op_id in [i for i, op in self._ops.items()
+                          if op.done and now - op.finished > Settings.WAITER_RETENTION]:
+                del self._ops[op_id]
+            pending = [op for op in self._ops.values() if not op.done]
+
+        for op in pending:
+            if op.deadline <= now:
+                self._finish(op, TIMED_OUT, f"Timed out waiting for {op.message()}")
+        pending = [op for op in pending if not op.done]
+
+        groups: Dict[Tuple[str, str, Optional[str]], List[Operation]] = {}
+        for op in pending:
+            if op.next_poll <= now:
+                groups.setdefault((op.kind, op.region, op.profile), []).append(op)
+        for key, due in groups.items():
+            # The describe call is made anyway; operations due soon share it
+            riders = [
+                op for op in pending
+                if (op.kind, op.region, op.profile) == key
+                and now < op.next_poll <= now + op.delay / 2
+            ]
+            try:
+                self._poll(key, due + riders)
+            except Exception as e:
+                print(f"[Waiters] Polling {key[0]} in {key[1]} failed => {e}", file=sys.stderr)
+                for op in due + riders:
+                    if not op.done:
+                        self._finish(op, FAILED, f"Poller error: {e}")
+
+        pending = [op for op in pending if not op.done]
+        if pending:
+            wake_at = min(min(op.next_poll, op.deadline) for op in pending)
+            return max(0.0, wake_at - time.monotonic())
+        return Settings.WAITER_RETENTION
+
+    def _poll(self, key: Tuple[str, str, Optional[str]], ops: List[Operation]):
+        kind, region, profile = key
+        ids = list(dict.fromkeys(rid for op in ops for rid in op.resource_ids))
+        try:
+            states = WAITER_KINDS[kind].describe(ids, region, profile)
+            error = None
+        except Exception as e:
+            states, error = {}, str(e)
+            print(f"[Waiters] Polling {len(ids)} {kind} resource(s) in {region} failed => {e}", file=sys.stderr)
+
+        now = time.monotonic()
+        with self._lock:
+            self._stats["describe_calls"] += -(-len(ids) // MAX_POLL_IDS)
+            self._stats["resource_checks"] += sum(len(op.resource_ids) for op in ops)
+            self._stats["poll_errors"] += int(error is not None)
+
+        for op in ops:
+            op.polls += 1
+            op.next_poll = now + op.delay
+            op.delay = min(op.delay * Settings.WAITER_BACKOFF, Settings.WAITER_MAX_DELAY)
+            if error is not None:
+                op.poll_errors += 1
+                if op.poll_errors >= MAX_POLL_ERRORS:
+                    self._finish(op, FAILED, error)
+                continue
+            op.poll_errors = 0
+            try:
+                self._update(op, states)
+            except Exception as e:
+                print(f"[Waiters] Updating {op.id} failed => {e}", file=sys.stderr)
+                self._finish(op, FAILED, f"Poller error: {e}")
+
+    def _update(self, op: Operation, states: StateMap):
+        failures = WAITER_KINDS[op.kind].targets[op.target]
+        changed = False
+        failed, missing = [], []
+        for rid in op.resource_ids:
+            state = states.get(rid)
+            if state is None:
+                op.missing[rid] = op.missing.get(rid, 0) + 1
+                if op.missing[rid] >= MISSING_LIMIT:
+                    missing.append(rid)
+                continue
+            op.missing.pop(rid, None)
+            if op.states.get(rid) != state:
+                op.states[rid] = state
+                changed = True
+            if state[0] in failures:
+                failed.append(f"{rid} is {state[0]}")
+
+        if changed:
+            op.version += 1
+        if failed:
+            self._finish(op, FAILED, "; ".join(failed))
+        elif missing:
+            self._finish(op, FAILED, f"Not found: {', '.join(missing)}")
+        elif all(op.states.get(rid, (None,))[0] == op.target for rid in op.resource_ids):
+            self._finish(op, SUCCEEDED)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["pending"] = sum(1 for op in self._ops.values() if not op.done)
+            stats["tracked"] = len(self._ops)
+        stats["enabled"] = Settings.WAITER_ENABLED
+        stats["calls_saved"] = max(0, stats["resource_checks"] - stats["describe_calls"])
+        return stats
+
+
+_registry = WaiterRegistry()
+
+
+def get_waiters() -> WaiterRegistry:
+    return _registry
+
+
+def with_operation(response: Dict[str, Any], kind: str, resource_ids: List[str], region: str,
+                   **kwargs) -> Dict[str, Any]:
+    """
+    Start waiting for the resources a mutating call created and attach the
+    handle to its response as ``operation_id``. A no-op when waiters are disabled.
+    """
+    if Settings.WAITER_ENABLED and resource_ids:
+        response["operation_id"] = _registry.start(kind, resource_ids, region, **kwargs).id
+    return response
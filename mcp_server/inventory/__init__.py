@@ -0,0 +1 @@
+"""Local inventory of EC2/EBS/VPC resources (SQLite snapshot, incremental refresh)."""
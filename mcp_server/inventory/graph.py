@@ -0,0 +1,327 @@
+"""
+Relationship graph over the local inventory.
+
+"Which instances use this security group", "which volumes belong to stopped
+instances" or "what is in this subnet" otherwise take several describe calls
+joined in the conversation. The references EC2 already returns (an instance's
+SubnetId and SecurityGroups, a volume's Attachments, a snapshot's VolumeId,
+an AMI's block device mappings, ...) are turned into edges once per region:
+
+    vpc -> subnet -> instance -> volume -> snapshot
+    vpc -> security group -> network interface / instance
+    subnet -> network interface <- instance
+    AMI -> instance, AMI -> snapshot, snapshot -> restored volume
+    launch template -> AMI
+
+Nodes are numbered densely and edges are kept as CSR adjacency (an offsets
+array per node into flat target / relation arrays), once in the parent ->
+child direction and once reversed, so a traversal step is a slice of two
+``array`` buffers. Resources referenced but not in the inventory (public
+AMIs, another account's snapshots) become placeholder nodes.
+
+A region's graph is rebuilt lazily on the first traversal after any
+inventory write to that region.
+"""
+
+import threading
+import time
+from array import array
+from collections import deque
+from itertools import accumulate
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from mcp_server.inventory.store import RESOURCE_TYPES, TableKey, _tag_values, get_inventory
+
+MAX_DEPTH = 6
+
+
+class Relation:
+    """
+    parent -> child edge type. ``refs`` reads the referenced IDs from the
+    item of the ``holder`` side ("child" when the child points at its
+    parent, as subnets carry VpcId).
+    """
+
+    def __init__(self, name: str, inverse: str, parent: str, child: str,
+                 refs: Callable[[Dict[str, Any]], Iterable[Optional[str]]], holder: str = "child"):
+        self.name = name
+        self.inverse = inverse
+        self.parent = parent
+        self.child = child
+        self.refs = refs
+        self.holder = holder
+
+
+def _one(key: str) -> Callable[[Dict[str, Any]], List[Optional[str]]]:
+    return lambda item: [item.get(key)]
+
+
+RELATIONS: List[Relation] = [
+    Relation("contains", "belongs_to", "vpcs", "subnets", _one("VpcId")),
+    Relation("contains", "belongs_to", "vpcs", "security_groups", _one("VpcId")),
+    Relation("contains", "belongs_to", "subnets", "instances", _one("SubnetId")),
+    Relation("contains", "belongs_to", "subnets", "network_interfaces", _one("SubnetId")),
+    Relation("attaches", "attached_to", "instances", "volumes",
+             lambda v: [a.get("InstanceId") for a in v.get("Attachments", [])]),
+    Relation("attaches", "attached_to", "instances", "network_interfaces",
+             lambda n: [n.get("Attachment", {}).get("InstanceId")]),
+    Relation("protects", "protected_by", "security_groups", "instances",
+             lambda i: [g.get("GroupId") for g in i.get("SecurityGroups", [])]),
+    Relation("protects", "protected_by", "security_groups", "network_interfaces",
+             lambda n: [g.get("GroupId") for g in n.get("Groups", [])]),
+    Relation("snapshotted_as", "snapshot_of", "volumes", "snapshots", _one("VolumeId")),
+    Relation("restored_as", "restored_from", "snapshots", "volumes", _one("SnapshotId")),
+    Relation("launched", "launched_from", "images", "instances", _one("ImageId")),
+    Relation("backed_by", "backs", "images", "snapshots",
+             lambda a: [m["Ebs"].get("SnapshotId") for m in a.get("BlockDeviceMappings", []) if "Ebs" in m],
+             holder="parent"),
+    Relation("uses", "used_by", "launch_templates", "images",
+             lambda t: [t.get("LaunchTemplateData", {}).get("ImageId")], holder="parent"),
+]
+
+GRAPH_TYPES = sorted({t for r in RELATIONS for t in (r.parent, r.child)})
+_TYPE_CODES = {t: code for code, t in enumerate(GRAPH_TYPES)}
+
+
+def _name(item: Dict[str, Any]) -> Optional[str]:
+    names = _tag_values(item, "Name")
+    if names:
+        return names[0]
+    return item.get("Name") or item.get("GroupName") or item.get("LaunchTemplateName")
+
+
+def _csr(n: int, src: array, dst: array, rel: array) -> Tuple[array, array, array]:
+    """Counting sort of (src, dst, rel) edges into offsets / targets / relations arrays."""
+    counts = [0] * (n + 1)
+    for s in src:
+        counts[s + 1] += 1
+    offsets = array("I", accumulate(counts))
+    cursor = list(offsets[:-1])
+    targets = array("I", bytes(4 * len(src)))
+    relations = array("B", bytes(len(src)))
+    for s, d, r in zip(src, dst, rel):
+        p = cursor[s]
+        targets[p] = d
+        relations[p] = r
+        cursor[s] = p + 1
+    return offsets, targets, relations
+
+
+class RegionGraph:
+    """Immutable adjacency snapshot of one region's inventory."""
+
+    def __init__(self, region: str, tables: Dict[str, Dict[str, Dict[str, Any]]]):
+        self.region = region
+        self.ids: List[str] = []
+        self.types = array("B")
+        self.items: List[Optional[Dict[str, Any]]] = []
+        self.index: Dict[str, int] = {}
+
+        for resource_type in GRAPH_TYPES:
+            for rid, item in tables.get(resource_type, {}).items():
+                self._node(rid, resource_type, item)
+        self.known = len(self.ids)
+
+        src, dst, rel = array("I"), array("I"), array("B")
+        for code, relation in enumerate(RELATIONS):
+            holder_type = relation.child if relation.holder == "child" else relation.parent
+            other_type = relation.parent if relation.holder == "child" else relation.child
+            for rid, item in tables.get(holder_type, {}).items():
+                holder = self.index[rid]
+                for ref in relation.refs(item):
+                    if not ref:
+                        continue
+                    other = self.index.get(ref)
+                    if other is None:
+                        other = self._node(ref, other_type, None)
+                    parent, child = (other, holder) if relation.holder == "child" else (holder, other)
+                    src.append(parent)
+                    dst.append(child)
+                    rel.append(code)
+
+        n = len(self.ids)
+        self.edges = len(src)
+        self.out_offsets, self.out_targets, self.out_relations = _csr(n, src, dst, rel)
+        self.in_offsets, self.in_targets, self.in_relations = _csr(n, dst, src, rel)
+        self.built_at = time.time()
+
+    def _node(self, rid: str, resource_type: str, item: Optional[Dict[str, Any]]) -> int:
+        node = self.index[rid] = len(self.ids)
+        self.ids.append(rid)
+        self.types.append(_TYPE_CODES[resource_type])
+        self.items.append(item)
+        return node
+
+    def neighbors(self, node: int, direction: str) -> Iterable[Tuple[int, str]]:
+        """(neighbor, relation as seen from node) pairs; direction is down, up or both."""
+        if direction in ("down", "both"):
+            start, end = self.out_offsets[node], self.out_offsets[node + 1]
+            for target, code in zip(self.out_targets[start:end], self.out_relations[start:end]):
+                yield target, RELATIONS[code].name
+        if direction in ("up", "both"):
+            start, end = self.in_offsets[node], self.in_offsets[node + 1]
+            for target, code in zip(self.in_targets[start:end], self.in_relations[start:end]):
+                yield target, RELATIONS[code].inverse
+
+    def describe(self, node: int) -> Dict[str, Any]:
+        resource_type = GRAPH_TYPES[self.types[node]]
+        item = self.items[node]
+        out: Dict[str, Any] = {"id": self.ids[node], "type": resource_type}
+        if item is None:
+            out["in_inventory"] = False
+            return out
+        name = _name(item)
+        if name:
+            out["name"] = name
+        state = RESOURCE_TYPES[resource_type].state
+        state = state(item) if state else item.get("State") or item.get("Status")
+        if isinstance(state, str):
+            out["state"] = state
+        return out
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "nodes": len(self.ids),
+            "placeholders": len(self.ids) - self.known,
+            "edges": self.edges,
+            "bytes": sum(a.itemsize * len(a) for a in (
+                self.types, self.out_offsets, self.out_targets, self.out_relations,
+                self.in_offsets, self.in_targets, self.in_relations,
+            )),
+            "built_at": self.built_at,
+        }
+
+
+# =======================================================
+# GRAPH CACHE
+# =======================================================
+_graphs: Dict[str, RegionGraph] = {}
+_stale: Set[str] = set()
+_graphs_lock = threading.Lock()
+_build_locks: Dict[str, threading.Lock] = {}
+_listening = False
+
+
+def _on_write(key: TableKey, table, upserted, removed: Set[str]):
+    if key[1] in _TYPE_CODES:
+        with _graphs_lock:
+            _stale.add(key[0])
+
+
+def get_graph(region: str, max_staleness: Optional[float] = None) -> RegionGraph:
+    """The region's graph, refreshing stale inventory types first when max_staleness is given."""
+    global _listening
+    store = get_inventory()
+    with _graphs_lock:
+        if not _listening:
+            store.add_listener(_on_write)
+            _listening = True
+        lock = _build_locks.setdefault(region, threading.Lock())
+
+    if max_staleness is not None:
+        for resource_type in GRAPH_TYPES:
+            store.ensure_fresh(region, resource_type, max_staleness)
+
+    with lock:
+        with _graphs_lock:
+            graph = _graphs.get(region)
+            if graph is not None and region not in _stale:
+                return graph
+            _stale.discard(region)
+        # Writes landing while this runs mark the region stale again for the next call
+        tables = {t: store.read_table(region, t, dict) for t in GRAPH_TYPES}
+        graph = RegionGraph(region, tables)
+        with _graphs_lock:
+            _graphs[region] = graph
+        return graph
+
+
+def graph_stats() -> Dict[str, Any]:
+    with _graphs_lock:
+        graphs = dict(_graphs)
+        stale = set(_stale)
+    return {region: {**g.stats(), "stale": region in stale} for region, g in graphs.items()}
+
+
+# =======================================================
+# TRAVERSAL
+# =======================================================
+def related(
+    graph: RegionGraph,
+    start_ids: List[str],
+    *,
+    depth: int = 1,
+    direction: str = "both",
+    target_types: Optional[List[str]] = None,
+    max_nodes: int = 1000,
+) -> Dict[str, Any]:
+    """
+    Breadth-first walk from start_ids up to depth hops. Every reached node is
+    reported once, at its shortest distance, with the node and relation it
+    was reached through; target_types limits what is reported, not what is
+    walked through.
+    """
+    depth = max(1, min(depth, MAX_DEPTH))
+    wanted = {_TYPE_CODES[t] for t in target_types} if target_types else None
+    missing = [rid for rid in start_ids if rid not in graph.index]
+    starts = [graph.index[rid] for rid in dict.fromkeys(start_ids) if rid in graph.index]
+
+    seen = set(starts)
+    frontier = deque((node, 0) for node in starts)
+    found: List[Dict[str, Any]] = []
+    truncated = False
+    while frontier and not truncated:
+        node, hops = frontier.popleft()
+        if hops == depth:
+            continue
+        for neighbor, relation in graph.neighbors(node, direction):
+            if neighbor in seen:
+                continue
+            seen.add(neighbor)
+            frontier.append((neighbor, hops + 1))
+            if wanted is not None and graph.types[neighbor] not in wanted:
+                continue
+            if len(found) == max_nodes:
+                truncated = True
+                break
+            found.append({
+                **graph.describe(neighbor),
+                "depth": hops + 1,
+                "via": graph.ids[node],
+                "relation": relation,
+            })
+
+    result: Dict[str, Any] = {"count": len(found), "nodes": found, "truncated": truncated}
+    if missing:
+        result["not_found"] = missing
+    return result
+
+
+def shortest_path(graph: RegionGraph, source: str, target: str, max_depth: int = MAX_DEPTH) -> Optional[List[Dict[str, Any]]]:
+    """Hops from source to target ignoring edge direction, or None if not connected within max_depth."""
+    for rid in (source, target):
+        if rid not in graph.index:
+            raise KeyError(f"{rid} is not in the inventory for {graph.region}")
+    start, goal = graph.index[source], graph.index[target]
+    parents: Dict[int, Tuple[int, str]] = {start: (-1, "")}
+    frontier = [start]
+    for _ in range(max(1, min(max_depth, MAX_DEPTH))):
+        if goal in parents:
+            break
+        next_frontier = []
+        for node in frontier:
+            for neighbor, relation in graph.neighbors(node, "both"):
+                if neighbor not in parents:
+                    parents[neighbor] = (node, relation)
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    if goal not in parents:
+        return None
+
+    hops = []
+    node = goal
+    while node != start:
+        parent, relation = parents[node]
+        hops.append({**graph.describe(node), "from": graph.ids[parent], "relation": relation})
+        node = parent
+    return [graph.describe(start)] + hops[::-1]
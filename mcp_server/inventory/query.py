@@ -0,0 +1,760 @@
+"""
+Indexed boolean queries over the local inventory.
+
+EC2 filters AND together lists of OR-ed values, and list_instances_by_tag
+takes a single tag, so questions such as "running, tagged env=prod, without
+an Owner tag" or "security groups open to 0.0.0.0/0" otherwise mean listing
+everything and scanning it in the conversation.
+
+Each (region, resource type) of the inventory gets inverted indexes over
+every filter field its ResourceType defines (state, instance type,
+lifecycle, VPC, subnet, security groups, ...) plus every tag key and tag
+key/value. Documents are numbered densely; a value's postings are a set of
+document numbers, or an integer bitmap once it covers 1/DENSE_RATIO of the
+documents, so AND/OR/NOT over common values are a few big-int operations
+and group counts are popcounts.
+
+Indexes are built from the store's table on first use and then follow every
+write through a store listener: items whose indexed values did not change
+only have their document swapped, and large rewrites rebuild.
+
+Expressions::
+
+    state = running AND tag:env = prod AND NOT tag:Owner
+    type IN (t3.micro, t3.small) OR lifecycle = spot
+    ip-permission.cidr = 0.0.0.0/0 AND NOT group-name = default
+    tag:Name = "web-*" AND LaunchTime < 2024-01-01
+
+A bare field tests that it has any value; ``=``, ``!=`` and ``IN`` compare
+values (``*`` and ``?`` are wildcards, as in EC2 filters); ``<``, ``<=``,
+``>``, ``>=`` compare numerically when both sides are numbers and as text
+otherwise, which orders ISO timestamps correctly. Lower-case names are
+indexed fields (with a few short aliases such as ``state`` and ``vpc``);
+capitalised dotted paths (``LaunchTime``, ``Placement.Tenancy``) read the
+raw item and are evaluated by a scan.
+"""
+
+import fnmatch
+import heapq
+import operator
+import re
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from mcp_server.inventory.store import (
+    RESOURCE_TYPES,
+    TableKey,
+    _as_text,
+    _tag_getter,
+    _tag_keys,
+    get_inventory,
+)
+
+# A value's postings switch from a set to a bitmap once they hold 1/DENSE_RATIO of the documents
+DENSE_RATIO = 64
+
+# Rebuild instead of patching when a write changes more than this fraction of the table
+REBUILD_FRACTION = 0.25
+
+MAX_GROUPS = 200
+
+Postings = Union[int, Set[int]]
+
+# Short names for the filter fields people reach for first
+ALIASES: Dict[str, Dict[str, str]] = {
+    "instances": {
+        "state": "instance-state-name",
+        "type": "instance-type",
+        "lifecycle": "instance-lifecycle",
+        "vpc": "vpc-id",
+        "subnet": "subnet-id",
+        "sg": "instance.group-id",
+        "security-group": "instance.group-id",
+        "az": "availability-zone",
+        "image": "image-id",
+        "key": "key-name",
+    },
+    "volumes": {
+        "state": "status",
+        "type": "volume-type",
+        "az": "availability-zone",
+        "instance": "attachment.instance-id",
+        "snapshot": "snapshot-id",
+    },
+    "snapshots": {
+        "state": "status",
+        "volume": "volume-id",
+    },
+    "security_groups": {
+        "name": "group-name",
+        "vpc": "vpc-id",
+        "cidr": "ip-permission.cidr",
+    },
+    "vpcs": {
+        "default": "is-default",
+    },
+    "subnets": {
+        "vpc": "vpc-id",
+        "az": "availability-zone",
+        "default": "default-for-az",
+    },
+    "images": {
+        "snapshot": "block-device-mapping.snapshot-id",
+    },
+    "network_interfaces": {
+        "state": "status",
+        "type": "interface-type",
+        "vpc": "vpc-id",
+        "subnet": "subnet-id",
+        "sg": "group-id",
+        "instance": "attachment.instance-id",
+    },
+    "launch_templates": {
+        "name": "launch-template-name",
+        "image": "image-id",
+        "type": "instance-type",
+    },
+}
+
+# Bit positions set in each byte value, for walking bitmaps
+_BITS = tuple(tuple(b for b in range(8) if byte >> b & 1) for byte in range(256))
+
+
+class QueryError(ValueError):
+    """Malformed expression or unknown field."""
+
+
+# =======================================================
+# BITMAPS
+# =======================================================
+def _bitmap(docs: Iterable[int]) -> int:
+    docs = list(docs)
+    if not docs:
+        return 0
+    buf = bytearray((max(docs) >> 3) + 1)
+    for d in docs:
+        buf[d >> 3] |= 1 << (d & 7)
+    return int.from_bytes(buf, "little")
+
+
+def _members(bitmap: int, limit: Optional[int] = None) -> List[int]:
+    out: List[int] = []
+    for i, byte in enumerate(bitmap.to_bytes((bitmap.bit_length() + 7) >> 3, "little")):
+        if byte:
+            base = i << 3
+            out.extend(base + b for b in _BITS[byte])
+            if limit is not None and len(out) >= limit:
+                return out[:limit]
+    return out
+
+
+def _union(postings: Iterable[Postings]) -> int:
+    bitmap, sparse = 0, []
+    for p in postings:
+        if isinstance(p, int):
+            bitmap |= p
+        else:
+            sparse.extend(p)
+    return bitmap | _bitmap(sparse)
+
+
+# =======================================================
+# FIELDS
+# =======================================================
+def _attribute_getter(path: str) -> Callable[[Dict[str, Any]], Any]:
+    keys = path.split(".")
+
+    def get(item):
+        for key in keys:
+            if not isinstance(item, dict):
+                return None
+            item = item.get(key)
+        return item
+
+    return get
+
+
+class Field:
+    """A resolved field name: an indexed filter field, a tag, the resource ID, or a raw item attribute."""
+
+    __slots__ = ("name", "kind", "get")
+
+    def __init__(self, name: str, kind: str, get: Callable[[Dict[str, Any]], Any]):
+        self.name, self.kind, self.get = name, kind, get
+
+
+@lru_cache(maxsize=1024)
+def resolve_field(resource_type: str, name: str) -> Field:
+    spec = RESOURCE_TYPES[resource_type]
+    name = ALIASES.get(resource_type, {}).get(name, name)
+    if name.startswith("tag:") and len(name) > 4:
+        return Field(name, "indexed", _tag_getter(name[4:]))
+    if name == "tag-key":
+        return Field(name, "indexed", _tag_keys)
+    if name in ("id", spec.id_filter):
+        return Field(spec.id_filter, "id", lambda item: item.get(spec.id_field))
+    if name in spec.filters:
+        return Field(name, "indexed", spec.filters[name])
+    if name[:1].isupper():
+        return Field(name, "attribute", _attribute_getter(name))
+    known = sorted({*spec.filters, *ALIASES.get(resource_type, {}), "id", "tag-key", "tag:<key>"})
+    raise QueryError(
+        f"Unknown field {name!r} for {resource_type}. Indexed fields: {', '.join(known)}; "
+        "capitalised item attributes such as LaunchTime are also accepted"
+    )
+
+
+def _values(value: Any) -> List[Any]:
+    return [v for v in (value if isinstance(value, list) else [value]) if v is not None]
+
+
+_OPERATORS = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge}
+
+
+def _is_pattern(value: str) -> bool:
+    return "*" in value or "?" in value
+
+
+def _matcher(wanted: Sequence[str]) -> Callable[[str], bool]:
+    """Text equal to any wanted value, with * and ? as wildcards."""
+    exact = {w for w in wanted if not _is_pattern(w)}
+    patterns = [fnmatch.translate(w) for w in wanted if _is_pattern(w)]
+    regex = re.compile("|".join(patterns)) if patterns else None
+    return lambda text: text in exact or (regex is not None and regex.match(text) is not None)
+
+
+def _comparator(op: str, wanted: str) -> Callable[[Any], bool]:
+    """actual <op> wanted, numerically when both sides are numbers and as text otherwise."""
+    compare = _OPERATORS[op]
+    try:
+        number: Optional[float] = float(wanted)
+    except ValueError:
+        number = None
+
+    def test(actual: Any) -> bool:
+        if number is not None:
+            if isinstance(actual, (int, float)):
+                return compare(actual, number)
+            try:
+                return compare(float(actual), number)
+            except (TypeError, ValueError):
+                pass
+        return compare(_as_text(actual), wanted)
+
+    return test
+
+
+# =======================================================
+# PARSER
+# =======================================================
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<punct>[(),])
+      | (?P<op>!=|<=|>=|=|<|>)
+      | "(?P<dq>(?:[^"\\]|\\.)*)"
+      | '(?P<sq>[^']*)'
+      | (?P<word>[^\s(),=!<>"']+)
+    )""",
+    re.VERBOSE,
+)
+_KEYWORDS = {"AND", "OR", "NOT", "IN"}
+
+# AST nodes (hashable tuples):
+#   ("and", a, b) | ("or", a, b) | ("not", a) | ("has", field) | ("cmp", field, op, (values...)) | ("all",)
+Node = Tuple[Any, ...]
+
+
+def _tokenize(expression: str) -> List[Tuple[str, str]]:
+    tokens, pos = [], 0
+    expression = expression.rstrip()
+    while pos < len(expression):
+        match = _TOKEN.match(expression, pos)
+        if not match or match.end() == pos:
+            raise QueryError(f"Unexpected character at position {pos}: {expression[pos:pos + 20]!r}")
+        pos = match.end()
+        kind = match.lastgroup
+        if kind == "dq":
+            tokens.append(("value", re.sub(r"\\(.)", r"\1", match.group("dq"))))
+        elif kind == "sq":
+            tokens.append(("value", match.group("sq")))
+        elif kind == "word" and match.group("word").upper() in _KEYWORDS:
+            tokens.append(("kw", match.group("word").upper()))
+        elif kind == "word":
+            tokens.append(("value", match.group("word")))
+        else:
+            tokens.append((kind, match.group(kind)))
+    return tokens
+
+
+class _Parser:
+    def __init__(self, resource_type: str, expression: str):
+        self.resource_type = resource_type
+        self.tokens = _tokenize(expression)
+        self.pos = 0
+
+    def peek(self, kind: str, text: Optional[str] = None) -> bool:
+        if self.pos >= len(self.tokens):
+            return False
+        k, t = self.tokens[self.pos]
+        return k == kind and (text is None or t == text)
+
+    def take(self, kind: str, text: Optional[str] = None) -> str:
+        if not self.peek(kind, text):
+            found = self.tokens[self.pos][1] if self.pos < len(self.tokens) else "end of expression"
+            raise QueryError(f"Expected {text or kind}, found {found!r}")
+        self.pos += 1
+        return self.tokens[self.pos - 1][1]
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            return ("all",)
+        node = self.parse_or()
+        if self.pos < len(self.tokens):
+            raise QueryError(f"Unexpected {self.tokens[self.pos][1]!r}")
+        return node
+
+    def parse_or(self) -> Node:
+        node = self.parse_and()
+        while self.peek("kw", "OR"):
+            self.pos += 1
+            node = ("or", node, self.parse_and())
+        return node
+
+    def parse_and(self) -> Node:
+        node = self.parse_not()
+        while self.peek("kw", "AND"):
+            self.pos += 1
+            node = ("and", node, self.parse_not())
+        return node
+
+    def parse_not(self) -> Node:
+        if self.peek("kw", "NOT"):
+            self.pos += 1
+            return ("not", self.parse_not())
+        return self.parse_atom()
+
+    def parse_atom(self) -> Node:
+        if self.peek("punct", "("):
+            self.pos += 1
+            node = self.parse_or()
+            self.take("punct", ")")
+            return node
+
+        field = resolve_field(self.resource_type, self.take("value")).name
+        if self.peek("op"):
+            op = self.take("op")
+            return ("cmp", field, op, (self.take("value"),))
+        negate = False
+        if self.peek("kw", "NOT") and self.pos + 1 < len(self.tokens) and self.tokens[self.pos + 1] == ("kw", "IN"):
+            self.pos += 1
+            negate = True
+        if self.peek("kw", "IN"):
+            self.pos += 1
+            self.take("punct", "(")
+            values = [self.take("value")]
+            while self.peek("punct", ","):
+                self.pos += 1
+                values.append(self.take("value"))
+            self.take("punct", ")")
+            return ("cmp", field, "!=" if negate else "=", tuple(values))
+        return ("has", field)
+
+
+@lru_cache(maxsize=256)
+def parse(resource_type: str, expression: str) -> Node:
+    """Parse a where expression into a tuple AST (cached per expression)."""
+    if resource_type not in RESOURCE_TYPES:
+        raise QueryError(f"Unknown resource type {resource_type!r}")
+    return _Parser(resource_type, expression or "").parse()
+
+
+# =======================================================
+# INDEX
+# =======================================================
+class InventoryIndex:
+    """Inverted indexes over one (region, resource type) table."""
+
+    def __init__(self, resource_type: str):
+        spec = RESOURCE_TYPES[resource_type]
+        self.resource_type = resource_type
+        self.id_field = spec.id_field
+        # IDs are looked up through self.ids rather than one posting per document
+        self.fields: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            **{name: get for name, get in spec.filters.items() if name != spec.id_filter},
+            "tag-key": _tag_keys,
+        }
+
+        self._lock = threading.Lock()
+        self.docs: List[Optional[Dict[str, Any]]] = []
+        self.ids: Dict[str, int] = {}
+        self.live = 0
+        self.postings: Dict[str, Dict[str, Postings]] = {}
+        self._entries: List[FrozenSet[Tuple[str, str]]] = []
+        self._free: List[int] = []
+        self.built_at: Optional[float] = None
+        self.updates = 0
+
+    def _item_entries(self, item: Dict[str, Any]) -> FrozenSet[Tuple[str, str]]:
+        entries = []
+        for name, get in self.fields.items():
+            value = get(item)
+            if value is None:
+                continue
+            if isinstance(value, list):
+                entries.extend((name, v if type(v) is str else _as_text(v)) for v in value if v is not None)
+            else:
+                entries.append((name, value if type(value) is str else _as_text(value)))
+        for t in item.get("Tags") or []:
+            value = t.get("Value", "")
+            entries.append(("tag:" + t["Key"], value if type(value) is str else _as_text(value)))
+        return frozenset(entries)
+
+    # -------------------------
+    # Maintenance
+    # -------------------------
+    def rebuild(self, table: Dict[str, Dict[str, Any]]):
+        docs = list(table.values())
+        entries = [self._item_entries(item) for item in docs]
+        collected: Dict[Tuple[str, str], List[int]] = {}
+        for doc, doc_entries in enumerate(entries):
+            for entry in doc_entries:
+                docs_with = collected.get(entry)
+                if docs_with is None:
+                    collected[entry] = [doc]
+                else:
+                    docs_with.append(doc)
+
+        dense_at = max(len(docs) // DENSE_RATIO, 1)
+        postings: Dict[str, Dict[str, Postings]] = {}
+        for (name, value), docs_with in collected.items():
+            postings.setdefault(name, {})[value] = _bitmap(docs_with) if len(docs_with) >= dense_at else set(docs_with)
+        with self._lock:
+            self.docs = docs
+            self.ids = {item[self.id_field]: doc for doc, item in enumerate(docs)}
+            self._entries = entries
+            self._free = []
+            self.postings = postings
+            self.live = (1 << len(docs)) - 1
+            self.built_at = time.time()
+
+    def update(self, table: Dict[str, Dict[str, Any]], upserted: Dict[str, Dict[str, Any]], removed: Set[str]):
+        changed = []
+        with self._lock:
+            for rid, item in upserted.items():
+                doc = self.ids.get(rid)
+                if doc is not None and item == self.docs[doc]:
+                    self.docs[doc] = item
+                    continue
+                entries = self._item_entries(item)
+                if doc is not None and entries == self._entries[doc]:
+                    self.docs[doc] = item
+                else:
+                    changed.append((rid, item, entries))
+            removed = [rid for rid in removed if rid in self.ids]
+            if not changed and not removed:
+                return
+            rebuild = len(changed) + len(removed) > max(len(table) * REBUILD_FRACTION, 64)
+            if not rebuild:
+                for rid in removed:
+                    self._remove(self.ids.pop(rid))
+                for rid, item, entries in changed:
+                    self._put(rid, item, entries)
+                self.updates += 1
+        if rebuild:
+            self.rebuild(table)
+
+    def _remove(self, doc: int):
+        self._unpost(doc)
+        self.docs[doc] = None
+        self._entries[doc] = frozenset()
+        self._free.append(doc)
+        self.live &= ~(1 << doc)
+
+    def _put(self, rid: str, item: Dict[str, Any], entries: FrozenSet[Tuple[str, str]]):
+        doc = self.ids.get(rid)
+        if doc is None:
+            if self._free:
+                doc = self._free.pop()
+            else:
+                doc = len(self.docs)
+                self.docs.append(None)
+                self._entries.append(frozenset())
+            self.ids[rid] = doc
+            self.live |= 1 << doc
+        else:
+            self._unpost(doc)
+        self.docs[doc] = item
+        self._entries[doc] = entries
+
+        dense_at = max(len(self.docs) // DENSE_RATIO, 1)
+        for name, value in entries:
+            values = self.postings.setdefault(name, {})
+            p = values.get(value)
+            if p is None:
+                values[value] = {doc}
+            elif isinstance(p, int):
+                values[value] = p | (1 << doc)
+            else:
+                p.add(doc)
+                if len(p) >= dense_at:
+                    values[value] = _bitmap(p)
+
+    def _unpost(self, doc: int):
+        for name, value in self._entries[doc]:
+            values = self.postings[name]
+            p = values[value]
+            if isinstance(p, int):
+                p &= ~(1 << doc)
+            else:
+                p.discard(doc)
+            if p:
+                values[value] = p
+            else:
+                del values[value]
+                if not values:
+                    del self.postings[name]
+
+    # -------------------------
+    # Evaluation (callers hold self._lock)
+    # -------------------------
+    def _scan(self, test: Callable[[Dict[str, Any]], bool]) -> int:
+        return _bitmap(doc for doc, item in enumerate(self.docs) if item is not None and test(item))
+
+    def _field_values(self, field: str, test: Callable[[str], bool]) -> int:
+        return _union(p for value, p in self.postings.get(field, {}).items() if test(value))
+
+    def evaluate(self, node: Node) -> int:
+        kind = node[0]
+        if kind == "all":
+            return self.live
+        if kind == "and":
+            return self.evaluate(node[1]) & self.evaluate(node[2])
+        if kind == "or":
+            return self.evaluate(node[1]) | self.evaluate(node[2])
+        if kind == "not":
+            return self.live & ~self.evaluate(node[1])
+
+        field = resolve_field(self.resource_type, node[1])
+        if kind == "has":
+            if field.kind == "id":
+                return self.live
+            if field.name.startswith("tag:"):
+                return _union(p for p in [self.postings.get("tag-key", {}).get(field.name[4:])] if p)
+            if field.kind == "indexed":
+                return _union(self.postings.get(field.name, {}).values())
+            return self._scan(lambda item: bool(_values(field.get(item))))
+
+        _, _, op, wanted = node
+        if op in ("=", "!="):
+            if field.kind == "id":
+                if any(_is_pattern(w) for w in wanted):
+                    match = _matcher(wanted)
+                    matched = _bitmap(doc for rid, doc in self.ids.items() if match(rid))
+                else:
+                    matched = _bitmap(self.ids[w] for w in wanted if w in self.ids)
+            elif field.kind == "indexed":
+                values = self.postings.get(field.name, {})
+                if any(_is_pattern(w) for w in wanted):
+                    matched = self._field_values(field.name, _matcher(wanted))
+                else:
+                    matched = _union(values[w] for w in wanted if w in values)
+            else:
+                match = _matcher(wanted)
+                matched = self._scan(lambda item: any(match(_as_text(a)) for a in _values(field.get(item))))
+            return matched if op == "=" else self.live & ~matched
+
+        test = _comparator(op, wanted[0])
+        if field.kind == "indexed":
+            return self._field_values(field.name, test)
+        return self._scan(lambda item: any(test(a) for a in _values(field.get(item))))
+
+    def items(self, bitmap: int, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return [self.docs[d] for d in _members(bitmap, limit)]
+
+    def group_counts(self, field: Field, bitmap: int) -> Optional[Dict[Optional[str], int]]:
+        """Counts per value from the postings alone; None when the field is not indexed."""
+        if field.kind != "indexed":
+            return None
+        counts: Dict[Optional[str], int] = {}
+        values = self.postings.get(field.name, {})
+        inside: Optional[Set[int]] = None
+        for value, p in values.items():
+            if isinstance(p, int):
+                n = (p & bitmap).bit_count()
+            else:
+                if inside is None:
+                    inside = set(_members(bitmap))
+                n = len(p & inside)
+            if n:
+                counts[value] = n
+        missing = (bitmap & ~_union(values.values())).bit_count()
+        if missing:
+            counts[None] = missing
+        return counts
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            dense = sum(1 for values in self.postings.values() for p in values.values() if isinstance(p, int))
+            return {
+                "documents": self.live.bit_count(),
+                "fields": len(self.postings),
+                "values": sum(len(values) for values in self.postings.values()),
+                "dense_values": dense,
+                "built_at": self.built_at,
+                "updates": self.updates,
+            }
+
+
+_indexes: Dict[TableKey, InventoryIndex] = {}
+_indexes_lock = threading.Lock()
+_listening = False
+
+
+def _on_write(key: TableKey, table: Dict[str, Dict[str, Any]], upserted: Dict[str, Dict[str, Any]], removed: Set[str]):
+    index = _indexes.get(key)
+    if index is not None:
+        index.update(table, upserted, removed)
+
+
+def get_index(region: str, resource_type: str) -> InventoryIndex:
+    global _listening
+    key = (region, resource_type)
+    index = _indexes.get(key)
+    if index is not None:
+        return index
+    store = get_inventory()
+    with _indexes_lock:
+        if not _listening:
+            store.add_listener(_on_write)
+            _listening = True
+        index = _indexes.get(key)
+        if index is None:
+            index = InventoryIndex(resource_type)
+
+            # Built and published under the store lock, so no write falls between the two
+            def build(table):
+                index.rebuild(table)
+                _indexes[key] = index
+
+            store.read_table(region, resource_type, build)
+    return index
+
+
+def index_stats() -> Dict[str, Any]:
+    return {f"{region}/{resource_type}": index.stats() for (region, resource_type), index in list(_indexes.items())}
+
+
+# =======================================================
+# QUERY
+# =======================================================
+def select_ids(region: str, resource_type: str, where: Optional[str], max_staleness: float) -> List[str]:
+    """IDs of every resource matching a where expression."""
+    node = parse(resource_type, where or "")
+    get_inventory().ensure_fresh(region, resource_type, max_staleness)
+    index = get_index(region, resource_type)
+    with index._lock:
+        return [item[index.id_field] for item in index.items(index.evaluate(node))]
+
+
+def _sort_key(field: Field) -> Callable[[Dict[str, Any]], Tuple]:
+    def key(item):
+        values = _values(field.get(item))
+        if not values:
+            # Missing values sort last in either direction (see run())
+            return (2, 0)
+        value = values[0]
+        return (0, value) if isinstance(value, (int, float)) else (1, _as_text(value))
+
+    return key
+
+
+def run(
+    region: str,
+    resource_type: str,
+    where: Optional[str] = None,
+    *,
+    sort_by: Optional[str] = None,
+    limit: int = 50,
+    group_by: Optional[str] = None,
+    sum_field: Optional[str] = None,
+    max_staleness: float = 300,
+) -> Dict[str, Any]:
+    """
+    Evaluate a where expression against the inventory of one region/type.
+
+    Returns the match count, up to limit matching items (sorted by sort_by,
+    "-" prefix for descending), and optionally per-group counts (group_by)
+    and sums of a numeric field (sum_field).
+    """
+    node = parse(resource_type, where or "")
+    sort_field = resolve_field(resource_type, sort_by.lstrip("-")) if sort_by else None
+    group_field = resolve_field(resource_type, group_by) if group_by else None
+    sum_getter = resolve_field(resource_type, sum_field).get if sum_field else None
+
+    age = get_inventory().ensure_fresh(region, resource_type, max_staleness)
+    index = get_index(region, resource_type)
+
+    started = time.perf_counter()
+    with index._lock:
+        matched = index.evaluate(node)
+        count = matched.bit_count()
+        groups = index.group_counts(group_field, matched) if group_field and not sum_getter else None
+        if sum_getter is not None or (group_field is not None and groups is None) or (limit > 0 and sort_field):
+            items = index.items(matched)
+        else:
+            items = index.items(matched, limit) if limit > 0 else []
+
+    result: Dict[str, Any] = {
+        "region": region,
+        "resource_type": resource_type,
+        "count": count,
+    }
+
+    if group_field is not None:
+        sums: Dict[Optional[str], float] = {}
+        if groups is None:
+            groups = {}
+            for item in items:
+                keys = [_as_text(v) for v in _values(group_field.get(item))] or [None]
+                amount = _amount(sum_getter(item)) if sum_getter else 0
+                for k in keys:
+                    groups[k] = groups.get(k, 0) + 1
+                    if sum_getter:
+                        sums[k] = sums.get(k, 0) + amount
+        ordered = sorted(groups.items(), key=lambda kv: -kv[1])
+        result["groups"] = [
+            {"value": value, "count": n, **({"sum": sums[value]} if sum_getter else {})}
+            for value, n in ordered[:MAX_GROUPS]
+        ]
+        result["group_count"] = len(groups)
+    elif sum_getter is not None:
+        result["sum"] = sum(_amount(sum_getter(item)) for item in items)
+
+    if limit > 0:
+        if sort_field is not None:
+            key = _sort_key(sort_field)
+            if sort_by.startswith("-"):
+                present = [i for i in items if key(i)[0] != 2]
+                absent = [i for i in items if key(i)[0] == 2]
+                items = heapq.nlargest(limit, present, key=key) + absent[:max(limit - len(present), 0)]
+            else:
+                items = heapq.nsmallest(limit, items, key=key)
+        # Index docs are the store's own items; hand out copies
+        result["items"] = [dict(item) for item in items[:limit]]
+        result["truncated"] = count > limit
+
+    result["query_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    result["inventory_age_s"] = round(age, 1)
+    return result
+
+
+def _amount(value: Any) -> float:
+    values = _values(value)
+    if not values:
+        return 0
+    try:
+        return float(values[0])
+    except (TypeError, ValueError):
+        return 0
@@ -0,0 +1,843 @@
+"""
+Local inventory snapshot of EC2 resources.
+
+Instances, volumes, snapshots and AMIs (owned by the account), security
+groups, VPCs, subnets, network interfaces and the default version of each
+launch template are listed once per region into SQLite and kept in memory as
+``{resource_id: item}`` per (region, resource type), so read tools called
+with ``max_staleness`` answer from a dict instead of a describe round trip.
+
+Refreshes are incremental where EC2 allows it:
+
+* Resources created since the last refresh are found with day wildcards on
+  their creation-time filter (``launch-time``, ``create-time``,
+  ``start-time``, ``creation-date``), resources mid-transition with a state filter, and
+  resources the store last saw mid-transition are re-described by ID.
+* Mutating tools already report what they touched to the response cache;
+  those resources (or whole resource types) are marked dirty and refreshed
+  on the next read.
+* EventBridge events (EC2 state-change notifications, CloudTrail "AWS API
+  Call via CloudTrail" records, EBS notifications) appended one JSON object
+  per line to ``AWS_MCP_INVENTORY_EVENTS_PATH`` are replayed from the last
+  byte read; every resource ID they mention is re-described.
+* Types with no usable change filter (security groups, VPCs, subnets,
+  network interfaces, launch templates) are simply re-listed, and
+  everything is re-listed in full once the last full sync is older than
+  ``AWS_MCP_INVENTORY_FULL_SYNC_INTERVAL`` to catch changes none of the
+  above saw.
+
+An incremental refresh therefore only catches up on changes made through
+this server (or reported by the event feed): a resource stopped, retagged or
+deleted elsewhere without passing through a transitional state is only
+picked up by a full sync. Without an event feed, the age reported with
+inventory answers (``served_age``) is the age of the last full sync, and a
+read whose ``max_staleness`` that age exceeds triggers a full sync.
+"""
+
+import bisect
+import fnmatch
+import json
+import re
+import sqlite3
+import sys
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from mcp_server.core.cache import get_cache
+from mcp_server.core.clients import get_client
+from mcp_server.core.config import Settings
+
+# EC2 accepts at most 200 values per filter
+MAX_FILTER_VALUES = 200
+
+# Tokens handed out for inventory-served pages; live botocore tokens never start with this
+TOKEN_PREFIX = "inventory:"
+
+# (region, resource_type)
+TableKey = Tuple[str, str]
+
+# listener(key, table, upserted {id: item}, removed ids)
+TableListener = Callable[[TableKey, Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]], Set[str]], None]
+
+# Marks a whole (region, resource_type) dirty rather than individual IDs
+_ALL = "*"
+
+
+class UnsupportedFilter(ValueError):
+    """A filter the store cannot evaluate locally; the caller should go to AWS."""
+
+
+def _tag_values(item: Dict[str, Any], key: str) -> List[str]:
+    return [t["Value"] for t in item.get("Tags") or [] if t.get("Key") == key]
+
+
+def _tag_getter(key: str) -> Callable[[Dict[str, Any]], List[str]]:
+    return lambda item: _tag_values(item, key)
+
+
+def _tag_keys(item: Dict[str, Any]) -> List[str]:
+    return [t["Key"] for t in item.get("Tags") or []]
+
+
+def _permission_getter(rules: str, sources: str, field: str) -> Callable[[Dict[str, Any]], List[str]]:
+    return lambda g: [src.get(field) for rule in g.get(rules, []) for src in rule.get(sources, [])]
+
+
+class ResourceType:
+    """How one resource type is listed, identified and filtered."""
+
+    def __init__(
+        self,
+        method: str,
+        result_key: str,
+        id_field: str,
+        id_filter: str,
+        filters: Dict[str, Callable[[Dict[str, Any]], Any]],
+        params: Optional[Dict[str, Any]] = None,
+        created_filter: Optional[str] = None,
+        state: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        transitional: Iterable[str] = (),
+        state_filter: Optional[str] = None,
+    ):
+        self.method = method
+        self.result_key = result_key
+        self.id_field = id_field
+        self.id_filter = id_filter
+        self.params = params or {}
+        # Filter name -> value(s) of an item it matches against, for local queries
+        self.filters = {id_filter: lambda i: i.get(id_field), **filters}
+        # Incremental refresh support; types without created_filter are re-listed in full
+        self.created_filter = created_filter
+        self.state = state
+        self.transitional = set(transitional)
+        self.state_filter = state_filter
+
+    def items(self, page: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if self.result_key == "Reservations":
+            return [i for r in page.get("Reservations", []) for i in r.get("Instances", [])]
+        return page.get(self.result_key, [])
+
+
+RESOURCE_TYPES: Dict[str, ResourceType] = {
+    "instances": ResourceType(
+        "describe_instances", "Reservations", "InstanceId", "instance-id",
+        {
+            "instance-state-name": lambda i: i.get("State", {}).get("Name"),
+            "instance-type": lambda i: i.get("InstanceType"),
+            "instance-lifecycle": lambda i: i.get("InstanceLifecycle") or "on-demand",
+            "vpc-id": lambda i: i.get("VpcId"),
+            "subnet-id": lambda i: i.get("SubnetId"),
+            "instance.group-id": lambda i: [g["GroupId"] for g in i.get("SecurityGroups", [])],
+            "availability-zone": lambda i: i.get("Placement", {}).get("AvailabilityZone"),
+            "image-id": lambda i: i.get("ImageId"),
+            "key-name": lambda i: i.get("KeyName"),
+            "spot-instance-request-id": lambda i: i.get("SpotInstanceRequestId"),
+            "private-ip-address": lambda i: i.get("PrivateIpAddress"),
+        },
+        created_filter="launch-time",
+        state=lambda i: i.get("State", {}).get("Name"),
+        transitional=("pending", "stopping", "shutting-down"),
+        state_filter="instance-state-name",
+    ),
+    "volumes": ResourceType(
+        "describe_volumes", "Volumes", "VolumeId", "volume-id",
+        {
+            "status": lambda v: v.get("State"),
+            "volume-type": lambda v: v.get("VolumeType"),
+            "availability-zone": lambda v: v.get("AvailabilityZone"),
+            "attachment.instance-id": lambda v: [a["InstanceId"] for a in v.get("Attachments", [])],
+            "attachment.status": lambda v: [a["State"] for a in v.get("Attachments", [])],
+            "encrypted": lambda v: v.get("Encrypted"),
+            "size": lambda v: v.get("Size"),
+            "snapshot-id": lambda v: v.get("SnapshotId"),
+        },
+        created_filter="create-time",
+        state=lambda v: v.get("State"),
+        transitional=("creating", "deleting"),
+        state_filter="status",
+    ),
+    "snapshots": ResourceType(
+        "describe_snapshots", "Snapshots", "SnapshotId", "snapshot-id",
+        {
+            "status": lambda s: s.get("State"),
+            "volume-id": lambda s: s.get("VolumeId"),
+            "owner-id": lambda s: s.get("OwnerId"),
+            "encrypted": lambda s: s.get("Encrypted"),
+            "description": lambda s: s.get("Description"),
+        },
+        params={"OwnerIds": ["self"]},
+        created_filter="start-time",
+        state=lambda s: s.get("State"),
+        transitional=("pending",),
+        state_filter="status",
+    ),
+    "security_groups": ResourceType(
+        "describe_security_groups", "SecurityGroups", "GroupId", "group-id",
+        {
+            "group-name": lambda g: g.get("GroupName"),
+            "vpc-id": lambda g: g.get("VpcId"),
+            "owner-id": lambda g: g.get("OwnerId"),
+            "ip-permission.cidr": _permission_getter("IpPermissions", "IpRanges", "CidrIp"),
+            "ip-permission.ipv6-cidr": _permission_getter("IpPermissions", "Ipv6Ranges", "CidrIpv6"),
+            "ip-permission.group-id": _permission_getter("IpPermissions", "UserIdGroupPairs", "GroupId"),
+            "ip-permission.protocol": lambda g: [p.get("IpProtocol") for p in g.get("IpPermissions", [])],
+            "ip-permission.from-port": lambda g: [p.get("FromPort") for p in g.get("IpPermissions", [])],
+            "ip-permission.to-port": lambda g: [p.get("ToPort") for p in g.get("IpPermissions", [])],
+            "egress.ip-permission.cidr": _permission_getter("IpPermissionsEgress", "IpRanges", "CidrIp"),
+        },
+    ),
+    "vpcs": ResourceType(
+        "describe_vpcs", "Vpcs", "VpcId", "vpc-id",
+        {
+            "isDefault": lambda v: v.get("IsDefault"),
+            "is-default": lambda v: v.get("IsDefault"),
+            "state": lambda v: v.get("State"),
+            "cidr": lambda v: v.get("CidrBlock"),
+        },
+    ),
+    "subnets": ResourceType(
+        "describe_subnets", "Subnets", "SubnetId", "subnet-id",
+        {
+            "vpc-id": lambda s: s.get("VpcId"),
+            "availability-zone": lambda s: s.get("AvailabilityZone"),
+            "default-for-az": lambda s: s.get("DefaultForAz"),
+            "state": lambda s: s.get("State"),
+            "cidr-block": lambda s: s.get("CidrBlock"),
+        },
+    ),
+    "images": ResourceType(
+        "describe_images", "Images", "ImageId", "image-id",
+        {
+            "state": lambda a: a.get("State"),
+            "name": lambda a: a.get("Name"),
+            "architecture": lambda a: a.get("Architecture"),
+            "block-device-mapping.snapshot-id": lambda a: [
+                m["Ebs"].get("SnapshotId") for m in a.get("BlockDeviceMappings", []) if "Ebs" in m
+            ],
+        },
+        params={"Owners": ["self"]},
+        created_filter="creation-date",
+        state=lambda a: a.get("State"),
+        transitional=("pending",),
+        state_filter="state",
+    ),
+    "network_interfaces": ResourceType(
+        "describe_network_interfaces", "NetworkInterfaces", "NetworkInterfaceId", "network-interface-id",
+        {
+            "status": lambda n: n.get("Status"),
+            "interface-type": lambda n: n.get("InterfaceType"),
+            "vpc-id": lambda n: n.get("VpcId"),
+            "subnet-id": lambda n: n.get("SubnetId"),
+            "availability-zone": lambda n: n.get("AvailabilityZone"),
+            "group-id": lambda n: [g["GroupId"] for g in n.get("Groups", [])],
+            "attachment.instance-id": lambda n: n.get("Attachment", {}).get("InstanceId"),
+            "private-ip-address": lambda n: n.get("PrivateIpAddress"),
+        },
+    ),
+    # Default version of every template; DescribeLaunchTemplateVersions has no ID filter, so
+    # "launch-template-id" is only ever evaluated locally (the type is always re-listed in full)
+    "launch_templates": ResourceType(
+        "describe_launch_template_versions", "LaunchTemplateVersions", "LaunchTemplateId", "launch-template-id",
+        {
+            "launch-template-name": lambda t: t.get("LaunchTemplateName"),
+            "image-id": lambda t: t.get("LaunchTemplateData", {}).get("ImageId"),
+            "instance-type": lambda t: t.get("LaunchTemplateData", {}).get("InstanceType"),
+            "version-number": lambda t: t.get("VersionNumber"),
+        },
+        params={"Versions": ["$Default"]},
+    ),
+}
+
+# Resource ID prefix -> resource type, for cache tags and change events
+ID_PREFIXES = {
+    "i": "instances",
+    "vol": "volumes",
+    "snap": "snapshots",
+    "sg": "security_groups",
+    "vpc": "vpcs",
+    "subnet": "subnets",
+    "ami": "images",
+    "eni": "network_interfaces",
+    "lt": "launch_templates",
+}
+_ID_PATTERN = re.compile(r"\b(i|vol|snap|sg|vpc|subnet|ami|eni|lt)-[0-9a-f]{8,17}\b")
+
+# Resource-kind cache tags ("<region>/instances") -> resource type
+_KIND_TAGS = {
+    "instances": "instances",
+    "volumes": "volumes",
+    "snapshots": "snapshots",
+    "vpcs": "vpcs",
+    "images": "images",
+}
+
+
+# =======================================================
+# LOCAL FILTERING
+# =======================================================
+def _as_text(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _value_matches(actual: Any, wanted: List[str]) -> bool:
+    actuals = actual if isinstance(actual, list) else [actual]
+    for a in actuals:
+        if a is None:
+            continue
+        a = _as_text(a)
+        for w in wanted:
+            # EC2 filter values accept * and ? wildcards
+            if a == w or (("*" in w or "?" in w) and fnmatch.fnmatchcase(a, w)):
+                return True
+    return False
+
+
+def compile_filters(resource_type: str, filters: Optional[List[Dict[str, Any]]]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Predicate equivalent to an EC2 Filters list (values OR-ed, filters AND-ed).
+    Raises UnsupportedFilter for filter names the store has no getter for.
+    """
+    spec = RESOURCE_TYPES[resource_type]
+    checks = []
+    for f in filters or []:
+        name, wanted = f["Name"], [_as_text(v) for v in f.get("Values", [])]
+        if name.startswith("tag:"):
+            checks.append((_tag_getter(name[4:]), wanted))
+        elif name == "tag-key":
+            checks.append((_tag_keys, wanted))
+        elif name in spec.filters:
+            checks.append((spec.filters[name], wanted))
+        else:
+            raise UnsupportedFilter(f"Filter {name!r} is not supported for {resource_type} in the inventory")
+
+    def predicate(item: Dict[str, Any]) -> bool:
+        return all(_value_matches(get(item), wanted) for get, wanted in checks)
+
+    return predicate
+
+
+def _json_default(value: Any) -> str:
+    return value.isoformat() if isinstance(value, (datetime, date)) else str(value)
+
+
+# =======================================================
+# STORE
+# =======================================================
+class InventoryStore:
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path or Settings.INVENTORY_PATH).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._tables: Dict[TableKey, Dict[str, Dict[str, Any]]] = {}
+        self._refresh_locks: Dict[TableKey, threading.Lock] = {}
+        self._dirty: Dict[TableKey, Set[str]] = {}
+        self._last_refresh: Dict[TableKey, Dict[str, Any]] = {}
+        self.listeners: List[TableListener] = []
+
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS resources (
+                    region TEXT NOT NULL,
+                    resource_type TEXT NOT NULL,
+                    resource_id TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (region, resource_type, resource_id)
+                ) WITHOUT ROWID
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sync_log (
+                    region TEXT NOT NULL,
+                    resource_type TEXT NOT NULL,
+                    full_sync_at REAL,
+                    refreshed_at REAL,
+                    item_count INTEGER,
+                    PRIMARY KEY (region, resource_type)
+                )
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS event_feeds (
+                    path TEXT PRIMARY KEY,
+                    offset INTEGER NOT NULL,
+                    events INTEGER NOT NULL,
+                    replayed_at REAL
+                )
+                """
+            )
+
+    # -------------------------
+    # Memory tables
+    # -------------------------
+    def _table(self, key: TableKey) -> Dict[str, Dict[str, Any]]:
+        table = self._tables.get(key)
+        if table is None:
+            with self._lock:
+                table = self._tables.get(key)
+                if table is None:
+                    rows = self._conn.execute(
+                        "SELECT resource_id, data FROM resources WHERE region = ? AND resource_type = ?",
+                        key,
+                    ).fetchall()
+                    table = self._tables[key] = {rid: json.loads(data) for rid, data in rows}
+        return table
+
+    def add_listener(self, listener: TableListener):
+        """
+        Call listener(key, table, upserted, removed_ids) after every write, under
+        the store lock (e.g. so the query indexes follow the table).
+        """
+        self.listeners.append(listener)
+
+    def _sync_times(self, key: TableKey) -> Tuple[Optional[float], Optional[float]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT full_sync_at, refreshed_at FROM sync_log WHERE region = ? AND resource_type = ?",
+                key,
+            ).fetchone()
+        return (row[0], row[1]) if row else (None, None)
+
+    def age(self, region: str, resource_type: str) -> Optional[float]:
+        """Seconds since the last refresh of this region/type, None if never synced."""
+        refreshed_at = self._sync_times((region, resource_type))[1]
+        return None if refreshed_at is None else time.time() - refreshed_at
+
+    def served_age(self, region: str, resource_type: str) -> Optional[float]:
+        """
+        Age reported with inventory answers. Incremental refreshes miss settled
+        changes made outside this server unless an event feed reports them, so
+        without one the data is only known complete as of the last full sync.
+        """
+        full_sync_at, refreshed_at = self._sync_times((region, resource_type))
+        if refreshed_at is None:
+            return None
+        return time.time() - (refreshed_at if Settings.INVENTORY_EVENTS_PATH else full_sync_at)
+
+    # -------------------------
+    # Writes
+    # -------------------------
+    def _apply(self, key: TableKey, upserts: List[Dict[str, Any]], removals: Iterable[str],
+               full: bool, started: float) -> Tuple[int, int]:
+        spec = RESOURCE_TYPES[key[1]]
+        rows = []
+        for item in upserts:
+            text = json.dumps(item, default=_json_default, separators=(",", ":"))
+            rows.append((item[spec.id_field], text))
+        removals = set(removals)
+
+        with self._lock, self._conn:
+            table = self._table(key)
+            if full:
+                removals = set(table) - {rid for rid, _ in rows}
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO resources (region, resource_type, resource_id, data) VALUES (?, ?, ?, ?)",
+                [(key[0], key[1], rid, text) for rid, text in rows],
+            )
+            self._conn.executemany(
+                "DELETE FROM resources WHERE region = ? AND resource_type = ? AND resource_id = ?",
+                [(key[0], key[1], rid) for rid in removals],
+            )
+            upserted = {}
+            for rid, text in rows:
+                table[rid] = upserted[rid] = json.loads(text)
+            for rid in removals:
+                table.pop(rid, None)
+            for listener in self.listeners:
+                listener(key, table, upserted, removals)
+            full_sync_at = started if full else self._sync_times(key)[0]
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_log (region, resource_type, full_sync_at, refreshed_at, item_count) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key[0], key[1], full_sync_at, started, len(table)),
+            )
+        return len(rows), len(removals)
+
+    # -------------------------
+    # AWS listing
+    # -------------------------
+    @staticmethod
+    def _describe(key: TableKey, filters: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        region, resource_type = key
+        spec = RESOURCE_TYPES[resource_type]
+        ec2 = get_client("ec2", region)
+        params = dict(spec.params)
+        if filters:
+            params["Filters"] = filters
+        items = []
+        for page in ec2.get_paginator(spec.method).paginate(**params):
+            items.extend(spec.items(page))
+        return items
+
+    def _describe_ids(self, key: TableKey, ids: List[str]) -> List[Dict[str, Any]]:
+        spec = RESOURCE_TYPES[key[1]]
+        items = []
+        for start in range(0, len(ids), MAX_FILTER_VALUES):
+            chunk = ids[start:start + MAX_FILTER_VALUES]
+            items.extend(self._describe(key, [{"Name": spec.id_filter, "Values": chunk}]))
+        return items
+
+    def _full_sync(self, key: TableKey, started: float) -> Dict[str, Any]:
+        items = self._describe(key)
+        upserted, removed = self._apply(key, items, (), True, started)
+        return {"mode": "full", "upserted": upserted, "removed": removed}
+
+    def _incremental(self, key: TableKey, since: float, dirty: Set[str], started: float) -> Dict[str, Any]:
+        spec = RESOURCE_TYPES[key[1]]
+        table = self._table(key)
+        found: Dict[str, Dict[str, Any]] = {}
+
+        # Created since the last refresh: one wildcard value per UTC day (a day of margin for clock skew)
+        first = datetime.fromtimestamp(since, timezone.utc).date() - timedelta(days=1)
+        today = datetime.now(timezone.utc).date()
+        days = [(first + timedelta(days=d)).isoformat() + "*" for d in range((today - first).days + 1)]
+        for item in self._describe(key, [{"Name": spec.created_filter, "Values": days}]):
+            found[item[spec.id_field]] = item
+
+        # Mid-transition now, or last seen mid-transition, or touched by a mutating tool / event
+        for item in self._describe(key, [{"Name": spec.state_filter, "Values": sorted(spec.transitional)}]):
+            found[item[spec.id_field]] = item
+        recheck = {rid for rid, item in table.items() if spec.state(item) in spec.transitional} | dirty
+        recheck -= set(found)
+        rechecked = self._describe_ids(key, sorted(recheck)) if recheck else []
+        for item in rechecked:
+            found[item[spec.id_field]] = item
+
+        # A rechecked ID that no longer comes back has been deleted
+        removed = recheck - {item[spec.id_field] for item in rechecked}
+        upserted, removed_count = self._apply(key, list(found.values()), removed, False, started)
+        return {"mode": "incremental", "upserted": upserted, "removed": removed_count, "rechecked": len(recheck)}
+
+    # -------------------------
+    # Refresh
+    # -------------------------
+    def _take_dirty(self, key: TableKey) -> Set[str]:
+        with self._lock:
+            return self._dirty.pop(key, set())
+
+    def mark_dirty(self, region: str, resource_type: str, ids: Iterable[str] = (_ALL,)):
+        with self._lock:
+            self._dirty.setdefault((region, resource_type), set()).update(ids)
+
+    def refresh(self, region: str, resource_type: str, full: bool = False) -> Dict[str, Any]:
+        """Bring one region/type up to date, incrementally when possible."""
+        key = (region, resource_type)
+        spec = RESOURCE_TYPES[resource_type]
+        started = time.time()
+
+        self.replay_events()
+        full_sync_at, refreshed_at = self._sync_times(key)
+        dirty = self._take_dirty(key)
+        full = (
+            full
+            or full_sync_at is None
+            or started - full_sync_at > Settings.INVENTORY_FULL_SYNC_INTERVAL
+            or spec.created_filter is None
+            # More days since the last refresh than one created-time filter can list
+            or (started - refreshed_at) / 86400 > MAX_FILTER_VALUES - 2
+        )
+        # Kind-level marks ("instances were created") are covered by the created/state filters
+        try:
+            result = self._full_sync(key, started) if full else self._incremental(key, refreshed_at, dirty - {_ALL}, started)
+        except Exception:
+            # Try again on the next refresh
+            if dirty:
+                self.mark_dirty(region, resource_type, dirty)
+            raise
+
+        result["items"] = len(self._table(key))
+        result["seconds"] = round(time.time() - started, 3)
+        with self._lock:
+            self._last_refresh[key] = result
+        return result
+
+    def ensure_fresh(self, region: str, resource_type: str, max_staleness: float) -> float:
+        """Refresh when served_age() exceeds max_staleness or rows are marked dirty; returns served_age()."""
+        key = (region, resource_type)
+        with self._lock:
+            lock = self._refresh_locks.setdefault(key, threading.Lock())
+        with lock:
+            age = self.served_age(region, resource_type)
+            stale = age is None or age > max_staleness
+            with self._lock:
+                dirty = bool(self._dirty.get(key))
+            if stale or dirty or self._events_pending():
+                # Without an event feed only a full sync brings served_age back under max_staleness
+                self.refresh(region, resource_type, full=stale and not Settings.INVENTORY_EVENTS_PATH)
+        return self.served_age(region, resource_type)
+
+    def sync(self, region: str, resource_types: Optional[List[str]] = None, full: bool = False) -> Dict[str, Any]:
+        results = {}
+        for resource_type in resource_types or list(RESOURCE_TYPES):
+            key = (region, resource_type)
+            with self._lock:
+                lock = self._refresh_locks.setdefault(key, threading.Lock())
+            try:
+                with lock:
+                    results[resource_type] = self.refresh(region, resource_type, full=full)
+            except Exception as e:
+                results[resource_type] = {"error": str(e)}
+        return results
+
+    # -------------------------
+    # Reads
+    # -------------------------
+    # Items handed out are shallow copies: callers annotate them (fan_out_merge
+    # adds the region) and must not write into the stored tables and indexes.
+    def items(self, region: str, resource_type: str, max_staleness: Optional[float] = None) -> List[Dict[str, Any]]:
+        if max_staleness is not None:
+            self.ensure_fresh(region, resource_type, max_staleness)
+        table = self._table((region, resource_type))
+        with self._lock:
+            return [dict(item) for item in table.values()]
+
+    def read_table(self, region: str, resource_type: str, reader: Callable[[Dict[str, Dict[str, Any]]], Any]) -> Any:
+        """Call reader({id: item}) under the store lock, so no write lands while it runs."""
+        with self._lock:
+            return reader(self._table((region, resource_type)))
+
+    def get(self, region: str, resource_type: str, resource_id: str) -> Optional[Dict[str, Any]]:
+        item = self._table((region, resource_type)).get(resource_id)
+        return None if item is None else dict(item)
+
+    def query(
+        self,
+        region: str,
+        resource_type: str,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        max_staleness: float = 0,
+        ids: Optional[List[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], float]:
+        """Items matching EC2-style filters (and IDs), plus the age of the data served."""
+        predicate = compile_filters(resource_type, filters)
+        age = self.ensure_fresh(region, resource_type, max_staleness)
+        table = self._table((region, resource_type))
+        with self._lock:
+            candidates = [table[i] for i in dict.fromkeys(ids) if i in table] if ids else list(table.values())
+        return [dict(item) for item in candidates if predicate(item)], age
+
+    # -------------------------
+    # Change events
+    # -------------------------
+    def _events_pending(self) -> bool:
+        path = Settings.INVENTORY_EVENTS_PATH
+        if not path:
+            return False
+        try:
+            size = Path(path).expanduser().stat().st_size
+        except OSError:
+            return False
+        return size != self._feed_offset(path)
+
+    def _feed_offset(self, path: str) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT offset FROM event_feeds WHERE path = ?", (path,)).fetchone()
+        return row[0] if row else 0
+
+    def replay_events(self, path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Mark every resource mentioned by events appended to the feed since the
+        last replay dirty, so the next refresh of its type re-describes it.
+        """
+        path = path or Settings.INVENTORY_EVENTS_PATH
+        if not path:
+            return {"events": 0}
+        feed = Path(path).expanduser()
+        if not feed.exists():
+            return {"events": 0}
+
+        with self._lock:
+            offset = self._feed_offset(path)
+            if feed.stat().st_size < offset:
+                # Truncated or rotated; start over
+                offset = 0
+            events = marked = 0
+            with open(feed, "rb") as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        # Partially written; read it next time
+                        break
+                    offset += len(line)
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        continue
+                    events += 1
+                    marked += self._mark_event(event)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO event_feeds (path, offset, events, replayed_at) VALUES (?, ?, "
+                "COALESCE((SELECT events FROM event_feeds WHERE path = ?), 0) + ?, ?)",
+                (path, offset, path, events, time.time()),
+            )
+            self._conn.commit()
+        if events:
+            print(f"[Inventory] Replayed {events} events from {path}, {marked} resources marked", file=sys.stderr)
+        return {"events": events, "resources_marked": marked}
+
+    def _mark_event(self, event: Dict[str, Any]) -> int:
+        region = event.get("region") or event.get("detail", {}).get("awsRegion")
+        if not region:
+            return 0
+        text = json.dumps([event.get("resources"), event.get("detail")], default=str)
+        marked = 0
+        for match in _ID_PATTERN.finditer(text):
+            self._dirty.setdefault((region, ID_PREFIXES[match.group(1)]), set()).add(match.group(0))
+            marked += 1
+        return marked
+
+    # -------------------------
+    # Status
+    # -------------------------
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT region, resource_type, full_sync_at, refreshed_at, item_count FROM sync_log "
+                "ORDER BY region, resource_type"
+            ).fetchall()
+            feeds = self._conn.execute("SELECT path, offset, events, replayed_at FROM event_feeds").fetchall()
+            dirty = {key: len(ids) for key, ids in self._dirty.items() if ids}
+            last = dict(self._last_refresh)
+        now = time.time()
+        regions: Dict[str, Dict[str, Any]] = {}
+        for region, resource_type, full_sync_at, refreshed_at, count in rows:
+            regions.setdefault(region, {})[resource_type] = {
+                "items": count,
+                "age_s": round(now - refreshed_at, 1),
+                "full_sync_age_s": round(now - full_sync_at, 1) if full_sync_at else None,
+                "dirty": dirty.get((region, resource_type), 0),
+                "last_refresh": last.get((region, resource_type)),
+            }
+        return {
+            "path": str(self.path),
+            "regions": regions,
+            "event_feeds": [
+                {"path": path, "offset": offset, "events": events, "replayed_at": replayed_at}
+                for path, offset, events, replayed_at in feeds
+            ],
+        }
+
+
+# =======================================================
+# CACHE INVALIDATION HOOK
+# =======================================================
+_store: Optional[InventoryStore] = None
+_store_lock = threading.Lock()
+
+# Marks reported before the store was opened; the SQLite inventory outlives the
+# process, so a mutation made right after a restart must still dirty it
+_pending_dirty: Dict[TableKey, Set[str]] = {}
+
+
+def _on_invalidate(tags: Set[str]):
+    """Mutating tools tag what they touched ("<region>/i-0abc", "<region>/instances")."""
+    marks: Dict[TableKey, Set[str]] = {}
+    for t in tags:
+        region, _, name = t.partition("/")
+        if name in _KIND_TAGS:
+            marks.setdefault((region, _KIND_TAGS[name]), set()).add(_ALL)
+            continue
+        match = _ID_PATTERN.fullmatch(name)
+        if match:
+            marks.setdefault((region, ID_PREFIXES[match.group(1)]), set()).add(name)
+    if not marks:
+        return
+
+    with _store_lock:
+        store = _store
+        if store is None:
+            for key, ids in marks.items():
+                _pending_dirty.setdefault(key, set()).update(ids)
+            return
+    for (region, resource_type), ids in marks.items():
+        store.mark_dirty(region, resource_type, ids)
+
+
+def get_inventory() -> InventoryStore:
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                store = InventoryStore()
+                for (region, resource_type), ids in _pending_dirty.items():
+                    store.mark_dirty(region, resource_type, ids)
+                _pending_dirty.clear()
+                _store = store
+    return _store
+
+
+get_cache().add_listener(_on_invalidate)
+
+
+def token_error(next_token: Optional[str], max_staleness: Optional[float]) -> Optional[str]:
+    """Why a page token cannot be used: an inventory token on a call that would go to AWS."""
+    if next_token and next_token.startswith(TOKEN_PREFIX) and max_staleness is None:
+        return (
+            f"next_token {next_token!r} continues an inventory listing; "
+            "pass the same max_staleness as the call that returned it"
+        )
+    return None
+
+
+def serve(
+    region: str,
+    resource_type: str,
+    filters: Optional[List[Dict[str, Any]]],
+    max_staleness: float,
+    *,
+    ids: Optional[List[str]] = None,
+    max_items: Optional[int] = None,
+    next_token: Optional[str] = None,
+    transform: Optional[Callable[[List[Any]], List[Any]]] = None,
+) -> Optional[Tuple[List[Any], Optional[str], float]]:
+    """
+    Answer a list tool from the inventory: (items, next_token, age_s), or None
+    when the request needs AWS (a filter the store cannot evaluate, or a live
+    continuation token).
+
+    Items are served in resource ID order and the token holds the last ID
+    returned, so resources added or removed between pages (the inventory may
+    be refreshed by the next call) never shift the rest of the listing.
+    """
+    if next_token and not next_token.startswith(TOKEN_PREFIX):
+        return None
+    try:
+        items, age = get_inventory().query(region, resource_type, filters, max_staleness, ids=ids)
+    except UnsupportedFilter:
+        return None
+
+    id_field = RESOURCE_TYPES[resource_type].id_field
+    items.sort(key=lambda item: item[id_field])
+    start = 0
+    if next_token:
+        start = bisect.bisect_right([item[id_field] for item in items], next_token[len(TOKEN_PREFIX):])
+    end = start + (max_items or Settings.PAGINATION_MAX_ITEMS)
+    page = items[start:end]
+    token = f"{TOKEN_PREFIX}{page[-1][id_field]}" if end < len(items) else None
+    return (transform(page) if transform else page), token, round(age, 1)
+
+
+def start_sync_scheduler(interval: Optional[float] = None):
+    """Refresh every resource type of Settings.INVENTORY_REGIONS periodically on a daemon thread."""
+    interval = interval or Settings.INVENTORY_REFRESH_INTERVAL
+
+    def loop():
+        while True:
+            store = get_inventory()
+            for region in Settings.INVENTORY_REGIONS:
+                for resource_type, result in store.sync(region).items():
+                    if "error" in result:
+                        print(f"[Inventory] Refresh of {resource_type} in {region} failed => {result['error']}",
+                              file=sys.stderr)
+            time.sleep(interval)
+
+    threading.Thread(target=loop, name="inventory-scheduler", daemon=True).start()
@@ -0,0 +1,46 @@
+"""Models for server administration / introspection tools."""
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class ExecutorStatsParams(BaseModel):
+    pass
+
+
+class CacheStatsParams(BaseModel):
+    clear: bool = Field(
+        default=False,
+        description="If true, drop every cached response after reporting stats."
+    )
+
+
+class SingleFlightStatsParams(BaseModel):
+    reset: bool = Field(
+        default=False,
+        description="If true, zero the per-operation counters after reporting."
+    )
+
+
+class BatcherStatsParams(BaseModel):
+    pass
+
+
+class RateLimitStatsParams(BaseModel):
+    pass
+
+
+class ToolStatsParams(BaseModel):
+    tool: Optional[str] = Field(
+        default=None,
+        description="Only report tools whose name starts with this prefix (e.g. 'ec2.')."
+    )
+    reset: bool = Field(
+        default=False,
+        description="If true, zero every counter after reporting."
+    )
+
+
+class WaiterStatsParams(BaseModel):
+    pass
@@ -0,0 +1,40 @@
+"""Models shared across services."""
+
+from pydantic import BaseModel, Field
+from typing import List, Optional, Union
+
+
+class PaginationParams(BaseModel):
+    page_size: Optional[int] = Field(
+        default=None,
+        description="Items requested per AWS API call (MaxResults). Defaults to the service default."
+    )
+    max_items: Optional[int] = Field(
+        default=None,
+        description="Maximum number of items returned by this call. Defaults to 1000."
+    )
+    next_token: Optional[str] = Field(
+        default=None,
+        description="Cursor returned as next_token by a previous call; resumes the listing from there."
+    )
+
+
+class ProjectionParams(BaseModel):
+    fields: Optional[Union[str, List[str]]] = Field(
+        default=None,
+        description=(
+            "Return only these fields: 'compact' for a built-in summary, or JMESPath / dotted paths "
+            "such as ['InstanceId', 'State.Name', 'Placement.AvailabilityZone']. Omit for full items."
+        )
+    )
+
+
+class StalenessParams(BaseModel):
+    max_staleness: Optional[float] = Field(
+        default=None,
+        description=(
+            "Serve from the local inventory if its data is at most this many seconds old "
+            "(refreshing it first otherwise; without an inventory event feed that refresh is a full "
+            "re-listing). Omit to query AWS directly."
+        )
+    )
@@ -2,6 +2,7 @@
 
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any, List
+from mcp_server.models.common import PaginationParams, ProjectionParams, StalenessParams
 
 
 class RegionOnlyParams(BaseModel):
@@ -13,7 +14,7 @@ class SnapshotIdParam(BaseModel):
     SnapshotId: str
 
 
-class ListSnapshotsParams(BaseModel):
+class ListSnapshotsParams(PaginationParams, ProjectionParams, StalenessParams):
     region: str = Field(default="ap-south-1")
     OwnerIds: Optional[List[str]] = None   # ["self"]
     Filters: Optional[List[Dict[str, Any]]] = None
@@ -2,6 +2,7 @@
 
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
+from mcp_server.models.common import PaginationParams, ProjectionParams, StalenessParams
 
 
 class RegionOnlyParams(BaseModel):
@@ -36,7 +37,7 @@ class DeleteVolumeParams(BaseModel):
     VolumeId: str
 
 
-class DescribeVolumeParams(BaseModel):
+class DescribeVolumeParams(PaginationParams, ProjectionParams, StalenessParams):
     region: str = Field(default="ap-south-1")
     VolumeId: Optional[str] = None
     Filters: Optional[List[Dict[str, Any]]] = None
@@ -3,7 +3,10 @@ from .list import (
     ListEC2ParamsTagwise,
     EC2ListFilters,
     ListEC2Params,
+    ListRunningInstancesParams,
     GetInstanceDetailsParams,
+    GetInstanceDetailsBatchParams,
+    GetInstanceStatusBatchParams,
     ListSpotRequestsParams,
     GetSpotRequestDetailsParams,
     CancelSpotRequestParams,
@@ -12,6 +15,8 @@ from .list import (
 from .lifecycle import (
     StartInstanceParams,
     InstanceLifeCycleParams,
+    BulkLifecycleParams,
+    BulkStopParams,
 )
 
 from .creation import (
@@ -23,6 +28,7 @@ from .creation import (
     CreateSpotInstanceParams,
     CreateInstanceMinimalParams,
     InstanceSSHInstructionParams,
+    InstanceSSHInstructionBatchParams,
 )
 
 from .keypair import (
@@ -50,6 +56,7 @@ from .launch_templates import (
     LaunchFromTemplateParams,
     DescribeLaunchTemplateParams,
     DeleteLaunchTemplateParams,
+    ListLaunchTemplatesParams,
 )
 
 __all__ = [
@@ -57,7 +64,10 @@ __all__ = [
     "ListEC2ParamsTagwise",
     "EC2ListFilters",
     "ListEC2Params",
+    "ListRunningInstancesParams",
     "GetInstanceDetailsParams",
+    "GetInstanceDetailsBatchParams",
+    "GetInstanceStatusBatchParams",
     "ListSpotRequestsParams",
     "GetSpotRequestDetailsParams",
     "CancelSpotRequestParams",
@@ -65,6 +75,8 @@ __all__ = [
     # Lifecycle models
     "StartInstanceParams",
     "InstanceLifeCycleParams",
+    "BulkLifecycleParams",
+    "BulkStopParams",
     
     # Creation models
     "BaseEC2Tag",
@@ -75,6 +87,7 @@ __all__ = [
     "CreateSpotInstanceParams",
     "CreateInstanceMinimalParams",
     "InstanceSSHInstructionParams",
+    "InstanceSSHInstructionBatchParams",
     
     # Keypair models
     "CreateKeyPairParams",
@@ -99,4 +112,5 @@ __all__ = [
     "LaunchFromTemplateParams",
     "DescribeLaunchTemplateParams",
     "DeleteLaunchTemplateParams",
+    "ListLaunchTemplatesParams",
 ]
@@ -2,6 +2,7 @@
 
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict
+from mcp_server.models.common import PaginationParams
 
 # -------------------------------------------------------
 # CREATE AMI
@@ -21,7 +22,7 @@ class CreateAMIParams(BaseModel):
 # -------------------------------------------------------
 # DESCRIBE IMAGES
 # -------------------------------------------------------
-class DescribeImagesParams(BaseModel):
+class DescribeImagesParams(PaginationParams):
     region: str = Field(default="ap-south-1")
     owners: Optional[List[str]] = Field(
         default=None, 
@@ -110,3 +110,11 @@ class InstanceSSHInstructionParams(BaseModel):
     pem_path: Optional[str] = Field(
         None, description="Local path where the PEM is saved"
     )
+
+
+class InstanceSSHInstructionBatchParams(BaseModel):
+    instance_ids: List[str] = Field(..., min_length=1, description="IDs of the EC2 instances")
+    region: str = Field(default="ap-south-1")
+    pem_dir: Optional[str] = Field(
+        None, description="Local directory holding <key_name>.pem files (defaults to ~)"
+    )
@@ -2,6 +2,7 @@
 
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
+from mcp_server.models.common import PaginationParams
 
 
 # -----------------------------------
@@ -108,3 +109,7 @@ class DeleteLaunchTemplateParams(BaseModel):
     region: str = Field(default="ap-south-1")
     LaunchTemplateName: Optional[str] = None
     LaunchTemplateId: Optional[str] = None
+
+
+class ListLaunchTemplatesParams(PaginationParams):
+    region: str = Field(default="ap-south-1")
@@ -1,6 +1,7 @@
 """Models for EC2 instance lifecycle operations (start, stop, reboot, terminate)."""
 
 from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
 
 
 class StartInstanceParams(BaseModel):
@@ -11,3 +12,41 @@ class StartInstanceParams(BaseModel):
 class InstanceLifeCycleParams(BaseModel):
     instance_id: str = Field(..., description="ID of the EC2 instance")
     region: str = Field(..., description="AWS region of the instance")
+
+
+class BulkLifecycleParams(BaseModel):
+    """Select instances by ID list and/or filters; at least one selector is required."""
+
+    instance_ids: Optional[List[str]] = Field(
+        default=None, description="Instance IDs to act on (any number; sent in chunks of 200)."
+    )
+    region: Optional[str] = Field(default=None, description="AWS region. Defaults to the server's default region.")
+    regions: Optional[List[str]] = Field(
+        default=None,
+        description="Act in several regions concurrently, e.g. ['us-east-1', 'eu-west-1'] or ['*']. Overrides region."
+    )
+
+    tag_key: Optional[str] = None
+    tag_value: Optional[str] = None
+    states: Optional[List[str]] = Field(
+        default=None,
+        description="Only act on instances in these states. Defaults to the states the action applies to "
+                    "(e.g. running/pending for stop) when selecting by tag or filter."
+    )
+    instance_types: Optional[List[str]] = None
+    custom_filters: Optional[List[Dict[str, Any]]] = Field(
+        default=None,
+        description="Raw EC2 filter structures: [{'Name': '...', 'Values': [...]}]"
+    )
+
+    dry_run: bool = Field(
+        default=False,
+        description="Resolve the selection and check permissions with EC2 DryRun without changing anything."
+    )
+
+
+class BulkStopParams(BulkLifecycleParams):
+    force: bool = Field(
+        default=False,
+        description="Force the instances to stop without flushing file system caches or metadata."
+    )
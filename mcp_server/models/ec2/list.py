@@ -2,16 +2,17 @@
 
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
+from mcp_server.models.common import PaginationParams, ProjectionParams, StalenessParams
 
 
-class ListEC2ParamsTagwise(BaseModel):
+class ListEC2ParamsTagwise(PaginationParams, StalenessParams):
     region: str
     tag_key: Optional[str] = None
     tag_value: Optional[str] = None
     spot_only: bool = False
 
 
-class EC2ListFilters(BaseModel):
+class EC2ListFilters(PaginationParams, ProjectionParams, StalenessParams):
     region: Optional[str] = Field(default=None)
     instance_ids: Optional[List[str]] = Field(default=None)
     states: Optional[List[str]] = Field(default=None)
@@ -38,6 +39,12 @@ class EC2ListFilters(BaseModel):
         description="Filter instances that were created from a specific Spot Request ID."
     )
 
+    # ----- MULTI-REGION -----
+    regions: Optional[List[str]] = Field(
+        default=None,
+        description="Query several regions concurrently, e.g. ['us-east-1', 'eu-west-1'] or ['*'] for all enabled regions. Overrides region."
+    )
+
     # ----- RAW CUSTOM FILTERS -----
     custom_filters: Optional[List[Dict[str, Any]]] = Field(
         default=None,
@@ -49,12 +56,38 @@ class EC2ListFilters(BaseModel):
 ListEC2Params = EC2ListFilters
 
 
-class GetInstanceDetailsParams(BaseModel):
+class ListRunningInstancesParams(PaginationParams, StalenessParams):
+    region: Optional[str] = Field(default=None)
+    spot_only: bool = Field(
+        default=False,
+        description="If true, only return running Spot instances."
+    )
+    regions: Optional[List[str]] = Field(
+        default=None,
+        description="Query several regions concurrently, e.g. ['us-east-1', 'eu-west-1'] or ['*'] for all enabled regions. Overrides region."
+    )
+
+
+class GetInstanceDetailsParams(ProjectionParams):
     instance_id: str = Field(..., description="ID of the EC2 instance")
     region: str = Field(..., description="AWS region of the instance")
 
 
-class ListSpotRequestsParams(BaseModel):
+class GetInstanceDetailsBatchParams(ProjectionParams):
+    instance_ids: List[str] = Field(
+        ..., min_length=1, description="IDs of the EC2 instances (looked up 200 per API call)"
+    )
+    region: str = Field(..., description="AWS region of the instances")
+
+
+class GetInstanceStatusBatchParams(BaseModel):
+    instance_ids: List[str] = Field(
+        ..., min_length=1, description="IDs of the EC2 instances (looked up 200 per API call)"
+    )
+    region: str = Field(..., description="AWS region of the instances")
+
+
+class ListSpotRequestsParams(PaginationParams):
     region: Optional[str] = Field(
         None, description="AWS region to query. Defaults to the global DEFAULT_REGION."
     )
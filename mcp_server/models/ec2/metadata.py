@@ -11,6 +11,10 @@ class DescribeMetadataOptionsParams(BaseModel):
     instance_id: str
     region: str = Field(default="ap-south-1")
 
+class DescribeMetadataOptionsBatchParams(BaseModel):
+    instance_ids: List[str] = Field(..., min_length=1, description="EC2 instance IDs")
+    region: str = Field(default="ap-south-1")
+
 class ModifyMetadataOptionsParams(BaseModel):
     instance_id: str
     http_tokens: Optional[str] = Field(
@@ -1,7 +1,9 @@
 # mcp_server/models/ec2/pricing_models.py
 
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
+
+from mcp_server.models.common import PaginationParams
 
 
 class EC2OnDemandPriceParams(BaseModel):
@@ -13,7 +15,7 @@ class EC2OnDemandPriceParams(BaseModel):
     region: str = Field(default="ap-south-1")
 
 
-class SpotPriceHistoryParams(BaseModel):
+class SpotPriceHistoryParams(PaginationParams):
     instance_type: str
     product_description: str = Field(
         default="Linux/UNIX",
@@ -30,3 +32,58 @@ class EC2CostEstimateParams(BaseModel):
     hours_per_month: int = Field(default=720)
     operating_system: str = "Linux"
     region: str = Field(default="ap-south-1")
+
+
+class RefreshPriceIndexParams(BaseModel):
+    regions: List[str] = Field(..., description="Region codes to (re)index, e.g. ['ap-south-1']")
+    source: Optional[str] = Field(
+        default=None,
+        description="offer (bulk offer file) | api (Pricing get_products) | dump (recorded get_products file at path). Defaults to the server setting."
+    )
+    path: Optional[str] = Field(
+        default=None,
+        description="Local offer file or get_products dump to ingest instead of downloading."
+    )
+
+
+class PriceIndexStatusParams(BaseModel):
+    pass
+
+
+class EstimateFleetCostParams(BaseModel):
+    instances: Optional[List[Dict[str, Any]]] = Field(
+        default=None,
+        description="Instances from list_ec2_instances / list_running_instances. When omitted, the filters below are used to list them."
+    )
+    region: str = Field(default="ap-south-1", description="Region for filters, and for instances without a Region field")
+    regions: Optional[List[str]] = Field(default=None, description="Fan out the filters across these regions; ['*'] for all enabled regions")
+    states: Optional[List[str]] = Field(default=None, description="Instance states to include, e.g. ['running']")
+    tag_key: Optional[str] = None
+    tag_value: Optional[str] = None
+    instance_types: Optional[List[str]] = None
+    group_by_tags: Optional[List[str]] = Field(default=None, description="Tag keys to break cost down by, e.g. ['team', 'env']")
+    hours_per_month: float = Field(default=730)
+    include_volumes: bool = Field(default=True, description="Add attached EBS volume storage cost")
+    fetch_missing_prices: bool = Field(
+        default=True,
+        description="Query the Pricing API once per instance type missing from the local price index"
+    )
+
+
+class SpotPriceStatsParams(BaseModel):
+    instance_types: List[str] = Field(..., description="Instance types to analyse, e.g. ['m5.large', 'm6i.large']")
+    region: str = Field(default="ap-south-1")
+    availability_zones: Optional[List[str]] = Field(default=None, description="Restrict to these AZs (default: all AZs)")
+    product_description: str = Field(
+        default="Linux/UNIX",
+        description="Linux/UNIX | Windows | Red Hat Enterprise Linux | SUSE Linux"
+    )
+    window_hours: float = Field(default=168, description="Aggregation window ending now (max 720 with the default lookback)")
+    refresh: bool = Field(default=True, description="Pull history published since the last refresh before aggregating")
+
+
+class CheapestSpotAZParams(BaseModel):
+    instance_types: List[str] = Field(..., description="Candidate instance types")
+    region: str = Field(default="ap-south-1")
+    availability_zones: Optional[List[str]] = None
+    product_description: str = Field(default="Linux/UNIX")
@@ -2,6 +2,7 @@
 
 from pydantic import BaseModel, Field
 from typing import Optional, List
+from mcp_server.models.common import PaginationParams, StalenessParams
 
 
 class IpPermission(BaseModel):
@@ -36,5 +37,5 @@ class DescribeSGParams(BaseModel):
     group_name: Optional[str] = None
 
 
-class ListSGParams(BaseModel):
+class ListSGParams(PaginationParams, StalenessParams):
     region: str = Field(default="ap-south-1")
@@ -0,0 +1,115 @@
+"""Models for the local inventory tools."""
+
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from mcp_server.models.common import ProjectionParams
+
+ResourceTypeName = Literal[
+    "instances", "volumes", "snapshots", "security_groups", "vpcs", "subnets",
+    "images", "network_interfaces", "launch_templates",
+]
+
+
+class InventorySyncParams(BaseModel):
+    region: str = Field(default="ap-south-1")
+    regions: Optional[List[str]] = Field(
+        default=None,
+        description="Sync several regions concurrently; '*' means every enabled region."
+    )
+    resource_types: Optional[List[ResourceTypeName]] = Field(
+        default=None,
+        description="Resource types to sync; all of them when omitted."
+    )
+    full: bool = Field(
+        default=False,
+        description="Re-list everything instead of refreshing incrementally."
+    )
+
+
+class InventoryStatusParams(BaseModel):
+    pass
+
+
+class InventoryQueryParams(ProjectionParams):
+    region: str = Field(default="ap-south-1")
+    resource_type: ResourceTypeName = Field(default="instances")
+    where: Optional[str] = Field(
+        default=None,
+        description=(
+            "Boolean expression over indexed fields, e.g. "
+            "\"state = running AND tag:env = prod AND NOT tag:Owner\", "
+            "\"type IN (t3.micro, t3.small) OR lifecycle = spot\", "
+            "\"ip-permission.cidr = 0.0.0.0/0\". Supports AND / OR / NOT / parentheses, "
+            "=, != and IN (with * and ? wildcards), <, <=, >, >=, and a bare field to test presence. "
+            "Capitalised item attributes (LaunchTime, Size) are evaluated by a scan. Omit to match everything."
+        )
+    )
+    sort_by: Optional[str] = Field(
+        default=None,
+        description="Field to sort matching items by, e.g. 'LaunchTime' or '-Size' for descending."
+    )
+    limit: int = Field(
+        default=50,
+        description="Matching items returned (0 to return only counts / groups)."
+    )
+    group_by: Optional[str] = Field(
+        default=None,
+        description="Count matches per value of this field, e.g. 'type', 'tag:team', 'vpc'."
+    )
+    sum_field: Optional[str] = Field(
+        default=None,
+        description="Numeric field to total over the matches (per group with group_by), e.g. 'Size'."
+    )
+    max_staleness: Optional[float] = Field(
+        default=None,
+        description="Refresh the inventory first if older than this many seconds. Defaults to 300."
+    )
+
+
+class InventoryRelatedParams(BaseModel):
+    region: str = Field(default="ap-south-1")
+    resource_ids: Optional[List[str]] = Field(
+        default=None,
+        description="Resources to start from (any mix of instance, volume, snapshot, SG, VPC, subnet, ENI, AMI, launch template IDs)."
+    )
+    resource_type: Optional[ResourceTypeName] = Field(
+        default=None,
+        description="Start from every resource of this type matching where (instead of resource_ids)."
+    )
+    where: Optional[str] = Field(
+        default=None,
+        description="inventory.query expression selecting the start resources, e.g. \"state = stopped\"."
+    )
+    target_types: Optional[List[ResourceTypeName]] = Field(
+        default=None,
+        description="Only report resources of these types (others are still walked through)."
+    )
+    depth: int = Field(
+        default=1,
+        description="Maximum hops from the start resources (1-6)."
+    )
+    direction: Literal["down", "up", "both"] = Field(
+        default="both",
+        description=(
+            "down follows VPC -> subnet -> instance -> volume -> snapshot (and SG -> instance / ENI, "
+            "AMI -> instance / snapshot, launch template -> AMI); up follows the reverse."
+        )
+    )
+    max_nodes: int = Field(default=1000, description="Maximum related resources returned.")
+    max_staleness: Optional[float] = Field(
+        default=None,
+        description="Refresh inventory types older than this many seconds first. Defaults to 300."
+    )
+
+
+class InventoryPathParams(BaseModel):
+    region: str = Field(default="ap-south-1")
+    source: str = Field(..., description="Resource ID to start from")
+    target: str = Field(..., description="Resource ID to reach")
+    max_depth: int = Field(default=6, description="Maximum hops searched (1-6).")
+    max_staleness: Optional[float] = Field(
+        default=None,
+        description="Refresh inventory types older than this many seconds first. Defaults to 300."
+    )
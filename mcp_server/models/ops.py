@@ -0,0 +1,48 @@
+"""Models for the long-running operation (waiter) tools."""
+
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class OpsWaitParams(BaseModel):
+    operation_ids: List[str] = Field(
+        ...,
+        description="Operation IDs returned by mutating tools (operation_id) or ops.watch; waits for all of them."
+    )
+    timeout: Optional[float] = Field(
+        default=None,
+        description="Seconds to block before returning still-pending operations (capped by the server setting)."
+    )
+
+
+class OpsStatusParams(BaseModel):
+    operation_ids: Optional[List[str]] = Field(
+        default=None,
+        description="Operations to report; all tracked operations when omitted."
+    )
+    pending_only: bool = Field(
+        default=False,
+        description="If true, leave out operations that have finished."
+    )
+
+
+class OpsWatchParams(BaseModel):
+    region: str = Field(default="ap-south-1")
+    kind: Literal["instance", "snapshot", "image", "volume", "volume_attachment"] = Field(
+        ...,
+        description="Resource kind; volume_attachment takes volume IDs and tracks their attachment state."
+    )
+    resource_ids: List[str] = Field(..., description="IDs of the resources to wait for.")
+    target: Optional[str] = Field(
+        default=None,
+        description=(
+            "State to wait for. instance: running | stopped | terminated; snapshot: completed; "
+            "image: available; volume: available | in-use; volume_attachment: attached | detached. "
+            "Defaults to the first of each."
+        )
+    )
+    timeout: Optional[float] = Field(
+        default=None,
+        description="Seconds after which the operation is marked timed_out."
+    )
@@ -3,17 +3,31 @@
 from typing import Optional, List
 from pydantic import BaseModel, Field
 
+from mcp_server.models.common import ProjectionParams, StalenessParams
+
 
 class RegionOnlyParams(BaseModel):
     region: str = Field(default="ap-south-1")
 
 
-class DescribeVpcParams(BaseModel):
+class ListVpcsParams(ProjectionParams, StalenessParams):
+    region: str = Field(default="ap-south-1")
+    regions: Optional[List[str]] = Field(
+        default=None,
+        description="Query several regions concurrently, e.g. ['us-east-1', 'eu-west-1'] or ['*'] for all enabled regions. Overrides region."
+    )
+
+
+class DescribeVpcParams(ProjectionParams):
     region: str = "ap-south-1"
     vpc_id: Optional[str] = None
 
 
-class DescribeSubnetParams(BaseModel):
+class ListSubnetsParams(ProjectionParams, StalenessParams):
+    region: str = Field(default="ap-south-1")
+
+
+class DescribeSubnetParams(ProjectionParams):
     region: str = "ap-south-1"
     subnet_id: Optional[str] = None
     vpc_id: Optional[str] = None
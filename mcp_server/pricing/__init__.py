@@ -0,0 +1 @@
+"""Local pricing data stores (on-demand price index, spot price history)."""
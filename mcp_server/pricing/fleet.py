@@ -0,0 +1,225 @@
+"""
+Fleet-wide cost estimation.
+
+Instances are first collapsed to distinct price keys
+(region, instance_type, operating_system, tenancy, pre_installed_sw), each key
+is priced once against the local price index, and a single pass over the
+fleet then accumulates per-type, per-region, per-tag and total monthly cost.
+Attached EBS volumes are priced per GB-month by volume type.
+"""
+
+from collections import Counter, defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from mcp_server.pricing.index import PriceIndex, PriceKey
+
+# EC2 PlatformDetails -> (operatingSystem, preInstalledSw) as used by the price list
+PLATFORM_TO_PRICING = {
+    "Linux/UNIX": ("Linux", "NA"),
+    "Red Hat Enterprise Linux": ("RHEL", "NA"),
+    "Red Hat Enterprise Linux with HA": ("Red Hat Enterprise Linux with HA", "NA"),
+    "SUSE Linux": ("SUSE", "NA"),
+    "Ubuntu Pro": ("Ubuntu Pro", "NA"),
+    "Windows": ("Windows", "NA"),
+    # The license is the customer's; compute is billed at the base (Linux) rate, and
+    # the index drops BYOL rows
+    "Windows BYOL": ("Linux", "NA"),
+    "Windows with SQL Server Standard": ("Windows", "SQL Std"),
+    "Windows with SQL Server Enterprise": ("Windows", "SQL Ent"),
+    "Windows with SQL Server Web": ("Windows", "SQL Web"),
+    "Linux with SQL Server Standard": ("Linux", "SQL Std"),
+    "Linux with SQL Server Enterprise": ("Linux", "SQL Ent"),
+    "Linux with SQL Server Web": ("Linux", "SQL Web"),
+}
+
+TENANCY_TO_PRICING = {"default": "Shared", "dedicated": "Dedicated", "host": "Host"}
+
+# Compute is only billed while an instance is pending or running
+BILLED_STATES = {"pending", "running"}
+
+UNTAGGED = "(untagged)"
+
+
+def _get(inst: Dict[str, Any], *keys: str, default: Any = None) -> Any:
+    """First present key, so both raw DescribeInstances and compact list shapes work."""
+    for key in keys:
+        if key in inst and inst[key] is not None:
+            return inst[key]
+    return default
+
+
+def _state(inst: Dict[str, Any]) -> str:
+    state = _get(inst, "State", "state", default="running")
+    return state.get("Name", "running") if isinstance(state, dict) else state
+
+
+def _tags(inst: Dict[str, Any]) -> Dict[str, str]:
+    tags = _get(inst, "Tags", "tags", default=[])
+    if isinstance(tags, dict):
+        return tags
+    return {t["Key"]: t["Value"] for t in tags if "Key" in t}
+
+
+def price_key(inst: Dict[str, Any], region: str) -> Tuple[str, PriceKey]:
+    """(region, (instance_type, operating_system, tenancy, pre_installed_sw)) for one instance."""
+    operating_system, sw = PLATFORM_TO_PRICING.get(
+        _get(inst, "PlatformDetails", "platform_details", default="Linux/UNIX"), ("Linux", "NA")
+    )
+    placement = inst.get("Placement") or {}
+    tenancy = TENANCY_TO_PRICING.get(placement.get("Tenancy") or inst.get("Tenancy") or "default", "Shared")
+    instance_type = _get(inst, "InstanceType", "instance_type")
+    return _get(inst, "Region", "region", default=region), (instance_type, operating_system, tenancy, sw)
+
+
+def estimate(
+    instances: List[Dict[str, Any]],
+    volumes: Iterable[Dict[str, Any]],
+    index: PriceIndex,
+    *,
+    region: str,
+    hours_per_month: float = 730,
+    tag_keys: Optional[List[str]] = None,
+    fetch_missing: Optional[Callable[[str, PriceKey], Optional[float]]] = None,
+) -> Dict[str, Any]:
+    """
+    Price a fleet of instances plus their attached volumes.
+
+    Args:
+        instances: Raw DescribeInstances dicts or compact list_running_instances dicts
+        volumes: DescribeVolumes dicts, each tagged with a "Region" key
+        index: Local price index used for both compute and storage prices
+        region: Region assumed for instances that do not carry one
+        hours_per_month: Billing hours per month
+        tag_keys: Tag keys to break cost down by
+        fetch_missing: Called once per distinct key the index lacks; returns an hourly price or None
+    """
+    tag_keys = tag_keys or []
+
+    # ---- Collapse the fleet to distinct price keys ----
+    keys = [price_key(inst, region) for inst in instances]
+    distinct = set(keys)
+
+    prices: Dict[Tuple[str, PriceKey], Optional[float]] = {}
+    for r, key in distinct:
+        price = index.region_prices(r).get(key)
+        if price is None and fetch_missing is not None:
+            price = fetch_missing(r, key)
+        prices[(r, key)] = price
+
+    # ---- Volumes per instance ----
+    storage: Dict[str, float] = defaultdict(float)
+    volume_summary: Dict[str, Dict[str, float]] = defaultdict(lambda: {"count": 0, "size_gb": 0, "monthly_usd": 0.0})
+    unpriced_volume_types: Counter = Counter()
+
+    for vol in volumes:
+        vol_region = vol.get("Region", region)
+        vol_type = vol.get("VolumeType", "gp2")
+        size = vol.get("Size", 0)
+        rate = index.ebs_prices(vol_region).get(vol_type)
+
+        summary = volume_summary[vol_type]
+        summary["count"] += 1
+        summary["size_gb"] += size
+        if rate is None:
+            unpriced_volume_types[f"{vol_region}/{vol_type}"] += 1
+            continue
+
+        monthly = rate * size
+        summary["monthly_usd"] += monthly
+        for attachment in vol.get("Attachments", []):
+            storage[attachment.get("InstanceId")] += monthly
+            break
+
+    # ---- Single pass over the fleet ----
+    by_type: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+    by_region: Dict[str, float] = defaultdict(float)
+    by_tag: Dict[str, Dict[str, float]] = {k: defaultdict(float) for k in tag_keys}
+    unpriced: Counter = Counter()
+    compute_total = 0.0
+    billed = 0
+
+    for inst, (r, key) in zip(instances, keys):
+        instance_id = _get(inst, "InstanceId", "instance_id")
+        lifecycle = _get(inst, "InstanceLifecycle", "lifecycle", default="on-demand")
+        hourly = prices[(r, key)]
+
+        compute = 0.0
+        if _state(inst) in BILLED_STATES:
+            billed += 1
+            if hourly is None:
+                unpriced[(r, key)] += 1
+            else:
+                compute = hourly * hours_per_month
+
+        ebs = storage.get(instance_id, 0.0)
+        cost = compute + ebs
+        compute_total += compute
+        by_region[r] += cost
+
+        row = by_type.get((r, key[0], lifecycle))
+        if row is None:
+            row = by_type[(r, key[0], lifecycle)] = {
+                "region": r,
+                "instance_type": key[0],
+                "lifecycle": lifecycle,
+                "count": 0,
+                "billed_count": 0,
+                "price_per_hour_usd": hourly,
+                "compute_monthly_usd": 0.0,
+                "ebs_monthly_usd": 0.0,
+            }
+        row["count"] += 1
+        row["billed_count"] += int(_state(inst) in BILLED_STATES)
+        row["compute_monthly_usd"] += compute
+        row["ebs_monthly_usd"] += ebs
+
+        if tag_keys:
+            tags = _tags(inst)
+            for k in tag_keys:
+                by_tag[k][tags.get(k, UNTAGGED)] += cost
+
+    ebs_total = sum(v["monthly_usd"] for v in volume_summary.values())
+    spot_count = sum(row["count"] for row in by_type.values() if row["lifecycle"] == "spot")
+
+    type_rows = []
+    for row in by_type.values():
+        row["compute_monthly_usd"] = round(row["compute_monthly_usd"], 2)
+        row["ebs_monthly_usd"] = round(row["ebs_monthly_usd"], 2)
+        row["monthly_usd"] = round(row["compute_monthly_usd"] + row["ebs_monthly_usd"], 2)
+        type_rows.append(row)
+    type_rows.sort(key=lambda r: r["monthly_usd"], reverse=True)
+
+    return {
+        "hours_per_month": hours_per_month,
+        "instance_count": len(instances),
+        "billed_instance_count": billed,
+        "total_monthly_usd": round(compute_total + ebs_total, 2),
+        "compute_monthly_usd": round(compute_total, 2),
+        "ebs_monthly_usd": round(ebs_total, 2),
+        "by_instance_type": type_rows,
+        "by_region": {r: round(v, 2) for r, v in sorted(by_region.items())},
+        "by_tag": {
+            k: dict(sorted(((v, round(c, 2)) for v, c in values.items()), key=lambda x: -x[1]))
+            for k, values in by_tag.items()
+        },
+        "volumes": {
+            t: {**s, "monthly_usd": round(s["monthly_usd"], 2)}
+            for t, s in sorted(volume_summary.items())
+        },
+        "unpriced": [
+            {
+                "region": r,
+                "instance_type": key[0],
+                "operating_system": key[1],
+                "tenancy": key[2],
+                "pre_installed_sw": key[3],
+                "count": count,
+            }
+            for (r, key), count in unpriced.items()
+        ],
+        "unpriced_volumes": dict(unpriced_volume_types),
+        "notes": (
+            [f"{spot_count} spot instance(s) priced at on-demand rates (upper bound)"]
+            if spot_count else []
+        ),
+    }
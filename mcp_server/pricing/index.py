@@ -0,0 +1,574 @@
+"""
+Local on-demand EC2 price index.
+
+The AmazonEC2 bulk offer file (or a recorded ``get_products`` dump) is
+ingested once into SQLite, keyed by
+(region, instance_type, operating_system, tenancy, pre_installed_sw).
+EBS storage prices (per GB-month, by volume type) are ingested from the
+same source. Lookups read a per-region dict that is loaded from SQLite on
+first use, so a price lookup is a dictionary access instead of a Pricing
+API round-trip.
+"""
+
+import io
+import json
+import sqlite3
+import sys
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from mcp_server.core.clients import get_client
+from mcp_server.core.config import Settings
+from mcp_server.pricing.locations import AWS_PRICING_REGION_MAP, LOCATION_TO_REGION
+
+OFFER_FILE_URL = "{base}/offers/v1.0/aws/AmazonEC2/current/{region}/index.json"
+
+COMPUTE_FAMILIES = {"Compute Instance", "Compute Instance (bare metal)"}
+STORAGE_FAMILY = "Storage"
+
+# (region, instance_type, operating_system, tenancy, pre_installed_sw, price_per_hour, sku)
+PriceRow = Tuple[str, str, str, str, str, float, str]
+PriceKey = Tuple[str, str, str, str]
+
+# (region, volume_type, price_per_gb_month, sku)
+StorageRow = Tuple[str, str, float, str]
+
+
+# =======================================================
+# PARSING
+# =======================================================
+def _ondemand_usd(term_group: Dict[str, Any]) -> Optional[float]:
+    """First USD hourly price found in an OnDemand term group for one SKU."""
+    for term in term_group.values():
+        for dimension in term.get("priceDimensions", {}).values():
+            usd = dimension.get("pricePerUnit", {}).get("USD")
+            if usd is not None:
+                return float(usd)
+    return None
+
+
+def _row_from_product(product: Dict[str, Any], ondemand_terms: Dict[str, Any]) -> Optional[PriceRow]:
+    if product.get("productFamily") not in COMPUTE_FAMILIES:
+        return None
+
+    attrs = product.get("attributes", {})
+
+    # Only billable on-demand capacity; skip reservations, capacity blocks and BYOL
+    if attrs.get("capacitystatus", "Used") != "Used":
+        return None
+    if attrs.get("marketoption", "OnDemand") != "OnDemand":
+        return None
+    if attrs.get("licenseModel") == "Bring your own license":
+        return None
+
+    region = attrs.get("regionCode") or LOCATION_TO_REGION.get(attrs.get("location"))
+    if not region or not attrs.get("instanceType"):
+        return None
+
+    price = _ondemand_usd(ondemand_terms)
+    if price is None:
+        return None
+
+    return (
+        region,
+        attrs["instanceType"],
+        attrs.get("operatingSystem", "Linux"),
+        attrs.get("tenancy", "Shared"),
+        attrs.get("preInstalledSw", "NA"),
+        price,
+        product.get("sku", ""),
+    )
+
+
+def _storage_row_from_product(product: Dict[str, Any], ondemand_terms: Dict[str, Any]) -> Optional[StorageRow]:
+    if product.get("productFamily") != STORAGE_FAMILY:
+        return None
+
+    attrs = product.get("attributes", {})
+    region = attrs.get("regionCode") or LOCATION_TO_REGION.get(attrs.get("location"))
+    volume_type = attrs.get("volumeApiName")
+    if not region or not volume_type:
+        return None
+
+    price = _ondemand_usd(ondemand_terms)
+    if price is None:
+        return None
+
+    return (region, volume_type, price, product.get("sku", ""))
+
+
+def _split_rows(pairs: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]]) -> Tuple[List[PriceRow], List[StorageRow]]:
+    compute: List[PriceRow] = []
+    storage: List[StorageRow] = []
+    for product, terms in pairs:
+        row = _row_from_product(product, terms)
+        if row:
+            compute.append(row)
+            continue
+        storage_row = _storage_row_from_product(product, terms)
+        if storage_row:
+            storage.append(storage_row)
+    return compute, storage
+
+
+# Product attributes the row builders read; everything else is dropped while streaming
+_OFFER_ATTRIBUTES = (
+    "capacitystatus", "marketoption", "licenseModel", "regionCode", "location",
+    "instanceType", "operatingSystem", "tenancy", "preInstalledSw", "volumeApiName",
+)
+
+
+class _JsonStream:
+    """
+    Incremental reader over a JSON text stream. Objects are walked entry by
+    entry and only the values asked for are decoded, so memory stays bounded
+    by the largest single entry rather than the document.
+    """
+
+    def __init__(self, f: TextIO, chunk_size: int = 1 << 20):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._f.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of offer file")
+
+    def _expect(self, char: str):
+        if self._peek() != char:
+            raise ValueError(f"Expected {char!r} in offer file at offset {self._pos}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete value."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # Value straddles the buffer end; extend it and retry
+                if not self._fill():
+                    raise
+                continue
+            # A number at the buffer end may be cut short
+            if end == len(self._buf) and not isinstance(value, (dict, list, str)) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def skip(self):
+        """Discard the next value, walking objects so large ones are never decoded whole."""
+        if self._peek() == "{":
+            for _ in self.entries():
+                self.skip()
+        else:
+            self.value()
+
+    def entries(self) -> Iterator[str]:
+        """
+        Yield the keys of the object at the current position; the caller must
+        consume each key's value (value(), skip() or entries()) before resuming.
+        """
+        self._expect("{")
+        first = True
+        while True:
+            if self._peek() == "}":
+                self._pos += 1
+                return
+            if not first:
+                self._expect(",")
+            first = False
+            key = self.value()
+            self._expect(":")
+            yield key
+
+
+def _offer_product(product: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Trimmed copy of a compute or storage product, None for anything else."""
+    family = product.get("productFamily")
+    if family not in COMPUTE_FAMILIES and family != STORAGE_FAMILY:
+        return None
+    attrs = product.get("attributes", {})
+    return {
+        "productFamily": family,
+        "sku": product.get("sku", ""),
+        "attributes": {k: attrs[k] for k in _OFFER_ATTRIBUTES if k in attrs},
+    }
+
+
+def rows_from_offer_file(f: TextIO) -> Tuple[List[PriceRow], List[StorageRow]]:
+    """
+    Compute and storage rows from a bulk offer file
+    ({"products": {...}, "terms": {"OnDemand": {...}, "Reserved": {...}}}),
+    parsed as a stream: only trimmed compute/storage products are held while
+    the OnDemand terms are matched, and the Reserved terms are skipped.
+    """
+    stream = _JsonStream(f)
+    products: Dict[str, Dict[str, Any]] = {}
+
+    def pairs():
+        for key in stream.entries():
+            if key == "products":
+                for sku in stream.entries():
+                    product = _offer_product(stream.value())
+                    if product is not None:
+                        products[sku] = product
+            elif key == "terms":
+                for term_type in stream.entries():
+                    if term_type != "OnDemand":
+                        stream.skip()
+                        continue
+                    for sku in stream.entries():
+                        if sku in products:
+                            yield products.pop(sku), stream.value()
+                        else:
+                            stream.skip()
+            else:
+                stream.skip()
+
+    return _split_rows(pairs())
+
+
+def rows_from_price_list(price_list: Iterable[Any]) -> Tuple[List[PriceRow], List[StorageRow]]:
+    """Compute and storage rows from get_products PriceList entries (JSON strings or decoded dicts)."""
+
+    def pairs():
+        for item in price_list:
+            if isinstance(item, str):
+                item = json.loads(item)
+            yield item.get("product", {}), item.get("terms", {}).get("OnDemand", {})
+
+    return _split_rows(pairs())
+
+
+# =======================================================
+# INDEX
+# =======================================================
+class PriceIndex:
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path or Settings.PRICE_INDEX_PATH).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._tables: Dict[str, Dict[PriceKey, float]] = {}
+        self._storage_tables: Dict[str, Dict[str, float]] = {}
+        self._refreshing = set()
+
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ondemand_prices (
+                    region TEXT NOT NULL,
+                    instance_type TEXT NOT NULL,
+                    operating_system TEXT NOT NULL,
+                    tenancy TEXT NOT NULL,
+                    pre_installed_sw TEXT NOT NULL,
+                    price_per_hour REAL NOT NULL,
+                    sku TEXT,
+                    PRIMARY KEY (region, instance_type, operating_system, tenancy, pre_installed_sw)
+                ) WITHOUT ROWID
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ebs_prices (
+                    region TEXT NOT NULL,
+                    volume_type TEXT NOT NULL,
+                    price_per_gb_month REAL NOT NULL,
+                    sku TEXT,
+                    PRIMARY KEY (region, volume_type)
+                ) WITHOUT ROWID
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ingest_log (
+                    region TEXT PRIMARY KEY,
+                    source TEXT,
+                    row_count INTEGER,
+                    ingested_at REAL
+                )
+                """
+            )
+
+    # -------------------------
+    # Lookups
+    # -------------------------
+    def _region_table(self, region: str) -> Dict[PriceKey, float]:
+        table = self._tables.get(region)
+        if table is None:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT instance_type, operating_system, tenancy, pre_installed_sw, price_per_hour "
+                    "FROM ondemand_prices WHERE region = ?",
+                    (region,),
+                ).fetchall()
+            table = {(r[0], r[1], r[2], r[3]): r[4] for r in rows}
+            self._tables[region] = table
+        return table
+
+    def lookup(
+        self,
+        region: str,
+        instance_type: str,
+        operating_system: str = "Linux",
+        tenancy: str = "Shared",
+        pre_installed_sw: str = "NA",
+    ) -> Optional[float]:
+        """Hourly on-demand USD price, or None when the index has no entry."""
+        return self._region_table(region).get(
+            (instance_type, operating_system, tenancy, pre_installed_sw)
+        )
+
+    def region_prices(self, region: str) -> Dict[PriceKey, float]:
+        """Whole price table for a region: (type, os, tenancy, sw) -> hourly price."""
+        return self._region_table(region)
+
+    def ebs_prices(self, region: str) -> Dict[str, float]:
+        """EBS storage prices for a region: volume_type -> USD per GB-month."""
+        table = self._storage_tables.get(region)
+        if table is None:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT volume_type, price_per_gb_month FROM ebs_prices WHERE region = ?",
+                    (region,),
+                ).fetchall()
+            table = dict(rows)
+            self._storage_tables[region] = table
+        return table
+
+    # -------------------------
+    # Writes
+    # -------------------------
+    def upsert(self, rows: Iterable[PriceRow]) -> int:
+        rows = list(rows)
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO ondemand_prices "
+                "(region, instance_type, operating_system, tenancy, pre_installed_sw, price_per_hour, sku) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            for region in {r[0] for r in rows}:
+                self._tables.pop(region, None)
+        return len(rows)
+
+    def upsert_storage(self, rows: Iterable[StorageRow]) -> int:
+        rows = list(rows)
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO ebs_prices (region, volume_type, price_per_gb_month, sku) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            for region in {r[0] for r in rows}:
+                self._storage_tables.pop(region, None)
+        return len(rows)
+
+    def _replace_region(self, region: str, rows: Tuple[List[PriceRow], List[StorageRow]], source: str) -> int:
+        compute = [r for r in rows[0] if r[0] == region]
+        storage = [r for r in rows[1] if r[0] == region]
+        # One transaction, so readers never see the region half-replaced or empty
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM ondemand_prices WHERE region = ?", (region,))
+            self._conn.execute("DELETE FROM ebs_prices WHERE region = ?", (region,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO ondemand_prices "
+                "(region, instance_type, operating_system, tenancy, pre_installed_sw, price_per_hour, sku) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                compute,
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO ebs_prices (region, volume_type, price_per_gb_month, sku) "
+                "VALUES (?, ?, ?, ?)",
+                storage,
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ingest_log (region, source, row_count, ingested_at) VALUES (?, ?, ?, ?)",
+                (region, source, len(compute), time.time()),
+            )
+            self._tables.pop(region, None)
+            self._storage_tables.pop(region, None)
+        return len(compute)
+
+    # -------------------------
+    # Ingestion
+    # -------------------------
+    def ingest_offer_file(self, region: str, path: Optional[str] = None) -> int:
+        """
+        Ingest the AmazonEC2 bulk offer file for one region.
+
+        Reads a local copy when path is given, otherwise downloads the
+        current per-region file from the public price list endpoint.
+        """
+        if path:
+            with open(path, "r") as f:
+                rows = rows_from_offer_file(f)
+            return self._replace_region(region, rows, f"offer:{path}")
+
+        url = OFFER_FILE_URL.format(base=Settings.PRICE_OFFER_BASE_URL, region=region)
+        print(f"[PriceIndex] Downloading {url}", file=sys.stderr)
+
+        # Parsed while it downloads; the multi-GB document is never held in memory
+        with urllib.request.urlopen(url, timeout=300) as resp:
+            rows = rows_from_offer_file(io.TextIOWrapper(resp, encoding="utf-8"))
+
+        return self._replace_region(region, rows, f"offer:{url}")
+
+    def ingest_price_list_dump(self, region: str, path: str) -> int:
+        """Ingest a recorded get_products dump (JSON array or one PriceList entry per line)."""
+        with open(path, "r") as f:
+            text = f.read().strip()
+
+        if text.startswith("["):
+            price_list = json.loads(text)
+        else:
+            price_list = [line for line in text.splitlines() if line.strip()]
+
+        return self._replace_region(region, rows_from_price_list(price_list), f"dump:{path}")
+
+    def ingest_from_api(self, region: str) -> int:
+        """Pull every compute and EBS storage price for a region via get_products."""
+        location = AWS_PRICING_REGION_MAP.get(region)
+        if not location:
+            raise ValueError(f"Region {region} not supported for pricing API")
+
+        pricing = get_client("pricing", "us-east-1")
+        paginator = pricing.get_paginator("get_products")
+
+        # Storage products carry no capacitystatus, so they need their own query
+        queries = [
+            [
+                {"Type": "TERM_MATCH", "Field": "location", "Value": location},
+                {"Type": "TERM_MATCH", "Field": "capacitystatus", "Value": "Used"},
+            ],
+            [
+                {"Type": "TERM_MATCH", "Field": "location", "Value": location},
+                {"Type": "TERM_MATCH", "Field": "productFamily", "Value": STORAGE_FAMILY},
+            ],
+        ]
+
+        def price_list():
+            for filters in queries:
+                for page in paginator.paginate(ServiceCode="AmazonEC2", Filters=filters):
+                    yield from page.get("PriceList", [])
+
+        return self._replace_region(region, rows_from_price_list(price_list()), "api:get_products")
+
+    def refresh(self, region: str, source: Optional[str] = None) -> int:
+        source = source or Settings.PRICE_INDEX_SOURCE
+        if source == "api":
+            return self.ingest_from_api(region)
+        return self.ingest_offer_file(region)
+
+    # -------------------------
+    # Freshness & scheduling
+    # -------------------------
+    def ingested_at(self, region: str) -> Optional[float]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT ingested_at FROM ingest_log WHERE region = ?", (region,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def is_stale(self, region: str, max_age: Optional[float] = None) -> bool:
+        ingested_at = self.ingested_at(region)
+        max_age = max_age if max_age is not None else Settings.PRICE_INDEX_MAX_AGE
+        return ingested_at is None or time.time() - ingested_at > max_age
+
+    def refresh_in_background(self, region: str):
+        """Refresh one region on a daemon thread; concurrent requests for the same region are dropped."""
+        with self._lock:
+            if region in self._refreshing:
+                return
+            self._refreshing.add(region)
+
+        def run():
+            try:
+                count = self.refresh(region)
+                print(f"[PriceIndex] Refreshed {region}: {count} prices", file=sys.stderr)
+            except Exception as e:
+                print(f"[PriceIndex] Refresh failed for {region} => {e}", file=sys.stderr)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(region)
+
+        threading.Thread(target=run, name=f"price-index-{region}", daemon=True).start()
+
+    def indexed_regions(self) -> List[str]:
+        with self._lock:
+            return [r[0] for r in self._conn.execute("SELECT region FROM ingest_log ORDER BY region")]
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT region, source, row_count, ingested_at FROM ingest_log ORDER BY region"
+            ).fetchall()
+        now = time.time()
+        return {
+            "path": str(self.path),
+            "regions": {
+                region: {
+                    "source": source,
+                    "prices": count,
+                    "age_hours": round((now - ingested_at) / 3600, 1),
+                    "stale": now - ingested_at > Settings.PRICE_INDEX_MAX_AGE,
+                }
+                for region, source, count, ingested_at in rows
+            },
+        }
+
+
+_index: Optional[PriceIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_price_index() -> PriceIndex:
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = PriceIndex()
+    return _index
+
+
+def start_refresh_scheduler(interval: Optional[float] = None):
+    """
+    Periodically refresh stale regions (already-indexed ones plus
+    Settings.PRICE_INDEX_REGIONS) on a daemon thread.
+    """
+    interval = interval or Settings.PRICE_INDEX_CHECK_INTERVAL
+
+    def loop():
+        while True:
+            index = get_price_index()
+            regions = set(index.indexed_regions()) | set(Settings.PRICE_INDEX_REGIONS)
+            for region in sorted(regions):
+                if index.is_stale(region):
+                    index.refresh_in_background(region)
+            time.sleep(interval)
+
+    threading.Thread(target=loop, name="price-index-scheduler", daemon=True).start()
@@ -0,0 +1,238 @@
+"""
+In-memory spot price history store.
+
+describe_spot_price_history is pulled incrementally: each
+(region, instance_type, product_description) remembers how far it has been
+fetched, so a refresh only asks for the points published since. Points are
+kept per (availability zone, instance type) series as two compact arrays —
+int32 second offsets from the series' first stored timestamp (negative for
+older points merged in later) and float32 prices — instead of lists of
+dicts, and aggregates are computed over array slices.
+"""
+
+import bisect
+import math
+import statistics
+import threading
+import time
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from mcp_server.core.clients import get_client
+from mcp_server.core.config import Settings
+from mcp_server.core.pagination import paginate
+
+# describe_spot_price_history ProductDescription -> price list operatingSystem
+PRODUCT_TO_OS = {
+    "Linux/UNIX": "Linux",
+    "Linux/UNIX (Amazon VPC)": "Linux",
+    "Red Hat Enterprise Linux": "RHEL",
+    "Red Hat Enterprise Linux (Amazon VPC)": "RHEL",
+    "SUSE Linux": "SUSE",
+    "SUSE Linux (Amazon VPC)": "SUSE",
+    "Windows": "Windows",
+    "Windows (Amazon VPC)": "Windows",
+}
+
+# Pull cursor key: (region, instance_type, product_description)
+FetchKey = Tuple[str, str, str]
+# Series key: (region, availability_zone, instance_type, product_description)
+SeriesKey = Tuple[str, str, str, str]
+
+
+class SpotSeries:
+    """Price changes for one AZ / instance type, oldest first."""
+
+    __slots__ = ("base", "offsets", "prices")
+
+    def __init__(self, base: int):
+        self.base = base
+        self.offsets = array("i")
+        self.prices = array("f")
+
+    def insert(self, ts: int, price: float) -> bool:
+        """
+        Add a price change in timestamp order. Points at or after the last one
+        are appended; older points (e.g. a full lookback pulled after a short
+        window was cached) are merged in place. Timestamps already stored are
+        skipped.
+        """
+        offset = ts - self.base
+        if not self.offsets or offset > self.offsets[-1]:
+            self.offsets.append(offset)
+            self.prices.append(price)
+            return True
+
+        pos = bisect.bisect_left(self.offsets, offset)
+        if pos < len(self.offsets) and self.offsets[pos] == offset:
+            return False
+        self.offsets.insert(pos, offset)
+        self.prices.insert(pos, price)
+        return True
+
+    def __len__(self):
+        return len(self.offsets)
+
+    @property
+    def last_timestamp(self) -> int:
+        return self.base + self.offsets[-1]
+
+    def window(self, since: int) -> Tuple[array, array]:
+        """
+        Offsets and prices from `since` on, including the price already in
+        effect at `since` (spot prices are a step function).
+        """
+        start = bisect.bisect_right(self.offsets, since - self.base) - 1
+        start = max(start, 0)
+        return self.offsets[start:], self.prices[start:]
+
+    def nbytes(self) -> int:
+        return self.offsets.itemsize * len(self.offsets) + self.prices.itemsize * len(self.prices)
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    pos = (len(sorted_values) - 1) * q
+    lo, hi = math.floor(pos), math.ceil(pos)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def series_stats(series: SpotSeries, since: int, now: int) -> Optional[Dict[str, Any]]:
+    """min / max / time-weighted mean / p95 / volatility over [since, now]."""
+    offsets, prices = series.window(since)
+    if not prices:
+        return None
+
+    # Time each price was in effect, clipped to the window
+    since_off, now_off = since - series.base, now - series.base
+    starts = [max(o, since_off) for o in offsets]
+    ends = starts[1:] + [max(now_off, starts[-1])]
+    durations = [e - s for s, e in zip(starts, ends)]
+    total = sum(durations)
+
+    values = list(prices)
+    mean = (
+        sum(p * d for p, d in zip(values, durations)) / total
+        if total > 0 else statistics.fmean(values)
+    )
+    ordered = sorted(values)
+
+    return {
+        "current": round(values[-1], 6),
+        "min": round(ordered[0], 6),
+        "max": round(ordered[-1], 6),
+        "mean": round(mean, 6),
+        "p95": round(_percentile(ordered, 0.95), 6),
+        # Coefficient of variation of the observed prices
+        "volatility": round(statistics.pstdev(values) / mean, 4) if mean else 0.0,
+        "changes": len(values),
+        "last_change": datetime.fromtimestamp(series.last_timestamp, timezone.utc).isoformat(),
+    }
+
+
+class SpotPriceStore:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._series: Dict[SeriesKey, SpotSeries] = {}
+        self._fetched_until: Dict[FetchKey, datetime] = {}
+        self._fetched_at: Dict[FetchKey, float] = {}
+
+    # -------------------------
+    # Ingestion
+    # -------------------------
+    def add_points(self, region: str, points: List[Dict[str, Any]]) -> int:
+        """Add SpotPriceHistory entries; points already stored are skipped."""
+        # The API returns newest first; sorting keeps most inserts on the append path
+        points = sorted(points, key=lambda p: p["Timestamp"])
+        added = 0
+        with self._lock:
+            for p in points:
+                ts = int(p["Timestamp"].timestamp())
+                key = (region, p["AvailabilityZone"], p["InstanceType"], p["ProductDescription"])
+                series = self._series.get(key)
+                if series is None:
+                    series = self._series[key] = SpotSeries(ts)
+                added += series.insert(ts, float(p["SpotPrice"]))
+        return added
+
+    def refresh(
+        self,
+        region: str,
+        instance_types: List[str],
+        product_description: str = "Linux/UNIX",
+        force: bool = False,
+    ) -> int:
+        """Pull history published since the last refresh for these instance types."""
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            due = [
+                t for t in instance_types
+                if force or time.time() - self._fetched_at.get((region, t, product_description), 0)
+                > Settings.SPOT_REFRESH_INTERVAL
+            ]
+            if not due:
+                return 0
+            lookback = now - timedelta(days=Settings.SPOT_HISTORY_LOOKBACK_DAYS)
+            start = min(
+                self._fetched_until.get((region, t, product_description), lookback) for t in due
+            )
+
+        ec2 = get_client("ec2", region)
+        points, token = [], None
+        while True:
+            page, token = paginate(
+                ec2,
+                "describe_spot_price_history",
+                params={
+                    "InstanceTypes": due,
+                    "ProductDescriptions": [product_description],
+                    "StartTime": start,
+                    "EndTime": now,
+                },
+                next_token=token,
+            )
+            points.extend(page)
+            if not token:
+                break
+
+        added = self.add_points(region, points)
+        with self._lock:
+            for t in due:
+                self._fetched_until[(region, t, product_description)] = now
+                self._fetched_at[(region, t, product_description)] = time.time()
+        return added
+
+    # -------------------------
+    # Queries
+    # -------------------------
+    def series_for(
+        self,
+        region: str,
+        instance_type: str,
+        product_description: str = "Linux/UNIX",
+        availability_zones: Optional[List[str]] = None,
+    ) -> Dict[str, SpotSeries]:
+        with self._lock:
+            return {
+                az: series
+                for (r, az, t, pd), series in self._series.items()
+                if r == region and t == instance_type and pd == product_description
+                and (not availability_zones or az in availability_zones)
+            }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "series": len(self._series),
+                "points": sum(len(s) for s in self._series.values()),
+                "bytes": sum(s.nbytes() for s in self._series.values()),
+            }
+
+
+_store = SpotPriceStore()
+
+
+def get_spot_store() -> SpotPriceStore:
+    return _store
@@ -0,0 +1,15 @@
+"""
+Admin Tools Module
+
+Introspection tools for the MCP server itself (executor, caches, metrics).
+"""
+
+from .stats import tools as stats_tools
+
+tools = [
+    *stats_tools,
+]
+
+__all__ = [
+    "stats_tools",
+]
@@ -0,0 +1,135 @@
+# mcp_server/tools/admin/stats.py
+
+from fastmcp.tools import FunctionTool
+
+from mcp_server.core.batcher import get_instance_batcher
+from mcp_server.core.cache import get_cache
+from mcp_server.core.config import Settings
+from mcp_server.core.executor import get_executor
+from mcp_server.core.metrics import get_metrics
+from mcp_server.core.ratelimit import get_rate_limiter
+from mcp_server.core.singleflight import get_single_flight
+from mcp_server.core.waiters import get_waiters
+from mcp_server.models.admin import (
+    ExecutorStatsParams,
+    CacheStatsParams,
+    BatcherStatsParams,
+    SingleFlightStatsParams,
+    RateLimitStatsParams,
+    ToolStatsParams,
+    WaiterStatsParams,
+)
+
+
+def executor_stats():
+    """
+    Queue depth, concurrency and timing counters of the per-region tool executor.
+    """
+    return get_executor().stats()
+
+
+def cache_stats(*, clear: bool = False):
+    """
+    Hit/miss/invalidation counters of the read-only response cache.
+    """
+    stats = get_cache().stats()
+    if clear:
+        get_cache().clear()
+        stats["cleared"] = True
+    return stats
+
+
+def singleflight_stats(*, reset: bool = False):
+    """
+    How many concurrent identical read calls shared one in-flight AWS call,
+    per operation.
+    """
+    stats = get_single_flight().stats()
+    if reset:
+        get_single_flight().reset()
+        stats["reset"] = True
+    return stats
+
+
+def batcher_stats():
+    """
+    Lookups, batches and mean batch size of the single-instance
+    DescribeInstances micro-batcher.
+    """
+    return get_instance_batcher().stats()
+
+
+def rate_limit_stats():
+    """
+    Current refill rate, queued tokens, wait time and throttling counts of
+    every per-action rate limit bucket.
+    """
+    return get_rate_limiter().stats()
+
+
+def waiter_stats():
+    """
+    Operations tracked by the server-side waiters and how many describe
+    calls batching their polls saved.
+    """
+    return get_waiters().stats()
+
+
+def tool_stats(*, tool: str = None, reset: bool = False):
+    """
+    Per-tool latency, response size and AWS call counts, plus per-operation
+    AWS latency, retries and throttling.
+    """
+    if not Settings.METRICS_ENABLED:
+        return {"enabled": False, "hint": "Set AWS_MCP_METRICS_ENABLED=true to record tool stats."}
+    stats = get_metrics().stats(tool)
+    if reset:
+        get_metrics().reset()
+        stats["reset"] = True
+    return stats
+
+
+tools = [
+    FunctionTool(
+        name="admin.executor_stats",
+        description="Show per-region tool executor queue depth, concurrency and timing stats.",
+        fn=executor_stats,
+        parameters=ExecutorStatsParams.model_json_schema(),
+    ),
+    FunctionTool(
+        name="admin.cache_stats",
+        description="Show response cache hit/miss/invalidation stats, optionally clearing the cache.",
+        fn=cache_stats,
+        parameters=CacheStatsParams.model_json_schema(),
+    ),
+    FunctionTool(
+        name="admin.singleflight_stats",
+        description="Show how many concurrent identical read requests were coalesced into one AWS call.",
+        fn=singleflight_stats,
+        parameters=SingleFlightStatsParams.model_json_schema(),
+    ),
+    FunctionTool(
+        name="admin.batcher_stats",
+        description="Show how many single-instance lookups were merged into batched DescribeInstances calls.",
+        fn=batcher_stats,
+        parameters=BatcherStatsParams.model_json_schema(),
+    ),
+    FunctionTool(
+        name="admin.rate_limit_stats",
+        description="Show per-action AWS rate limit buckets: adaptive rate, wait time and throttling counts.",
+        fn=rate_limit_stats,
+        parameters=RateLimitStatsParams.model_json_schema(),
+    ),
+    FunctionTool(
+        name="admin.tool_stats",
+        description="Show per-tool latency percentiles, response bytes and AWS call/retry/throttle counts.",
+        fn=tool_stats,
+        parameters=ToolStatsParams.model_json_schema(),
+    ),
+    FunctionTool(
+        name="admin.waiter_stats",
+        description="Show server-side waiter counts: pending/finished operations and describe calls saved by batching.",
+        fn=waiter_stats,
+        parameters=WaiterStatsParams.model_json_schema(),
+    ),
+]
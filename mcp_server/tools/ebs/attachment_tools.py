@@ -1,6 +1,8 @@
 # mcp_server/tools/ec2/ebs/attachment_tools.py
 
-import boto3
+from mcp_server.core.clients import get_client
+from mcp_server.core.cache import invalidates, tag
+from mcp_server.core.waiters import with_operation
 from fastmcp.tools import FunctionTool
 from typing import Optional
 from mcp_server.models.ebs import (
@@ -11,6 +13,7 @@ from mcp_server.models.ebs import (
 # =======================================================
 # ATTACH
 # =======================================================
+@invalidates(lambda p: [tag(p["region"], p["VolumeId"]), tag(p["region"], p["InstanceId"])])
 def attach_volume(
     *,
     VolumeId: str,
@@ -18,17 +21,19 @@ def attach_volume(
     Device: str,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
-    return ec2.attach_volume(
+    ec2 = get_client("ec2", region)
+    resp = ec2.attach_volume(
         VolumeId=VolumeId,
         InstanceId=InstanceId,
         Device=Device,
     )
+    return with_operation(resp, "volume_attachment", [VolumeId], region, target="attached")
 
 
 # =======================================================
 # DETACH
 # =======================================================
+@invalidates(lambda p: [tag(p["region"], p["VolumeId"]), tag(p["region"], p["InstanceId"])])
 def detach_volume(
     *,
     VolumeId: str,
@@ -36,12 +41,13 @@ def detach_volume(
     Force: Optional[bool] = False,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
-    return ec2.detach_volume(
+    ec2 = get_client("ec2", region)
+    resp = ec2.detach_volume(
         VolumeId=VolumeId,
         InstanceId=InstanceId,
         Force=Force,
     )
+    return with_operation(resp, "volume_attachment", [VolumeId], region, target="detached")
 
 
 tools = [
@@ -1,8 +1,13 @@
 # mcp_server/tools/ec2/ebs/snapshot_tools.py
 
-import boto3
+from mcp_server.core.clients import get_client
+from mcp_server.core.pagination import paginate
+from mcp_server.core.singleflight import coalesced
+from mcp_server.core.waiters import with_operation
+from mcp_server.inventory.store import serve, token_error
+from mcp_server.utils.responses import Projection, with_projection
 from fastmcp.tools import FunctionTool
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 
 from mcp_server.models.ebs import (
     ListSnapshotsParams,
@@ -24,7 +29,7 @@ def create_snapshot(
     Tags: Optional[Dict[str, str]] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     req = {
         "VolumeId": VolumeId,
@@ -39,19 +44,47 @@ def create_snapshot(
             }
         ]
 
-    return ec2.create_snapshot(**req)
+    resp = ec2.create_snapshot(**req)
+    return with_operation(resp, "snapshot", [resp["SnapshotId"]], region)
 
 
 # =======================================================
 # LIST SNAPSHOTS
 # =======================================================
+@coalesced("ebs.list_snapshots")
 def list_snapshots(
     *,
     OwnerIds: Optional[List[str]] = None,
     Filters: Optional[List[Dict[str, Any]]] = None,
-    region: str = "ap-south-1"
+    region: str = "ap-south-1",
+    page_size: Optional[int] = None,
+    max_items: Optional[int] = None,
+    next_token: Optional[str] = None,
+    fields: Optional[Union[str, List[str]]] = None,
+    max_staleness: Optional[float] = None,
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    error = token_error(next_token, max_staleness)
+    if error:
+        return {"region": region, "error": error}
+
+    ec2 = get_client("ec2", region)
+    projection = Projection(fields, "snapshot")
+
+    # The inventory only holds the account's own snapshots
+    if max_staleness is not None and OwnerIds == ["self"]:
+        local = serve(
+            region, "snapshots", Filters, max_staleness,
+            max_items=max_items, next_token=next_token, transform=projection,
+        )
+        if local is not None:
+            snapshots, token, age = local
+            return with_projection({
+                "region": region,
+                "snapshots": snapshots,
+                "next_token": token,
+                "source": "inventory",
+                "inventory_age_s": age,
+            }, projection)
 
     req = {}
 
@@ -61,19 +94,28 @@ def list_snapshots(
     if Filters:
         req["Filters"] = Filters
 
-    resp = ec2.describe_snapshots(**req)
-    return resp.get("Snapshots", [])
+    snapshots, token = paginate(
+        ec2,
+        "describe_snapshots",
+        params=req,
+        page_size=page_size,
+        max_items=max_items,
+        next_token=next_token,
+        transform=projection,
+    )
+    return with_projection({"region": region, "snapshots": snapshots, "next_token": token}, projection)
 
 
 # =======================================================
 # DESCRIBE A SPECIFIC SNAPSHOT
 # =======================================================
+@coalesced("ebs.describe_snapshot")
 def describe_snapshot(
     *,
     SnapshotId: str,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
     resp = ec2.describe_snapshots(SnapshotIds=[SnapshotId])
     return resp.get("Snapshots", [])
 
@@ -86,7 +128,7 @@ def delete_snapshot(
     SnapshotId: str,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
     return ec2.delete_snapshot(SnapshotId=SnapshotId)
 
 
@@ -103,7 +145,7 @@ def copy_snapshot(
     Tags: Optional[Dict[str, str]] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     req = {
         "SourceRegion": SourceRegion,
@@ -125,7 +167,8 @@ def copy_snapshot(
             }
         ]
 
-    return ec2.copy_snapshot(**req)
+    resp = ec2.copy_snapshot(**req)
+    return with_operation(resp, "snapshot", [resp["SnapshotId"]], region)
 
 
 # =======================================================
@@ -144,7 +187,7 @@ def restore_volume_from_snapshot(
     ExtraParams: Optional[Dict[str, Any]] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     req = {
         "SnapshotId": SnapshotId,
@@ -165,7 +208,8 @@ def restore_volume_from_snapshot(
     if ExtraParams:
         req.update(ExtraParams)
 
-    return ec2.create_volume(**req)
+    resp = ec2.create_volume(**req)
+    return with_operation(resp, "volume", [resp["VolumeId"]], region)
 
 
 # =======================================================
@@ -178,7 +222,7 @@ def manage_fast_snapshot_restore(
     State: str,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     if State not in ("enable", "disable"):
         return {"error": "State must be 'enable' or 'disable'"}
@@ -1,8 +1,14 @@
 # mcp_server/tools/ec2/ebs/volume_tools.py
 
-import boto3
+from mcp_server.core.clients import get_client
+from mcp_server.core.cache import invalidates, tag
+from mcp_server.core.pagination import paginate
+from mcp_server.core.singleflight import coalesced
+from mcp_server.core.waiters import with_operation
+from mcp_server.inventory.store import serve, token_error
+from mcp_server.utils.responses import Projection, with_projection
 from fastmcp.tools import FunctionTool
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 from mcp_server.models.ebs import (
     CreateVolumeParams,
     ModifyVolumeParams,
@@ -27,7 +33,7 @@ def create_volume(
     ExtraParams: Optional[Dict[str, Any]] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     req = {
         "AvailabilityZone": AvailabilityZone,
@@ -58,12 +64,14 @@ def create_volume(
     if ExtraParams:
         req.update(ExtraParams)
 
-    return ec2.create_volume(**req)
+    resp = ec2.create_volume(**req)
+    return with_operation(resp, "volume", [resp["VolumeId"]], region)
 
 
 # =======================================================
 # MODIFY VOLUME
 # =======================================================
+@invalidates(lambda p: [tag(p["region"], p["VolumeId"])])
 def modify_volume(
     *,
     VolumeId: str,
@@ -73,7 +81,7 @@ def modify_volume(
     Throughput: Optional[int] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     req = {"VolumeId": VolumeId}
 
@@ -92,32 +100,68 @@ def modify_volume(
 # =======================================================
 # DELETE VOLUME
 # =======================================================
+@invalidates(lambda p: [tag(p["region"], p["VolumeId"])])
 def delete_volume(
     *,
     VolumeId: str,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
     return ec2.delete_volume(VolumeId=VolumeId)
 
 
 # =======================================================
 # DESCRIBE VOLUMES
 # =======================================================
+@coalesced("ebs.describe_volumes")
 def describe_volumes(
     *,
     VolumeId: Optional[str] = None,
     Filters: Optional[List[Dict[str, Any]]] = None,
-    region: str = "ap-south-1"
+    region: str = "ap-south-1",
+    page_size: Optional[int] = None,
+    max_items: Optional[int] = None,
+    next_token: Optional[str] = None,
+    fields: Optional[Union[str, List[str]]] = None,
+    max_staleness: Optional[float] = None,
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    error = token_error(next_token, max_staleness)
+    if error:
+        return {"region": region, "error": error}
+
+    ec2 = get_client("ec2", region)
+    projection = Projection(fields, "volume")
+
+    if max_staleness is not None:
+        local = serve(
+            region, "volumes", Filters, max_staleness,
+            ids=[VolumeId] if VolumeId else None, max_items=max_items, next_token=next_token, transform=projection,
+        )
+        if local is not None:
+            volumes, token, age = local
+            return with_projection({
+                "region": region,
+                "volumes": volumes,
+                "next_token": token,
+                "source": "inventory",
+                "inventory_age_s": age,
+            }, projection)
 
     if VolumeId:
-        resp = ec2.describe_volumes(VolumeIds=[VolumeId])
+        req = {"VolumeIds": [VolumeId]}
     else:
-        resp = ec2.describe_volumes(Filters=Filters or [])
-
-    return resp.get("Volumes", [])
+        req = {"Filters": Filters or []}
+
+    volumes, token = paginate(
+        ec2,
+        "describe_volumes",
+        params=req,
+        page_size=None if VolumeId else page_size,
+        max_items=max_items,
+        next_token=next_token,
+        transform=projection,
+    )
+    return with_projection({"region": region, "volumes": volumes, "next_token": token}, projection)
 
 
 tools = [
@@ -1,6 +1,10 @@
 # mcp_server/tools/ec2/ami_tools.py
 
-import boto3
+from mcp_server.core.clients import get_client
+from mcp_server.core.cache import cached, invalidates, tag
+from mcp_server.core.pagination import paginate
+from mcp_server.core.singleflight import coalesced
+from mcp_server.core.waiters import with_operation
 from fastmcp.tools import FunctionTool
 from typing import Dict, Any, Optional, List
 
@@ -10,6 +14,7 @@ from mcp_server.models.ec2.ami import (
     DeregisterAMIParams,
 )
 
+@invalidates(lambda p: [tag(p["region"], "images")])
 def create_ami(
     *,
     instance_id: str,
@@ -19,7 +24,7 @@ def create_ami(
     tags: Optional[Dict[str, str]] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     req: Dict[str, Any] = {
         "InstanceId": instance_id,
@@ -39,16 +44,26 @@ def create_ami(
             }
         ]
 
-    return ec2.create_image(**req)
+    resp = ec2.create_image(**req)
+    return with_operation(resp, "image", [resp["ImageId"]], region)
 
+@cached(
+    "aws.describe_images",
+    ttl=300,
+    tags=lambda p: [tag(p["region"], i) for i in (p["image_ids"] or ["images"])],
+)
+@coalesced("aws.describe_images")
 def describe_images(
     *,
     owners: Optional[List[str]] = None,
     image_ids: Optional[List[str]] = None,
     filters: Optional[List[Dict[str, Any]]] = None,
-    region: str = "ap-south-1"
+    region: str = "ap-south-1",
+    page_size: Optional[int] = None,
+    max_items: Optional[int] = None,
+    next_token: Optional[str] = None,
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     req: Dict[str, Any] = {}
 
@@ -61,15 +76,24 @@ def describe_images(
     if filters:
         req["Filters"] = filters
 
-    resp = ec2.describe_images(**req)
-    return resp.get("Images", [])
+    # DescribeImages rejects MaxResults together with ImageIds
+    images, token = paginate(
+        ec2,
+        "describe_images",
+        params=req,
+        page_size=None if image_ids else page_size,
+        max_items=max_items,
+        next_token=next_token,
+    )
+    return {"region": region, "images": images, "next_token": token}
 
+@invalidates(lambda p: [tag(p["region"], p["image_id"]), tag(p["region"], "images")])
 def deregister_ami(
     *,
     image_id: str,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
     return ec2.deregister_image(ImageId=image_id)
 
 tools = [
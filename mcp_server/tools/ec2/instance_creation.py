@@ -2,15 +2,20 @@ from mcp_server.models.ec2 import (
     CreateInstanceParams,
     CreateInstanceMinimalParams,
     InstanceSSHInstructionParams,
+    InstanceSSHInstructionBatchParams,
     CreateSpotInstanceParams
 )
-import boto3
+from mcp_server.core.batcher import get_instance, get_instances
+from mcp_server.core.clients import get_client
+from mcp_server.core.cache import invalidates, tag
+from mcp_server.core.waiters import with_operation
 import os
 from fastmcp.tools import FunctionTool
 from typing import Optional, List, Dict, Any
 
 DEFAULT_REGION = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
 
+@invalidates(lambda p: [tag(p["region"], "instances")])
 def create_instance(
     *,
     ImageId: str,
@@ -30,7 +35,7 @@ def create_instance(
     region: str = "ap-south-1"
 ):
     region = region or DEFAULT_REGION
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     payload = {
         "ImageId": ImageId,
@@ -73,16 +78,22 @@ def create_instance(
         resp = ec2.run_instances(**payload)
         inst = resp["Instances"][0]
 
-        return {
-            "region": region,
-            "instance_id": inst["InstanceId"],
-            "instance_type": inst["InstanceType"],
-            "state": inst["State"]["Name"],
-        }
+        return with_operation(
+            {
+                "region": region,
+                "instance_id": inst["InstanceId"],
+                "instance_type": inst["InstanceType"],
+                "state": inst["State"]["Name"],
+            },
+            "instance",
+            [i["InstanceId"] for i in resp["Instances"]],
+            region,
+        )
 
     except Exception as e:
         return {"error": str(e)}
 
+@invalidates(lambda p: [tag(p["region"], "instances")])
 def create_instance_minimal(
     *,
     ImageId: str,
@@ -94,7 +105,7 @@ def create_instance_minimal(
     region: str = "ap-south-1"
 ):
     region = region or DEFAULT_REGION
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     try:
         payload = {
@@ -119,16 +130,22 @@ def create_instance_minimal(
         resp = ec2.run_instances(**payload)
         inst = resp["Instances"][0]
 
-        return {
-            "region": region,
-            "instance_id": inst["InstanceId"],
-            "public_ip": inst.get("PublicIpAddress"),
-            "state": inst["State"]["Name"]
-        }
+        return with_operation(
+            {
+                "region": region,
+                "instance_id": inst["InstanceId"],
+                "public_ip": inst.get("PublicIpAddress"),
+                "state": inst["State"]["Name"]
+            },
+            "instance",
+            [inst["InstanceId"]],
+            region,
+        )
 
     except Exception as e:
         return {"error": str(e)}
 
+@invalidates(lambda p: [tag(p["region"], "instances")])
 def create_spot_instance(
     *,
     ImageId: str,
@@ -147,7 +164,7 @@ def create_spot_instance(
     region: str = "ap-south-1"
 ):
     region = region or DEFAULT_REGION
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     launch_spec = {
         "ImageId": ImageId,
@@ -211,46 +228,82 @@ def generate_instance_ssh_instruction(
     region: str = "ap-south-1"
 ):
     region = region or DEFAULT_REGION
-    ec2 = boto3.client("ec2", region_name=region)
 
     try:
-        resp = ec2.describe_instances(InstanceIds=[instance_id])
-        inst = resp["Reservations"][0]["Instances"][0]
+        inst = get_instance(instance_id, region)
+        if inst is None:
+            return {"error": f"Instance {instance_id} not found"}
 
-        pub_ip = inst.get("PublicIpAddress")
-        if not pub_ip:
-            return {"error": "Instance has no public IP"}
+        return _ssh_instruction(inst, region, key_name, pem_path)
 
-        key_name = key_name or inst.get("KeyName")
-        if not key_name:
-            return {"error": "No KeyPair associated with instance"}
+    except Exception as e:
+        return {"error": str(e)}
 
-        pem_path = pem_path or f"~/{key_name}.pem"
 
-        # Best-effort username guess
-        ami = inst["ImageId"]
-        if "ubuntu" in ami.lower():
-            user = "ubuntu"
-        elif "amazon" in ami.lower() or "amzn" in ami.lower():
-            user = "ec2-user"
-        else:
-            user = "ec2-user"
+def _ssh_instruction(
+    inst: Dict[str, Any],
+    region: str,
+    key_name: Optional[str] = None,
+    pem_path: Optional[str] = None,
+    pem_dir: str = "~",
+) -> Dict[str, Any]:
+    pub_ip = inst.get("PublicIpAddress")
+    if not pub_ip:
+        return {"error": "Instance has no public IP"}
+
+    key_name = key_name or inst.get("KeyName")
+    if not key_name:
+        return {"error": "No KeyPair associated with instance"}
+
+    pem_path = pem_path or f"{pem_dir}/{key_name}.pem"
+
+    # Best-effort username guess
+    ami = inst["ImageId"]
+    if "ubuntu" in ami.lower():
+        user = "ubuntu"
+    elif "amazon" in ami.lower() or "amzn" in ami.lower():
+        user = "ec2-user"
+    else:
+        user = "ec2-user"
+
+    ssh_command = f"ssh -i {pem_path} {user}@{pub_ip}"
+
+    return {
+        "instance_id": inst["InstanceId"],
+        "region": region,
+        "public_ip": pub_ip,
+        "key_name": key_name,
+        "pem_path": pem_path,
+        "recommended_user": user,
+        "ssh_command": ssh_command
+    }
 
-        ssh_command = f"ssh -i {pem_path} {user}@{pub_ip}"
 
-        return {
-            "instance_id": instance_id,
-            "region": region,
-            "public_ip": pub_ip,
-            "key_name": key_name,
-            "pem_path": pem_path,
-            "recommended_user": user,
-            "ssh_command": ssh_command
-        }
+def generate_instance_ssh_instruction_batch(
+    *,
+    instance_ids: List[str],
+    pem_dir: Optional[str] = None,
+    region: str = "ap-south-1"
+):
+    region = region or DEFAULT_REGION
+
+    try:
+        found = get_instances(instance_ids, region)
+        results, not_found = [], []
+        for instance_id in dict.fromkeys(instance_ids):
+            if instance_id not in found:
+                not_found.append(instance_id)
+                continue
+            entry = _ssh_instruction(found[instance_id], region, pem_dir=(pem_dir or "~").rstrip("/"))
+            entry.setdefault("instance_id", instance_id)
+            results.append(entry)
+
+        return {"region": region, "results": results, "not_found": not_found}
 
     except Exception as e:
         return {"error": str(e)}
-    
+
+
 tools = [
     FunctionTool(
         name="ec2.create_instance",
@@ -276,4 +329,10 @@ tools = [
         fn=generate_instance_ssh_instruction,
         parameters=InstanceSSHInstructionParams.model_json_schema(),
     ),
+    FunctionTool(
+        name="ec2.generate_instance_ssh_instruction_batch",
+        description="Generate SSH commands for many EC2 instances in one call.",
+        fn=generate_instance_ssh_instruction_batch,
+        parameters=InstanceSSHInstructionBatchParams.model_json_schema(),
+    ),
 ]
\ No newline at end of file
@@ -1,17 +1,30 @@
-import boto3
+from mcp_server.core.clients import get_client
+from mcp_server.core.cache import get_cache, invalidates, tag
+from mcp_server.core.regions import fan_out
 import os
+import time
+from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 from fastmcp.tools import FunctionTool
+from typing import Any, Dict, List, Optional
 from mcp_server.models.ec2 import (
     InstanceLifeCycleParams,
+    BulkLifecycleParams,
+    BulkStopParams,
 )
 
 load_dotenv()
 
 DEFAULT_REGION = os.getenv("AWS_DEFAULT_REGION", "ap-south-1")
 
+
+def _instance_tags(params):
+    return [tag(params["region"], params["instance_id"]), tag(params["region"], "instances")]
+
+
+@invalidates(_instance_tags)
 def start_instance(*, instance_id: str, region: str = DEFAULT_REGION) -> dict:
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     try:
         resp = ec2.start_instances(InstanceIds=[instance_id])
@@ -22,8 +35,9 @@ def start_instance(*, instance_id: str, region: str = DEFAULT_REGION) -> dict:
     except Exception as e:
         return {"status": "error", "instance_id": instance_id, "error": str(e)}
 
+@invalidates(_instance_tags)
 def stop_instance(*, instance_id: str, region: str = DEFAULT_REGION) -> dict:
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     try:
         resp = ec2.stop_instances(InstanceIds=[instance_id])
@@ -34,8 +48,9 @@ def stop_instance(*, instance_id: str, region: str = DEFAULT_REGION) -> dict:
     except Exception as e:
         return {"status": "error", "instance_id": instance_id, "error": str(e)}
 
+@invalidates(_instance_tags)
 def reboot_instance(*, instance_id: str, region: str = DEFAULT_REGION) -> dict:
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     try:
         ec2.reboot_instances(InstanceIds=[instance_id])
@@ -49,8 +64,9 @@ def reboot_instance(*, instance_id: str, region: str = DEFAULT_REGION) -> dict:
     except Exception as e:
         return {"status": "error", "instance_id": instance_id, "error": str(e)}
 
+@invalidates(_instance_tags)
 def hard_reboot_instance(*, instance_id: str, region: str = DEFAULT_REGION) -> dict:
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     try:
         ec2.reboot_instances(InstanceIds=[instance_id], Force=True)
@@ -64,8 +80,9 @@ def hard_reboot_instance(*, instance_id: str, region: str = DEFAULT_REGION) -> d
     except Exception as e:
         return {"status": "error", "instance_id": instance_id, "error": str(e)}
 
+@invalidates(_instance_tags)
 def terminate_instance(*, instance_id: str, region: str = DEFAULT_REGION) -> dict:
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     try:
         resp = ec2.terminate_instances(InstanceIds=[instance_id])
@@ -77,6 +94,281 @@ def terminate_instance(*, instance_id: str, region: str = DEFAULT_REGION) -> dic
         return {"status": "error", "instance_id": instance_id, "error": str(e)}
 
 
+# =======================================================
+# BULK OPERATIONS
+# =======================================================
+# Instance IDs per API call (also the EC2 limit on filter values)
+CHUNK_SIZE = 200
+
+# action -> (client method, response key, states the action applies to)
+BULK_ACTIONS = {
+    "start": ("start_instances", "StartingInstances", ["stopped"]),
+    "stop": ("stop_instances", "StoppingInstances", ["pending", "running"]),
+    "reboot": ("reboot_instances", None, ["running"]),
+    "terminate": ("terminate_instances", "TerminatingInstances", ["pending", "running", "stopping", "stopped"]),
+}
+
+# Errors caused by individual instances; a chunk failing with one is split to isolate them
+PER_INSTANCE_ERRORS = ("InvalidInstanceID", "IncorrectInstanceState", "IncorrectState", "OperationNotPermitted", "UnsupportedOperation")
+
+
+def _selection_filters(tag_key, tag_value, states, instance_types, custom_filters):
+    filters = []
+    if tag_key and tag_value:
+        filters.append({"Name": f"tag:{tag_key}", "Values": [tag_value]})
+    elif tag_key:
+        filters.append({"Name": "tag-key", "Values": [tag_key]})
+    if states:
+        filters.append({"Name": "instance-state-name", "Values": states})
+    if instance_types:
+        filters.append({"Name": "instance-type", "Values": instance_types})
+    if custom_filters:
+        filters.extend(custom_filters)
+    return filters
+
+
+def _select(ec2, instance_ids: Optional[List[str]], filters: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Instance ID -> current state for every instance matching the selection."""
+    paginator = ec2.get_paginator("describe_instances")
+    ids = list(dict.fromkeys(instance_ids or []))
+    id_chunks = [ids[i:i + CHUNK_SIZE] for i in range(0, len(ids), CHUNK_SIZE)] or [None]
+
+    selected: Dict[str, str] = {}
+    for chunk in id_chunks:
+        chunk_filters = filters + ([{"Name": "instance-id", "Values": chunk}] if chunk else [])
+        for page in paginator.paginate(Filters=chunk_filters):
+            for reservation in page.get("Reservations", []):
+                for inst in reservation.get("Instances", []):
+                    selected[inst["InstanceId"]] = inst["State"]["Name"]
+    return selected
+
+
+def _run_chunk(ec2, action: str, ids: List[str], extra: Dict[str, Any], dry_run: bool) -> Dict[str, Dict[str, Any]]:
+    method, response_key, _ = BULK_ACTIONS[action]
+    try:
+        resp = getattr(ec2, method)(InstanceIds=ids, DryRun=dry_run, **extra)
+    except ClientError as e:
+        code = e.response.get("Error", {}).get("Code", "")
+        if code == "DryRunOperation":
+            return {i: {"status": "dry_run_ok"} for i in ids}
+        if len(ids) > 1 and code.startswith(PER_INSTANCE_ERRORS):
+            # One bad instance fails the whole request; bisect so the rest still go through
+            mid = len(ids) // 2
+            return {
+                **_run_chunk(ec2, action, ids[:mid], extra, dry_run),
+                **_run_chunk(ec2, action, ids[mid:], extra, dry_run),
+            }
+        return {i: {"status": "error", "error": str(e)} for i in ids}
+    except Exception as e:
+        return {i: {"status": "error", "error": str(e)} for i in ids}
+
+    if response_key is None:
+        return {i: {"status": "success"} for i in ids}
+
+    rows = {i: {"status": "error", "error": "Instance missing from the response"} for i in ids}
+    for item in resp.get(response_key, []):
+        rows[item["InstanceId"]] = {"status": "success", "current_state": item["CurrentState"]["Name"]}
+    return rows
+
+
+def _bulk_in_region(
+    *,
+    region: str,
+    action: str,
+    instance_ids: Optional[List[str]],
+    filters: List[Dict[str, Any]],
+    extra: Dict[str, Any],
+    dry_run: bool,
+) -> Dict[str, Any]:
+    ec2 = get_client("ec2", region)
+    selected = _select(ec2, instance_ids, filters)
+    targets = [i for i, state in selected.items() if state != "terminated"]
+
+    outcome: Dict[str, Dict[str, Any]] = {}
+    for start in range(0, len(targets), CHUNK_SIZE):
+        outcome.update(_run_chunk(ec2, action, targets[start:start + CHUNK_SIZE], extra, dry_run))
+
+    rows = []
+    for instance_id, state in selected.items():
+        row = {"instance_id": instance_id, "region": region, "previous_state": state}
+        row.update(outcome.get(instance_id, {"status": "skipped", "error": "Instance is terminated"}))
+        rows.append(row)
+
+    if not dry_run and targets:
+        get_cache().invalidate([tag(region, i) for i in targets] + [tag(region, "instances")])
+
+    return {"instances": rows, "selected": len(selected)}
+
+
+def bulk_instance_action(
+    action: str,
+    *,
+    instance_ids: Optional[List[str]] = None,
+    region: Optional[str] = None,
+    regions: Optional[List[str]] = None,
+    tag_key: Optional[str] = None,
+    tag_value: Optional[str] = None,
+    states: Optional[List[str]] = None,
+    instance_types: Optional[List[str]] = None,
+    custom_filters: Optional[List[Dict[str, Any]]] = None,
+    dry_run: bool = False,
+    extra: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Apply a lifecycle action to every instance matched by IDs and/or filters,
+    200 IDs per API call, concurrently across regions. Returns one row per
+    matched instance plus per-region stats.
+    """
+    started = time.perf_counter()
+    if not (instance_ids or tag_key or instance_types or custom_filters):
+        return {"error": "Refusing to act on every instance: pass instance_ids, a tag or filters"}
+
+    # Unless told otherwise, a selector only picks instances the action applies to
+    if states is None and not instance_ids:
+        states = BULK_ACTIONS[action][2]
+    filters = _selection_filters(tag_key, tag_value, states, instance_types, custom_filters)
+
+    fanned = fan_out(
+        _bulk_in_region,
+        regions or [region or DEFAULT_REGION],
+        action=action,
+        instance_ids=instance_ids,
+        filters=filters,
+        extra=extra or {},
+        dry_run=dry_run,
+    )
+    if "error" in fanned:
+        return fanned
+
+    rows = []
+    for r in fanned["regions"]:
+        result = fanned["results"].get(r)
+        if result is not None:
+            rows.extend(result["instances"])
+            fanned["region_stats"][r]["selected"] = result["selected"]
+
+    found = {row["instance_id"] for row in rows}
+    not_found = [i for i in dict.fromkeys(instance_ids or []) if i not in found]
+    summary: Dict[str, int] = {"selected": len(rows), "not_found": len(not_found)}
+    for row in rows:
+        summary[row["status"]] = summary.get(row["status"], 0) + 1
+
+    return {
+        "action": action,
+        "dry_run": dry_run,
+        "summary": summary,
+        "instances": rows,
+        "not_found": not_found,
+        "region_stats": fanned["region_stats"],
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+def bulk_start_instances(
+    *,
+    instance_ids: Optional[List[str]] = None,
+    region: Optional[str] = None,
+    regions: Optional[List[str]] = None,
+    tag_key: Optional[str] = None,
+    tag_value: Optional[str] = None,
+    states: Optional[List[str]] = None,
+    instance_types: Optional[List[str]] = None,
+    custom_filters: Optional[List[Dict[str, Any]]] = None,
+    dry_run: bool = False,
+):
+    return bulk_instance_action(
+        "start",
+        instance_ids=instance_ids,
+        region=region,
+        regions=regions,
+        tag_key=tag_key,
+        tag_value=tag_value,
+        states=states,
+        instance_types=instance_types,
+        custom_filters=custom_filters,
+        dry_run=dry_run,
+    )
+
+
+def bulk_stop_instances(
+    *,
+    instance_ids: Optional[List[str]] = None,
+    region: Optional[str] = None,
+    regions: Optional[List[str]] = None,
+    tag_key: Optional[str] = None,
+    tag_value: Optional[str] = None,
+    states: Optional[List[str]] = None,
+    instance_types: Optional[List[str]] = None,
+    custom_filters: Optional[List[Dict[str, Any]]] = None,
+    dry_run: bool = False,
+    force: bool = False,
+):
+    return bulk_instance_action(
+        "stop",
+        instance_ids=instance_ids,
+        region=region,
+        regions=regions,
+        tag_key=tag_key,
+        tag_value=tag_value,
+        states=states,
+        instance_types=instance_types,
+        custom_filters=custom_filters,
+        dry_run=dry_run,
+        extra={"Force": True} if force else None,
+    )
+
+
+def bulk_reboot_instances(
+    *,
+    instance_ids: Optional[List[str]] = None,
+    region: Optional[str] = None,
+    regions: Optional[List[str]] = None,
+    tag_key: Optional[str] = None,
+    tag_value: Optional[str] = None,
+    states: Optional[List[str]] = None,
+    instance_types: Optional[List[str]] = None,
+    custom_filters: Optional[List[Dict[str, Any]]] = None,
+    dry_run: bool = False,
+):
+    return bulk_instance_action(
+        "reboot",
+        instance_ids=instance_ids,
+        region=region,
+        regions=regions,
+        tag_key=tag_key,
+        tag_value=tag_value,
+        states=states,
+        instance_types=instance_types,
+        custom_filters=custom_filters,
+        dry_run=dry_run,
+    )
+
+
+def bulk_terminate_instances(
+    *,
+    instance_ids: Optional[List[str]] = None,
+    region: Optional[str] = None,
+    regions: Optional[List[str]] = None,
+    tag_key: Optional[str] = None,
+    tag_value: Optional[str] = None,
+    states: Optional[List[str]] = None,
+    instance_types: Optional[List[str]] = None,
+    custom_filters: Optional[List[Dict[str, Any]]] = None,
+    dry_run: bool = False,
+):
+    return bulk_instance_action(
+        "terminate",
+        instance_ids=instance_ids,
+        region=region,
+        regions=regions,
+        tag_key=tag_key,
+        tag_value=tag_value,
+        states=states,
+        instance_types=instance_types,
+        custom_filters=custom_filters,
+        dry_run=dry_run,
+    )
+
 tools = [
     FunctionTool(
         name="ec2.start_instance",
@@ -108,4 +400,28 @@ tools = [
         fn=terminate_instance,
         parameters=InstanceLifeCycleParams.model_json_schema()
     ),
-]
\ No newline at end of file
+    FunctionTool(
+        name="ec2.bulk_start_instances",
+        description="Start many EC2 instances selected by IDs or tag/filters, across regions; per-instance results.",
+        fn=bulk_start_instances,
+        parameters=BulkLifecycleParams.model_json_schema()
+    ),
+    FunctionTool(
+        name="ec2.bulk_stop_instances",
+        description="Stop many EC2 instances selected by IDs or tag/filters, across regions; per-instance results.",
+        fn=bulk_stop_instances,
+        parameters=BulkStopParams.model_json_schema()
+    ),
+    FunctionTool(
+        name="ec2.bulk_reboot_instances",
+        description="Reboot many EC2 instances selected by IDs or tag/filters, across regions; per-instance results.",
+        fn=bulk_reboot_instances,
+        parameters=BulkLifecycleParams.model_json_schema()
+    ),
+    FunctionTool(
+        name="ec2.bulk_terminate_instances",
+        description="Terminate many EC2 instances selected by IDs or tag/filters, across regions; per-instance results.",
+        fn=bulk_terminate_instances,
+        parameters=BulkLifecycleParams.model_json_schema()
+    ),
+]
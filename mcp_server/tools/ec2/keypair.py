@@ -1,4 +1,5 @@
-import boto3
+from mcp_server.core.clients import get_client
+from mcp_server.core.singleflight import coalesced
 from typing import Dict, Any
 from pathlib import Path
 import stat
@@ -13,7 +14,7 @@ def create_keypair(region: str, key_name: str) -> Dict[str, Any]:
     """
     Creates an EC2 KeyPair and returns the PEM material.
     """
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     try:
         resp = ec2.create_key_pair(KeyName=key_name)
@@ -31,7 +32,7 @@ def delete_keypair(region: str, key_name: str) -> Dict[str, Any]:
     """
     Deletes an EC2 KeyPair.
     """
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     try:
         ec2.delete_key_pair(KeyName=key_name)
@@ -44,11 +45,12 @@ def delete_keypair(region: str, key_name: str) -> Dict[str, Any]:
         return {"error": str(e), "key_name": key_name}
 
 
+@coalesced("ec2.list_keypairs")
 def list_keypairs(region: str) -> Dict[str, Any]:
     """
     Returns all key pairs in the region.
     """
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     try:
         resp = ec2.describe_key_pairs()
@@ -3,9 +3,14 @@ from mcp_server.models.ec2.launch_templates import (
     CreateLaunchTemplateVersionParams,
     DescribeLaunchTemplateParams,
     DeleteLaunchTemplateParams,
-    LaunchFromTemplateParams
+    LaunchFromTemplateParams,
+    ListLaunchTemplatesParams
 )
-import boto3
+from mcp_server.core.clients import get_client
+from mcp_server.core.cache import invalidates, tag
+from mcp_server.core.pagination import paginate
+from mcp_server.core.singleflight import coalesced
+from mcp_server.core.waiters import with_operation
 import base64
 from fastmcp.tools import FunctionTool
 from typing import Optional, List, Dict, Any
@@ -29,7 +34,7 @@ def create_launch_template(
     ExtraParams: Optional[Dict[str, Any]] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     lt_data = {
         "ImageId": ImageId,
@@ -96,7 +101,7 @@ def create_launch_template_version(
     ExtraParams: Optional[Dict[str, Any]] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     lt_data = {}
 
@@ -138,13 +143,14 @@ def create_launch_template_version(
 # DESCRIBE TEMPLATE
 # ================================================
 
+@coalesced("ec2.describe_launch_template")
 def describe_launch_template(
     *,
     LaunchTemplateName: Optional[str] = None,
     LaunchTemplateId: Optional[str] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     if LaunchTemplateId:
         return ec2.describe_launch_templates(
@@ -166,7 +172,7 @@ def delete_launch_template(
     LaunchTemplateId: Optional[str] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     if LaunchTemplateId:
         return ec2.delete_launch_template(
@@ -182,15 +188,30 @@ def delete_launch_template(
 # LIST ALL TEMPLATES
 # ================================================
 
-def list_launch_templates(region: str = "ap-south-1"):
-    ec2 = boto3.client("ec2", region_name=region)
-    return ec2.describe_launch_templates()
+@coalesced("ec2.list_launch_templates")
+def list_launch_templates(
+    region: str = "ap-south-1",
+    page_size: Optional[int] = None,
+    max_items: Optional[int] = None,
+    next_token: Optional[str] = None,
+):
+    ec2 = get_client("ec2", region)
+
+    templates, token = paginate(
+        ec2,
+        "describe_launch_templates",
+        page_size=page_size,
+        max_items=max_items,
+        next_token=next_token,
+    )
+    return {"region": region, "launch_templates": templates, "next_token": token}
 
 
 # ================================================
 # LAUNCH INSTANCE FROM TEMPLATE
 # ================================================
 
+@invalidates(lambda p: [tag(p["region"], "instances")])
 def launch_from_template(
     *,
     LaunchTemplateName: str,
@@ -199,7 +220,7 @@ def launch_from_template(
     MaxCount: int = 1,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     resp = ec2.run_instances(
         LaunchTemplate={
@@ -210,7 +231,7 @@ def launch_from_template(
         MaxCount=MaxCount
     )
 
-    return resp
+    return with_operation(resp, "instance", [i["InstanceId"] for i in resp["Instances"]], region)
 
 tools = [
     FunctionTool(
@@ -241,7 +262,7 @@ tools = [
         name="ec2.list_launch_templates",
         description="List all EC2 launch templates in a region",
         fn=list_launch_templates,
-        parameters={"type": "object", "properties": {"region": {"type": "string"}}}
+        parameters=ListLaunchTemplatesParams.model_json_schema(),
     ),
     FunctionTool(
         name="ec2.launch_from_template",
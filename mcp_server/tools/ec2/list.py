@@ -1,21 +1,33 @@
 from fastmcp.tools import FunctionTool
 from mcp_server.models.ec2 import (
     ListEC2Params,
+    ListRunningInstancesParams,
     GetInstanceDetailsParams,
+    GetInstanceDetailsBatchParams,
+    GetInstanceStatusBatchParams,
     ListEC2ParamsTagwise,
     ListSpotRequestsParams,
     GetSpotRequestDetailsParams,
     CancelSpotRequestParams
 )
-import boto3
+from mcp_server.core.batcher import get_instance, get_instances
+from mcp_server.core.clients import get_client
+from mcp_server.core.cache import cached, invalidates, tag
+from mcp_server.core.pagination import paginate, paginate_nested
+from mcp_server.core.regions import fan_out_merge
+from mcp_server.core.singleflight import coalesced
+from mcp_server.inventory.store import serve, token_error
+from mcp_server.utils.responses import Projection, with_projection
 import os
-from typing import Dict, Any, List, Optional
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Union
 
 DEFAULT_REGION = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
 
 # -------------------------
 # TOOL FUNCTION 1 — LIST EC2
 # -------------------------
+@coalesced("ec2.list_ec2_instances")
 def list_ec2_instances(
     *,
     region: Optional[str] = None,
@@ -31,11 +43,26 @@ def list_ec2_instances(
     exclude_spot: bool = False,
     spot_request_id: Optional[str] = None,
     custom_filters: Optional[List[Dict[str, Any]]] = None,
+    page_size: Optional[int] = None,
+    max_items: Optional[int] = None,
+    next_token: Optional[str] = None,
+    regions: Optional[List[str]] = None,
+    fields: Optional[Union[str, List[str]]] = None,
+    max_staleness: Optional[float] = None,
 ):
+    # ---- Multi-region fan-out ----
+    if regions:
+        params = {k: v for k, v in locals().items() if k not in ("region", "regions", "next_token")}
+        return fan_out_merge(list_ec2_instances, regions, "instances", region_key="Region", **params)
+
     if not region:
         region = DEFAULT_REGION
 
-    ec2 = boto3.client("ec2", region_name=region)
+    error = token_error(next_token, max_staleness)
+    if error:
+        return {"region": region, "error": error}
+
+    ec2 = get_client("ec2", region)
     filters = []
 
     # ---- Standard Filters ----
@@ -73,20 +100,43 @@ def list_ec2_instances(
 
     # ---- Query AWS ----
     try:
-        if instance_ids:
-            resp = ec2.describe_instances(InstanceIds=instance_ids, Filters=filters or None)
-        else:
-            resp = ec2.describe_instances(Filters=filters or None)
+        projection = Projection(fields, "instance")
 
-        instances = []
-        for res in resp.get("Reservations", []):
-            instances.extend(res.get("Instances", []))
+        # ---- Local inventory ----
+        if max_staleness is not None:
+            local = serve(
+                region, "instances", filters, max_staleness,
+                ids=instance_ids, max_items=max_items, next_token=next_token, transform=projection,
+            )
+            if local is not None:
+                instances, token, age = local
+                return with_projection({
+                    "region": region,
+                    "filters_applied": filters,
+                    "instances": instances,
+                    "next_token": token,
+                    "source": "inventory",
+                    "inventory_age_s": age,
+                }, projection)
+
+        # max_items counts instances, as on the inventory path; DescribeInstances rejects MaxResults with InstanceIds
+        instances, token = paginate_nested(
+            ec2,
+            "describe_instances",
+            item_key="Instances",
+            params={"InstanceIds": instance_ids, "Filters": filters or None},
+            page_size=None if instance_ids else page_size,
+            max_items=max_items,
+            next_token=next_token,
+            transform=projection,
+        )
 
-        return {
+        return with_projection({
             "region": region,
             "filters_applied": filters,
             "instances": instances,
-        }
+            "next_token": token,
+        }, projection)
 
     except Exception as e:
         return {"region": region, "error": str(e)}
@@ -95,16 +145,25 @@ def list_ec2_instances(
 # -------------------------
 # TOOL FUNCTION 2 — GET DETAILS
 # -------------------------
-def get_instance_details(*, instance_id: str, region: str = None):
+@cached(
+    "ec2.get_instance_details",
+    ttl=60,
+    tags=lambda p: [tag(p["region"], p["instance_id"])],
+)
+@coalesced("ec2.get_instance_details")
+def get_instance_details(
+    *,
+    instance_id: str,
+    region: str = None,
+    fields: Optional[Union[str, List[str]]] = None
+):
     if not region:
         region = DEFAULT_REGION
 
-    ec2 = boto3.client("ec2", region_name=region)
+    # Concurrent lookups in the same region share one DescribeInstances call
+    inst = get_instance(instance_id, region)
 
-    resp = ec2.describe_instances(InstanceIds=[instance_id])
-    reservations = resp.get("Reservations", [])
-
-    if not reservations or not reservations[0].get("Instances"):
+    if inst is None:
         return {
             "instance_id": instance_id,
             "region": region,
@@ -112,19 +171,64 @@ def get_instance_details(*, instance_id: str, region: str = None):
             "error": f"Instance {instance_id} not found"
         }
 
-    return {
+    projection = Projection(fields, "instance")
+    return with_projection({
         "instance_id": instance_id,
         "region": region,
-        "details": reservations[0]["Instances"][0]
+        "details": projection.one(inst)
+    }, projection)
+
+
+@coalesced("ec2.get_instance_details_batch")
+def get_instance_details_batch(
+    *,
+    instance_ids: List[str],
+    region: str = None,
+    fields: Optional[Union[str, List[str]]] = None
+):
+    if not region:
+        region = DEFAULT_REGION
+
+    try:
+        found = get_instances(instance_ids, region)
+        projection = Projection(fields, "instance")
+        return with_projection({
+            "region": region,
+            "results": [projection.one(found[i]) for i in dict.fromkeys(instance_ids) if i in found],
+            "not_found": [i for i in dict.fromkeys(instance_ids) if i not in found],
+        }, projection)
+
+    except Exception as e:
+        return {"region": region, "error": str(e)}
+
+
+def _launch_time(inst: Dict[str, Any]) -> Optional[str]:
+    """ISO 8601 whether the instance came from botocore (datetime) or the inventory (already a string)."""
+    value = inst.get("LaunchTime")
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _instance_status(inst: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "instance_id": inst["InstanceId"],
+        "state": inst["State"]["Name"],
+        "public_ip": inst.get("PublicIpAddress"),
+        "instance_type": inst.get("InstanceType"),
+        "launch_time": _launch_time(inst),
+        "lifecycle": inst.get("InstanceLifecycle", "on-demand")
     }
 
-def get_instance_status(*, instance_id: str, region: str = DEFAULT_REGION):
-    ec2 = boto3.client("ec2", region_name=region)
 
+@cached(
+    "ec2.get_instance_running_details",
+    ttl=15,
+    tags=lambda p: [tag(p["region"], p["instance_id"])],
+)
+@coalesced("ec2.get_instance_running_details")
+def get_instance_status(*, instance_id: str, region: str = DEFAULT_REGION):
     try:
-        resp = ec2.describe_instances(InstanceIds=[instance_id])
-        reservations = resp.get("Reservations", [])
-        if not reservations:
+        inst = get_instance(instance_id, region)
+        if inst is None:
             return {
                 "instance_id": instance_id,
                 "state": "not_found",
@@ -132,21 +236,101 @@ def get_instance_status(*, instance_id: str, region: str = DEFAULT_REGION):
                 "instance_type": None
             }
 
-        inst = reservations[0]["Instances"][0]
+        return _instance_status(inst)
+
+    except Exception as e:
+        return {"error": str(e), "instance_id": instance_id}
+
 
+@coalesced("ec2.get_instance_running_details_batch")
+def get_instance_status_batch(*, instance_ids: List[str], region: str = DEFAULT_REGION):
+    try:
+        found = get_instances(instance_ids, region)
         return {
-            "instance_id": instance_id,
-            "state": inst["State"]["Name"],
-            "public_ip": inst.get("PublicIpAddress"),
-            "instance_type": inst.get("InstanceType"),
-            "launch_time": str(inst.get("LaunchTime")),
-            "lifecycle": inst.get("InstanceLifecycle", "on-demand")
+            "region": region,
+            "results": [_instance_status(found[i]) for i in dict.fromkeys(instance_ids) if i in found],
+            "not_found": [i for i in dict.fromkeys(instance_ids) if i not in found],
         }
 
     except Exception as e:
-        return {"error": str(e), "instance_id": instance_id}
-        
-def list_running_instances(*, region: str = DEFAULT_REGION, spot_only: bool = False):
+        return {"region": region, "error": str(e)}
+
+
+def _instance_row(inst: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "instance_id": inst["InstanceId"],
+        "instance_type": inst.get("InstanceType"),
+        "public_ip": inst.get("PublicIpAddress"),
+        "private_ip": inst.get("PrivateIpAddress"),
+        "state": inst["State"]["Name"],
+        "tags": inst.get("Tags", []),
+        "lifecycle": inst.get("InstanceLifecycle", "on-demand"),
+        "launch_time": _launch_time(inst)
+    }
+
+
+def _instance_rows(
+    region: str,
+    filters: List[Dict[str, Any]],
+    page_size: Optional[int],
+    max_items: Optional[int],
+    next_token: Optional[str],
+    max_staleness: Optional[float],
+) -> Dict[str, Any]:
+    """Summary rows for list_running_instances / list_instances_by_tag, from the inventory or AWS."""
+    error = token_error(next_token, max_staleness)
+    if error:
+        return {"region": region, "error": error}
+
+    if max_staleness is not None:
+        local = serve(region, "instances", filters, max_staleness, max_items=max_items, next_token=next_token)
+        if local is not None:
+            instances, token, age = local
+            return {
+                "region": region,
+                "instances": [_instance_row(inst) for inst in instances],
+                "next_token": token,
+                "source": "inventory",
+                "inventory_age_s": age,
+            }
+
+    ec2 = get_client("ec2", region)
+    instances, token = paginate_nested(
+        ec2,
+        "describe_instances",
+        item_key="Instances",
+        params={"Filters": filters},
+        page_size=page_size,
+        max_items=max_items,
+        next_token=next_token,
+        transform=lambda page: [_instance_row(inst) for inst in page],
+    )
+    return {"region": region, "instances": instances, "next_token": token}
+
+
+@coalesced("ec2.list_running_instances")
+def list_running_instances(
+    *,
+    region: str = DEFAULT_REGION,
+    spot_only: bool = False,
+    page_size: Optional[int] = None,
+    max_items: Optional[int] = None,
+    next_token: Optional[str] = None,
+    regions: Optional[List[str]] = None,
+    max_staleness: Optional[float] = None,
+):
+    if regions:
+        return fan_out_merge(
+            list_running_instances,
+            regions,
+            "instances",
+            spot_only=spot_only,
+            page_size=page_size,
+            max_items=max_items,
+            max_staleness=max_staleness,
+        )
+
+    region = region or DEFAULT_REGION
     filters = [
         {"Name": "instance-state-name", "Values": ["running"]}
     ]
@@ -154,27 +338,22 @@ def list_running_instances(*, region: str = DEFAULT_REGION, spot_only: bool = Fa
     if spot_only:
         filters.append({"Name": "instance-lifecycle", "Values": ["spot"]})
 
-    ec2 = boto3.client("ec2", region_name=region)
-    resp = ec2.describe_instances(Filters=filters)
-
-    instances = []
-    for reservation in resp.get("Reservations", []):
-        for inst in reservation.get("Instances", []):
-            instances.append({
-                "instance_id": inst["InstanceId"],
-                "instance_type": inst["InstanceType"],
-                "public_ip": inst.get("PublicIpAddress"),
-                "private_ip": inst.get("PrivateIpAddress"),
-                "state": inst["State"]["Name"],
-                "tags": inst.get("Tags", []),
-                "lifecycle": inst.get("InstanceLifecycle", "on-demand"),
-                "launch_time": str(inst.get("LaunchTime"))
-            })
-
-    return instances
+    return _instance_rows(region, filters, page_size, max_items, next_token, max_staleness)
 
 
-def list_instances_by_tag(*, tag_key: str, tag_value: str, region: str = DEFAULT_REGION, spot_only=False):
+@coalesced("ec2.list_instances_by_tag")
+def list_instances_by_tag(
+    *,
+    tag_key: str,
+    tag_value: str,
+    region: str = DEFAULT_REGION,
+    spot_only=False,
+    page_size: Optional[int] = None,
+    max_items: Optional[int] = None,
+    next_token: Optional[str] = None,
+    max_staleness: Optional[float] = None,
+):
+    region = region or DEFAULT_REGION
     filters = [
         {"Name": f"tag:{tag_key}", "Values": [tag_value]}
     ]
@@ -182,31 +361,17 @@ def list_instances_by_tag(*, tag_key: str, tag_value: str, region: str = DEFAULT
     if spot_only:
         filters.append({"Name": "instance-lifecycle", "Values": ["spot"]})
 
-    ec2 = boto3.client("ec2", region_name=region)
-
-    resp = ec2.describe_instances(Filters=filters)
-
-    instances = []
-    for reservation in resp.get("Reservations", []):
-        for inst in reservation.get("Instances", []):
-            instances.append({
-                "instance_id": inst["InstanceId"],
-                "instance_type": inst.get("InstanceType"),
-                "public_ip": inst.get("PublicIpAddress"),
-                "private_ip": inst.get("PrivateIpAddress"),
-                "state": inst["State"]["Name"],
-                "tags": inst.get("Tags", []),
-                "lifecycle": inst.get("InstanceLifecycle", "on-demand"),
-                "launch_time": str(inst.get("LaunchTime"))
-            })
-
-    return instances
+    return _instance_rows(region, filters, page_size, max_items, next_token, max_staleness)
 
+@coalesced("ec2.list_spot_requests")
 def list_spot_requests(
     *,
     region: Optional[str] = None,
     spot_request_ids: Optional[List[str]] = None,
     states: Optional[List[str]] = None,
+    page_size: Optional[int] = None,
+    max_items: Optional[int] = None,
+    next_token: Optional[str] = None,
 ):
     """
     List all Spot Instance Requests (SIRs).
@@ -215,30 +380,36 @@ def list_spot_requests(
     if not region:
         region = DEFAULT_REGION
 
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     filters = []
     if states:
         filters.append({"Name": "state", "Values": states})
 
     try:
-        if spot_request_ids:
-            resp = ec2.describe_spot_instance_requests(
-                SpotInstanceRequestIds=spot_request_ids,
-                Filters=filters or None
-            )
-        else:
-            resp = ec2.describe_spot_instance_requests(Filters=filters or None)
+        spot_requests, token = paginate(
+            ec2,
+            "describe_spot_instance_requests",
+            params={
+                "SpotInstanceRequestIds": spot_request_ids,
+                "Filters": filters or None,
+            },
+            page_size=None if spot_request_ids else page_size,
+            max_items=max_items,
+            next_token=next_token,
+        )
 
         return {
             "region": region,
             "filters_applied": filters,
-            "spot_requests": resp.get("SpotInstanceRequests", [])
+            "spot_requests": spot_requests,
+            "next_token": token,
         }
 
     except Exception as e:
         return {"region": region, "error": str(e)}
     
+@coalesced("ec2.get_spot_request_details")
 def get_spot_request_details(
     *,
     spot_request_id: str,
@@ -251,7 +422,7 @@ def get_spot_request_details(
     if not region:
         region = DEFAULT_REGION
 
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     try:
         resp = ec2.describe_spot_instance_requests(
@@ -278,6 +449,7 @@ def get_spot_request_details(
             "error": str(e)
         }
         
+@invalidates(lambda p: [tag(p["region"], "instances")])
 def cancel_spot_request(
     *,
     spot_request_id: str,
@@ -290,7 +462,7 @@ def cancel_spot_request(
     if not region:
         region = DEFAULT_REGION
 
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     try:
         resp = ec2.cancel_spot_instance_requests(
@@ -334,11 +506,23 @@ tools = [
         fn=get_instance_status,
         parameters=GetInstanceDetailsParams.model_json_schema(),
     ),
+    FunctionTool(
+        name="ec2.get_instance_details_batch",
+        description="Get full details of many EC2 instances (200 IDs per DescribeInstances call).",
+        fn=get_instance_details_batch,
+        parameters=GetInstanceDetailsBatchParams.model_json_schema(),
+    ),
+    FunctionTool(
+        name="ec2.get_instance_running_details_batch",
+        description="Get running status of many EC2 instances in one call.",
+        fn=get_instance_status_batch,
+        parameters=GetInstanceStatusBatchParams.model_json_schema(),
+    ),
     FunctionTool(
         name="ec2.list_running_instances",
         description="Get full list of instances currently running and being billed",
         fn=list_running_instances,
-        parameters=ListEC2Params.model_json_schema(),
+        parameters=ListRunningInstancesParams.model_json_schema(),
     ),
     FunctionTool(
         name="ec2.list_instances_by_tag",
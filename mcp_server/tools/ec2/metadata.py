@@ -1,22 +1,27 @@
 # mcp_server/tools/ec2/metadata_tools.py
 
-import boto3
+from mcp_server.core.batcher import get_instance, get_instances
+from mcp_server.core.clients import get_client
+from mcp_server.core.cache import invalidates, tag
+from mcp_server.core.singleflight import coalesced
 import base64
 from fastmcp.tools import FunctionTool
-from typing import Optional
+from typing import List, Optional
 
 from mcp_server.models.ec2.metadata import (
     GetUserDataParams,
     DescribeMetadataOptionsParams,
+    DescribeMetadataOptionsBatchParams,
     ModifyMetadataOptionsParams
 )
 
+@coalesced("aws.get_user_data")
 def get_user_data(
     *,
     instance_id: str,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     resp = ec2.describe_instance_attribute(
         InstanceId=instance_id,
@@ -35,22 +40,39 @@ def get_user_data(
         "user_data": decoded,
     }
 
+@coalesced("aws.describe_metadata_options")
 def describe_metadata_options(
     *,
     instance_id: str,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
-
-    resp = ec2.describe_instances(InstanceIds=[instance_id])
-
-    instance = resp["Reservations"][0]["Instances"][0]
+    instance = get_instance(instance_id, region)
+    if instance is None:
+        return {"instance_id": instance_id, "error": f"Instance {instance_id} not found"}
 
     return {
         "instance_id": instance_id,
         "metadata_options": instance.get("MetadataOptions", {})
     }
 
+@coalesced("aws.describe_metadata_options_batch")
+def describe_metadata_options_batch(
+    *,
+    instance_ids: List[str],
+    region: str = "ap-south-1"
+):
+    found = get_instances(instance_ids, region)
+
+    return {
+        "region": region,
+        "results": [
+            {"instance_id": i, "metadata_options": found[i].get("MetadataOptions", {})}
+            for i in dict.fromkeys(instance_ids) if i in found
+        ],
+        "not_found": [i for i in dict.fromkeys(instance_ids) if i not in found],
+    }
+
+@invalidates(lambda p: [tag(p["region"], p["instance_id"])])
 def modify_metadata_options(
     *,
     instance_id: str,
@@ -59,7 +81,7 @@ def modify_metadata_options(
     http_put_response_hop_limit: Optional[int] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     req = {"InstanceId": instance_id}
 
@@ -87,6 +109,12 @@ tools = [
         fn=describe_metadata_options,
         parameters=DescribeMetadataOptionsParams.model_json_schema(),
     ),
+    FunctionTool(
+        name="aws.describe_metadata_options_batch",
+        description="Describe IMDS metadata options for many EC2 instances in one call.",
+        fn=describe_metadata_options_batch,
+        parameters=DescribeMetadataOptionsBatchParams.model_json_schema(),
+    ),
     FunctionTool(
         name="aws.modify_metadata_options",
         description="Modify IMDS metadata settings for an EC2 instance.",
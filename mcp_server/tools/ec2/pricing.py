@@ -1,56 +1,31 @@
 # mcp_server/tools/ec2/pricing_tools.py
 
-import boto3
+from mcp_server.core.clients import get_client
 import json
+import time
 from fastmcp.tools import FunctionTool
 from botocore.exceptions import ClientError
-from typing import Optional
+from typing import Optional, List, Dict, Any
 from datetime import datetime
 
+from mcp_server.core.config import Settings
+from mcp_server.core.pagination import paginate
+from mcp_server.core.regions import fan_out
 from mcp_server.models.ec2.pricing import (
     EC2OnDemandPriceParams,
     SpotPriceHistoryParams,
-    EC2CostEstimateParams
+    EC2CostEstimateParams,
+    RefreshPriceIndexParams,
+    PriceIndexStatusParams,
+    EstimateFleetCostParams,
+    SpotPriceStatsParams,
+    CheapestSpotAZParams
 )
-
-AWS_PRICING_REGION_MAP = {
-    "us-east-1": "US East (N. Virginia)",
-    "us-east-2": "US East (Ohio)",
-    "us-west-1": "US West (N. California)",
-    "us-west-2": "US West (Oregon)",
-
-    "af-south-1": "Africa (Cape Town)",
-    "ap-east-1": "Asia Pacific (Hong Kong)",
-    "ap-south-1": "Asia Pacific (Mumbai)",
-    "ap-south-2": "Asia Pacific (Hyderabad)",
-    "ap-southeast-1": "Asia Pacific (Singapore)",
-    "ap-southeast-2": "Asia Pacific (Sydney)",
-    "ap-southeast-3": "Asia Pacific (Jakarta)",
-    "ap-southeast-4": "Asia Pacific (Melbourne)",
-    "ap-northeast-1": "Asia Pacific (Tokyo)",
-    "ap-northeast-2": "Asia Pacific (Seoul)",
-    "ap-northeast-3": "Asia Pacific (Osaka)",
-
-    "ca-central-1": "Canada (Central)",
-    "ca-west-1": "Canada West (Calgary)",
-
-    "eu-central-1": "EU (Frankfurt)",
-    "eu-central-2": "EU (Zurich)",
-    "eu-west-1": "EU (Ireland)",
-    "eu-west-2": "EU (London)",
-    "eu-west-3": "EU (Paris)",
-    "eu-north-1": "EU (Stockholm)",
-    "eu-south-1": "EU (Milan)",
-    "eu-south-2": "EU (Spain)",
-
-    "me-south-1": "Middle East (Bahrain)",
-    "me-central-1": "Middle East (UAE)",
-
-    "sa-east-1": "South America (São Paulo)",
-
-    "us-gov-east-1": "AWS GovCloud (US-East)",
-    "us-gov-west-1": "AWS GovCloud (US-West)"
-}
+from mcp_server.pricing import fleet
+from mcp_server.tools.ec2.list import list_ec2_instances
+from mcp_server.pricing.index import get_price_index
+from mcp_server.pricing.locations import AWS_PRICING_REGION_MAP
+from mcp_server.pricing.spot_store import PRODUCT_TO_OS, get_spot_store, series_stats
 
 def get_ondemand_price(
     *, 
@@ -58,8 +33,25 @@ def get_ondemand_price(
     operating_system: str = "Linux",
     region: str = "ap-south-1"
 ):
+    # ---- Local price index first ----
+    index = get_price_index()
+    price_per_hour = index.lookup(region, instance_type, operating_system)
+
+    if price_per_hour is not None:
+        if Settings.PRICE_INDEX_SCHEDULE and index.is_stale(region):
+            index.refresh_in_background(region)
+
+        return {
+            "instance_type": instance_type,
+            "operating_system": operating_system,
+            "region": region,
+            "price_per_hour_usd": price_per_hour,
+            "price_per_month_usd": round(price_per_hour * 720, 2),
+            "source": "price_index",
+        }
 
-    pricing = boto3.client("pricing", region_name="us-east-1")
+    # ---- Fall back to the Pricing API ----
+    pricing = get_client("pricing", "us-east-1")
 
     region_name = AWS_PRICING_REGION_MAP.get(region)
     if not region_name:
@@ -71,6 +63,7 @@ def get_ondemand_price(
         {"Type": "TERM_MATCH", "Field": "operatingSystem", "Value": operating_system},
         {"Type": "TERM_MATCH", "Field": "preInstalledSw", "Value": "NA"},
         {"Type": "TERM_MATCH", "Field": "capacitystatus", "Value": "Used"},
+        {"Type": "TERM_MATCH", "Field": "tenancy", "Value": "Shared"},
     ]
 
     resp = pricing.get_products(ServiceCode="AmazonEC2", Filters=filters)
@@ -85,12 +78,19 @@ def get_ondemand_price(
     price_dimension = next(iter(on_demand_terms["priceDimensions"].values()))
     price_per_hour = float(price_dimension["pricePerUnit"]["USD"])
 
+    # Write-through so the next lookup is served locally
+    index.upsert([(
+        region, instance_type, operating_system, "Shared", "NA",
+        price_per_hour, price_item.get("product", {}).get("sku", ""),
+    )])
+
     return {
         "instance_type": instance_type,
         "operating_system": operating_system,
         "region": region,
         "price_per_hour_usd": price_per_hour,
         "price_per_month_usd": round(price_per_hour * 720, 2),
+        "source": "pricing_api",
     }
 
 
@@ -101,25 +101,32 @@ def get_spot_price_history(
     start_time: Optional[datetime] = None,
     end_time: Optional[datetime] = None,
     availability_zone: Optional[str] = None,
-    region: str = "ap-south-1"
+    region: str = "ap-south-1",
+    page_size: Optional[int] = None,
+    max_items: Optional[int] = None,
+    next_token: Optional[str] = None
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     req = {
         "InstanceTypes": [instance_type],
         "ProductDescriptions": [product_description],
+        "StartTime": start_time,
+        "EndTime": end_time,
+        "AvailabilityZone": availability_zone,
     }
 
-    if start_time:
-        req["StartTime"] = start_time
-
-    if end_time:
-        req["EndTime"] = end_time
-
-    if availability_zone:
-        req["AvailabilityZone"] = availability_zone
+    points, token = paginate(
+        ec2,
+        "describe_spot_price_history",
+        params=req,
+        page_size=page_size,
+        max_items=max_items,
+        next_token=next_token,
+    )
 
-    resp = ec2.describe_spot_price_history(**req)
+    # Anything we fetched is also useful to the spot analytics store
+    get_spot_store().add_points(region, points)
 
     history = [
         {
@@ -128,7 +135,7 @@ def get_spot_price_history(
             "instance_type": h["InstanceType"],
             "az": h["AvailabilityZone"]
         }
-        for h in resp["SpotPriceHistory"]
+        for h in points
     ]
 
     return {
@@ -136,8 +143,128 @@ def get_spot_price_history(
         "region": region,
         "history_count": len(history),
         "history": history,
+        "next_token": token,
+    }
+
+
+# =======================================================
+# SPOT ANALYTICS
+# =======================================================
+def _ondemand_hourly(region: str, instance_type: str, product_description: str) -> Optional[float]:
+    info = get_ondemand_price(
+        instance_type=instance_type,
+        operating_system=PRODUCT_TO_OS.get(product_description, "Linux"),
+        region=region,
+    )
+    return info.get("price_per_hour_usd")
+
+
+def _savings(spot: float, ondemand: Optional[float]) -> Optional[float]:
+    if not ondemand:
+        return None
+    return round((1 - spot / ondemand) * 100, 1)
+
+
+def spot_price_stats(
+    *,
+    instance_types: List[str],
+    region: str = "ap-south-1",
+    availability_zones: Optional[List[str]] = None,
+    product_description: str = "Linux/UNIX",
+    window_hours: float = 168,
+    refresh: bool = True
+):
+    """
+    Per-AZ spot price statistics over a trailing window, with savings versus
+    the on-demand price from the local price index.
+    """
+    store = get_spot_store()
+    try:
+        if refresh:
+            store.refresh(region, instance_types, product_description)
+    except ClientError as e:
+        return {"error": str(e)}
+
+    now = int(time.time())
+    since = now - int(window_hours * 3600)
+    results = {}
+
+    for instance_type in instance_types:
+        try:
+            ondemand = _ondemand_hourly(region, instance_type, product_description)
+        except Exception:
+            ondemand = None
+
+        azs = {}
+        for az, series in sorted(store.series_for(region, instance_type, product_description, availability_zones).items()):
+            stats = series_stats(series, since, now)
+            if stats is None:
+                continue
+            stats["savings_vs_ondemand_pct"] = _savings(stats["current"], ondemand)
+            stats["mean_savings_vs_ondemand_pct"] = _savings(stats["mean"], ondemand)
+            azs[az] = stats
+
+        results[instance_type] = {
+            "ondemand_price_per_hour_usd": ondemand,
+            "availability_zones": azs,
+        }
+
+    return {
+        "region": region,
+        "product_description": product_description,
+        "window_hours": window_hours,
+        "instance_types": results,
+        "store": store.stats(),
+    }
+
+
+def cheapest_spot_az(
+    *,
+    instance_types: List[str],
+    region: str = "ap-south-1",
+    availability_zones: Optional[List[str]] = None,
+    product_description: str = "Linux/UNIX"
+):
+    """
+    Cheapest AZ right now for each candidate instance type, cheapest first.
+    """
+    store = get_spot_store()
+    try:
+        store.refresh(region, instance_types, product_description)
+    except ClientError as e:
+        return {"error": str(e)}
+
+    candidates = []
+    for instance_type in instance_types:
+        series = store.series_for(region, instance_type, product_description, availability_zones)
+        if not series:
+            continue
+
+        az, best = min(series.items(), key=lambda item: item[1].prices[-1])
+        spot = round(best.prices[-1], 6)
+
+        try:
+            ondemand = _ondemand_hourly(region, instance_type, product_description)
+        except Exception:
+            ondemand = None
+
+        candidates.append({
+            "instance_type": instance_type,
+            "availability_zone": az,
+            "spot_price_per_hour_usd": spot,
+            "ondemand_price_per_hour_usd": ondemand,
+            "savings_vs_ondemand_pct": _savings(spot, ondemand),
+        })
+
+    candidates.sort(key=lambda c: c["spot_price_per_hour_usd"])
+    return {
+        "region": region,
+        "product_description": product_description,
+        "cheapest": candidates[0] if candidates else None,
+        "candidates": candidates,
     }
 
+
 def estimate_instance_cost(
     *,
     instance_type: str,
@@ -163,7 +290,173 @@ def estimate_instance_cost(
         "price_per_hour_usd": hourly,
         "estimated_cost_usd": round(monthly, 2)
     }
-    
+
+
+# =======================================================
+# FLEET COST
+# =======================================================
+def _collect_pages(fn, **kwargs) -> List[Dict[str, Any]]:
+    """Walk every page of a list tool, raising on tool-level errors."""
+    items, token = [], None
+    while True:
+        resp = fn(**kwargs, next_token=token)
+        if "error" in resp:
+            raise RuntimeError(resp["error"])
+        items.extend(resp["instances"])
+        token = resp.get("next_token")
+        if not token:
+            return items
+
+
+def _attached_volumes(ec2, instance_ids: List[str]) -> List[Dict[str, Any]]:
+    volumes = []
+    # EC2 filters accept at most 200 values each
+    for i in range(0, len(instance_ids), 200):
+        chunk = instance_ids[i:i + 200]
+        token = None
+        while True:
+            page, token = paginate(
+                ec2,
+                "describe_volumes",
+                params={"Filters": [{"Name": "attachment.instance-id", "Values": chunk}]},
+                next_token=token,
+            )
+            volumes.extend(page)
+            if not token:
+                break
+    return volumes
+
+
+def _collect_fleet(
+    *,
+    region: str,
+    instances: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    include_volumes: bool = True,
+):
+    """Instances (given or listed) plus their attached volumes for one region."""
+    if instances is not None:
+        region_instances = instances.get(region, [])
+    else:
+        region_instances = _collect_pages(list_ec2_instances, region=region, **(filters or {}))
+
+    volumes = []
+    if include_volumes and region_instances:
+        ids = [i.get("InstanceId") or i.get("instance_id") for i in region_instances]
+        volumes = _attached_volumes(get_client("ec2", region), [i for i in ids if i])
+        for vol in volumes:
+            vol["Region"] = region
+
+    for inst in region_instances:
+        inst.setdefault("Region", region)
+
+    return {"instances": region_instances, "volumes": volumes}
+
+
+def estimate_fleet_cost(
+    *,
+    instances: Optional[List[Dict[str, Any]]] = None,
+    region: str = "ap-south-1",
+    regions: Optional[List[str]] = None,
+    states: Optional[List[str]] = None,
+    tag_key: Optional[str] = None,
+    tag_value: Optional[str] = None,
+    instance_types: Optional[List[str]] = None,
+    group_by_tags: Optional[List[str]] = None,
+    hours_per_month: float = 730,
+    include_volumes: bool = True,
+    fetch_missing_prices: bool = True,
+):
+    """
+    Estimate monthly cost for a whole fleet. Instances come either from a
+    previous list_ec2_instances / list_running_instances result or from the
+    filter arguments; every distinct price key is priced once.
+    """
+    try:
+        if instances is not None:
+            by_region: Dict[str, List[Dict[str, Any]]] = {}
+            for inst in instances:
+                by_region.setdefault(inst.get("Region") or inst.get("region") or region, []).append(inst)
+            targets = list(by_region)
+            collect_args = {"instances": by_region}
+        else:
+            targets = regions or [region]
+            collect_args = {
+                "filters": {
+                    "states": states,
+                    "tag_key": tag_key,
+                    "tag_value": tag_value,
+                    "instance_types": instance_types,
+                },
+            }
+
+        fanned = fan_out(_collect_fleet, targets, include_volumes=include_volumes, **collect_args)
+        if "error" in fanned:
+            return fanned
+
+        fleet_instances, fleet_volumes = [], []
+        for result in fanned["results"].values():
+            fleet_instances.extend(result["instances"])
+            fleet_volumes.extend(result["volumes"])
+
+        def fetch_missing(price_region, key):
+            instance_type, operating_system, tenancy, sw = key
+            # The API fallback only covers shared-tenancy, no pre-installed software
+            if tenancy != "Shared" or sw != "NA":
+                return None
+            info = get_ondemand_price(
+                instance_type=instance_type,
+                operating_system=operating_system,
+                region=price_region,
+            )
+            return info.get("price_per_hour_usd")
+
+        result = fleet.estimate(
+            fleet_instances,
+            fleet_volumes,
+            get_price_index(),
+            region=region,
+            hours_per_month=hours_per_month,
+            tag_keys=group_by_tags,
+            fetch_missing=fetch_missing if fetch_missing_prices else None,
+        )
+        result["region_stats"] = fanned["region_stats"]
+        return result
+
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def refresh_price_index(
+    *,
+    regions: List[str],
+    source: Optional[str] = None,
+    path: Optional[str] = None
+):
+    """
+    (Re)build the local on-demand price index for the given regions.
+    """
+    index = get_price_index()
+    results = {}
+
+    for region in regions:
+        try:
+            if path and source == "dump":
+                count = index.ingest_price_list_dump(region, path)
+            elif path:
+                count = index.ingest_offer_file(region, path)
+            else:
+                count = index.refresh(region, source)
+            results[region] = {"prices": count}
+        except Exception as e:
+            results[region] = {"error": str(e)}
+
+    return {"regions": results, "index": index.status()}
+
+
+def price_index_status():
+    return get_price_index().status()
+
 
 tools = [
     FunctionTool(
@@ -184,4 +477,34 @@ tools = [
         fn=estimate_instance_cost,
         parameters=EC2CostEstimateParams.model_json_schema(),
     ),
+    FunctionTool(
+        name="aws.refresh_price_index",
+        description="Build or refresh the local on-demand price index from the bulk offer file, the Pricing API, or a recorded dump.",
+        fn=refresh_price_index,
+        parameters=RefreshPriceIndexParams.model_json_schema(),
+    ),
+    FunctionTool(
+        name="aws.price_index_status",
+        description="Show which regions are in the local price index and how old they are.",
+        fn=price_index_status,
+        parameters=PriceIndexStatusParams.model_json_schema(),
+    ),
+    FunctionTool(
+        name="pricing.estimate_fleet_cost",
+        description="Estimate total monthly cost of a fleet (compute + attached EBS) with per-type, per-region and per-tag breakdowns. Accepts list_ec2_instances output or filters.",
+        fn=estimate_fleet_cost,
+        parameters=EstimateFleetCostParams.model_json_schema(),
+    ),
+    FunctionTool(
+        name="aws.spot_price_stats",
+        description="Spot price min/mean/p95/volatility per AZ over a trailing window, with savings vs on-demand.",
+        fn=spot_price_stats,
+        parameters=SpotPriceStatsParams.model_json_schema(),
+    ),
+    FunctionTool(
+        name="aws.cheapest_spot_az",
+        description="Cheapest AZ right now for each candidate instance type, with savings vs on-demand.",
+        fn=cheapest_spot_az,
+        parameters=CheapestSpotAZParams.model_json_schema(),
+    ),
 ]
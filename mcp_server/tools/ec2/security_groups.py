@@ -1,4 +1,8 @@
-import boto3
+from mcp_server.core.clients import get_client
+from mcp_server.core.cache import cached, invalidates, tag
+from mcp_server.core.pagination import paginate
+from mcp_server.core.singleflight import coalesced
+from mcp_server.inventory.store import serve, token_error
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 from fastmcp.tools import FunctionTool
@@ -11,6 +15,10 @@ from mcp_server.models.ec2 import (
     ListSGParams
 )
 
+def _sg_tags(params):
+    return [tag(params["region"], params.get("group_id")), tag(params["region"], "security-groups")]
+
+
 def to_ip_permissions(rules: List[IpPermission]):
     """Convert Pydantic rules → Boto3 IpPermission structure"""
     perms = []
@@ -23,6 +31,7 @@ def to_ip_permissions(rules: List[IpPermission]):
         })
     return perms
 
+@invalidates(_sg_tags)
 def create_security_group(
     region: str,
     group_name: str,
@@ -30,7 +39,7 @@ def create_security_group(
     vpc_id: str,
     inbound_rules: Optional[List[IpPermission]] = None,
 ) -> Dict[str, Any]:
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     try:
         resp = ec2.create_security_group(
@@ -55,8 +64,9 @@ def create_security_group(
         return {"error": str(e)}
 
 
+@invalidates(_sg_tags)
 def delete_security_group(region: str, group_id: str) -> Dict[str, Any]:
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     try:
         ec2.delete_security_group(GroupId=group_id)
@@ -66,8 +76,9 @@ def delete_security_group(region: str, group_id: str) -> Dict[str, Any]:
         return {"error": str(e), "group_id": group_id}
 
 
+@invalidates(_sg_tags)
 def authorize_rules(region: str, group_id: str, rules: List[IpPermission]):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     try:
         ec2.authorize_security_group_ingress(
@@ -80,8 +91,9 @@ def authorize_rules(region: str, group_id: str, rules: List[IpPermission]):
         return {"error": str(e), "group_id": group_id}
 
 
+@invalidates(_sg_tags)
 def revoke_rules(region: str, group_id: str, rules: List[IpPermission]):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     try:
         ec2.revoke_security_group_ingress(
@@ -94,8 +106,14 @@ def revoke_rules(region: str, group_id: str, rules: List[IpPermission]):
         return {"error": str(e), "group_id": group_id}
 
 
+@cached(
+    "ec2.describe_security_group",
+    ttl=120,
+    tags=lambda p: [tag(p["region"], p["group_id"] or "security-groups")],
+)
+@coalesced("ec2.describe_security_group")
 def describe_security_group(region: str, group_id: str = None, group_name: str = None):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     try:
         filters = []
@@ -112,14 +130,37 @@ def describe_security_group(region: str, group_id: str = None, group_name: str =
         return {"error": str(e)}
 
 
-def list_security_groups(region: str):
-    ec2 = boto3.client("ec2", region_name=region)
+@coalesced("ec2.list_security_groups")
+def list_security_groups(
+    region: str,
+    page_size: Optional[int] = None,
+    max_items: Optional[int] = None,
+    next_token: Optional[str] = None,
+    max_staleness: Optional[float] = None,
+):
+    error = token_error(next_token, max_staleness)
+    if error:
+        return {"error": error}
+
+    ec2 = get_client("ec2", region)
 
     try:
-        resp = ec2.describe_security_groups()
+        local = None
+        if max_staleness is not None:
+            local = serve(region, "security_groups", None, max_staleness, max_items=max_items, next_token=next_token)
+        if local is not None:
+            groups, token, age = local
+        else:
+            groups, token = paginate(
+                ec2,
+                "describe_security_groups",
+                page_size=page_size,
+                max_items=max_items,
+                next_token=next_token,
+            )
         sgs = []
 
-        for sg in resp.get("SecurityGroups", []):
+        for sg in groups:
             sgs.append({
                 "group_id": sg["GroupId"],
                 "group_name": sg["GroupName"],
@@ -128,7 +169,11 @@ def list_security_groups(region: str):
                 "inbound_rule_count": len(sg.get("IpPermissions", [])),
             })
 
-        return {"region": region, "security_groups": sgs}
+        response = {"region": region, "security_groups": sgs, "next_token": token}
+        if local is not None:
+            response["source"] = "inventory"
+            response["inventory_age_s"] = age
+        return response
 
     except Exception as e:
         return {"error": str(e)}
@@ -0,0 +1,21 @@
+"""
+Inventory Tools Module
+
+Tools for the local resource inventory that read tools can be served from.
+"""
+
+from .sync import tools as sync_tools
+from .query import tools as query_tools
+from .graph import tools as graph_tools
+
+tools = [
+    *sync_tools,
+    *query_tools,
+    *graph_tools,
+]
+
+__all__ = [
+    "sync_tools",
+    "query_tools",
+    "graph_tools",
+]
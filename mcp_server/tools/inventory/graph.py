@@ -0,0 +1,94 @@
+# mcp_server/tools/inventory/graph.py
+
+from typing import List, Optional
+
+from fastmcp.tools import FunctionTool
+
+from mcp_server.core.config import Settings
+from mcp_server.inventory.graph import get_graph, related as graph_related, shortest_path
+from mcp_server.inventory.query import select_ids
+from mcp_server.models.inventory import (
+    InventoryRelatedParams,
+    InventoryPathParams,
+)
+
+
+def _staleness(max_staleness: Optional[float]) -> float:
+    return Settings.INVENTORY_REFRESH_INTERVAL if max_staleness is None else max_staleness
+
+
+def related(
+    *,
+    region: str = "ap-south-1",
+    resource_ids: Optional[List[str]] = None,
+    resource_type: Optional[str] = None,
+    where: Optional[str] = None,
+    target_types: Optional[List[str]] = None,
+    depth: int = 1,
+    direction: str = "both",
+    max_nodes: int = 1000,
+    max_staleness: Optional[float] = None,
+):
+    """
+    Resources connected to the given ones (or to every resource matching
+    where) within depth hops of the inventory relationship graph.
+    """
+    try:
+        if not resource_ids and not resource_type:
+            return {"error": "Pass resource_ids, or resource_type (with an optional where expression)"}
+        max_staleness = _staleness(max_staleness)
+        start_ids = list(resource_ids or [])
+        if resource_type:
+            start_ids += select_ids(region, resource_type, where, max_staleness)
+        graph = get_graph(region, max_staleness)
+        result = graph_related(
+            graph, start_ids,
+            depth=depth, direction=direction, target_types=target_types, max_nodes=max_nodes,
+        )
+        return {"region": region, "start_count": len(start_ids), **result}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def path(
+    *,
+    region: str = "ap-south-1",
+    source: str,
+    target: str,
+    max_depth: int = 6,
+    max_staleness: Optional[float] = None,
+):
+    """
+    Shortest chain of relationships connecting two resources.
+    """
+    try:
+        graph = get_graph(region, _staleness(max_staleness))
+        hops = shortest_path(graph, source, target, max_depth)
+        if hops is None:
+            return {"region": region, "connected": False}
+        return {"region": region, "connected": True, "hops": len(hops) - 1, "path": hops}
+    except KeyError as e:
+        return {"error": e.args[0]}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+tools = [
+    FunctionTool(
+        name="inventory.related",
+        description=(
+            "Walk the inventory relationship graph (VPC -> subnet -> instance -> volume -> snapshot, "
+            "SG <-> ENI <-> instance, AMI -> snapshot, launch template -> AMI) from given resources or from "
+            "every resource matching an inventory.query expression, e.g. the volumes of stopped instances "
+            "or everything in a subnet."
+        ),
+        fn=related,
+        parameters=InventoryRelatedParams.model_json_schema(),
+    ),
+    FunctionTool(
+        name="inventory.path",
+        description="Find how two resources are connected: the shortest chain of relationships between them.",
+        fn=path,
+        parameters=InventoryPathParams.model_json_schema(),
+    ),
+]
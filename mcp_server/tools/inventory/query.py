@@ -0,0 +1,72 @@
+# mcp_server/tools/inventory/query.py
+
+from typing import List, Optional, Union
+
+from fastmcp.tools import FunctionTool
+
+from mcp_server.core.config import Settings
+from mcp_server.inventory import query as inventory_query
+from mcp_server.models.inventory import InventoryQueryParams
+from mcp_server.utils.responses import Projection, with_projection
+
+# Resource type -> projection profile kind
+_KINDS = {
+    "instances": "instance",
+    "volumes": "volume",
+    "snapshots": "snapshot",
+    "security_groups": "security_group",
+    "vpcs": "vpc",
+    "subnets": "subnet",
+    "images": "image",
+    "network_interfaces": "network_interface",
+    "launch_templates": "launch_template",
+}
+
+
+def query(
+    *,
+    region: str = "ap-south-1",
+    resource_type: str = "instances",
+    where: Optional[str] = None,
+    sort_by: Optional[str] = None,
+    limit: int = 50,
+    group_by: Optional[str] = None,
+    sum_field: Optional[str] = None,
+    max_staleness: Optional[float] = None,
+    fields: Optional[Union[str, List[str]]] = None,
+):
+    """
+    Filter, sort and aggregate inventory resources with a boolean expression
+    evaluated against in-memory indexes.
+    """
+    try:
+        projection = Projection(fields, _KINDS[resource_type])
+        result = inventory_query.run(
+            region,
+            resource_type,
+            where,
+            sort_by=sort_by,
+            limit=limit,
+            group_by=group_by,
+            sum_field=sum_field,
+            max_staleness=Settings.INVENTORY_REFRESH_INTERVAL if max_staleness is None else max_staleness,
+        )
+        if "items" in result:
+            result["items"] = projection(result["items"])
+        return with_projection(result, projection)
+    except Exception as e:
+        return {"error": str(e)}
+
+
+tools = [
+    FunctionTool(
+        name="inventory.query",
+        description=(
+            "Query the local inventory with boolean expressions over tags, state, instance type, VPC, subnet, "
+            "security groups, lifecycle and other filter fields (AND / OR / NOT, IN, wildcards, comparisons), "
+            "with sorting, per-field group counts and sums. Answers from in-memory indexes in milliseconds."
+        ),
+        fn=query,
+        parameters=InventoryQueryParams.model_json_schema(),
+    ),
+]
@@ -0,0 +1,62 @@
+# mcp_server/tools/inventory/sync.py
+
+from typing import List, Optional
+
+from fastmcp.tools import FunctionTool
+
+from mcp_server.core.regions import fan_out
+from mcp_server.inventory.graph import graph_stats
+from mcp_server.inventory.query import index_stats
+from mcp_server.inventory.store import get_inventory
+from mcp_server.models.inventory import (
+    InventorySyncParams,
+    InventoryStatusParams,
+)
+
+
+def sync(
+    *,
+    region: str = "ap-south-1",
+    regions: Optional[List[str]] = None,
+    resource_types: Optional[List[str]] = None,
+    full: bool = False,
+):
+    """
+    Refresh the local inventory for one or more regions, incrementally
+    unless full is set or the last full sync is too old.
+    """
+    store = get_inventory()
+    if regions:
+        fanned = fan_out(store.sync, regions, resource_types=resource_types, full=full)
+        if "error" in fanned:
+            return fanned
+        return {"regions": fanned["results"], "region_stats": fanned["region_stats"]}
+    return {"region": region, "resource_types": store.sync(region, resource_types, full)}
+
+
+def status():
+    """
+    Item counts, age and last refresh of every synced region/resource type,
+    plus the query indexes and relationship graphs built over them.
+    """
+    return {**get_inventory().status(), "indexes": index_stats(), "graphs": graph_stats()}
+
+
+tools = [
+    FunctionTool(
+        name="inventory.sync",
+        description=(
+            "Sync instances, volumes, snapshots, AMIs, security groups, VPCs, subnets, network interfaces and "
+            "launch templates into the local inventory (incremental by default). Read tools given max_staleness "
+            "are then served from it."
+        ),
+        fn=sync,
+        parameters=InventorySyncParams.model_json_schema(),
+    ),
+    FunctionTool(
+        name="inventory.status",
+        description="Show what the local inventory holds per region and resource type, and how stale it is.",
+        fn=status,
+        parameters=InventoryStatusParams.model_json_schema(),
+    ),
+]
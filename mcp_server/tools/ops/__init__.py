@@ -0,0 +1,15 @@
+"""
+Ops Tools Module
+
+Tools for tracking long-running AWS operations started by other tools.
+"""
+
+from .operations import tools as operation_tools
+
+tools = [
+    *operation_tools,
+]
+
+__all__ = [
+    "operation_tools",
+]
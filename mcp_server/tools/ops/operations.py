@@ -0,0 +1,154 @@
+# mcp_server/tools/ops/operations.py
+
+import asyncio
+import time
+from typing import List, Optional
+
+from fastmcp.server.dependencies import get_context
+from fastmcp.tools import FunctionTool
+
+from mcp_server.core.config import Settings
+from mcp_server.core.waiters import FAILED, TIMED_OUT, get_waiters
+from mcp_server.models.ops import (
+    OpsWaitParams,
+    OpsStatusParams,
+    OpsWatchParams,
+)
+
+# How often ops.wait re-reads operation state; this never calls AWS
+_CHECK_INTERVAL = 0.25
+
+
+def _progress_message(ops) -> str:
+    """One line per (kind, target), e.g. "snapshot 3/5 completed, 1 failed"."""
+    groups = {}
+    for op in ops:
+        group = groups.setdefault((op.kind, op.target), {"reached": 0, "total": 0, "failed": 0})
+        group["reached"] += op.reached()
+        group["total"] += len(op.resource_ids)
+        group["failed"] += int(op.status in (FAILED, TIMED_OUT))
+    return "; ".join(
+        f"{kind} {g['reached']}/{g['total']} {target}" + (f", {g['failed']} failed" if g["failed"] else "")
+        for (kind, target), g in groups.items()
+    )
+
+
+# =======================================================
+# WAIT
+# =======================================================
+async def wait(
+    *,
+    operation_ids: List[str],
+    timeout: Optional[float] = None,
+):
+    """
+    Block until every operation finishes, streaming progress notifications
+    while the server-side poller tracks the resources.
+    """
+    waiters = get_waiters()
+    ops = [waiters.get(op_id) for op_id in operation_ids]
+    unknown = [op_id for op_id, op in zip(operation_ids, ops) if op is None]
+    if unknown:
+        return {"error": f"Unknown or expired operation(s): {', '.join(unknown)}"}
+
+    try:
+        ctx = get_context()
+    except RuntimeError:
+        ctx = None
+
+    limit = min(timeout or Settings.WAITER_WAIT_TIMEOUT, Settings.WAITER_WAIT_TIMEOUT)
+    deadline = time.monotonic() + limit
+    reported = None
+    while True:
+        versions = tuple(op.version for op in ops)
+        if ctx is not None and versions != reported:
+            reported = versions
+            parts = [op.progress() for op in ops]
+            await ctx.report_progress(
+                progress=sum(p[0] for p in parts),
+                total=sum(p[1] for p in parts),
+                message=_progress_message(ops),
+            )
+        if all(op.done for op in ops) or time.monotonic() >= deadline:
+            break
+        await asyncio.sleep(_CHECK_INTERVAL)
+
+    pending = [op.id for op in ops if not op.done]
+    response = {"done": not pending, "operations": [op.summary() for op in ops]}
+    if pending:
+        response["hint"] = f"Still pending after {limit:.0f}s; call ops.wait again to keep waiting."
+    return response
+
+
+# =======================================================
+# STATUS
+# =======================================================
+def status(
+    *,
+    operation_ids: Optional[List[str]] = None,
+    pending_only: bool = False,
+):
+    """
+    Current state of tracked operations, without waiting.
+    """
+    waiters = get_waiters()
+    if operation_ids:
+        ops = [waiters.get(op_id) for op_id in operation_ids]
+        unknown = [op_id for op_id, op in zip(operation_ids, ops) if op is None]
+        ops = [op for op in ops if op is not None]
+    else:
+        ops, unknown = waiters.list(), []
+
+    response = {
+        "operations": [op.summary() for op in ops if not (pending_only and op.done)],
+    }
+    if unknown:
+        response["unknown"] = unknown
+    return response
+
+
+# =======================================================
+# WATCH
+# =======================================================
+def watch(
+    *,
+    kind: str,
+    resource_ids: List[str],
+    target: Optional[str] = None,
+    timeout: Optional[float] = None,
+    region: str = "ap-south-1",
+):
+    """
+    Start tracking existing resources (e.g. after a bulk start/stop) so
+    ops.wait can wait for them.
+    """
+    try:
+        op = get_waiters().start(kind, resource_ids, region, target=target, timeout=timeout)
+    except ValueError as e:
+        return {"error": str(e)}
+    return op.summary()
+
+
+tools = [
+    FunctionTool(
+        name="ops.wait",
+        description=(
+            "Wait server-side for operations (operation_id from create/attach/copy tools or ops.watch) "
+            "to finish, with progress notifications. Use instead of polling describe tools."
+        ),
+        fn=wait,
+        parameters=OpsWaitParams.model_json_schema(),
+    ),
+    FunctionTool(
+        name="ops.status",
+        description="Show the current state of tracked long-running operations without waiting.",
+        fn=status,
+        parameters=OpsStatusParams.model_json_schema(),
+    ),
+    FunctionTool(
+        name="ops.watch",
+        description="Track existing instances, snapshots, images, volumes or attachments until they reach a state.",
+        fn=watch,
+        parameters=OpsWatchParams.model_json_schema(),
+    ),
+]
@@ -1,11 +1,18 @@
 # mcp_server/tools/ec2/vpc_tools.py
 
-import boto3
+from mcp_server.core.clients import get_client
+from mcp_server.core.cache import cached, tag
+from mcp_server.core.regions import fan_out_merge
+from mcp_server.core.singleflight import coalesced
+from mcp_server.inventory.store import get_inventory
+from mcp_server.utils.responses import Projection, with_projection
 from fastmcp.tools import FunctionTool
-from typing import Optional
+from typing import Optional, List, Union
 
 from mcp_server.models.vpc.describe_vpc import (
     RegionOnlyParams,
+    ListVpcsParams,
+    ListSubnetsParams,
     DescribeVpcParams,
     DescribeSubnetParams
 )
@@ -14,21 +21,45 @@ from mcp_server.models.vpc.describe_vpc import (
 # LIST ALL VPCS
 # ============================================================
 
-def list_vpcs(*, region: str = "ap-south-1"):
-    ec2 = boto3.client("ec2", region_name=region)
+@coalesced("vpc.list_vpcs")
+def list_vpcs(
+    *,
+    region: str = "ap-south-1",
+    regions: Optional[List[str]] = None,
+    fields: Optional[Union[str, List[str]]] = None,
+    max_staleness: Optional[float] = None,
+):
+    if regions:
+        return fan_out_merge(
+            list_vpcs, regions, "vpcs", region_key="Region", fields=fields, max_staleness=max_staleness
+        )
+
+    projection = Projection(fields, "vpc")
+    if max_staleness is not None:
+        vpcs = get_inventory().items(region, "vpcs", max_staleness)
+        return with_projection({
+            "region": region,
+            "vpcs": projection(vpcs),
+            "source": "inventory",
+            "inventory_age_s": round(get_inventory().served_age(region, "vpcs"), 1),
+        }, projection)
+
+    ec2 = get_client("ec2", region)
     resp = ec2.describe_vpcs()
-    return {
+    return with_projection({
         "region": region,
-        "vpcs": resp.get("Vpcs", [])
-    }
+        "vpcs": projection(resp.get("Vpcs", []))
+    }, projection)
 
 
 # ============================================================
 # GET DEFAULT VPC
 # ============================================================
 
+@cached("vpc.get_default_vpc", ttl=3600, tags=lambda p: [tag(p["region"], "vpcs")])
+@coalesced("vpc.get_default_vpc")
 def get_default_vpc(*, region: str = "ap-south-1"):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
     resp = ec2.describe_vpcs(
         Filters=[{"Name": "isDefault", "Values": ["true"]}]
     )
@@ -44,39 +75,63 @@ def get_default_vpc(*, region: str = "ap-south-1"):
 # DESCRIBE SPECIFIC VPC
 # ============================================================
 
-def describe_vpc(*, vpc_id: Optional[str] = None, region: str = "ap-south-1"):
-    ec2 = boto3.client("ec2", region_name=region)
+@coalesced("vpc.describe_vpc")
+def describe_vpc(
+    *,
+    vpc_id: Optional[str] = None,
+    region: str = "ap-south-1",
+    fields: Optional[Union[str, List[str]]] = None
+):
+    ec2 = get_client("ec2", region)
+    projection = Projection(fields, "vpc")
 
     if vpc_id:
         resp = ec2.describe_vpcs(VpcIds=[vpc_id])
     else:
         resp = ec2.describe_vpcs()
 
-    return {
+    return with_projection({
         "region": region,
-        "vpcs": resp.get("Vpcs", [])
-    }
+        "vpcs": projection(resp.get("Vpcs", []))
+    }, projection)
 
 
 # ============================================================
 # LIST SUBNETS
 # ============================================================
 
-def list_subnets(*, region: str = "ap-south-1"):
-    ec2 = boto3.client("ec2", region_name=region)
+@coalesced("vpc.list_subnets")
+def list_subnets(
+    *,
+    region: str = "ap-south-1",
+    fields: Optional[Union[str, List[str]]] = None,
+    max_staleness: Optional[float] = None,
+):
+    projection = Projection(fields, "subnet")
+    if max_staleness is not None:
+        subnets = get_inventory().items(region, "subnets", max_staleness)
+        return with_projection({
+            "region": region,
+            "subnets": projection(subnets),
+            "source": "inventory",
+            "inventory_age_s": round(get_inventory().served_age(region, "subnets"), 1),
+        }, projection)
+
+    ec2 = get_client("ec2", region)
     resp = ec2.describe_subnets()
-    return {
+    return with_projection({
         "region": region,
-        "subnets": resp.get("Subnets", [])
-    }
+        "subnets": projection(resp.get("Subnets", []))
+    }, projection)
 
 
 # ============================================================
 # GET ALL SUBNETS IN DEFAULT VPC
 # ============================================================
 
+@coalesced("vpc.get_default_subnets")
 def get_default_subnets(*, region: str = "ap-south-1"):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
 
     # Fetch default VPC
     vpcs = ec2.describe_vpcs(
@@ -107,13 +162,16 @@ def get_default_subnets(*, region: str = "ap-south-1"):
 # DESCRIBE SPECIFIC SUBNET OR FILTER BY VPC
 # ============================================================
 
+@coalesced("vpc.describe_subnet")
 def describe_subnet(
     *,
     subnet_id: Optional[str] = None,
     vpc_id: Optional[str] = None,
-    region: str = "ap-south-1"
+    region: str = "ap-south-1",
+    fields: Optional[Union[str, List[str]]] = None
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_client("ec2", region)
+    projection = Projection(fields, "subnet")
 
     filters = []
     if vpc_id:
@@ -124,10 +182,10 @@ def describe_subnet(
     else:
         resp = ec2.describe_subnets(Filters=filters or None)
 
-    return {
+    return with_projection({
         "region": region,
-        "subnets": resp.get("Subnets", [])
-    }
+        "subnets": projection(resp.get("Subnets", []))
+    }, projection)
 
 
 # ============================================================
@@ -139,7 +197,7 @@ tools = [
         name="vpc.list_vpcs",
         description="List all VPCs in a region.",
         fn=list_vpcs,
-        parameters=RegionOnlyParams.model_json_schema()
+        parameters=ListVpcsParams.model_json_schema()
     ),
     FunctionTool(
         name="vpc.get_default_vpc",
@@ -157,7 +215,7 @@ tools = [
         name="vpc.list_subnets",
         description="List all subnets in a region.",
         fn=list_subnets,
-        parameters=RegionOnlyParams.model_json_schema()
+        parameters=ListSubnetsParams.model_json_schema()
     ),
     FunctionTool(
         name="vpc.get_default_subnets",
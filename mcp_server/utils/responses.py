@@ -0,0 +1,239 @@
+"""
+Field projection for describe/list responses.
+
+Raw botocore items (Instances, Volumes, Vpcs, ...) carry block device
+mappings, network interfaces, nested placement data and more, which for a
+few hundred resources serializes to megabytes. Tools accept a ``fields``
+argument that is either a named profile ("compact") or a list of JMESPath
+expressions / dotted paths; each field is compiled once (plain dotted paths
+to a direct dict walk, anything else to JMESPath) and applied to each page
+as it arrives, so the full items never accumulate.
+"""
+
+import json
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import jmespath
+
+Fields = Optional[Union[str, Sequence[str]]]
+
+_PATH = r"[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*"
+_SIMPLE_PATH = re.compile(rf"^{_PATH}$")
+# "Path[].Sub" and "Path[].{Key: Sub, ...}" list projections
+_LIST_PATH = re.compile(rf"^({_PATH})\[\]\.({_PATH})$")
+_LIST_SELECT = re.compile(rf"^({_PATH})\[\]\.\{{(\s*\w+\s*:\s*{_PATH}\s*(?:,\s*\w+\s*:\s*{_PATH}\s*)*)\}}$")
+
+# Raw page sizes are estimated from this many evenly spaced items
+_SIZE_SAMPLE = 32
+
+# Output key -> JMESPath expression, per resource kind
+COMPACT_PROFILES: Dict[str, Dict[str, str]] = {
+    "instance": {
+        "InstanceId": "InstanceId",
+        "InstanceType": "InstanceType",
+        "State": "State.Name",
+        "InstanceLifecycle": "InstanceLifecycle",
+        "PlatformDetails": "PlatformDetails",
+        "AvailabilityZone": "Placement.AvailabilityZone",
+        "Tenancy": "Placement.Tenancy",
+        "PrivateIpAddress": "PrivateIpAddress",
+        "PublicIpAddress": "PublicIpAddress",
+        "VpcId": "VpcId",
+        "SubnetId": "SubnetId",
+        "ImageId": "ImageId",
+        "KeyName": "KeyName",
+        "SecurityGroupIds": "SecurityGroups[].GroupId",
+        "LaunchTime": "LaunchTime",
+        "Tags": "Tags",
+    },
+    "volume": {
+        "VolumeId": "VolumeId",
+        "VolumeType": "VolumeType",
+        "Size": "Size",
+        "Iops": "Iops",
+        "Throughput": "Throughput",
+        "State": "State",
+        "AvailabilityZone": "AvailabilityZone",
+        "Encrypted": "Encrypted",
+        "Attachments": "Attachments[].{InstanceId: InstanceId, Device: Device, State: State}",
+        "Tags": "Tags",
+    },
+    "snapshot": {
+        "SnapshotId": "SnapshotId",
+        "VolumeId": "VolumeId",
+        "VolumeSize": "VolumeSize",
+        "State": "State",
+        "StartTime": "StartTime",
+        "Description": "Description",
+        "Tags": "Tags",
+    },
+    "vpc": {
+        "VpcId": "VpcId",
+        "CidrBlock": "CidrBlock",
+        "IsDefault": "IsDefault",
+        "State": "State",
+        "Tags": "Tags",
+    },
+    "subnet": {
+        "SubnetId": "SubnetId",
+        "VpcId": "VpcId",
+        "CidrBlock": "CidrBlock",
+        "AvailabilityZone": "AvailabilityZone",
+        "AvailableIpAddressCount": "AvailableIpAddressCount",
+        "MapPublicIpOnLaunch": "MapPublicIpOnLaunch",
+        "DefaultForAz": "DefaultForAz",
+        "Tags": "Tags",
+    },
+}
+
+
+def _normalize(fields: Fields) -> Optional[tuple]:
+    if not fields:
+        return None
+    if isinstance(fields, str):
+        fields = [f.strip() for f in fields.split(",") if f.strip()]
+    return tuple(fields)
+
+
+def _path_getter(path: str) -> Callable[[Any], Any]:
+    keys = path.split(".")
+
+    def get(item):
+        for key in keys:
+            if not isinstance(item, dict):
+                return None
+            item = item.get(key)
+        return item
+
+    return get
+
+
+def _getter(expression: str) -> Callable[[Any], Any]:
+    """
+    Compile one field expression. Dotted paths and simple list projections
+    (which cover every compact profile) become direct dict walks; anything
+    else goes through the JMESPath interpreter, which is several times slower
+    per item.
+    """
+    expression = expression.strip()
+    if _SIMPLE_PATH.match(expression):
+        return _path_getter(expression)
+
+    match = _LIST_PATH.match(expression)
+    if match:
+        base, sub = _path_getter(match.group(1)), _path_getter(match.group(2))
+
+        def get_list(item):
+            values = base(item)
+            if not isinstance(values, list):
+                return None
+            # JMESPath projections drop null results
+            return [v for v in map(sub, values) if v is not None]
+
+        return get_list
+
+    match = _LIST_SELECT.match(expression)
+    if match:
+        base = _path_getter(match.group(1))
+        selection = [
+            (key.strip(), _path_getter(path.strip()))
+            for key, path in (pair.split(":") for pair in match.group(2).split(","))
+        ]
+
+        def get_select(item):
+            values = base(item)
+            if not isinstance(values, list):
+                return None
+            return [{key: get(v) for key, get in selection} for v in values if v is not None]
+
+        return get_select
+
+    return jmespath.compile(expression).search
+
+
+@lru_cache(maxsize=256)
+def _compile(fields: tuple, kind: str) -> Tuple[Tuple[str, Callable[[Any], Any]], ...]:
+    if fields == ("compact",):
+        if kind not in COMPACT_PROFILES:
+            raise ValueError(f"No compact profile for {kind} responses")
+        selection = COMPACT_PROFILES[kind]
+    else:
+        selection = {f: f for f in fields}
+
+    return tuple((key, _getter(expression)) for key, expression in selection.items())
+
+
+def _size(value: Any) -> int:
+    return len(json.dumps(value, default=str, separators=(",", ":")))
+
+
+def _estimated_size(items: List[Any]) -> int:
+    if len(items) <= _SIZE_SAMPLE:
+        return _size(items)
+    step = len(items) / _SIZE_SAMPLE
+    sample = [items[int(i * step)] for i in range(_SIZE_SAMPLE)]
+    return round(_size(sample) * len(items) / _SIZE_SAMPLE)
+
+
+class Projection:
+    """
+    Callable page transform that projects items and tracks bytes saved.
+
+    With no fields it passes items through untouched and reports nothing.
+    """
+
+    def __init__(self, fields: Fields, kind: str):
+        self.fields = _normalize(fields)
+        self.kind = kind
+        self.getters = _compile(self.fields, kind) if self.fields else None
+        self.raw_bytes_estimate = 0
+        self.projected_bytes = 0
+        self.sampled = False
+
+    def __bool__(self):
+        return self.getters is not None
+
+    def __call__(self, items: List[Any]) -> List[Any]:
+        if self.getters is None:
+            return items
+        getters = self.getters
+        # Absent fields are dropped rather than returned as nulls
+        projected = [
+            {key: value for key, get in getters for value in (get(item),) if value is not None}
+            for item in items
+        ]
+        self.raw_bytes_estimate += _estimated_size(items)
+        self.sampled = self.sampled or len(items) > _SIZE_SAMPLE
+        self.projected_bytes += _size(projected)
+        return projected
+
+    def one(self, item: Any) -> Any:
+        if self.getters is None or item is None:
+            return item
+        return self([item])[0]
+
+    def report(self) -> Optional[Dict[str, Any]]:
+        if self.getters is None:
+            return None
+        raw = self.raw_bytes_estimate
+        saved = raw - self.projected_bytes
+        # projected_bytes is measured; the raw size (and so the savings) is
+        # extrapolated from a sample on pages larger than _SIZE_SAMPLE items
+        return {
+            "fields": list(self.fields),
+            "raw_bytes_estimate": raw,
+            "projected_bytes": self.projected_bytes,
+            "saved_bytes_estimate": saved,
+            "saved_pct_estimate": round(saved * 100 / raw, 1) if raw else 0.0,
+            "raw_size": "sampled" if self.sampled else "measured",
+        }
+
+
+def with_projection(response: Dict[str, Any], projection: Projection) -> Dict[str, Any]:
+    """Attach the projection report to a tool response when fields were requested."""
+    report = projection.report()
+    if report is not None:
+        response["projection"] = report
+    return response
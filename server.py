@@ -1,13 +1,25 @@
 from fastmcp import FastMCP
+from mcp_server.core.config import Settings
 from mcp_server.core.registry import ToolRegistry
 
 mcp = FastMCP("aws-mcp")
 
-# Auto-load all tools
-for tool in ToolRegistry.load_all_tools():
+# Auto-load all tools (lazily from the tool manifest when it is up to date)
+for tool in ToolRegistry.load_tools():
     mcp.add_tool(tool)
 
+if Settings.METRICS_ENABLED:
+    from mcp_server.core.metrics import install as install_metrics
+    install_metrics(mcp)
+
 def run():
+    if Settings.PRICE_INDEX_SCHEDULE:
+        # Imported here so boto3 stays out of the startup path
+        from mcp_server.pricing.index import start_refresh_scheduler
+        start_refresh_scheduler()
+    if Settings.INVENTORY_SCHEDULE:
+        from mcp_server.inventory.store import start_sync_scheduler
+        start_sync_scheduler()
     mcp.run()
 
 if __name__ == "__main__":
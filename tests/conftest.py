@@ -0,0 +1,51 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Settings are read at import time, and botocore signs requests before the
+# synthetic backend answers them
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from fixtures import SyntheticAWS  # noqa: E402
+
+from mcp_server.core.cache import get_cache  # noqa: E402
+from mcp_server.inventory import graph, query, store  # noqa: E402
+
+REGION = "us-east-1"
+
+
+@pytest.fixture(scope="session")
+def synthetic_aws():
+    # The botocore hook is registered once per pooled client; tests reload its data
+    return SyntheticAWS(REGION).install()
+
+
+@pytest.fixture
+def aws(synthetic_aws):
+    """Synthetic EC2 backend with no resources; tests load() what they need."""
+    synthetic_aws.load()
+    synthetic_aws.calls = 0
+    get_cache().clear()
+    return synthetic_aws
+
+
+@pytest.fixture
+def inventory(aws, monkeypatch, tmp_path):
+    """A fresh inventory store (with its query indexes and graphs) backed by aws."""
+    inv = store.InventoryStore(str(tmp_path / "inventory.sqlite"))
+    monkeypatch.setattr(store, "_store", inv)
+    monkeypatch.setattr(store, "_pending_dirty", {})
+    monkeypatch.setattr(query, "_indexes", {})
+    monkeypatch.setattr(query, "_listening", False)
+    monkeypatch.setattr(graph, "_graphs", {})
+    monkeypatch.setattr(graph, "_stale", set())
+    monkeypatch.setattr(graph, "_build_locks", {})
+    monkeypatch.setattr(graph, "_listening", False)
+    return inv
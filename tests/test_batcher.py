@@ -0,0 +1,76 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from mcp_server.core import batcher
+from mcp_server.core.batcher import InstanceBatcher
+
+REGION = "us-east-1"
+
+
+def test_concurrent_lookups_share_one_describe_call(aws):
+    aws.load(instances=20)
+    ids = aws.instance_ids()[:8]
+    instances = InstanceBatcher(window_ms=200)
+
+    with ThreadPoolExecutor(max_workers=len(ids)) as pool:
+        found = list(pool.map(lambda i: instances.get(i, REGION), ids))
+
+    assert [inst["InstanceId"] for inst in found] == ids
+    assert aws.calls == 1
+    stats = instances.stats()
+    assert stats["lookups"] == 8
+    assert stats["batches"] == 1
+    assert stats["calls_saved"] == 7
+
+
+def test_missing_ids_return_none_without_failing_the_batch(aws):
+    aws.load(instances=5)
+    existing = aws.instance_ids()[0]
+    instances = InstanceBatcher(window_ms=200)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        found = list(pool.map(
+            lambda i: instances.get(i, REGION), [existing, "i-0fffffffffffffff0", "not-an-id"]
+        ))
+
+    assert found[0]["InstanceId"] == existing
+    assert found[1:] == [None, None]
+    assert aws.calls == 1
+
+
+def test_full_batch_is_sent_before_the_window_closes(aws):
+    aws.load(instances=10)
+    ids = aws.instance_ids()[:4]
+    # A window long enough that the test would time out if it were waited out
+    instances = InstanceBatcher(window_ms=60_000, max_ids=4)
+
+    with ThreadPoolExecutor(max_workers=len(ids)) as pool:
+        found = list(pool.map(lambda i: instances.get(i, REGION), ids))
+
+    assert [inst["InstanceId"] for inst in found] == ids
+    assert instances.stats()["full_batches"] == 1
+
+
+def test_callers_get_their_own_copies(aws):
+    aws.load(instances=3)
+    instance_id = aws.instance_ids()[0]
+    instances = InstanceBatcher(window_ms=200)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first, second = pool.map(lambda i: instances.get(i, REGION), [instance_id, instance_id])
+
+    assert first == second
+    assert first is not second
+
+
+def test_zero_window_looks_up_directly(aws):
+    aws.load(instances=3)
+    instances = InstanceBatcher(window_ms=0)
+    assert instances.get(aws.instance_ids()[1], REGION)["InstanceId"] == aws.instance_ids()[1]
+    assert instances.stats()["batches"] == 0
+
+
+def test_get_instances_returns_only_existing_ids(aws):
+    aws.load(instances=5)
+    ids = aws.instance_ids()[:2]
+    found = batcher.get_instances(ids + ["i-0fffffffffffffff0"], REGION)
+    assert sorted(found) == sorted(ids)
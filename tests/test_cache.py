@@ -0,0 +1,139 @@
+import threading
+
+import pytest
+
+from mcp_server.core import cache as cache_module
+from mcp_server.core.cache import (
+    MemoryLRUBackend,
+    ResponseCache,
+    SQLiteBackend,
+    cached,
+    get_cache,
+    invalidates,
+    tag,
+)
+
+REGION = "us-east-1"
+
+
+@pytest.fixture(params=["memory", "disk"])
+def response_cache(request, tmp_path):
+    if request.param == "disk":
+        return ResponseCache(SQLiteBackend(str(tmp_path / "responses.sqlite")), default_ttl=60)
+    return ResponseCache(MemoryLRUBackend(16), default_ttl=60)
+
+
+def test_entries_expire_after_their_ttl(response_cache, monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+
+    assert response_cache.set("k", {"v": 1}, 30, [tag(REGION, "vpcs")])
+    assert response_cache.get("k") == {"v": 1}
+
+    now[0] += 31
+    assert response_cache.get("k") is cache_module._MISS
+    assert response_cache.stats()["hits"] == 1
+    assert response_cache.stats()["misses"] == 1
+
+
+def test_invalidation_drops_only_entries_with_a_matching_tag(response_cache):
+    response_cache.set("vpcs", 1, 60, [tag(REGION, "vpcs")])
+    response_cache.set("instance", 2, 60, [tag(REGION, "instances"), tag(REGION, "i-1")])
+    response_cache.set("other-region", 3, 60, [tag("eu-west-1", "instances")])
+
+    assert response_cache.invalidate([tag(REGION, "i-1")]) == 1
+
+    assert response_cache.get("vpcs") == 1
+    assert response_cache.get("instance") is cache_module._MISS
+    assert response_cache.get("other-region") == 3
+
+
+def test_value_computed_across_an_invalidation_is_not_stored(response_cache):
+    tags = [tag(REGION, "instances")]
+    generation = response_cache.generation(tags)
+
+    # A mutation lands while the read is in flight
+    response_cache.invalidate(tags)
+
+    assert not response_cache.set("k", "stale", 60, tags, generation)
+    assert response_cache.get("k") is cache_module._MISS
+    assert response_cache.stats()["stale_skipped"] == 1
+
+    # Unrelated tags do not block a store, nor does a fresh generation
+    assert response_cache.set("k", "fresh", 60, tags, response_cache.generation(tags))
+    assert response_cache.set("v", "vpcs", 60, [tag(REGION, "vpcs")], response_cache.generation([tag(REGION, "vpcs")]))
+
+
+def test_clear_also_rejects_values_read_before_it(response_cache):
+    generation = response_cache.generation([tag(REGION, "vpcs")])
+    response_cache.clear()
+    assert not response_cache.set("k", "stale", 60, [tag(REGION, "vpcs")], generation)
+
+
+def test_lru_evicts_the_least_recently_read_entry():
+    backend = MemoryLRUBackend(max_entries=2)
+    backend.set("a", 1, 60, set())
+    backend.set("b", 2, 60, set())
+    backend.get("a")
+    backend.set("c", 3, 60, set())
+
+    assert backend.get("a") == 1
+    assert backend.get("b") is cache_module._MISS
+    assert backend.get("c") == 3
+
+
+def test_decorated_tools_hit_the_cache_until_a_mutation_invalidates_it(aws):
+    calls = []
+
+    @cached("describe_thing", tags=lambda p: [tag(p["region"], "things")])
+    def describe_thing(name, region=REGION):
+        calls.append(name)
+        return {"name": name, "tags": []}
+
+    @invalidates(lambda p: [tag(p["region"], "things")])
+    def change_thing(name, region=REGION):
+        return {"changed": name}
+
+    first = describe_thing("a")
+    first["tags"].append("mutated by caller")
+    assert describe_thing("a") == {"name": "a", "tags": []}
+    assert calls == ["a"]
+
+    change_thing("a")
+    describe_thing("a")
+    assert calls == ["a", "a"]
+
+
+def test_errors_are_not_cached(aws):
+    calls = []
+
+    @cached("describe_flaky", tags=lambda p: [tag(p["region"], "flaky")])
+    def describe_flaky(region=REGION):
+        calls.append(region)
+        return {"error": "Throttling"}
+
+    describe_flaky()
+    describe_flaky()
+    assert len(calls) == 2
+
+
+def test_read_racing_a_mutation_is_not_cached(aws):
+    started, release = threading.Event(), threading.Event()
+    values = iter(["before", "after"])
+
+    @cached("describe_slow", tags=lambda p: [tag(p["region"], "slow")])
+    def describe_slow(region=REGION):
+        value = next(values)
+        if value == "before":
+            started.set()
+            release.wait(5)
+        return {"value": value}
+
+    reader = threading.Thread(target=describe_slow)
+    reader.start()
+    started.wait(5)
+    get_cache().invalidate([tag(REGION, "slow")])
+    release.set()
+    reader.join(5)
+
+    assert describe_slow() == {"value": "after"}
@@ -0,0 +1,105 @@
+from mcp_server.inventory import graph
+
+REGION = "us-east-1"
+
+
+def _instances(aws):
+    return [i for r in aws.data["DescribeInstances"] for i in r["Instances"]]
+
+
+def _ids(result, resource_type=None):
+    return {n["id"] for n in result["nodes"] if resource_type is None or n["type"] == resource_type}
+
+
+def test_subnet_contents(aws, inventory):
+    aws.load(instances=60)
+    subnet = "subnet-00000000000000005"
+
+    result = graph.related(graph.get_graph(REGION, 300), [subnet], direction="down")
+
+    assert _ids(result, "instances") == {i["InstanceId"] for i in _instances(aws) if i["SubnetId"] == subnet}
+    assert _ids(result, "network_interfaces") == {
+        n["NetworkInterfaceId"] for n in aws.data["DescribeNetworkInterfaces"] if n["SubnetId"] == subnet
+    }
+    assert {n["relation"] for n in result["nodes"]} == {"contains"}
+    assert {n["depth"] for n in result["nodes"]} == {1}
+
+
+def test_instance_neighbourhood(aws, inventory):
+    aws.load(instances=10)
+    inst = _instances(aws)[4]
+
+    result = graph.related(graph.get_graph(REGION, 300), [inst["InstanceId"]])
+    nodes = {n["id"]: n for n in result["nodes"]}
+
+    assert nodes[inst["SubnetId"]]["relation"] == "belongs_to"
+    assert nodes[inst["SecurityGroups"][0]["GroupId"]]["relation"] == "protected_by"
+    assert {m["Ebs"]["VolumeId"] for m in inst["BlockDeviceMappings"]} == _ids(result, "volumes")
+    # Its AMI is not one of the account's images, so it is a placeholder node
+    assert nodes[inst["ImageId"]] == {
+        "id": inst["ImageId"], "type": "images", "in_inventory": False,
+        "depth": 1, "via": inst["InstanceId"], "relation": "launched_from",
+    }
+
+
+def test_target_types_filter_reports_but_walks_through(aws, inventory):
+    aws.load(instances=60)
+    vpc = "vpc-00000000000000001"
+
+    result = graph.related(graph.get_graph(REGION, 300), [vpc], depth=2, direction="down", target_types=["instances"])
+
+    # Through the VPC's subnets and through its security groups
+    groups = {g["GroupId"] for g in aws.data["DescribeSecurityGroups"] if g["VpcId"] == vpc}
+    assert _ids(result) == {
+        i["InstanceId"] for i in _instances(aws)
+        if i["VpcId"] == vpc or groups & {g["GroupId"] for g in i["SecurityGroups"]}
+    }
+    assert {n["depth"] for n in result["nodes"]} == {2}
+
+
+def test_max_nodes_truncates(aws, inventory):
+    aws.load(instances=60)
+
+    result = graph.related(graph.get_graph(REGION, 300), ["vpc-00000000000000000"], depth=3, max_nodes=5)
+
+    assert result["count"] == 5
+    assert result["truncated"]
+
+
+def test_unknown_start_is_reported(aws, inventory):
+    aws.load(instances=3)
+
+    result = graph.related(graph.get_graph(REGION, 300), ["i-0fffffffffffffff0"])
+
+    assert result["not_found"] == ["i-0fffffffffffffff0"]
+    assert result["count"] == 0
+
+
+def test_shortest_path_from_snapshot_to_vpc(aws, inventory):
+    aws.load(instances=20, snapshots=5)
+    snapshot = aws.data["DescribeSnapshots"][2]
+    volume = next(v for v in aws.data["DescribeVolumes"] if v["VolumeId"] == snapshot["VolumeId"])
+    inst = next(i for i in _instances(aws) if i["InstanceId"] == volume["Attachments"][0]["InstanceId"])
+
+    path = graph.shortest_path(graph.get_graph(REGION, 300), snapshot["SnapshotId"], inst["VpcId"])
+
+    assert [hop["id"] for hop in path][:3] == [snapshot["SnapshotId"], volume["VolumeId"], inst["InstanceId"]]
+    assert path[-1]["id"] == inst["VpcId"]
+    assert len(path) == 5  # snapshot, volume, instance, subnet or security group, VPC
+
+
+def test_graph_is_rebuilt_after_an_inventory_write(aws, inventory):
+    aws.load(instances=10)
+    before = graph.get_graph(REGION, 300)
+    assert graph.get_graph(REGION, 300) is before
+
+    gone = aws.instance_ids()[0]
+    for reservation in aws.data["DescribeInstances"]:
+        reservation["Instances"] = [i for i in reservation["Instances"] if i["InstanceId"] != gone]
+    inventory.mark_dirty(REGION, "instances", [gone])
+    after = graph.get_graph(REGION, 300)
+
+    assert after is not before
+    assert gone in before.index
+    # Still referenced by its volumes and ENI, but no longer an inventory item
+    assert after.describe(after.index[gone])["in_inventory"] is False
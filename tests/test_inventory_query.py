@@ -0,0 +1,112 @@
+from collections import Counter
+from datetime import datetime, timezone
+
+import pytest
+
+from mcp_server.inventory import query
+
+REGION = "us-east-1"
+
+
+def _instances(aws):
+    return [i for r in aws.data["DescribeInstances"] for i in r["Instances"]]
+
+
+def _tags(inst):
+    return {t["Key"]: t["Value"] for t in inst.get("Tags", [])}
+
+
+def _state(inst):
+    return inst["State"]["Name"]
+
+
+CUTOFF = datetime(2026, 1, 1, 0, 30, tzinfo=timezone.utc)
+
+# where expression -> the same question asked of the raw items
+EXPRESSIONS = {
+    "": lambda i: True,
+    "state = running AND tag:env = prod AND NOT tag:Owner":
+        lambda i: _state(i) == "running" and _tags(i).get("env") == "prod" and "Owner" not in _tags(i),
+    "type IN (t3.micro, m5.large) OR lifecycle = spot":
+        lambda i: i["InstanceType"] in ("t3.micro", "m5.large") or i.get("InstanceLifecycle") == "spot",
+    "state NOT IN (running, pending)": lambda i: _state(i) not in ("running", "pending"),
+    'tag:Name = "bench-1*"': lambda i: _tags(i)["Name"].startswith("bench-1"),
+    "tag:team != ml AND (az = us-east-1a OR az = us-east-1c)":
+        lambda i: _tags(i)["team"] != "ml" and i["Placement"]["AvailabilityZone"] in ("us-east-1a", "us-east-1c"),
+    "LaunchTime < 2026-01-01T00:30": lambda i: i["LaunchTime"] < CUTOFF,
+}
+
+
+@pytest.mark.parametrize("dense_ratio", [1, 64, 10 ** 6])
+@pytest.mark.parametrize("where", list(EXPRESSIONS))
+def test_matches_agree_with_a_scan(aws, inventory, monkeypatch, dense_ratio, where):
+    # Every value posted as a set, mixed, or every value as a bitmap
+    monkeypatch.setattr(query, "DENSE_RATIO", dense_ratio)
+    aws.load(instances=200)
+    expected = {i["InstanceId"] for i in _instances(aws) if EXPRESSIONS[where](i)}
+
+    result = query.run(REGION, "instances", where, limit=0)
+
+    assert result["count"] == len(expected)
+    assert set(query.select_ids(REGION, "instances", where, 300)) == expected
+
+
+def test_group_counts_and_sums(aws, inventory):
+    aws.load(instances=120)
+    running = [i for i in _instances(aws) if _state(i) == "running"]
+
+    by_type = query.run(REGION, "instances", "state = running", group_by="type", limit=0)
+    assert {g["value"]: g["count"] for g in by_type["groups"]} == Counter(i["InstanceType"] for i in running)
+
+    volumes = query.run(REGION, "volumes", "", group_by="type", sum_field="Size", limit=0)
+    sizes = Counter()
+    for v in aws.data["DescribeVolumes"]:
+        sizes[v["VolumeType"]] += v["Size"]
+    assert {g["value"]: g["sum"] for g in volumes["groups"]} == sizes
+
+
+def test_sorted_limit(aws, inventory):
+    aws.load(instances=50)
+
+    newest = query.run(REGION, "instances", "", sort_by="-LaunchTime", limit=3)
+
+    assert [i["InstanceId"] for i in newest["items"]] == aws.instance_ids()[-1:-4:-1]
+    assert newest["truncated"]
+
+
+def test_index_follows_inventory_writes(aws, inventory):
+    aws.load(instances=100)
+    assert query.run(REGION, "instances", "state = stopped", limit=0)["count"] == sum(
+        _state(i) == "stopped" for i in _instances(aws)
+    )
+
+    # A few instances stop and one is terminated and gone; the index is patched, not rebuilt
+    changed = aws.instance_ids()[:5]
+    for inst in _instances(aws):
+        if inst["InstanceId"] in changed:
+            inst["State"] = {"Code": 80, "Name": "stopped"}
+    gone = aws.instance_ids()[-1]
+    for reservation in aws.data["DescribeInstances"]:
+        reservation["Instances"] = [i for i in reservation["Instances"] if i["InstanceId"] != gone]
+    inventory.mark_dirty(REGION, "instances", changed + [gone])
+    inventory.refresh(REGION, "instances")
+
+    index = query.get_index(REGION, "instances")
+    expected = {i["InstanceId"] for i in _instances(aws) if _state(i) == "stopped"}
+    assert set(query.select_ids(REGION, "instances", "state = stopped", 300)) == expected
+    assert query.run(REGION, "instances", "", limit=0)["count"] == 99
+    assert index.stats()["updates"] >= 1
+
+
+def test_items_are_copies(aws, inventory):
+    aws.load(instances=5)
+
+    query.run(REGION, "instances", "", limit=5)["items"][0]["Region"] = REGION
+
+    assert not any("Region" in item for item in query.run(REGION, "instances", "", limit=5)["items"])
+
+
+@pytest.mark.parametrize("where", ["state = ", "(state = running", "state = running AND", "state ~ running"])
+def test_malformed_expressions_are_rejected(where):
+    with pytest.raises(query.QueryError):
+        query.parse("instances", where)
@@ -0,0 +1,140 @@
+import json
+
+from mcp_server.core.cache import get_cache, tag
+from mcp_server.core.config import Settings
+from mcp_server.inventory import store
+from mcp_server.tools.ec2.instance_lifecycle import stop_instance
+
+REGION = "us-east-1"
+
+
+def _instance(aws, instance_id):
+    return next(i for r in aws.data["DescribeInstances"] for i in r["Instances"] if i["InstanceId"] == instance_id)
+
+
+def test_invalidation_before_store_is_opened_marks_it_dirty(monkeypatch, tmp_path):
+    # As after a restart: a mutating tool runs before any inventory read
+    monkeypatch.setattr(Settings, "INVENTORY_PATH", str(tmp_path / "inventory.sqlite"))
+    monkeypatch.setattr(store, "_store", None)
+    monkeypatch.setattr(store, "_pending_dirty", {})
+
+    get_cache().invalidate([tag("us-east-1", "i-0123456789abcdef0"), tag("us-east-1", "volumes")])
+
+    assert store.get_inventory()._dirty == {
+        ("us-east-1", "instances"): {"i-0123456789abcdef0"},
+        ("us-east-1", "volumes"): {"*"},
+    }
+    assert store._pending_dirty == {}
+
+
+def _remove_instance(aws, instance_id):
+    for reservation in aws.data["DescribeInstances"]:
+        reservation["Instances"] = [i for i in reservation["Instances"] if i["InstanceId"] != instance_id]
+
+
+def test_page_tokens_survive_resources_removed_between_pages(aws, inventory):
+    aws.load(instances=30)
+    items, token, _ = store.serve("us-east-1", "instances", None, 300, max_items=10)
+    first = [i["InstanceId"] for i in items]
+
+    # An instance on the first page disappears before the second is requested
+    _remove_instance(aws, first[0])
+    inventory.refresh("us-east-1", "instances", full=True)
+
+    rest = []
+    while token:
+        items, token, _ = store.serve("us-east-1", "instances", None, 300, max_items=10, next_token=token)
+        rest += [i["InstanceId"] for i in items]
+
+    assert sorted(set(first[1:] + rest)) == sorted(aws.instance_ids())
+    assert len(first) + len(rest) == 30
+
+
+def test_staleness_is_checked_against_the_reported_age(aws, inventory, monkeypatch):
+    monkeypatch.setattr(Settings, "INVENTORY_EVENTS_PATH", "")
+    aws.load(instances=10)
+    inventory.refresh("us-east-1", "instances")
+
+    # Half an hour later, with an incremental refresh in between
+    clock = store.time.time() + 1800
+    monkeypatch.setattr(store.time, "time", lambda: clock)
+    inventory.refresh("us-east-1", "instances")
+    assert inventory.age("us-east-1", "instances") < 1
+    assert inventory.served_age("us-east-1", "instances") >= 1800
+
+    age = inventory.ensure_fresh("us-east-1", "instances", 60)
+
+    assert age <= 60
+    assert inventory._last_refresh[("us-east-1", "instances")]["mode"] == "full"
+
+
+def test_first_refresh_is_full_then_incremental(aws, inventory):
+    aws.load(instances=25)
+
+    assert inventory.refresh(REGION, "instances")["mode"] == "full"
+    result = inventory.refresh(REGION, "instances")
+
+    assert result["mode"] == "incremental"
+    assert result["items"] == 25
+    assert inventory.age(REGION, "instances") < 5
+
+
+def test_incremental_refresh_follows_instances_last_seen_mid_transition(aws, inventory):
+    aws.load(instances=25)
+    inventory.refresh(REGION, "instances")
+    pending = [i for i in aws.instance_ids() if _instance(aws, i)["State"]["Name"] == "pending"]
+    assert pending
+
+    for instance_id in pending:
+        _instance(aws, instance_id)["State"] = {"Code": 16, "Name": "running"}
+    assert inventory.refresh(REGION, "instances")["mode"] == "incremental"
+
+    assert {inventory.get(REGION, "instances", i)["State"]["Name"] for i in pending} == {"running"}
+
+
+def test_incremental_refresh_removes_dirty_instances_that_are_gone(aws, inventory):
+    aws.load(instances=25)
+    inventory.refresh(REGION, "instances")
+    gone = aws.instance_ids()[3]
+
+    _remove_instance(aws, gone)
+    inventory.mark_dirty(REGION, "instances", [gone])
+    result = inventory.refresh(REGION, "instances")
+
+    assert result["mode"] == "incremental"
+    assert result["removed"] == 1
+    assert inventory.get(REGION, "instances", gone) is None
+    assert inventory._dirty == {}
+
+
+def test_mutating_tool_marks_the_instance_dirty(aws, inventory):
+    aws.load(instances=5)
+    instance_id = aws.instance_ids()[0]
+
+    stop_instance(instance_id=instance_id, region=REGION)
+
+    assert instance_id in inventory._dirty[(REGION, "instances")]
+
+
+def test_event_feed_is_replayed_from_the_last_complete_line(aws, inventory, monkeypatch, tmp_path):
+    feed = tmp_path / "events.jsonl"
+    monkeypatch.setattr(Settings, "INVENTORY_EVENTS_PATH", str(feed))
+    event = {
+        "detail-type": "EC2 Instance State-change Notification",
+        "region": REGION,
+        "detail": {"instance-id": "i-00000000000000001", "state": "stopped"},
+    }
+    partial = json.dumps({**event, "detail": {"instance-id": "i-00000000000000002"}})
+    feed.write_text(json.dumps(event) + "\n" + partial)
+
+    assert inventory.replay_events() == {"events": 1, "resources_marked": 1}
+    assert inventory._dirty == {(REGION, "instances"): {"i-00000000000000001"}}
+    assert inventory._events_pending()
+
+    # The partially written event is read once its line is complete
+    with open(feed, "a") as f:
+        f.write("\n")
+    assert inventory.replay_events()["events"] == 1
+    assert inventory.replay_events()["events"] == 0
+    assert not inventory._events_pending()
+    assert inventory._dirty[(REGION, "instances")] == {"i-00000000000000001", "i-00000000000000002"}
@@ -0,0 +1,53 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "aws-mcp-project"))
+
+from search_index import SearchIndex  # noqa: E402
+
+EC2_DOCS = {
+    'methods': [
+        {
+            'name': 'stop_instances',
+            'description': 'Stops an Amazon EBS-backed instance.',
+            'parameters': [{'name': 'InstanceIds', 'type': 'list', 'required': True, 'description': 'The IDs of the instances.'}],
+        },
+        {
+            'name': 'start_instances',
+            'description': 'Starts an Amazon EBS-backed instance that you have previously stopped.',
+            'parameters': [{'name': 'InstanceIds', 'type': 'list', 'required': True, 'description': 'The IDs of the instances.'}],
+        },
+        {
+            'name': 'describe_volumes',
+            'description': 'Describes the specified EBS volumes.',
+            'parameters': [{'name': 'VolumeIds', 'type': 'list', 'required': False, 'description': 'The volume IDs.'}],
+        },
+    ]
+}
+
+
+def _index(tmp_path):
+    index = SearchIndex(tmp_path / "search_index.pkl")
+    index.add_service('ec2', EC2_DOCS, timestamp=1)
+    return index
+
+
+def test_transposed_letters_are_corrected(tmp_path):
+    response = _index(tmp_path).search('stop instnace')
+
+    assert 'instance' in response['corrections']['instnace']
+    assert response['results'][0]['operation'] == 'stop_instances'
+
+
+def test_trigram_misspellings_are_still_corrected(tmp_path):
+    response = _index(tmp_path).search('describ volumes')
+
+    assert response['corrections']['describ'] == ['describe']
+    assert response['results'][0]['operation'] == 'describe_volumes'
+
+
+def test_unrelated_words_are_not_corrected(tmp_path):
+    response = _index(tmp_path).search('stop lambda')
+
+    assert 'corrections' not in response
+    assert response['results'][0]['operation'] == 'stop_instances'
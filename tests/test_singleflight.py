@@ -0,0 +1,99 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mcp_server.core import singleflight
+from mcp_server.core.singleflight import SingleFlight, coalesced
+
+
+@pytest.fixture
+def flights(monkeypatch):
+    fresh = SingleFlight()
+    monkeypatch.setattr(singleflight, "_flights", fresh)
+    return fresh
+
+
+def _run_concurrently(fn, n):
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        futures = [pool.submit(fn) for _ in range(n)]
+        return [f.result() for f in futures]
+
+
+def test_concurrent_identical_calls_share_one_execution(flights):
+    calls = []
+
+    @coalesced("describe_images")
+    def describe_images(owners, region=None):
+        calls.append(owners)
+        time.sleep(0.2)
+        return {"images": [{"ImageId": "ami-1"}]}
+
+    results = _run_concurrently(lambda: describe_images("self"), 8)
+
+    assert len(calls) == 1
+    assert all(r == {"images": [{"ImageId": "ami-1"}]} for r in results)
+    # Waiters get copies, not the leader's dict
+    assert len({id(r) for r in results}) == 8
+
+    stats = flights.stats()
+    assert stats["calls"] == 8
+    assert stats["deduplicated"] == 7
+    assert stats["in_flight"] == 0
+
+
+def test_different_parameters_are_not_coalesced(flights):
+    calls = []
+    barrier = threading.Barrier(2)
+
+    @coalesced("describe_vpcs")
+    def describe_vpcs(region=None):
+        calls.append(region)
+        barrier.wait(5)
+        return {"region": region}
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        east = pool.submit(describe_vpcs, "us-east-1")
+        west = pool.submit(describe_vpcs, "us-west-2")
+        assert east.result() == {"region": "us-east-1"}
+        assert west.result() == {"region": "us-west-2"}
+    assert sorted(calls) == ["us-east-1", "us-west-2"]
+
+
+def test_default_region_matches_an_explicit_one(flights):
+    key = flights.make_key("describe_vpcs", {"region": None, "vpc_id": None})
+    assert key == flights.make_key("describe_vpcs", {"region": singleflight.Settings.DEFAULT_REGION})
+
+
+def test_errors_reach_every_waiter(flights):
+    started = threading.Event()
+    calls = []
+
+    def fail():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        raise RuntimeError("throttled")
+
+    def call():
+        try:
+            flights.do("op", "key", fail)
+        except RuntimeError as e:
+            return str(e)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        leader = pool.submit(call)
+        started.wait(5)
+        waiters = [pool.submit(call) for _ in range(3)]
+        results = [leader.result()] + [w.result() for w in waiters]
+
+    assert calls == [1]
+    assert results == ["throttled"] * 4
+
+
+def test_nothing_is_remembered_after_completion(flights):
+    calls = []
+    flights.do("op", "key", lambda: calls.append(1))
+    flights.do("op", "key", lambda: calls.append(1))
+    assert calls == [1, 1]
@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta, timezone
+
+from mcp_server.pricing.spot_store import SpotPriceStore, SpotSeries
+
+
+def _points(timestamps, price=0.05):
+    return [
+        {
+            "Timestamp": ts,
+            "AvailabilityZone": "us-east-1a",
+            "InstanceType": "m5.large",
+            "ProductDescription": "Linux/UNIX",
+            "SpotPrice": str(price),
+        }
+        for ts in timestamps
+    ]
+
+
+def test_older_points_are_merged_in_order():
+    now = datetime.now(timezone.utc)
+    store = SpotPriceStore()
+
+    # A short window cached first, then the full lookback
+    assert store.add_points("us-east-1", _points([now - timedelta(minutes=30)])) == 1
+    older = [now - timedelta(hours=h) for h in range(1, 20)]
+    assert store.add_points("us-east-1", _points(older)) == 19
+
+    series = store.series_for("us-east-1", "m5.large")["us-east-1a"]
+    assert len(series) == 20
+    assert list(series.offsets) == sorted(series.offsets)
+    assert series.last_timestamp == int((now - timedelta(minutes=30)).timestamp())
+
+
+def test_stored_timestamps_are_skipped():
+    series = SpotSeries(1000)
+    assert series.insert(1000, 0.1)
+    assert series.insert(1200, 0.3)
+    assert series.insert(1100, 0.2)
+    assert not series.insert(1100, 0.9)
+    assert not series.insert(1200, 0.9)
+
+    assert list(series.offsets) == [0, 100, 200]
+    assert [round(p, 2) for p in series.prices] == [0.1, 0.2, 0.3]